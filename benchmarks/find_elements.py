@@ -0,0 +1,141 @@
+"""
+Measure multi-element resolution round trips against a fake CDP server.
+
+Starts a local WebSocket server answering the Runtime and DOM commands used
+by FindElementsMixin._find_elements for a page with N matching elements,
+each reply delayed by a fixed latency, and compares the batched resolution
+with the previous one DOM.describeNode round trip per match.
+
+Usage:
+    python benchmarks/find_elements.py --latency 0.002 --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from websockets.asyncio.server import serve
+
+from pydoll.commands import RuntimeCommands
+from pydoll.connection import ConnectionHandler
+from pydoll.constants import By
+from pydoll.elements.mixins import FindElementsMixin
+from pydoll.elements.mixins.find_elements_mixin import create_web_element
+
+LIST_OBJECT_ID = 'matches'
+
+
+class FakeCDPServer:
+    """Answers element lookup commands for a page with `matches` elements."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.matches = 0
+        self.commands = 0
+
+    def reply(self, message: dict) -> dict:
+        method, params = message['method'], message.get('params', {})
+        if method == 'Runtime.evaluate':
+            result = {'result': {'type': 'object', 'objectId': LIST_OBJECT_ID}}
+        elif method == 'Runtime.getProperties':
+            result = {
+                'result': [
+                    {'name': str(i), 'value': {'type': 'object', 'objectId': f'node-{i}'}}
+                    for i in range(self.matches)
+                ]
+            }
+        elif method == 'Runtime.callFunctionOn':
+            result = {
+                'result': {
+                    'type': 'object',
+                    'value': [
+                        {'nodeName': 'div', 'attributes': ['class', 'card', 'id', f'card-{i}']}
+                        for i in range(self.matches)
+                    ],
+                }
+            }
+        elif method == 'DOM.describeNode':
+            index = params['objectId'].split('-')[1]
+            result = {
+                'node': {'nodeName': 'DIV', 'attributes': ['class', 'card', 'id', f'card-{index}']}
+            }
+        else:
+            result = {}
+        return {'id': message['id'], 'result': result}
+
+    async def handler(self, websocket):
+        async def answer(message: dict):
+            await asyncio.sleep(self.latency)
+            await websocket.send(json.dumps(self.reply(message)))
+
+        tasks = set()
+        async for raw in websocket:
+            self.commands += 1
+            task = asyncio.create_task(answer(json.loads(raw)))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+
+class Document(FindElementsMixin):
+    def __init__(self, connection_handler: ConnectionHandler):
+        self._connection_handler = connection_handler
+
+
+class PerNodeDocument(Document):
+    """Previous resolution: Runtime.getProperties, then DOM.describeNode per match."""
+
+    async def _find_elements(self, by, value, raise_exc=True):
+        response = await self._execute_command(self._get_find_elements_command(by, value))
+        object_id = response['result']['result']['objectId']
+        properties = await self._execute_command(RuntimeCommands.get_properties(object_id))
+        elements = []
+        for prop in properties['result']['result']:
+            node_object_id = prop['value']['objectId']
+            attributes = await self._get_object_attributes(node_object_id)
+            elements.append(
+                create_web_element(node_object_id, self._connection_handler, by, value, attributes)
+            )
+        return elements
+
+
+async def measure(document: Document, server: FakeCDPServer, matches: int, runs: int) -> dict:
+    server.matches = matches
+    server.commands = 0
+    started = time.perf_counter()
+    for _ in range(runs):
+        elements = await document.find_or_wait_element(By.CSS_SELECTOR, '.card', find_all=True)
+        assert len(elements) == matches
+    return {
+        'ms_per_lookup': (time.perf_counter() - started) / runs * 1000,
+        'commands_per_lookup': server.commands / runs,
+    }
+
+
+async def main(latency: float, runs: int, sizes: list[int]):
+    server = FakeCDPServer(latency)
+    async with serve(server.handler, '127.0.0.1', 0) as websocket_server:
+        port = websocket_server.sockets[0].getsockname()[1]
+        connection = ConnectionHandler(port, page_id='benchmark')
+        print(f'latency {latency * 1000:.1f} ms per command, {runs} runs')
+        print(f'{"matches":>8} {"variant":>10} {"commands":>9} {"ms/lookup":>10}')
+        for matches in sizes:
+            for name, document in (
+                ('per-node', PerNodeDocument(connection)),
+                ('batched', Document(connection)),
+            ):
+                result = await measure(document, server, matches, runs)
+                print(
+                    f'{matches:>8} {name:>10} {result["commands_per_lookup"]:>9.0f} '
+                    f'{result["ms_per_lookup"]:>10.1f}'
+                )
+        await connection.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency', type=float, default=0.001, help='seconds per reply')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+    args = parser.parse_args()
+    asyncio.run(main(args.latency, args.runs, args.sizes))
@@ -0,0 +1,109 @@
+"""
+Compare Chromium launch profiles for headless crawling.
+
+Serves a synthetic page (text, images and a script) from a local server and
+crawls it with a fixed number of concurrent tabs for every profile, reporting
+pages per minute and resident memory per tab (Linux only, read from /proc).
+
+Usage:
+    python benchmarks/launch_profiles.py --pages 200 --tabs 8
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from aiohttp import web
+
+from pydoll.browser import Chrome
+from pydoll.browser.options import ChromiumOptions
+from pydoll.constants import PerformanceProfile
+
+PIXEL = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+    '1f15c4890000000d4944415478da63f8ffff3f0005fe02fea7d6a5d60000000049454e44ae426082'
+)
+
+
+def build_page(index: int) -> str:
+    images = ''.join(f'<img src="/img/{index}-{n}.png">' for n in range(20))
+    paragraphs = ''.join(f'<p>Paragraph {n} of page {index}</p>' for n in range(200))
+    return (
+        f'<html><head><title>Page {index}</title></head><body>{images}{paragraphs}'
+        '<script>for (let i = 0; i < 1e5; i++) { Math.sqrt(i); }</script></body></html>'
+    )
+
+
+async def start_server(port: int) -> web.AppRunner:
+    async def page(request):
+        return web.Response(
+            text=build_page(int(request.match_info['index'])), content_type='text/html'
+        )
+
+    async def image(request):
+        return web.Response(body=PIXEL, content_type='image/png')
+
+    app = web.Application()
+    app.router.add_get('/page/{index}', page)
+    app.router.add_get('/img/{name}', image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', port).start()
+    return runner
+
+
+async def run_profile(
+    profile: Optional[PerformanceProfile], pages: int, tabs: int, server_port: int
+) -> dict:
+    options = ChromiumOptions()
+    if profile is not None:
+        options.apply_performance_profile(profile)
+
+    async with Chrome(options=options) as browser:
+        first_tab = await browser.start(headless=True)
+        workers = [first_tab] + [await browser.new_tab() for _ in range(tabs - 1)]
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for index in range(pages):
+            queue.put_nowait(index)
+
+        async def crawl(tab):
+            while not queue.empty():
+                index = queue.get_nowait()
+                await tab.go_to(f'http://127.0.0.1:{server_port}/page/{index}')
+
+        started = time.perf_counter()
+        await asyncio.gather(*(crawl(tab) for tab in workers))
+        elapsed = time.perf_counter() - started
+        usage = browser.get_resource_usage()
+
+    return {
+        'profile': profile.value if profile is not None else 'default',
+        'pages_per_minute': pages / elapsed * 60,
+        'rss_per_tab_mb': usage.rss_bytes / tabs / 2**20 if usage else float('nan'),
+        'processes': usage.process_count if usage else 0,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--tabs', type=int, default=8)
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    runner = await start_server(args.port)
+    try:
+        print(f'{"profile":<16}{"pages/min":>12}{"MB/tab":>10}{"processes":>11}')
+        for profile in (None, *PerformanceProfile):
+            result = await run_profile(profile, args.pages, args.tabs, args.port)
+            print(
+                f'{result["profile"]:<16}{result["pages_per_minute"]:>12.1f}'
+                f'{result["rss_per_tab_mb"]:>10.1f}{result["processes"]:>11}'
+            )
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
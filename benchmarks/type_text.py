@@ -0,0 +1,84 @@
+"""
+Measure typing wall time against a fake CDP server.
+
+Starts a local WebSocket server acknowledging every command after a fixed
+latency and types the same text into a WebElement with awaited key events
+(one round trip per character on top of the typing plan) and with
+pipelined ones (replies collected at the end).
+
+Usage:
+    python benchmarks/type_text.py --latency 0.02 --length 200 --interval 0.01
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from websockets.asyncio.server import serve
+
+from pydoll.connection import ConnectionHandler
+from pydoll.elements.web_element import WebElement
+
+
+class FakeCDPServer:
+    """Acknowledges commands, answering the click preflight with a visible element."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.commands = 0
+
+    @staticmethod
+    def reply(message: dict) -> dict:
+        result = {}
+        if message['method'] == 'Runtime.callFunctionOn':
+            result = {
+                'result': {
+                    'type': 'object',
+                    'value': {'visible': True, 'x': 10, 'y': 10, 'covered_by': None},
+                }
+            }
+        return {'id': message['id'], 'result': result}
+
+    async def handler(self, websocket):
+        async def answer(message: dict):
+            await asyncio.sleep(self.latency)
+            await websocket.send(json.dumps(self.reply(message)))
+
+        tasks = set()
+        async for raw in websocket:
+            self.commands += 1
+            task = asyncio.create_task(answer(json.loads(raw)))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+
+async def main(latency: float, length: int, interval: float):
+    server = FakeCDPServer(latency)
+    text = ('lorem ipsum dolor sit amet ' * (length // 27 + 1))[:length]
+    async with serve(server.handler, '127.0.0.1', 0) as websocket_server:
+        port = websocket_server.sockets[0].getsockname()[1]
+        connection = ConnectionHandler(port, page_id='benchmark')
+        element = WebElement('textarea', connection, attributes_list=['tag_name', 'textarea'])
+        plan = length * interval
+        print(
+            f'{length} characters every {interval * 1000:.1f} ms (plan {plan:.2f} s), '
+            f'latency {latency * 1000:.1f} ms per command'
+        )
+        print(f'{"variant":>10} {"commands":>9} {"seconds":>8}')
+        for name, pipelined in (('awaited', False), ('pipelined', True)):
+            server.commands = 0
+            started = time.perf_counter()
+            await element.type_text(text, interval=interval, pipelined=pipelined)
+            elapsed = time.perf_counter() - started
+            print(f'{name:>10} {server.commands:>9} {elapsed:>8.2f}')
+        await connection.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency', type=float, default=0.01, help='seconds per reply')
+    parser.add_argument('--length', type=int, default=200, help='characters typed')
+    parser.add_argument('--interval', type=float, default=0.01, help='seconds between keys')
+    args = parser.parse_args()
+    asyncio.run(main(args.latency, args.length, args.interval))
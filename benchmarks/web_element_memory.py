@@ -0,0 +1,71 @@
+"""
+Measure the memory held by WebElement handles.
+
+Creates N handles with a typical attribute list, as find_elements does for
+a large result set, and reports the bytes allocated per handle with
+tracemalloc before and after reading an attribute of every handle. The
+previous layout (instance __dict__, attribute dictionary built in
+__init__) is replicated for comparison.
+
+Usage:
+    python benchmarks/web_element_memory.py --count 50000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from pydoll.elements.web_element import WebElement
+
+
+class EagerElement:
+    """Previous layout: per-instance __dict__ and attributes parsed upfront."""
+
+    def __init__(self, object_id, connection_handler, method, selector, attributes_list):
+        self._object_id = object_id
+        self._search_method = method
+        self._selector = selector
+        self._connection_handler = connection_handler
+        self._attributes = {}
+        for i in range(0, len(attributes_list), 2):
+            key = attributes_list[i]
+            self._attributes[key if key != 'class' else 'class_name'] = attributes_list[i + 1]
+
+    @property
+    def id(self):
+        return self._attributes.get('id')
+
+
+def measure(element_class, attribute_lists: list[list[str]]) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    elements = [
+        element_class(f'object-{i}', None, 'css', '.card', attributes)
+        for i, attributes in enumerate(attribute_lists)
+    ]
+    created, _ = tracemalloc.get_traced_memory()
+    for element in elements:
+        element.id
+    accessed, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return created / len(elements), accessed / len(elements)
+
+
+def main(count: int):
+    # lists are built outside the measurement, find_elements receives them from CDP
+    attribute_lists = [
+        ['class', f'card item-{i}', 'id', f'card-{i}', 'data-sku', str(i), 'tag_name', 'div']
+        for i in range(count)
+    ]
+    print(f'{count} handles, bytes per handle')
+    print(f'{"variant":>10} {"created":>9} {"accessed":>9}')
+    for name, element_class in (('eager', EagerElement), ('slotted', WebElement)):
+        created, accessed = measure(element_class, attribute_lists)
+        print(f'{name:>10} {created:>9.0f} {accessed:>9.0f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=50000)
+    args = parser.parse_args()
+    main(args.count)
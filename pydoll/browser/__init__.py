@@ -1,4 +1,5 @@
 from pydoll.browser.chromium.chrome import Chrome
 from pydoll.browser.chromium.edge import Edge
+from pydoll.browser.fleet import BrowserFleet, WorkerStats
 
-__all__ = ['Chrome', 'Edge']
+__all__ = ['BrowserFleet', 'Chrome', 'Edge', 'WorkerStats']
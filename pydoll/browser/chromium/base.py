@@ -1,16 +1,25 @@
 import asyncio
 import logging
+import math
+import time
 from abc import ABC, abstractmethod
+from contextlib import suppress
 from functools import partial
 from random import randint
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 
 from pydoll.browser.interfaces import BrowserOptionsManager
 from pydoll.browser.managers import (
+    BrowserOutputManager,
     BrowserProcessManager,
+    BrowserResourceMonitor,
+    BrowserResourceUsage,
     ProxyManager,
+    ResourceThresholds,
     TempDirectoryManager,
 )
+from pydoll.browser.network import RequestRule, RequestRuleSet
+from pydoll.browser.network.rules import skip_rule_matches
 
 if TYPE_CHECKING:
     from pydoll.browser.tab import Tab
@@ -31,7 +40,12 @@ from pydoll.constants import (
     RequestMethod,
     ResourceType,
 )
-from pydoll.exceptions import BrowserNotRunning, FailedToStartBrowser, NoValidTabFound
+from pydoll.exceptions import (
+    BrowserCrashed,
+    BrowserNotRunning,
+    FailedToStartBrowser,
+    NoValidTabFound,
+)
 from pydoll.protocol.base import Command, Response
 from pydoll.protocol.browser.responses import (
     GetVersionResponse,
@@ -43,6 +57,7 @@ from pydoll.protocol.fetch.events import FetchEvent
 from pydoll.protocol.fetch.types import HeaderEntry
 from pydoll.protocol.network.types import Cookie, CookieParam, RequestPausedEvent
 from pydoll.protocol.storage.responses import GetCookiesResponse
+from pydoll.protocol.target.events import TargetEvent
 from pydoll.protocol.target.responses import (
     CreateBrowserContextResponse,
     CreateTargetResponse,
@@ -85,8 +100,22 @@ class Browser(ABC):  # noqa: PLR0904
         self._proxy_manager = ProxyManager(self.options)
         self._connection_port = connection_port if connection_port else randint(9223, 9322)
         self._browser_process_manager = BrowserProcessManager()
+        self._browser_output_manager = BrowserOutputManager(
+            max_lines=self.options.output_buffer_size,
+            log_file=self.options.output_log_file,
+        )
         self._temp_directory_manager = TempDirectoryManager()
         self._connection_handler = ConnectionHandler(self._connection_port)
+        self._resource_monitor: Optional[BrowserResourceMonitor] = None
+        self._proxy_config: Optional[tuple[bool, tuple[Optional[str], Optional[str]]]] = None
+        self._lifecycle_lock = asyncio.Lock()
+        self._crash_watchdog_task: Optional[asyncio.Task] = None
+        self._crash_detected = asyncio.Event()
+        self._known_targets: dict[str, TargetInfo] = {}
+        self._fetch_events_enabled = False
+        self._request_rules: Optional[RequestRuleSet] = None
+        self._request_rules_callback_id: Optional[int] = None
+        self._connection_handler.register_disconnect_callback(self._crash_detected.set)
 
         # Store fingerprint manager reference if available
         self.fingerprint_manager = getattr(options_manager, 'fingerprint_manager', None)
@@ -126,15 +155,20 @@ class Browser(ABC):  # noqa: PLR0904
                 self.options.add_argument(headless_arg)
 
         self._setup_user_dir()
-        proxy_config = self._proxy_manager.get_proxy_credentials()
+        # credentials are stripped from the arguments on first start, keep them for restarts
+        if self._proxy_config is None:
+            self._proxy_config = self._proxy_manager.get_proxy_credentials()
+        proxy_config = self._proxy_config
 
-        self._browser_process_manager.start_browser_process(
+        process = self._browser_process_manager.start_browser_process(
             binary_location,
             self._connection_port,
             self.options.arguments,
         )
+        await self._browser_output_manager.attach(process)
         await self._verify_browser_running()
         await self._configure_proxy(proxy_config[0], proxy_config[1])
+        await self._restore_request_rules()
 
         # Import at runtime to avoid circular import
         from pydoll.browser.tab import Tab  # noqa: PLC0415
@@ -160,11 +194,148 @@ class Browser(ABC):  # noqa: PLR0904
         if not await self._is_browser_running():
             raise BrowserNotRunning()
 
+        await self.disable_resource_monitor()
+        await self.disable_crash_watchdog()
         await self._execute_command(BrowserCommands.close())
         self._browser_process_manager.stop_process()
+        await self._browser_output_manager.detach()
         self._temp_directory_manager.cleanup()
         await self._connection_handler.close()
 
+    async def restart(self) -> 'Tab':
+        """
+        Relaunch the browser process with the same options.
+
+        The current process is closed (or killed if unresponsive) and a new one
+        is started reusing the same arguments, user data directory and proxy
+        credentials. Tabs of the previous process become invalid.
+
+        Returns:
+            Initial tab of the new browser process.
+
+        Raises:
+            FailedToStartBrowser: If the new process fails to start or connect.
+        """
+        async with self._lifecycle_lock:
+            await self._shutdown_browser_process()
+            return await self.start()
+
+    async def enable_crash_watchdog(
+        self,
+        auto_restart: bool = False,
+        callback: Optional[Callable[[BrowserCrashed], Any]] = None,
+        poll_interval: float = 0.5,
+    ):
+        """
+        Detect browser crashes and optionally recover from them.
+
+        A crash is detected as soon as the browser output pipes close, the
+        browser-level WebSocket is lost or (as fallback) the process is seen
+        as exited. Pending commands of every tab then fail immediately with
+        BrowserCrashed instead of waiting for their timeout.
+
+        With auto_restart the browser is relaunched with the same options and
+        proxy credentials. Existing Tab objects are moved to new targets opened
+        at their last known URL, with fingerprint injection and previously
+        enabled event domains applied again, so they stay usable.
+
+        Args:
+            auto_restart: Relaunch the browser and restore tabs after a crash.
+            callback: Called with the BrowserCrashed error (sync or async).
+            poll_interval: Seconds between process liveness checks.
+
+        Raises:
+            BrowserNotRunning: If the browser process was not started.
+        """
+        if not self._browser_process_manager.is_process_alive():
+            raise BrowserNotRunning()
+
+        await self.disable_crash_watchdog()
+        await self._start_target_tracking()
+        self._crash_detected.clear()
+        self._crash_watchdog_task = asyncio.create_task(
+            self._watch_for_crash(auto_restart, callback, poll_interval)
+        )
+
+    async def disable_crash_watchdog(self):
+        """Stop watching the browser process for crashes."""
+        task = self._crash_watchdog_task
+        self._crash_watchdog_task = None
+        if task is None or task is asyncio.current_task():
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    async def enable_resource_monitor(
+        self,
+        thresholds: Optional[ResourceThresholds] = None,
+        interval: float = 5.0,
+        callback: Optional[Callable[[BrowserResourceUsage, list[str]], Any]] = None,
+        auto_restart: bool = False,
+    ) -> BrowserResourceMonitor:
+        """
+        Periodically sample resource usage of the browser process tree.
+
+        Args:
+            thresholds: Limits (RSS, renderer RSS, CPU time, threads, processes).
+            interval: Seconds between samples.
+            callback: Called with (usage, violations) when a limit is exceeded.
+            auto_restart: Restart the browser when a limit is exceeded.
+
+        Returns:
+            The running monitor (use last_usage or sample() to read values).
+
+        Raises:
+            UnsupportedOS: If the proc filesystem is not available (Linux only).
+        """
+        await self.disable_resource_monitor()
+        monitor = BrowserResourceMonitor(
+            self._browser_process_manager, thresholds=thresholds, interval=interval
+        )
+        if callback is not None:
+            monitor.on_threshold_exceeded(callback)
+        if auto_restart:
+            monitor.on_threshold_exceeded(self._restart_on_threshold_exceeded)
+
+        await monitor.start()
+        self._resource_monitor = monitor
+        return monitor
+
+    async def disable_resource_monitor(self):
+        """Stop periodic resource sampling."""
+        if self._resource_monitor is not None:
+            await self._resource_monitor.stop()
+            self._resource_monitor = None
+
+    def get_resource_usage(self) -> Optional[BrowserResourceUsage]:
+        """
+        Sample current resource usage of the browser process tree.
+
+        Returns:
+            Usage of the browser and every child process, None if not running.
+
+        Raises:
+            UnsupportedOS: If the proc filesystem is not available (Linux only).
+        """
+        monitor = self._resource_monitor or BrowserResourceMonitor(self._browser_process_manager)
+        return monitor.sample()
+
+    def get_recent_output(
+        self, limit: Optional[int] = None, stream: Optional[str] = None
+    ) -> list[str]:
+        """
+        Get recent browser stdout/stderr lines (useful for crash diagnostics).
+
+        Args:
+            limit: Maximum number of lines to return (all buffered lines if None).
+            stream: Restrict to 'stdout' or 'stderr' (both if None).
+
+        Returns:
+            Buffered output lines, oldest first.
+        """
+        return self._browser_output_manager.get_recent_lines(limit, stream)
+
     async def create_browser_context(
         self, proxy_server: Optional[str] = None, proxy_bypass_list: Optional[str] = None
     ) -> str:
@@ -408,8 +579,17 @@ class Browser(ABC):  # noqa: PLR0904
             Callback ID for removal.
 
         Note:
-            For page-specific events, use Tab.on() instead.
+            For page-specific events, use Tab.on() instead. Fetch.requestPaused
+            callbacks never see requests that active request rules answer.
         """
+        if event_name == FetchEvent.REQUEST_PAUSED:
+            callback = skip_rule_matches(callback, lambda: self._request_rules)
+        return await self._register_callback(event_name, callback, temporary)
+
+    async def _register_callback(
+        self, event_name: str, callback: Callable[[Any], Any], temporary: bool = False
+    ) -> int:
+        """Register an event callback as is, async callbacks run in background tasks."""
 
         async def callback_wrapper(event):
             asyncio.create_task(callback(event))
@@ -440,16 +620,71 @@ class Browser(ABC):  # noqa: PLR0904
         Note:
             Paused requests must be continued or they will timeout.
         """
-        return await self._connection_handler.execute_command(
+        response = await self._connection_handler.execute_command(
             FetchCommands.enable(
                 handle_auth_requests=handle_auth_requests,
                 resource_type=resource_type,
             )
         )
+        self._fetch_events_enabled = True
+        return response
 
     async def disable_fetch_events(self):
-        """Disable request interception and release any paused requests."""
-        return await self._connection_handler.execute_command(FetchCommands.disable())
+        """Disable request interception and release paused requests (request rules stay on)."""
+        response = await self._connection_handler.execute_command(FetchCommands.disable())
+        self._fetch_events_enabled = False
+        if self._request_rules is not None:
+            await self._connection_handler.execute_command(
+                FetchCommands.enable(
+                    handle_auth_requests=False, patterns=self._request_rules.request_patterns()
+                )
+            )
+        return response
+
+    @property
+    def request_rules(self) -> Optional[RequestRuleSet]:
+        """Active browser-level request rules, None unless enabled."""
+        return self._request_rules
+
+    async def enable_request_rules(self, rules: list[RequestRule]) -> RequestRuleSet:
+        """
+        Block, allow or rewrite requests of all pages with declarative rules.
+
+        Rules are compiled into a single matcher and Fetch.enable is narrowed
+        to the patterns block and rewrite rules can match. While your own
+        fetch events are enabled, requests no rule matches are left to your
+        handlers.
+
+        Args:
+            rules: Rules in priority order, the first matching rule wins.
+
+        Returns:
+            The compiled rule set with per-rule hit counters.
+        """
+        await self.disable_request_rules()
+        rule_set = RequestRuleSet(rules)
+        self._request_rules = rule_set
+        self._request_rules_callback_id = await self._register_callback(
+            FetchEvent.REQUEST_PAUSED, self._apply_request_rules
+        )
+        if not self._fetch_events_enabled:
+            await self._connection_handler.execute_command(
+                FetchCommands.enable(
+                    handle_auth_requests=False, patterns=rule_set.request_patterns()
+                )
+            )
+        return rule_set
+
+    async def disable_request_rules(self):
+        """Stop applying browser-level request rules."""
+        if self._request_rules is None:
+            return
+        if self._request_rules_callback_id is not None:
+            await self._connection_handler.remove_callback(self._request_rules_callback_id)
+        self._request_rules = None
+        self._request_rules_callback_id = None
+        if not self._fetch_events_enabled:
+            await self._connection_handler.execute_command(FetchCommands.disable())
 
     async def enable_runtime_events(self):
         """Enable runtime events."""
@@ -505,12 +740,180 @@ class Browser(ABC):  # noqa: PLR0904
             )
         )
 
+    async def _restart_on_threshold_exceeded(
+        self, usage: BrowserResourceUsage, violations: list[str]
+    ):
+        """Resource monitor callback that recycles the browser."""
+        logger.warning(f'Restarting browser {usage.pid}: {", ".join(violations)}')
+        await self.restart()
+
+    async def _watch_for_crash(
+        self,
+        auto_restart: bool,
+        callback: Optional[Callable[[BrowserCrashed], Any]],
+        poll_interval: float,
+    ):
+        """Watchdog loop: wait for a crash, then fail pending work and recover."""
+        while True:
+            await self._wait_for_crash_signal(poll_interval)
+
+            if self._lifecycle_lock.locked():
+                # intentional restart in progress, watch the new process afterwards
+                async with self._lifecycle_lock:
+                    pass
+                self._crash_detected.clear()
+                await self._start_target_tracking()
+                continue
+
+            error = BrowserCrashed(self._describe_crash())
+            logger.error(str(error))
+            tabs = self._get_page_tabs()
+            for tab in tabs:
+                tab._connection_handler.fail_pending_commands(error)
+            self._connection_handler.fail_pending_commands(error)
+
+            if auto_restart:
+                try:
+                    await self._recover_from_crash(tabs)
+                except Exception as exc:
+                    logger.error(f'Failed to recover from browser crash: {exc}')
+                    auto_restart = False
+
+            if callback is not None:
+                try:
+                    result = callback(error)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception as exc:
+                    logger.error(f'Error in crash callback: {exc}')
+
+            if not auto_restart:
+                self._crash_watchdog_task = None
+                return
+            self._crash_detected.clear()
+
+    async def _wait_for_crash_signal(self, poll_interval: float):
+        """Return once the process exited, its output closed or its socket was lost."""
+        waiters = {asyncio.create_task(self._crash_detected.wait())}
+        if self._browser_output_manager.is_attached:
+            waiters.add(asyncio.create_task(self._browser_output_manager.wait_closed()))
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    waiters, timeout=poll_interval, return_when=asyncio.FIRST_COMPLETED
+                )
+                if done or not self._browser_process_manager.is_process_alive():
+                    return
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    def _describe_crash(self) -> str:
+        """Build crash message including exit code and recent browser output."""
+        exit_code = self._browser_process_manager.get_exit_code()
+        output = '\n'.join(self._browser_output_manager.get_recent_lines(limit=20))
+        return f'Browser process crashed (exit code: {exit_code})\n{output}'.rstrip()
+
+    def _get_page_tabs(self) -> list['Tab']:
+        """Get Tab instances of this browser that point at known page targets."""
+        # Import at runtime to avoid circular import
+        from pydoll.browser.tab import Tab  # noqa: PLC0415
+
+        return [
+            tab
+            for target_id, tab in Tab.get_all_instances().items()
+            if tab._browser is self and self._known_targets.get(target_id, {}).get('type') == 'page'
+        ]
+
+    async def _recover_from_crash(self, tabs: list['Tab']):
+        """Relaunch the browser and move existing tabs to new targets at their last URL."""
+        urls = {tab._target_id: self._known_targets[tab._target_id].get('url', '') for tab in tabs}
+        initial_tab: Optional['Tab'] = await self.restart()
+        await self._start_target_tracking()
+        contexts: dict[Optional[str], Optional[str]] = {None: None}
+
+        for tab in tabs:
+            url = urls[tab._target_id]
+            old_context_id = tab._browser_context_id
+            if old_context_id not in contexts:
+                contexts[old_context_id] = await self.create_browser_context()
+            context_id = contexts[old_context_id]
+
+            if initial_tab is not None and context_id is None:
+                target_id = initial_tab._target_id
+                await initial_tab._connection_handler.close()
+                initial_tab = None
+            else:
+                response: CreateTargetResponse = await self._execute_command(
+                    TargetCommands.create_target(url='about:blank', browser_context_id=context_id)
+                )
+                target_id = response['result']['targetId']
+
+            await tab._attach_to_target(target_id, context_id)
+            await self._setup_fingerprint_for_tab(tab)
+            if url and url != 'about:blank':
+                await tab._execute_command(PageCommands.navigate(url))
+
+    async def _start_target_tracking(self):
+        """Keep last known info (type, URL) of every target via target discovery."""
+        self._known_targets = {target['targetId']: target for target in await self.get_targets()}
+        await self.on(TargetEvent.TARGET_CREATED, self._update_known_target)
+        await self.on(TargetEvent.TARGET_INFO_CHANGED, self._update_known_target)
+        await self.on(TargetEvent.TARGET_DESTROYED, self._remove_known_target)
+        await self._execute_command(TargetCommands.set_discover_targets(True))
+
+    def _update_known_target(self, event: dict):
+        """Store target info from targetCreated/targetInfoChanged events."""
+        target_info = event['params']['targetInfo']
+        self._known_targets[target_info['targetId']] = target_info
+
+    def _remove_known_target(self, event: dict):
+        """Forget target on targetDestroyed event."""
+        self._known_targets.pop(event['params']['targetId'], None)
+
+    async def _shutdown_browser_process(self):
+        """Close the browser process without removing its user data directory."""
+        if await self._connection_handler.ping():
+            with suppress(Exception):
+                await self._execute_command(BrowserCommands.close(), timeout=5)
+        self._browser_process_manager.stop_process()
+        await self._browser_output_manager.detach()
+        await self._connection_handler.close()
+        # closing the connection dropped every callback and the new process starts without Fetch
+        self._fetch_events_enabled = False
+        self._request_rules_callback_id = None
+
+    async def _restore_request_rules(self):
+        """Apply request rules enabled before a restart to the new browser process."""
+        if self._request_rules is None or self._request_rules_callback_id is not None:
+            return
+        self._request_rules_callback_id = await self._register_callback(
+            FetchEvent.REQUEST_PAUSED, self._apply_request_rules
+        )
+        if not self._fetch_events_enabled:
+            await self._connection_handler.execute_command(
+                FetchCommands.enable(
+                    handle_auth_requests=False,
+                    patterns=self._request_rules.request_patterns(),
+                )
+            )
+
     @staticmethod
     def _validate_connection_port(connection_port: Optional[int]):
         """Validate connection port."""
         if connection_port and connection_port < 0:
             raise ValueError('Connection port must be a positive integer')
 
+    async def _apply_request_rules(self, event: RequestPausedEvent):
+        """Answer a paused request according to the active request rules."""
+        if self._request_rules is None:
+            return
+        command = self._request_rules.resolve(
+            event, continue_unmatched=not self._fetch_events_enabled
+        )
+        if command is not None:
+            await self._execute_command(command)
+
     async def _continue_request_callback(self, event: RequestPausedEvent):
         """Internal callback to continue paused requests."""
         request_id = event['params']['requestId']
@@ -539,10 +942,25 @@ class Browser(ABC):  # noqa: PLR0904
         """
         Verify browser started successfully.
 
+        Waits for the DevTools banner on the browser output when available so
+        that an early process exit fails immediately instead of after the
+        full start timeout. Time spent waiting for the banner counts towards
+        start_timeout.
+
         Raises:
             FailedToStartBrowser: If the browser failed to start.
         """
-        if not await self._is_browser_running(self.options.start_timeout):
+        deadline = time.monotonic() + self.options.start_timeout
+        if self._browser_output_manager.is_attached:
+            await self._browser_output_manager.wait_for_line(
+                'DevTools listening on', timeout=self.options.start_timeout
+            )
+            if self._browser_output_manager.closed:
+                output = '\n'.join(self._browser_output_manager.get_recent_lines(limit=20))
+                raise FailedToStartBrowser(f'Browser process exited during startup:\n{output}')
+
+        remaining = max(1, math.ceil(deadline - time.monotonic()))
+        if not await self._is_browser_running(remaining):
             raise FailedToStartBrowser()
 
     async def _configure_proxy(
@@ -0,0 +1,617 @@
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterable, Optional
+
+from pydoll.browser.chromium.chrome import Chrome
+from pydoll.exceptions import (
+    FailedToStartBrowser,
+    FleetJobFailed,
+    FleetNotRunning,
+    FleetWorkerDied,
+)
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from pydoll.browser.chromium.base import Browser
+    from pydoll.browser.tab import Tab
+
+logger = logging.getLogger(__name__)
+
+FleetJob = Callable[..., Awaitable[Any]]
+
+_TERMINAL_STATES = {'stopped', 'failed', 'dead'}
+
+
+@dataclass
+class WorkerStats:
+    """Counters of a single fleet worker process."""
+
+    worker_id: int
+    pid: Optional[int] = None
+    state: str = 'starting'
+    jobs_completed: int = 0
+    jobs_failed: int = 0
+    running: int = 0
+    busy_time: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class _WorkerConfig:
+    """Picklable settings shipped to every worker process."""
+
+    browser_factory: Callable[..., 'Browser']
+    browsers_per_worker: int
+    headless: bool
+    base_port: Optional[int]
+    recycle_after: Optional[int]
+    poll_interval: float
+
+
+class BrowserFleet:
+    """
+    Runs browsers in a pool of worker processes.
+
+    A single event loop saturates one CPU core long before a machine runs
+    out of memory for browsers. The fleet starts several worker processes,
+    each with its own event loop and browsers, and feeds them jobs from a
+    shared queue so that busy workers never hold back idle ones.
+
+    Jobs are async functions called as ``await job(tab, *args, **kwargs)``
+    inside a worker. They, their arguments and their return values must be
+    picklable, so jobs are usually module level functions.
+
+    Example:
+        ```python
+        async def get_title(tab, url):
+            await tab.go_to(url)
+            return await tab.execute_script('return document.title')
+
+
+        async with BrowserFleet(workers=4) as fleet:
+            async for title in fleet.map(get_title, urls):
+                print(title)
+        ```
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        workers: Optional[int] = None,
+        browsers_per_worker: int = 1,
+        browser_factory: Callable[..., 'Browser'] = Chrome,
+        headless: bool = True,
+        base_port: Optional[int] = 9400,
+        recycle_after: Optional[int] = None,
+        start_method: str = 'spawn',
+        poll_interval: float = 0.5,
+        grace_period: float = 5.0,
+    ):
+        """
+        Initialize browser fleet.
+
+        Args:
+            workers: Number of worker processes (CPU count if None).
+            browsers_per_worker: Browsers started by each worker, each one
+                processes jobs concurrently with its own tab.
+            browser_factory: Picklable callable receiving connection_port and
+                returning a browser, e.g. ``functools.partial(Chrome, options)``.
+            headless: Start browsers in headless mode.
+            base_port: First CDP port, every browser gets its own port from
+                there on (random ports if None, which may collide).
+            recycle_after: Restart a browser after it completed this many jobs.
+            start_method: Multiprocessing start method for worker processes.
+            poll_interval: Seconds between liveness checks of worker processes.
+            grace_period: Seconds terminate() gives workers to stop their
+                browsers before killing them along with their child processes.
+        """
+        self._worker_count = workers or os.cpu_count() or 1
+        self._config = _WorkerConfig(
+            browser_factory=browser_factory,
+            browsers_per_worker=browsers_per_worker,
+            headless=headless,
+            base_port=base_port,
+            recycle_after=recycle_after,
+            poll_interval=poll_interval,
+        )
+        self._start_method = start_method
+        self._poll_interval = poll_interval
+        self._grace_period = grace_period
+        self._job_ids = itertools.count(1)
+        self._accepting = False
+        self._processes: dict[int, 'BaseProcess'] = {}
+        self._workers: dict[int, WorkerStats] = {}
+        self._futures: dict[int, asyncio.Future] = {}
+        self._running_jobs: dict[int, set[int]] = {}
+        self._job_queue: Any = None
+        self._result_queue: Any = None
+        self._stop_event: Any = None
+        self._held_jobs: Any = None
+        self._dispatcher_task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+
+    async def __aenter__(self) -> 'BrowserFleet':
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        if exc_type is None:
+            await self.drain()
+        else:
+            await self.terminate()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the fleet accepts new jobs."""
+        return self._accepting
+
+    @property
+    def pending_jobs(self) -> int:
+        """Number of submitted jobs that have not finished yet."""
+        return len(self._futures)
+
+    @property
+    def stats(self) -> list[WorkerStats]:
+        """Snapshot of per-worker counters."""
+        return [replace(stats) for stats in self._workers.values()]
+
+    async def start(self, timeout: float = 60.0):
+        """
+        Start worker processes and wait until their browsers are up.
+
+        Args:
+            timeout: Maximum seconds to wait for workers to become ready.
+
+        Raises:
+            FailedToStartBrowser: If no worker managed to start its browsers.
+        """
+        if self._dispatcher_task is not None:
+            return
+
+        context = multiprocessing.get_context(self._start_method)
+        self._job_queue = context.Queue()
+        self._result_queue = context.Queue()
+        self._stop_event = context.Event()
+        # job taken by every consumer, written right after dequeuing so that it
+        # survives a worker dying before its 'started' message is flushed
+        self._held_jobs = context.RawArray(
+            'q', self._worker_count * self._config.browsers_per_worker
+        )
+        self._ready.clear()
+        for worker_id in range(self._worker_count):
+            process = context.Process(
+                target=_worker_main,
+                args=(
+                    worker_id,
+                    self._config,
+                    self._job_queue,
+                    self._result_queue,
+                    self._stop_event,
+                    self._held_jobs,
+                ),
+                name=f'pydoll-fleet-{worker_id}',
+                daemon=True,
+            )
+            process.start()
+            self._processes[worker_id] = process
+            self._workers[worker_id] = WorkerStats(worker_id=worker_id, pid=process.pid)
+            self._running_jobs[worker_id] = set()
+
+        self._dispatcher_task = asyncio.create_task(self._dispatch())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            await self.terminate()
+            raise FailedToStartBrowser(f'Fleet workers did not start within {timeout}s')
+
+        if not any(stats.state == 'ready' for stats in self._workers.values()):
+            errors = '; '.join(
+                f'worker {stats.worker_id}: {stats.error or stats.state}'
+                for stats in self._workers.values()
+            )
+            await self.terminate()
+            raise FailedToStartBrowser(f'No fleet worker could start its browsers ({errors})')
+
+        self._accepting = True
+
+    def submit(self, job: FleetJob, *args, **kwargs) -> asyncio.Future:
+        """
+        Queue a job for the next free browser.
+
+        Args:
+            job: Async function called as ``job(tab, *args, **kwargs)``.
+            *args: Positional arguments for the job.
+            **kwargs: Keyword arguments for the job.
+
+        Returns:
+            Future resolved with the job's return value.
+
+        Raises:
+            FleetNotRunning: If the fleet is not started or is draining.
+        """
+        if not self._accepting:
+            raise FleetNotRunning()
+
+        # pickled here so that unpicklable jobs fail loudly instead of in the queue feeder
+        payload = pickle.dumps((job, args, kwargs))
+        job_id = next(self._job_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._futures[job_id] = future
+        self._job_queue.put((job_id, payload))
+        return future
+
+    async def map(
+        self, job: FleetJob, items: Iterable[Any], return_exceptions: bool = False
+    ) -> AsyncIterator[Any]:
+        """
+        Run a job for every item and stream results as they complete.
+
+        Args:
+            job: Async function called as ``job(tab, item)``.
+            items: Arguments, one job per item.
+            return_exceptions: Yield job exceptions instead of raising them.
+
+        Yields:
+            Job results in completion order.
+        """
+        futures = [self.submit(job, item) for item in items]
+        for future in asyncio.as_completed(futures):
+            try:
+                yield await future
+            except (FleetJobFailed, FleetWorkerDied) as exc:
+                if not return_exceptions:
+                    raise
+                yield exc
+
+    async def drain(self, timeout: Optional[float] = None):
+        """
+        Stop accepting jobs, finish queued ones and shut workers down.
+
+        Args:
+            timeout: Maximum seconds to wait before terminating workers.
+        """
+        if self._dispatcher_task is None:
+            return
+
+        self._accepting = False
+        for _ in range(self._worker_count * self._config.browsers_per_worker):
+            self._job_queue.put(None)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(self._dispatcher_task), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f'Fleet did not drain within {timeout}s, terminating workers')
+            await self.terminate()
+            return
+        await self._cleanup()
+
+    async def terminate(self):
+        """
+        Stop workers without finishing queued jobs, failing unfinished ones.
+
+        Workers cancel their running jobs and stop their browsers. Workers
+        still alive after the grace period are killed together with their
+        child processes, so that no browser outlives the fleet.
+        """
+        if self._dispatcher_task is None:
+            return
+
+        self._accepting = False
+        self._stop_event.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._dispatcher_task), self._grace_period)
+        except asyncio.TimeoutError:
+            logger.warning(f'Fleet workers did not stop within {self._grace_period}s, killing them')
+            for process in self._processes.values():
+                if process.is_alive():
+                    _kill_process_group(process)
+            await self._dispatcher_task
+        await self._cleanup()
+
+    async def _cleanup(self):
+        """Join worker processes and release queues."""
+        for process in self._processes.values():
+            await asyncio.to_thread(process.join)
+        # sentinels left by dead workers must not block interpreter exit
+        self._job_queue.cancel_join_thread()
+        self._job_queue.close()
+        self._result_queue.close()
+        self._dispatcher_task = None
+        self._processes = {}
+
+    async def _dispatch(self):
+        """Route worker messages until every worker is gone."""
+        loop = asyncio.get_running_loop()
+        while not self._all_workers_gone():
+            message, dead_workers = await loop.run_in_executor(None, self._poll_message)
+            if message is not None:
+                self._handle_message(*message)
+                continue
+            for worker_id in dead_workers:
+                if self._workers[worker_id].state not in _TERMINAL_STATES:
+                    self._handle_worker_death(worker_id)
+
+        self._accepting = False
+        self._ready.set()
+        self._fail_pending_jobs(FleetWorkerDied('No fleet worker left to run the job'))
+
+    def _poll_message(self) -> tuple[Optional[tuple], list[int]]:
+        """
+        Wait for one worker message.
+
+        Dead workers are collected before waiting: a worker's messages are
+        flushed before it exits, so a worker found dead before an empty wait
+        has nothing left in the queue.
+        """
+        dead_workers = [
+            worker_id for worker_id, process in self._processes.items() if not process.is_alive()
+        ]
+        try:
+            return self._result_queue.get(timeout=self._poll_interval), []
+        except queue.Empty:
+            return None, dead_workers
+
+    def _handle_message(self, kind: str, worker_id: int, payload: Any):
+        """Update worker state and resolve job futures."""
+        stats = self._workers[worker_id]
+        if kind == 'ready':
+            stats.state = 'ready'
+            stats.pid = payload
+        elif kind == 'failed':
+            stats.state = 'failed'
+            stats.error = payload
+            logger.error(f'Fleet worker {worker_id} failed to start: {payload}')
+        elif kind == 'started':
+            stats.running += 1
+            self._running_jobs[worker_id].add(payload)
+        elif kind == 'result':
+            self._handle_result(stats, *payload)
+        elif kind == 'stopped':
+            stats.state = 'stopped'
+
+        if not any(stats.state == 'starting' for stats in self._workers.values()):
+            self._ready.set()
+
+    def _handle_result(
+        self,
+        stats: WorkerStats,
+        job_id: int,
+        value: Optional[bytes],
+        error: Optional[str],
+        duration: float,
+    ):
+        """Resolve the future of a finished job."""
+        stats.running -= 1
+        stats.busy_time += duration
+        self._running_jobs[stats.worker_id].discard(job_id)
+
+        result = None
+        if error is None:
+            try:
+                result = pickle.loads(value)
+            except Exception as exc:
+                error = f'{type(exc).__name__}: {exc}'
+
+        future = self._futures.pop(job_id, None)
+        if error is not None:
+            stats.jobs_failed += 1
+            self._set_exception(
+                future, FleetJobFailed(f'Job {job_id} failed on worker {stats.worker_id}: {error}')
+            )
+            return
+
+        stats.jobs_completed += 1
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    def _handle_worker_death(self, worker_id: int):
+        """Fail jobs held by a worker that exited unexpectedly."""
+        stats = self._workers[worker_id]
+        process = self._processes[worker_id]
+        exit_code = process.exitcode
+        stats.state = 'dead'
+        stats.error = f'exit code {exit_code}'
+        logger.error(f'Fleet worker {worker_id} died with exit code {exit_code}')
+        # browsers of a crashed worker would otherwise keep running
+        _kill_process_group(process)
+
+        # jobs whose results were already received are no longer in _futures
+        job_ids = self._running_jobs[worker_id] | set(self._jobs_held_by(worker_id))
+        for job_id in job_ids:
+            future = self._futures.pop(job_id, None)
+            if future is None:
+                continue
+            stats.jobs_failed += 1
+            self._set_exception(
+                future, FleetWorkerDied(f'Worker {worker_id} died with exit code {exit_code}')
+            )
+        self._running_jobs[worker_id].clear()
+        stats.running = 0
+
+    def _jobs_held_by(self, worker_id: int) -> list[int]:
+        """Jobs last dequeued by the consumers of a worker."""
+        first = worker_id * self._config.browsers_per_worker
+        held = self._held_jobs[first : first + self._config.browsers_per_worker]
+        return [job_id for job_id in held if job_id]
+
+    def _fail_pending_jobs(self, exception: Exception):
+        """Fail every job that is still waiting for a result."""
+        for future in self._futures.values():
+            self._set_exception(future, exception)
+        self._futures.clear()
+
+    def _all_workers_gone(self) -> bool:
+        return all(stats.state in _TERMINAL_STATES for stats in self._workers.values())
+
+    @staticmethod
+    def _set_exception(future: Optional[asyncio.Future], exception: Exception):
+        if future is None or future.done():
+            return
+        future.set_exception(exception)
+        # results of map() are often abandoned early, don't log them as never retrieved
+        future.exception()
+
+
+def _kill_process_group(process: 'BaseProcess'):
+    """Kill a worker process and the browsers it started."""
+    if hasattr(os, 'killpg') and process.pid is not None:
+        with suppress(ProcessLookupError, PermissionError):
+            os.killpg(process.pid, signal.SIGKILL)
+    elif process.is_alive():
+        process.kill()
+
+
+def _worker_main(  # noqa: PLR0913, PLR0917
+    worker_id: int,
+    config: _WorkerConfig,
+    job_queue: Any,
+    result_queue: Any,
+    stop_event: Any,
+    held_jobs: Any,
+):
+    """Entry point of a worker process."""
+    if hasattr(os, 'setsid'):
+        # own process group, inherited by browsers, so they can be killed with the worker
+        os.setsid()
+    asyncio.run(_run_worker(worker_id, config, job_queue, result_queue, stop_event, held_jobs))
+
+
+async def _run_worker(  # noqa: PLR0913, PLR0917
+    worker_id: int,
+    config: _WorkerConfig,
+    job_queue: Any,
+    result_queue: Any,
+    stop_event: Any,
+    held_jobs: Any,
+):
+    """
+    Start browsers, run jobs until a stop sentinel arrives for each of them.
+
+    Setting the stop event cancels running jobs and stops the browsers.
+    """
+    browsers: list['Browser'] = []
+    tabs: list['Tab'] = []
+    try:
+        for index in range(config.browsers_per_worker):
+            port = None
+            if config.base_port is not None:
+                port = config.base_port + worker_id * config.browsers_per_worker + index
+            browser = config.browser_factory(connection_port=port)
+            browsers.append(browser)
+            tabs.append(await browser.start(headless=config.headless))
+    except Exception as exc:
+        result_queue.put(('failed', worker_id, f'{type(exc).__name__}: {exc}'))
+        await _stop_browsers(browsers)
+        return
+
+    result_queue.put(('ready', worker_id, os.getpid()))
+    with ThreadPoolExecutor(max_workers=len(browsers)) as executor:
+        consumers = [
+            asyncio.create_task(
+                _consume_jobs(
+                    _JobSource(
+                        job_queue,
+                        stop_event,
+                        held_jobs,
+                        worker_id * config.browsers_per_worker + index,
+                        config.poll_interval,
+                    ),
+                    worker_id,
+                    config,
+                    browser,
+                    tab,
+                    result_queue,
+                    executor,
+                )
+            )
+            for index, (browser, tab) in enumerate(zip(browsers, tabs))
+        ]
+        pending = set(consumers)
+        while pending and not stop_event.is_set():
+            _, pending = await asyncio.wait(pending, timeout=config.poll_interval)
+        for consumer in pending:
+            consumer.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+    await _stop_browsers(browsers)
+    result_queue.put(('stopped', worker_id, None))
+
+
+@dataclass
+class _JobSource:
+    """Job queue end of one consumer, recording the job it dequeued last."""
+
+    job_queue: Any
+    stop_event: Any
+    held_jobs: Any
+    slot: int
+    poll_interval: float
+
+    def take(self) -> Optional[tuple[int, bytes]]:
+        """Block until a job or a stop sentinel arrives, None once stopped."""
+        while not self.stop_event.is_set():
+            try:
+                job = self.job_queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                continue
+            if job is not None:
+                self.held_jobs[self.slot] = job[0]
+            return job
+        return None
+
+
+async def _consume_jobs(  # noqa: PLR0913, PLR0917
+    source: _JobSource,
+    worker_id: int,
+    config: _WorkerConfig,
+    browser: 'Browser',
+    tab: 'Tab',
+    result_queue: Any,
+    executor: ThreadPoolExecutor,
+):
+    """Run jobs on one browser."""
+    loop = asyncio.get_running_loop()
+    completed = 0
+    while True:
+        job = await loop.run_in_executor(executor, source.take)
+        if job is None:
+            return
+
+        job_id, payload = job
+        result_queue.put(('started', worker_id, job_id))
+        started = time.monotonic()
+        value, error = None, None
+        try:
+            function, args, kwargs = pickle.loads(payload)
+            value = pickle.dumps(await function(tab, *args, **kwargs))
+        except Exception as exc:
+            error = f'{type(exc).__name__}: {exc}'
+        result_queue.put(('result', worker_id, (job_id, value, error, time.monotonic() - started)))
+
+        completed += 1
+        if config.recycle_after and completed % config.recycle_after == 0:
+            try:
+                tab = await browser.restart()
+            except Exception as exc:
+                logger.error(f'Fleet worker {worker_id} failed to recycle browser: {exc}')
+                return
+
+
+async def _stop_browsers(browsers: list['Browser']):
+    """Stop browsers, ignoring ones that fail to stop."""
+    for browser in browsers:
+        try:
+            await browser.stop()
+        except Exception as exc:
+            logger.debug(f'Error stopping fleet browser: {exc}')
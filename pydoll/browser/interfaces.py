@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class Options(ABC):
@@ -17,6 +18,14 @@ class Options(ABC):
     def start_timeout(self) -> int:
         pass
 
+    @property
+    def output_buffer_size(self) -> int:
+        return 1000
+
+    @property
+    def output_log_file(self) -> Optional[str]:
+        return None
+
     @abstractmethod
     def add_argument(self, argument: str):
         pass
@@ -1,15 +1,27 @@
 from pydoll.browser.managers.browser_options_manager import (
     ChromiumOptionsManager,
 )
+from pydoll.browser.managers.browser_output_manager import BrowserOutputManager
 from pydoll.browser.managers.browser_process_manager import (
     BrowserProcessManager,
 )
 from pydoll.browser.managers.proxy_manager import ProxyManager
+from pydoll.browser.managers.resource_monitor import (
+    BrowserResourceMonitor,
+    BrowserResourceUsage,
+    ProcessUsage,
+    ResourceThresholds,
+)
 from pydoll.browser.managers.temp_dir_manager import TempDirectoryManager
 
 __all__ = [
     'ChromiumOptionsManager',
+    'BrowserOutputManager',
     'BrowserProcessManager',
     'ProxyManager',
+    'BrowserResourceMonitor',
+    'BrowserResourceUsage',
+    'ProcessUsage',
+    'ResourceThresholds',
     'TempDirectoryManager',
 ]
@@ -0,0 +1,187 @@
+import asyncio
+import io
+import logging
+import subprocess
+from collections import deque
+from typing import IO, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserOutputManager:
+    """
+    Drains browser stdout/stderr into a bounded in-memory ring buffer.
+
+    Chromium writes logs to its standard streams. When they are pipes that
+    nobody reads, the OS pipe buffer fills up and the browser blocks on write.
+    This manager attaches async readers to both pipes, keeps the most recent
+    lines for diagnostics and optionally mirrors everything to a log file.
+    """
+
+    def __init__(self, max_lines: int = 1000, log_file: Optional[str] = None):
+        """
+        Initialize browser output manager.
+
+        Args:
+            max_lines: Maximum number of lines kept in memory (oldest dropped first).
+            log_file: Optional file path that receives a copy of every line.
+        """
+        self._lines: deque[tuple[str, str]] = deque(maxlen=max_lines)
+        self._log_file_path = log_file
+        self._log_file: Optional[IO[str]] = None
+        self._transports: list[asyncio.BaseTransport] = []
+        self._reader_tasks: list[asyncio.Task] = []
+        self._line_waiters: list[tuple[str, asyncio.Future]] = []
+        self._closed = asyncio.Event()
+
+    @property
+    def is_attached(self) -> bool:
+        """Whether readers are currently attached to a browser process."""
+        return bool(self._reader_tasks)
+
+    @property
+    def closed(self) -> bool:
+        """Whether all attached streams reached EOF (usually means the process exited)."""
+        return self._closed.is_set()
+
+    async def attach(self, process: Optional[subprocess.Popen]):
+        """
+        Start draining stdout and stderr of the given process.
+
+        Streams that are not real pipes (e.g. from custom process creators)
+        are ignored.
+
+        Args:
+            process: Browser process created with stdout/stderr pipes.
+        """
+        await self.detach()
+        self._closed.clear()
+        loop = asyncio.get_running_loop()
+
+        if self._log_file_path:
+            self._log_file = open(self._log_file_path, 'a', encoding='utf-8')
+
+        for name in ('stdout', 'stderr'):
+            stream = getattr(process, name, None)
+            if not isinstance(stream, io.IOBase):
+                continue
+
+            reader = asyncio.StreamReader()
+            try:
+                transport, _ = await loop.connect_read_pipe(
+                    lambda reader=reader: asyncio.StreamReaderProtocol(reader), stream
+                )
+            except (NotImplementedError, OSError, ValueError) as exc:
+                logger.debug(f'Cannot attach reader to browser {name}: {exc}')
+                continue
+
+            self._transports.append(transport)
+            self._reader_tasks.append(asyncio.create_task(self._drain(name, reader)))
+
+        if not self._reader_tasks:
+            self._close_log_file()
+
+    async def detach(self):
+        """Stop readers, close pipe transports and flush the log file."""
+        for task in self._reader_tasks:
+            if not task.done():
+                task.cancel()
+        if self._reader_tasks:
+            await asyncio.gather(*self._reader_tasks, return_exceptions=True)
+        for transport in self._transports:
+            transport.close()
+
+        self._reader_tasks = []
+        self._transports = []
+        self._close_log_file()
+
+    def get_recent_lines(
+        self, limit: Optional[int] = None, stream: Optional[str] = None
+    ) -> list[str]:
+        """
+        Get the most recent output lines.
+
+        Args:
+            limit: Maximum number of lines to return (all buffered lines if None).
+            stream: Restrict to 'stdout' or 'stderr' (both if None).
+
+        Returns:
+            Lines in the order they were written, oldest first.
+        """
+        lines = [line for name, line in self._lines if stream is None or name == stream]
+        if limit is not None:
+            lines = lines[-limit:] if limit > 0 else []
+        return lines
+
+    async def wait_for_line(self, text: str, timeout: float) -> Optional[str]:
+        """
+        Wait for an output line containing the given text.
+
+        Lines already in the buffer are checked first.
+
+        Args:
+            text: Substring to look for.
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            The matching line, or None on timeout or when all streams closed.
+        """
+        for _, line in self._lines:
+            if text in line:
+                return line
+
+        if not self.is_attached or self.closed:
+            return None
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        waiter = (text, future)
+        self._line_waiters.append(waiter)
+        closed_task = asyncio.create_task(self._closed.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {future, closed_task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if future in done:
+                return future.result()
+            return None
+        finally:
+            closed_task.cancel()
+            if waiter in self._line_waiters:
+                self._line_waiters.remove(waiter)
+
+    async def wait_closed(self):
+        """Wait until all attached streams reach EOF."""
+        await self._closed.wait()
+
+    async def _drain(self, name: str, reader: asyncio.StreamReader):
+        """Read lines from one stream until EOF."""
+        try:
+            while True:
+                try:
+                    raw_line = await reader.readline()
+                except ValueError:
+                    # line exceeded the reader limit and was discarded
+                    continue
+                if not raw_line:
+                    break
+                self._add_line(name, raw_line.decode('utf-8', errors='replace').rstrip('\r\n'))
+        finally:
+            if all(task.done() or task is asyncio.current_task() for task in self._reader_tasks):
+                self._closed.set()
+
+    def _add_line(self, name: str, line: str):
+        """Store line in the ring buffer, mirror it and notify waiters."""
+        self._lines.append((name, line))
+
+        if self._log_file is not None:
+            self._log_file.write(f'[{name}] {line}\n')
+
+        for text, future in self._line_waiters:
+            if text in line and not future.done():
+                future.set_result(line)
+
+    def _close_log_file(self):
+        """Flush and close the mirror log file if open."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
@@ -52,6 +52,14 @@ class BrowserProcessManager:
         ])
         return self._process
 
+    def is_process_alive(self) -> bool:
+        """Whether the browser process was started and has not exited yet."""
+        return self._process is not None and self._process.poll() is None
+
+    def get_exit_code(self) -> Optional[int]:
+        """Exit code of the browser process (None if not started or still running)."""
+        return self._process.poll() if self._process is not None else None
+
     @staticmethod
     def _default_process_creator(command: list[str]) -> subprocess.Popen:
         """Create browser process with output capture to prevent console clutter."""
@@ -0,0 +1,292 @@
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from pydoll.exceptions import UnsupportedOS
+
+if TYPE_CHECKING:
+    from pydoll.browser.managers.browser_process_manager import BrowserProcessManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProcessUsage:
+    """Resource usage of a single process in the browser process tree."""
+
+    pid: int
+    process_type: str
+    rss_bytes: int
+    cpu_time: float
+    num_threads: int
+
+
+@dataclass
+class BrowserResourceUsage:
+    """Aggregated resource usage of a browser and all of its child processes."""
+
+    pid: int
+    rss_bytes: int
+    cpu_time: float
+    num_threads: int
+    process_count: int
+    processes: list[ProcessUsage] = field(default_factory=list)
+
+    @property
+    def renderers(self) -> list[ProcessUsage]:
+        """Usage entries of renderer processes only."""
+        return [process for process in self.processes if process.process_type == 'renderer']
+
+
+@dataclass
+class ResourceThresholds:
+    """
+    Limits checked against every sample.
+
+    Any limit left as None is not checked.
+    """
+
+    max_rss_bytes: Optional[int] = None
+    max_renderer_rss_bytes: Optional[int] = None
+    max_cpu_time: Optional[float] = None
+    max_threads: Optional[int] = None
+    max_process_count: Optional[int] = None
+
+    def check(self, usage: BrowserResourceUsage) -> list[str]:
+        """
+        Compare usage against limits.
+
+        Returns:
+            Human readable description of every exceeded limit (empty if none).
+        """
+        violations = []
+        if self.max_rss_bytes is not None and usage.rss_bytes > self.max_rss_bytes:
+            violations.append(f'rss {usage.rss_bytes} > {self.max_rss_bytes}')
+        if self.max_renderer_rss_bytes is not None:
+            for renderer in usage.renderers:
+                if renderer.rss_bytes > self.max_renderer_rss_bytes:
+                    violations.append(
+                        f'renderer {renderer.pid} rss {renderer.rss_bytes} '
+                        f'> {self.max_renderer_rss_bytes}'
+                    )
+        if self.max_cpu_time is not None and usage.cpu_time > self.max_cpu_time:
+            violations.append(f'cpu time {usage.cpu_time:.2f}s > {self.max_cpu_time}s')
+        if self.max_threads is not None and usage.num_threads > self.max_threads:
+            violations.append(f'threads {usage.num_threads} > {self.max_threads}')
+        if self.max_process_count is not None and usage.process_count > self.max_process_count:
+            violations.append(f'processes {usage.process_count} > {self.max_process_count}')
+        return violations
+
+
+class BrowserResourceMonitor:
+    """
+    Samples resource usage of a browser process tree from /proc.
+
+    Walks every descendant of the browser process started by
+    BrowserProcessManager and reports RSS, CPU time, thread and process
+    counts, both aggregated and per process. Samples can be taken on demand
+    or periodically in a background task that invokes callbacks whenever
+    configured thresholds are exceeded.
+    """
+
+    def __init__(
+        self,
+        process_manager: 'BrowserProcessManager',
+        thresholds: Optional[ResourceThresholds] = None,
+        interval: float = 5.0,
+        proc_root: str = '/proc',
+    ):
+        """
+        Initialize resource monitor.
+
+        Args:
+            process_manager: Process manager owning the browser process.
+            thresholds: Limits that trigger callbacks (no checks if None).
+            interval: Seconds between samples when running in background.
+            proc_root: Mount point of the proc filesystem (mainly for testing).
+        """
+        self._process_manager = process_manager
+        self.thresholds = thresholds or ResourceThresholds()
+        self.interval = interval
+        self._proc_root = Path(proc_root)
+        self._callbacks: list[Callable[[BrowserResourceUsage, list[str]], Any]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._last_usage: Optional[BrowserResourceUsage] = None
+        self._page_size = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+        self._clock_ticks = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+    @property
+    def is_supported(self) -> bool:
+        """Whether the proc filesystem is available on this system."""
+        return (self._proc_root / 'self' / 'stat').exists()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether background sampling is active."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def last_usage(self) -> Optional[BrowserResourceUsage]:
+        """Most recent sample taken by the monitor."""
+        return self._last_usage
+
+    def on_threshold_exceeded(
+        self, callback: Callable[[BrowserResourceUsage, list[str]], Any]
+    ) -> None:
+        """
+        Register callback invoked with (usage, violations) when a limit is exceeded.
+
+        Callback may be sync or async. It is invoked on every sample that
+        exceeds a limit, so long running actions should be idempotent.
+        """
+        self._callbacks.append(callback)
+
+    def sample(self) -> Optional[BrowserResourceUsage]:
+        """
+        Take a single resource usage sample.
+
+        Returns:
+            Aggregated usage, or None if the browser process is not running.
+
+        Raises:
+            UnsupportedOS: If the proc filesystem is not available.
+        """
+        if not self.is_supported:
+            raise UnsupportedOS('Resource monitoring requires the /proc filesystem')
+
+        process = self._process_manager._process
+        if process is None:
+            return None
+
+        root_pid = process.pid
+        children = self._get_children_map()
+        processes = []
+        pending = [root_pid]
+        while pending:
+            pid = pending.pop()
+            usage = self._read_process_usage(pid)
+            if usage is None:
+                continue
+            processes.append(usage)
+            pending.extend(children.get(pid, []))
+
+        if not processes:
+            return None
+
+        usage = BrowserResourceUsage(
+            pid=root_pid,
+            rss_bytes=sum(process.rss_bytes for process in processes),
+            cpu_time=sum(process.cpu_time for process in processes),
+            num_threads=sum(process.num_threads for process in processes),
+            process_count=len(processes),
+            processes=processes,
+        )
+        self._last_usage = usage
+        return usage
+
+    async def start(self):
+        """
+        Start periodic sampling in a background task.
+
+        Raises:
+            UnsupportedOS: If the proc filesystem is not available.
+        """
+        if not self.is_supported:
+            raise UnsupportedOS('Resource monitoring requires the /proc filesystem')
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop periodic sampling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        if self._task is asyncio.current_task():
+            # stopped from a threshold callback, the cancellation ends the loop
+            self._task = None
+            return
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        """Sampling loop."""
+        while True:
+            try:
+                usage = await asyncio.to_thread(self.sample)
+                if usage is not None:
+                    await self._check_thresholds(usage)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error(f'Error while sampling browser resources: {exc}')
+            await asyncio.sleep(self.interval)
+
+    async def _check_thresholds(self, usage: BrowserResourceUsage):
+        """Invoke callbacks if usage exceeds any threshold."""
+        violations = self.thresholds.check(usage)
+        if not violations:
+            return
+
+        logger.warning(f'Browser {usage.pid} exceeded resource limits: {", ".join(violations)}')
+        for callback in self._callbacks:
+            try:
+                result = callback(usage, violations)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as exc:
+                logger.error(f'Error in resource threshold callback: {exc}')
+
+    def _get_children_map(self) -> dict[int, list[int]]:
+        """Map each pid to its direct children by scanning every process."""
+        children: dict[int, list[int]] = {}
+        for entry in self._proc_root.iterdir():
+            if not entry.name.isdigit():
+                continue
+            fields = self._read_stat_fields(int(entry.name))
+            if fields is None:
+                continue
+            children.setdefault(int(fields[1]), []).append(int(entry.name))
+        return children
+
+    def _read_process_usage(self, pid: int) -> Optional[ProcessUsage]:
+        """Read usage of a single process (None if it vanished)."""
+        fields = self._read_stat_fields(pid)
+        if fields is None:
+            return None
+
+        # fields start at 'state' (field 3 in proc(5)), so indexes are shifted by 3
+        utime, stime = int(fields[11]), int(fields[12])
+        return ProcessUsage(
+            pid=pid,
+            process_type=self._read_process_type(pid),
+            rss_bytes=int(fields[21]) * self._page_size,
+            cpu_time=(utime + stime) / self._clock_ticks,
+            num_threads=int(fields[17]),
+        )
+
+    def _read_stat_fields(self, pid: int) -> Optional[list[str]]:
+        """Read /proc/<pid>/stat fields that follow the command name."""
+        try:
+            stat = (self._proc_root / str(pid) / 'stat').read_text()
+        except OSError:
+            return None
+        # the command name is in parentheses and may itself contain spaces
+        return stat[stat.rfind(')') + 2 :].split()
+
+    def _read_process_type(self, pid: int) -> str:
+        """Get Chromium process type from its --type= argument ('browser' if absent)."""
+        try:
+            cmdline = (self._proc_root / str(pid) / 'cmdline').read_bytes()
+        except OSError:
+            return 'unknown'
+        for argument in cmdline.split(b'\0'):
+            if argument.startswith(b'--type='):
+                return argument[len(b'--type=') :].decode(errors='replace')
+        return 'browser'
@@ -0,0 +1,33 @@
+from pydoll.browser.network.asset_cache import AssetCache, AssetCacheStats
+from pydoll.browser.network.body_stream import ResponseBodyStreamer
+from pydoll.browser.network.budget import NavigationUsage, NetworkBudget
+from pydoll.browser.network.dispatcher import InterceptionDispatcher, InterceptionStats
+from pydoll.browser.network.expectations import (
+    CapturedRequest,
+    CapturedResponse,
+    RequestExpectation,
+    ResponseExpectation,
+)
+from pydoll.browser.network.har import HarRecorder, HarReplayer, HarReplayStats
+from pydoll.browser.network.idle_tracker import NetworkIdleTracker
+from pydoll.browser.network.rules import RequestRule, RequestRuleSet
+
+__all__ = [
+    'AssetCache',
+    'AssetCacheStats',
+    'CapturedRequest',
+    'CapturedResponse',
+    'HarRecorder',
+    'HarReplayer',
+    'HarReplayStats',
+    'InterceptionDispatcher',
+    'InterceptionStats',
+    'NavigationUsage',
+    'NetworkBudget',
+    'NetworkIdleTracker',
+    'RequestExpectation',
+    'RequestRule',
+    'RequestRuleSet',
+    'ResponseBodyStreamer',
+    'ResponseExpectation',
+]
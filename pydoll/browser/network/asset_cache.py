@@ -0,0 +1,369 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Union
+
+import aiofiles
+
+from pydoll.commands import FetchCommands
+from pydoll.constants import RequestStage, ResourceType
+from pydoll.protocol.base import Command, Response
+from pydoll.protocol.fetch.types import HeaderEntry, RequestPattern
+from pydoll.protocol.network.types import RequestPausedEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHED_RESOURCE_TYPES = [ResourceType.SCRIPT, ResourceType.STYLESHEET, ResourceType.FONT]
+
+# headers describing the transfer rather than the stored (decoded) body
+_UNSTORED_HEADERS = {
+    'connection',
+    'content-encoding',
+    'content-length',
+    'keep-alive',
+    'set-cookie',
+    'transfer-encoding',
+}
+
+
+@dataclass
+class CacheEntry:
+    """Index record of a cached response."""
+
+    digest: str
+    status: int
+    headers: list[HeaderEntry]
+    expires_at: float
+    size: int
+
+
+@dataclass
+class AssetCacheStats:
+    """Counters of an asset cache."""
+
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+    evicted: int = 0
+    bytes_served: int = 0
+
+
+class AssetCache:
+    """
+    On-disk content-addressed cache for static assets.
+
+    Responses are captured at the response stage of Fetch interception and
+    their bodies stored under their SHA-256 digest, so identical files
+    served from different URLs are kept once. Later requests for a fresh
+    entry are answered with Fetch.fulfillRequest without touching the
+    network. Only GET responses with status 200 and an explicit freshness
+    lifetime (Cache-Control max-age/s-maxage or Expires) are stored, and
+    no-store, no-cache and private responses are skipped. The least
+    recently used entries are evicted once the stored bodies exceed
+    max_size. The store directory can be shared by several browsers;
+    call save() to persist the URL index for later runs.
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_size: int = 512 * 2**20,
+        resource_types: Optional[list[ResourceType]] = None,
+        default_ttl: float = 0,
+    ):
+        """
+        Initialize asset cache.
+
+        Args:
+            directory: Directory holding the bodies and the URL index.
+            max_size: Maximum total size of stored bodies in bytes.
+            resource_types: Resource types to cache (scripts, stylesheets
+                and fonts by default).
+            default_ttl: Seconds to keep responses without explicit
+                freshness information (0 to skip them).
+        """
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.resource_types = list(resource_types or DEFAULT_CACHED_RESOURCE_TYPES)
+        self.default_ttl = default_ttl
+        self.stats = AssetCacheStats()
+        self._types = {
+            str(getattr(resource_type, 'value', resource_type)).lower()
+            for resource_type in self.resource_types
+        }
+        self._index: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._digest_refs: dict[str, int] = {}
+        self._size = 0
+        (self.directory / 'blobs').mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    @property
+    def size(self) -> int:
+        """Total size of stored bodies in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._index
+
+    def request_patterns(self) -> list[RequestPattern]:
+        """Fetch.enable patterns pausing cached resource types at both stages."""
+        return [
+            RequestPattern(urlPattern='*', resourceType=resource_type, requestStage=stage)
+            for resource_type in self.resource_types
+            for stage in (RequestStage.REQUEST, RequestStage.RESPONSE)
+        ]
+
+    async def handle(
+        self,
+        event: RequestPausedEvent,
+        execute_command: Callable[[Command], Awaitable[Any]],
+    ) -> Optional[Command[Response]]:
+        """
+        Serve a paused request from the cache or store its response.
+
+        Args:
+            event: The paused request event.
+            execute_command: Sends commands on the intercepting target.
+
+        Returns:
+            Fetch.fulfillRequest command on a cache hit, None otherwise
+            (the request is left to other handlers).
+        """
+        params = event['params']
+        request = params['request']
+        if request.get('method', 'GET') != 'GET':
+            return None
+        if str(params.get('resourceType', '')).lower() not in self._types:
+            return None
+
+        if 'responseStatusCode' in params or 'responseErrorReason' in params:
+            await self._store_response(params, execute_command)
+            return None
+        if _bypasses_cache(request.get('headers', {})):
+            return None
+        return await self._serve(params['requestId'], request['url'])
+
+    def save(self):
+        """Write the URL index next to the stored bodies."""
+        index_path = self.directory / self.INDEX_FILE
+        temporary_path = _temporary_path(self.directory)
+        try:
+            temporary_path.write_text(
+                json.dumps({url: asdict(entry) for url, entry in self._index.items()}),
+                encoding='utf-8',
+            )
+            os.replace(temporary_path, index_path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
+
+    def clear(self):
+        """Drop every entry and its stored body."""
+        for url in list(self._index):
+            self._remove(url)
+
+    async def _serve(self, request_id: str, url: str) -> Optional[Command[Response]]:
+        entry = self._index.get(url)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if entry.expires_at <= time.time():
+            self._remove(url)
+            self.stats.misses += 1
+            return None
+
+        try:
+            async with aiofiles.open(self._blob_path(entry.digest), 'rb') as blob:
+                body = await blob.read()
+        except FileNotFoundError:
+            # evicted by another browser sharing the directory
+            self._remove(url)
+            self.stats.misses += 1
+            return None
+
+        self._index.move_to_end(url)
+        self.stats.hits += 1
+        self.stats.bytes_served += len(body)
+        return FetchCommands.fulfill_request(
+            request_id=request_id,
+            response_code=entry.status,
+            response_headers=entry.headers,
+            body=base64.b64encode(body).decode('ascii'),
+        )
+
+    async def _store_response(
+        self, params: dict, execute_command: Callable[[Command], Awaitable[Any]]
+    ):
+        if params.get('responseStatusCode') != 200:  # noqa: PLR2004
+            return
+        headers = params.get('responseHeaders', [])
+        ttl = self._freshness_lifetime(headers)
+        if ttl <= 0:
+            return
+
+        try:
+            response = await execute_command(FetchCommands.get_response_body(params['requestId']))
+            result = response['result']
+        except Exception as exc:
+            logger.debug(f'Could not read response body of {params["request"]["url"]}: {exc}')
+            return
+        if result['base64Encoded']:
+            body = base64.b64decode(result['body'])
+        else:
+            body = result['body'].encode('utf-8')
+        if len(body) > self.max_size:
+            return
+
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(exist_ok=True)
+            temporary_path = _temporary_path(blob_path.parent)
+            try:
+                async with aiofiles.open(temporary_path, 'wb') as blob:
+                    await blob.write(body)
+                os.replace(temporary_path, blob_path)
+            finally:
+                temporary_path.unlink(missing_ok=True)
+
+        url = params['request']['url']
+        self._remove(url, keep_digest=digest)
+        self._add(
+            url,
+            CacheEntry(
+                digest=digest,
+                status=200,
+                headers=[
+                    HeaderEntry(name=header['name'], value=header['value'])
+                    for header in headers
+                    if header['name'].lower() not in _UNSTORED_HEADERS
+                ],
+                expires_at=time.time() + ttl,
+                size=len(body),
+            ),
+        )
+        self.stats.stored += 1
+        self._evict()
+
+    def _freshness_lifetime(self, headers: list[HeaderEntry]) -> float:
+        """Seconds a response stays fresh for a shared cache, 0 if it must not be stored."""
+        values = {header['name'].lower(): header['value'] for header in headers}
+        vary = {name.strip().lower() for name in values.get('vary', '').split(',')}
+        if vary - {'', 'accept-encoding'}:
+            return 0
+
+        directives = _parse_cache_control(values.get('cache-control', ''))
+        if {'no-store', 'no-cache', 'private'} & directives.keys():
+            return 0
+
+        lifetime: Optional[float] = None
+        for directive in ('s-maxage', 'max-age'):
+            if directive in directives:
+                try:
+                    lifetime = float(directives[directive] or 0)
+                except ValueError:
+                    return 0
+                break
+        if lifetime is None and 'expires' in values:
+            lifetime = _seconds_until(values['expires'], values.get('date'))
+        if lifetime is None:
+            lifetime = self.default_ttl
+
+        try:
+            age = float(values.get('age', 0))
+        except ValueError:
+            age = 0
+        return lifetime - age
+
+    def _add(self, url: str, entry: CacheEntry):
+        self._index[url] = entry
+        refs = self._digest_refs.get(entry.digest, 0)
+        if refs == 0:
+            self._size += entry.size
+        self._digest_refs[entry.digest] = refs + 1
+
+    def _remove(self, url: str, keep_digest: Optional[str] = None):
+        """Drop an entry, deleting its body once no entry refers to it (unless kept)."""
+        entry = self._index.pop(url, None)
+        if entry is None:
+            return
+        refs = self._digest_refs.pop(entry.digest, 1) - 1
+        if refs > 0:
+            self._digest_refs[entry.digest] = refs
+            return
+        self._size -= entry.size
+        if entry.digest != keep_digest:
+            self._blob_path(entry.digest).unlink(missing_ok=True)
+
+    def _evict(self):
+        while self._size > self.max_size and self._index:
+            self._remove(next(iter(self._index)))
+            self.stats.evicted += 1
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.directory / 'blobs' / digest[:2] / digest
+
+    def _load_index(self):
+        index_path = self.directory / self.INDEX_FILE
+        if not index_path.exists():
+            return
+        try:
+            records = json.loads(index_path.read_text(encoding='utf-8'))
+            entries = [(url, CacheEntry(**record)) for url, record in records.items()]
+        except (ValueError, TypeError) as exc:
+            logger.warning(f'Ignoring unreadable asset cache index {index_path}: {exc}')
+            return
+        now = time.time()
+        for url, entry in entries:
+            if entry.expires_at > now and self._blob_path(entry.digest).exists():
+                self._add(url, entry)
+        self._evict()
+
+
+def _temporary_path(directory: Path) -> Path:
+    """Create a uniquely named empty file in directory, for atomic replaces."""
+    descriptor, path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    os.close(descriptor)
+    return Path(path)
+
+
+def _parse_cache_control(value: str) -> dict[str, Optional[str]]:
+    directives: dict[str, Optional[str]] = {}
+    for part in value.split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def _seconds_until(expires: str, date: Optional[str]) -> float:
+    try:
+        expires_at = parsedate_to_datetime(expires).timestamp()
+        now = parsedate_to_datetime(date).timestamp() if date else time.time()
+    except (TypeError, ValueError):
+        # invalid dates (e.g. 'Expires: 0') mean already expired
+        return 0
+    return expires_at - now
+
+
+def _bypasses_cache(headers: dict[str, str]) -> bool:
+    """Whether the request asks not to be served from a cache (e.g. a hard reload)."""
+    values = {name.lower(): value for name, value in headers.items()}
+    directives = _parse_cache_control(values.get('cache-control', ''))
+    return (
+        'no-cache' in directives
+        or 'no-store' in directives
+        or 'no-cache' in values.get('pragma', '').lower()
+    )
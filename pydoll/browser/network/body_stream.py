@@ -0,0 +1,116 @@
+import asyncio
+import base64
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Union
+
+import aiofiles
+
+from pydoll.commands import FetchCommands, IOCommands
+from pydoll.protocol.base import Command
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class ResponseBodyStreamer:
+    """
+    Reads response bodies of paused requests in chunks.
+
+    The body is taken with Fetch.takeResponseBodyAsStream and read with
+    IO.read, so neither the whole body nor its base64 form is ever held in
+    memory or sent in a single WebSocket message. At most max_concurrent
+    bodies are streamed at a time, further captures wait for a free slot;
+    max_concurrent can be changed while captures run.
+
+    Taking the body consumes it: once streamed, the request can no longer
+    be continued as is and must be fulfilled or failed.
+    """
+
+    def __init__(
+        self,
+        execute_command: Callable[[Command], Awaitable[Any]],
+        max_concurrent: int = 4,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Initialize response body streamer.
+
+        Args:
+            execute_command: Sends commands on the intercepting target.
+            max_concurrent: Maximum number of bodies streamed at once.
+            chunk_size: Bytes requested per IO.read.
+        """
+        self.max_concurrent = max_concurrent
+        self.chunk_size = chunk_size
+        self._execute_command = execute_command
+        self._active = 0
+        self._slot_freed = asyncio.Condition()
+
+    @property
+    def active(self) -> int:
+        """Number of bodies being streamed."""
+        return self._active
+
+    async def iter_body(self, request_id: str) -> AsyncIterator[bytes]:
+        """
+        Stream the body of a request paused at the response stage.
+
+        Args:
+            request_id: Fetch request id from Fetch.requestPaused.
+
+        Yields:
+            Decoded body chunks of up to chunk_size bytes.
+        """
+        async with self._slot():
+            response = await self._execute_command(
+                FetchCommands.take_response_body_as_stream(request_id)
+            )
+            handle = response['result']['stream']
+            try:
+                while True:
+                    response = await self._execute_command(
+                        IOCommands.read(handle, size=self.chunk_size)
+                    )
+                    result = response['result']
+                    data = result['data']
+                    if data:
+                        yield (
+                            base64.b64decode(data)
+                            if result.get('base64Encoded')
+                            else data.encode('utf-8')
+                        )
+                    if result['eof']:
+                        break
+            finally:
+                with suppress(Exception):
+                    await self._execute_command(IOCommands.close(handle))
+
+    async def save_body(self, request_id: str, path: Union[str, Path]) -> int:
+        """
+        Stream the body of a request paused at the response stage to a file.
+
+        Args:
+            request_id: Fetch request id from Fetch.requestPaused.
+            path: File to write, replaced if it exists.
+
+        Returns:
+            Number of bytes written.
+        """
+        written = 0
+        async with aiofiles.open(path, 'wb') as file:
+            async for chunk in self.iter_body(request_id):
+                await file.write(chunk)
+                written += len(chunk)
+        return written
+
+    @asynccontextmanager
+    async def _slot(self):
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self._active < self.max_concurrent)
+            self._active += 1
+        try:
+            yield
+        finally:
+            async with self._slot_freed:
+                self._active -= 1
+                self._slot_freed.notify_all()
@@ -0,0 +1,264 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Awaitable, Callable, Optional
+
+from pydoll.commands import FetchCommands, PageCommands
+from pydoll.constants import BudgetAction, NetworkErrorReason, RequestStage
+from pydoll.protocol.base import Command, Response
+from pydoll.protocol.fetch.types import RequestPattern
+from pydoll.protocol.network.types import RequestPausedEvent
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class NavigationUsage:
+    """Network usage of one main frame navigation."""
+
+    url: str
+    started_at: float
+    requests: int = 0
+    bytes_received: int = 0
+    exceeded: Optional[str] = None
+    finished_at: Optional[float] = None
+    _started_monotonic: float = field(default_factory=time.monotonic, repr=False)
+    _finished_monotonic: Optional[float] = field(default=None, repr=False)
+
+    @property
+    def duration(self) -> float:
+        """Seconds since the navigation started, up to the next navigation."""
+        end = self._finished_monotonic
+        return (end if end is not None else time.monotonic()) - self._started_monotonic
+
+    def _finish(self):
+        self.finished_at = time.time()
+        self._finished_monotonic = time.monotonic()
+
+
+class NetworkBudget:
+    """
+    Enforces byte, request and wall time limits on each navigation of a tab.
+
+    Usage is counted from Network domain events: a navigation starts with
+    the main frame document request, every request sent afterwards counts
+    once (redirects reuse the request id) and received bytes are the
+    encodedDataLength of Network.dataReceived, corrected by the total
+    reported in Network.loadingFinished. The first limit exceeded stops the
+    page from loading or blocks every further request, depending on
+    action; nothing else happens until the next navigation. Limits left as
+    None are not enforced.
+
+    Requests are blocked through Fetch interception rather than
+    Network.setBlockedURLs, so URLs blocked by the user stay blocked:
+    while blocking, request_patterns pauses every request and handle
+    fails it.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        execute_command: Callable[[Command], Awaitable[Any]],
+        main_frame_id: str,
+        max_bytes: Optional[int] = None,
+        max_requests: Optional[int] = None,
+        max_duration: Optional[float] = None,
+        action: BudgetAction = BudgetAction.STOP_LOADING,
+        on_exceeded: Optional[Callable[[NavigationUsage], Any]] = None,
+        history_size: int = 50,
+        update_interception: Optional[Callable[[], Awaitable[Any]]] = None,
+    ):
+        """
+        Initialize network budget.
+
+        Args:
+            execute_command: Sends commands on the tab's target.
+            main_frame_id: Frame whose document requests start navigations.
+            max_bytes: Maximum encoded bytes received per navigation.
+            max_requests: Maximum requests sent per navigation.
+            max_duration: Maximum seconds per navigation.
+            action: What to do once a limit is exceeded.
+            on_exceeded: Called with the usage of the navigation that
+                exceeded a limit.
+            history_size: Number of finished navigations kept in history.
+            update_interception: Called when blocking starts or stops, so
+                the owner re-reads request_patterns and routes paused
+                requests to handle.
+        """
+        if max_bytes is None and max_requests is None and max_duration is None:
+            raise ValueError('At least one of max_bytes, max_requests or max_duration is required')
+        self.main_frame_id = main_frame_id
+        self.max_bytes = max_bytes
+        self.max_requests = max_requests
+        self.max_duration = max_duration
+        self.action = BudgetAction(action)
+        self.history: deque[NavigationUsage] = deque(maxlen=history_size)
+        self._execute_command = execute_command
+        self._update_interception = update_interception
+        self._on_exceeded = on_exceeded
+        self._current: Optional[NavigationUsage] = None
+        self._navigation_request_id: Optional[str] = None
+        # encoded bytes counted so far for each request of the current navigation
+        self._received: dict[str, int] = {}
+        self._duration_timer: Optional[asyncio.TimerHandle] = None
+        self._blocking = False
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def current(self) -> Optional[NavigationUsage]:
+        """Usage of the ongoing navigation, None before the first one."""
+        return self._current
+
+    @property
+    def blocking(self) -> bool:
+        """Whether requests are blocked after a BLOCK_REQUESTS budget was exceeded."""
+        return self._blocking
+
+    def on_request_will_be_sent(self, event: dict):
+        """Start a navigation on main frame documents and count requests."""
+        params = event['params']
+        request_id = params['requestId']
+        if self._is_navigation(params) and request_id != self._navigation_request_id:
+            self._start_navigation(request_id, params['request']['url'])
+        usage = self._current
+        if usage is None or request_id in self._received:
+            return
+        self._received[request_id] = 0
+        usage.requests += 1
+        if self.max_requests is not None and usage.requests > self.max_requests:
+            self._exceed('requests')
+
+    def on_data_received(self, event: dict):
+        """Count the encoded bytes of a received chunk."""
+        params = event['params']
+        self._add_bytes(params['requestId'], params.get('encodedDataLength', 0))
+
+    def on_loading_finished(self, event: dict):
+        """Count bytes the chunks did not report (headers, bodies sent in one piece)."""
+        params = event['params']
+        request_id = params['requestId']
+        if request_id in self._received:
+            self._add_bytes(request_id, params['encodedDataLength'] - self._received[request_id])
+
+    async def release(self):
+        """Lift the request block so the next navigation can load."""
+        if not self._blocking:
+            return
+        self._blocking = False
+        if self._update_interception is not None:
+            await self._update_interception()
+
+    def request_patterns(self) -> list[RequestPattern]:
+        """Fetch.enable patterns pausing every request while blocking."""
+        if not self._blocking:
+            return []
+        return [RequestPattern(urlPattern='*', requestStage=RequestStage.REQUEST)]
+
+    async def handle(
+        self,
+        event: RequestPausedEvent,
+        execute_command: Callable[[Command], Awaitable[Any]],
+    ) -> Optional[Command[Response]]:
+        """
+        Fail paused requests while blocking.
+
+        Args:
+            event: The paused request event.
+            execute_command: Sends commands on the intercepting target.
+
+        Returns:
+            Fetch.failRequest command for requests paused before being
+            sent while blocking, None otherwise.
+        """
+        params = event['params']
+        if not self._blocking or 'responseStatusCode' in params or 'responseErrorReason' in params:
+            return None
+        return FetchCommands.fail_request(params['requestId'], NetworkErrorReason.BLOCKED_BY_CLIENT)
+
+    def close(self):
+        """Stop the duration timer of the ongoing navigation."""
+        self._cancel_duration_timer()
+
+    def _is_navigation(self, params: dict) -> bool:
+        return (
+            params.get('type') == 'Document'
+            and params.get('frameId') == self.main_frame_id
+            and params.get('loaderId') == params['requestId']
+        )
+
+    def _start_navigation(self, request_id: str, url: str):
+        if self._current is not None:
+            self._current._finish()
+            self.history.append(self._current)
+        self._cancel_duration_timer()
+        self._current = NavigationUsage(url=url, started_at=time.time())
+        self._navigation_request_id = request_id
+        self._received = {}
+        if self.max_duration is not None:
+            self._duration_timer = asyncio.get_running_loop().call_later(
+                self.max_duration, self._exceed, 'duration'
+            )
+
+    def _add_bytes(self, request_id: str, length: int):
+        usage = self._current
+        if usage is None or request_id not in self._received or length <= 0:
+            return
+        self._received[request_id] += length
+        usage.bytes_received += length
+        if self.max_bytes is not None and usage.bytes_received > self.max_bytes:
+            self._exceed('bytes')
+
+    def _exceed(self, reason: str):
+        usage = self._current
+        if usage is None or usage.exceeded is not None:
+            return
+        usage.exceeded = reason
+        self._cancel_duration_timer()
+        logger.info(f'Network budget exceeded ({reason}) while loading {usage.url}')
+        if self.action == BudgetAction.BLOCK_REQUESTS:
+            self._blocking = True
+            task = asyncio.ensure_future(self._enforce(self._update_interception))
+        else:
+            task = asyncio.ensure_future(
+                self._enforce(partial(self._execute_command, PageCommands.stop_loading()))
+            )
+        self._track(task)
+        self._notify_exceeded(usage)
+
+    def _notify_exceeded(self, usage: NavigationUsage):
+        if self._on_exceeded is None:
+            return
+        try:
+            result = self._on_exceeded(usage)
+        except Exception as exc:
+            logger.error(f'Error in network budget callback: {exc}')
+            return
+        if asyncio.iscoroutine(result):
+            self._track(asyncio.ensure_future(self._await_callback(result)))
+
+    @staticmethod
+    async def _await_callback(result: Awaitable[Any]):
+        try:
+            await result
+        except Exception as exc:
+            logger.error(f'Error in network budget callback: {exc}')
+
+    def _track(self, task: asyncio.Future):
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _enforce(action: Optional[Callable[[], Awaitable[Any]]]):
+        if action is None:
+            return
+        try:
+            await action()
+        except Exception as exc:
+            logger.warning(f'Could not enforce network budget: {exc}')
+
+    def _cancel_duration_timer(self):
+        if self._duration_timer is not None:
+            self._duration_timer.cancel()
+            self._duration_timer = None
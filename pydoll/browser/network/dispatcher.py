@@ -0,0 +1,214 @@
+import asyncio
+import inspect
+import logging
+import time
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from pydoll.commands import FetchCommands
+from pydoll.protocol.base import Command
+from pydoll.protocol.network.types import RequestPausedEvent
+
+logger = logging.getLogger(__name__)
+
+RequestHandler = Callable[[RequestPausedEvent], Any]
+# returns the Command answering the request (or an awaitable of it), None to pass it on
+InterceptionStage = Callable[[RequestPausedEvent], Any]
+
+
+async def run_interception_stages(
+    stages: list[InterceptionStage], event: RequestPausedEvent
+) -> Optional[Command]:
+    """
+    Offer a paused request to each stage in turn.
+
+    Returns:
+        Command of the first stage that answers the request, or None.
+    """
+    for stage in stages:
+        try:
+            result = stage(event)
+            if inspect.isawaitable(result):
+                result = await result
+        except Exception as exc:
+            logger.error(f'Interception stage failed for {event["params"]["requestId"]}: {exc}')
+            continue
+        if result is not None:
+            return result
+    return None
+
+
+@dataclass
+class InterceptionStats:
+    """Counters and queue delay measurements of an interception dispatcher."""
+
+    dispatched: int = 0
+    completed: int = 0
+    timed_out: int = 0
+    failed: int = 0
+    resolved_by_stages: int = 0
+    auto_continued: int = 0
+    queued: int = 0
+    in_progress: int = 0
+    queue_delay_total: float = 0.0
+    queue_delay_max: float = 0.0
+    recent_queue_delays: deque = field(default_factory=lambda: deque(maxlen=1024))
+
+    @property
+    def queue_delay_mean(self) -> float:
+        """Mean seconds paused requests waited for a free worker."""
+        started = self.dispatched - self.queued
+        return self.queue_delay_total / started if started else 0.0
+
+    def queue_delay_percentile(self, percentile: float) -> float:
+        """
+        Queue delay percentile over the most recent requests.
+
+        Args:
+            percentile: Percentile between 0 and 100.
+
+        Returns:
+            Delay in seconds, or 0.0 if no request was handled yet.
+        """
+        if not self.recent_queue_delays:
+            return 0.0
+        delays = sorted(self.recent_queue_delays)
+        index = round(percentile / 100 * (len(delays) - 1))
+        return delays[min(max(index, 0), len(delays) - 1)]
+
+    def record_queue_delay(self, delay: float):
+        """Account for a request leaving the queue."""
+        self.queued -= 1
+        self.queue_delay_total += delay
+        self.queue_delay_max = max(self.queue_delay_max, delay)
+        self.recent_queue_delays.append(delay)
+
+
+class InterceptionDispatcher:
+    """
+    Runs Fetch.requestPaused handlers on a bounded pool of workers.
+
+    Events are queued as they arrive so the connection keeps reading
+    messages, and up to max_concurrency handlers run at the same time.
+    A handler either answers the request itself (continue, fail, fulfill)
+    or returns the Command to send. Handlers that overrun handler_timeout
+    are cancelled and, like handlers that raise, their request is continued
+    unchanged so a slow handler never stalls page loading.
+    """
+
+    def __init__(
+        self,
+        handler: RequestHandler,
+        execute_command: Callable[[Command], Awaitable[Any]],
+        max_concurrency: int = 16,
+        handler_timeout: Optional[float] = 10.0,
+        stages: Optional[list[InterceptionStage]] = None,
+    ):
+        """
+        Initialize interception dispatcher.
+
+        Args:
+            handler: Called with every paused request (sync or async).
+            execute_command: Sends a command on the intercepting target.
+            max_concurrency: Maximum number of handlers running at once.
+            handler_timeout: Seconds a handler may run before the request is
+                continued unchanged (None for no limit).
+            stages: Callables offered the request before the handler (e.g.
+                request rules), the first one returning a Command answers it.
+        """
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        self.handler = handler
+        self.stages = list(stages or [])
+        self.max_concurrency = max_concurrency
+        self.handler_timeout = handler_timeout
+        self.stats = InterceptionStats()
+        self._execute_command = execute_command
+        self._queue: asyncio.Queue[tuple[RequestPausedEvent, float]] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def is_running(self) -> bool:
+        """Whether worker tasks are alive."""
+        return any(not worker.done() for worker in self._workers)
+
+    def dispatch(self, event: RequestPausedEvent):
+        """Queue a paused request (registered as a synchronous event callback)."""
+        self.stats.dispatched += 1
+        self.stats.queued += 1
+        self._queue.put_nowait((event, self._now()))
+        if not self._workers:
+            self._start_workers()
+
+    async def join(self):
+        """Wait until every queued request was handled."""
+        await self._queue.join()
+
+    async def close(self):
+        """Stop the workers; requests still queued are released when Fetch is disabled."""
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            with suppress(asyncio.CancelledError):
+                await worker
+        self._workers = []
+
+    def _start_workers(self):
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_concurrency)]
+
+    async def _worker(self):
+        while True:
+            event, queued_at = await self._queue.get()
+            self.stats.record_queue_delay(self._now() - queued_at)
+            self.stats.in_progress += 1
+            try:
+                await self._handle(event)
+            finally:
+                self.stats.in_progress -= 1
+                self._queue.task_done()
+
+    async def _handle(self, event: RequestPausedEvent):
+        request_id = event['params']['requestId']
+        command = await run_interception_stages(self.stages, event)
+        if command is not None:
+            self.stats.resolved_by_stages += 1
+            await self._send(command)
+            return
+
+        try:
+            result = await asyncio.wait_for(self._call_handler(event), self.handler_timeout)
+        except asyncio.TimeoutError:
+            self.stats.timed_out += 1
+            logger.warning(
+                f'Request handler exceeded {self.handler_timeout}s, continuing {request_id}'
+            )
+        except Exception as exc:
+            self.stats.failed += 1
+            logger.error(f'Request handler failed for {request_id}: {exc}')
+        else:
+            self.stats.completed += 1
+            if isinstance(result, dict) and 'method' in result:
+                await self._send(result)  # type: ignore[arg-type]
+            return
+
+        self.stats.auto_continued += 1
+        await self._send(FetchCommands.continue_request(request_id))
+
+    async def _call_handler(self, event: RequestPausedEvent) -> Any:
+        result = self.handler(event)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _send(self, command: Command):
+        try:
+            await self._execute_command(command)
+        except Exception as exc:
+            # e.g. the request was already answered or its target went away
+            logger.debug(f'Failed to answer paused request: {exc}')
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
@@ -0,0 +1,298 @@
+import asyncio
+import base64
+import json
+import re
+from abc import ABC, abstractmethod
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generator, Generic, Optional, TypeVar, Union
+
+from pydoll.browser.network.rules import glob_to_regex
+from pydoll.commands import NetworkCommands
+from pydoll.exceptions import NetworkEventTimeout
+from pydoll.protocol.base import Command
+from pydoll.protocol.network.events import NetworkEvent
+from pydoll.protocol.network.types import Request, Response
+
+T = TypeVar('T')
+UrlPattern = Union[str, re.Pattern]
+EventPredicate = Callable[[dict], bool]
+
+
+def compile_url_matcher(url_pattern: Optional[UrlPattern]) -> Callable[[str], bool]:
+    """
+    Compile a URL pattern once into a matching function.
+
+    Strings are Fetch style globs matched against the whole URL ('*' any
+    characters, '?' a single one), compiled regexes are searched anywhere
+    in it and None matches every URL.
+    """
+    if url_pattern is None:
+        return lambda url: True
+    if isinstance(url_pattern, re.Pattern):
+        return lambda url: url_pattern.search(url) is not None
+    regex = re.compile(glob_to_regex(url_pattern), re.DOTALL)
+    return lambda url: regex.fullmatch(url) is not None
+
+
+@dataclass
+class CapturedRequest:
+    """A request seen in Network.requestWillBeSent."""
+
+    request_id: str
+    request: Request
+    resource_type: str
+    event: dict
+
+    @property
+    def url(self) -> str:
+        return self.request['url']
+
+    @property
+    def method(self) -> str:
+        return self.request['method']
+
+
+@dataclass
+class CapturedResponse:
+    """A response whose body finished loading, with the body if requested."""
+
+    request_id: str
+    response: Response
+    resource_type: str
+    body: Optional[str] = None
+    base64_encoded: bool = False
+
+    @property
+    def url(self) -> str:
+        return self.response['url']
+
+    @property
+    def status(self) -> int:
+        return self.response['status']
+
+    @property
+    def headers(self) -> Any:
+        return self.response['headers']
+
+    @property
+    def text(self) -> Optional[str]:
+        """Body decoded as UTF-8 text, None if the body was not fetched."""
+        if self.body is None:
+            return None
+        if self.base64_encoded:
+            return base64.b64decode(self.body).decode('utf-8', errors='replace')
+        return self.body
+
+    def json(self) -> Any:
+        """Body parsed as JSON."""
+        return json.loads(self.text or '')
+
+
+class NetworkExpectation(ABC, Generic[T]):
+    """
+    Future for the first request or response matching a pattern.
+
+    Listeners are registered by start() and removed as soon as the
+    expectation is resolved, times out or is cancelled. Awaiting the
+    expectation waits at most timeout seconds.
+    """
+
+    def __init__(
+        self,
+        url_pattern: Optional[UrlPattern] = None,
+        predicate: Optional[EventPredicate] = None,
+        timeout: float = 30,
+    ):
+        """
+        Initialize network expectation.
+
+        Args:
+            url_pattern: Glob matched against the whole URL or compiled regex
+                searched in it (every URL if None).
+            predicate: Called with the event params, must return True to match.
+            timeout: Seconds awaiting the expectation waits for a match.
+        """
+        self.url_pattern = url_pattern
+        self.timeout = timeout
+        self._matches_url = compile_url_matcher(url_pattern)
+        self._predicate = predicate
+        self._future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._callback_ids: list[int] = []
+        self._remove_callback: Optional[Callable[[int], Awaitable[Any]]] = None
+
+    @abstractmethod
+    def listeners(self) -> list[tuple[str, Callable[[dict], Any]]]:
+        """Event names and callbacks to register (implemented by subclasses)."""
+        pass
+
+    async def start(
+        self,
+        register_callback: Callable[[str, Callable[[dict], Any]], Awaitable[int]],
+        remove_callback: Callable[[int], Awaitable[Any]],
+    ):
+        """Register the listeners (done by Tab.expect_request/expect_response)."""
+        self._remove_callback = remove_callback
+        for event_name, listener in self.listeners():
+            self._callback_ids.append(await register_callback(event_name, listener))
+
+    def done(self) -> bool:
+        """Whether a match was found (or the expectation failed or was cancelled)."""
+        return self._future.done()
+
+    def result(self) -> T:
+        """Matched request or response, raises if not resolved yet."""
+        return self._future.result()
+
+    async def wait(self) -> T:
+        """
+        Wait for the first match.
+
+        Raises:
+            NetworkEventTimeout: If nothing matched within timeout seconds.
+        """
+        try:
+            return await asyncio.wait_for(asyncio.shield(self._future), self.timeout)
+        except asyncio.TimeoutError:
+            raise NetworkEventTimeout(
+                f'No {self._kind} matching {self.url_pattern!r} within {self.timeout}s'
+            )
+        finally:
+            await self.cancel()
+
+    def __await__(self) -> Generator[Any, None, T]:
+        return self.wait().__await__()
+
+    async def cancel(self):
+        """Stop listening; a pending expectation is cancelled."""
+        if not self._future.done():
+            self._future.cancel()
+        await self._unregister()
+
+    @property
+    def _kind(self) -> str:
+        return 'event'
+
+    def _matches(self, url: str, params: dict) -> bool:
+        if self._future.done() or not self._matches_url(url):
+            return False
+        return self._predicate is None or bool(self._predicate(params))
+
+    def _resolve(self, value: T):
+        if not self._future.done():
+            self._future.set_result(value)
+        asyncio.ensure_future(self._unregister())
+
+    def _fail(self, exc: BaseException):
+        if not self._future.done():
+            self._future.set_exception(exc)
+        asyncio.ensure_future(self._unregister())
+
+    async def _unregister(self):
+        callback_ids, self._callback_ids = self._callback_ids, []
+        if self._remove_callback is None:
+            return
+        for callback_id in callback_ids:
+            with suppress(Exception):
+                await self._remove_callback(callback_id)
+
+
+class RequestExpectation(NetworkExpectation[CapturedRequest]):
+    """Resolves with the first request matching the pattern and predicate."""
+
+    def listeners(self) -> list[tuple[str, Callable[[dict], Any]]]:
+        return [(NetworkEvent.REQUEST_WILL_BE_SENT, self._on_request_will_be_sent)]
+
+    @property
+    def _kind(self) -> str:
+        return 'request'
+
+    def _on_request_will_be_sent(self, event: dict):
+        params = event['params']
+        if not self._matches(params['request']['url'], params):
+            return
+        self._resolve(
+            CapturedRequest(
+                request_id=params['requestId'],
+                request=params['request'],
+                resource_type=params.get('type', ''),
+                event=event,
+            )
+        )
+
+
+class ResponseExpectation(NetworkExpectation[CapturedResponse]):
+    """
+    Resolves with the first matching response once its body finished loading.
+
+    Responses are matched on Network.responseReceived and resolved on
+    Network.loadingFinished, after fetching the body if with_body is set.
+    Matching responses whose loading fails are skipped.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        url_pattern: Optional[UrlPattern] = None,
+        predicate: Optional[EventPredicate] = None,
+        timeout: float = 30,
+        with_body: bool = False,
+        execute_command: Optional[Callable[[Command], Awaitable[Any]]] = None,
+    ):
+        """
+        Initialize response expectation.
+
+        Args:
+            url_pattern: Glob matched against the whole URL or compiled regex
+                searched in it (every URL if None).
+            predicate: Called with the responseReceived params, must return
+                True to match.
+            timeout: Seconds awaiting the expectation waits for a match.
+            with_body: Fetch the response body before resolving.
+            execute_command: Sends Network.getResponseBody, required with with_body.
+        """
+        super().__init__(url_pattern, predicate, timeout)
+        if with_body and execute_command is None:
+            raise ValueError('with_body requires execute_command')
+        self.with_body = with_body
+        self._execute_command = execute_command
+        self._candidates: dict[str, dict] = {}
+
+    def listeners(self) -> list[tuple[str, Callable[[dict], Any]]]:
+        return [
+            (NetworkEvent.RESPONSE_RECEIVED, self._on_response_received),
+            (NetworkEvent.LOADING_FINISHED, self._on_loading_finished),
+            (NetworkEvent.LOADING_FAILED, self._on_loading_failed),
+        ]
+
+    @property
+    def _kind(self) -> str:
+        return 'response'
+
+    def _on_response_received(self, event: dict):
+        params = event['params']
+        if self._matches(params['response']['url'], params):
+            self._candidates[params['requestId']] = params
+
+    def _on_loading_failed(self, event: dict):
+        self._candidates.pop(event['params']['requestId'], None)
+
+    async def _on_loading_finished(self, event: dict):
+        params = self._candidates.pop(event['params']['requestId'], None)
+        if params is None or self._future.done():
+            return
+        captured = CapturedResponse(
+            request_id=params['requestId'],
+            response=params['response'],
+            resource_type=params.get('type', ''),
+        )
+        if self.with_body:
+            try:
+                response = await self._execute_command(  # type: ignore[misc]
+                    NetworkCommands.get_response_body(params['requestId'])
+                )
+            except Exception as exc:
+                self._fail(exc)
+                return
+            captured.body = response['result']['body']
+            captured.base64_encoded = response['result'].get('base64Encoded', False)
+        self._resolve(captured)
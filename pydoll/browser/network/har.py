@@ -0,0 +1,309 @@
+import base64
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Union
+from urllib.parse import parse_qsl, urlsplit
+
+import aiofiles
+
+from pydoll.commands import FetchCommands
+from pydoll.constants import HarMissBehavior, NetworkErrorReason, RequestStage
+from pydoll.exceptions import InvalidHarFile
+from pydoll.protocol.base import Command, Response
+from pydoll.protocol.fetch.types import HeaderEntry, RequestPattern
+from pydoll.protocol.network.types import RequestPausedEvent
+
+logger = logging.getLogger(__name__)
+
+HAR_VERSION = '1.2'
+
+# headers describing the recorded transfer, invalid for a replayed (decoded) body
+_REPLAY_SKIPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+
+def _creator() -> dict[str, str]:
+    try:
+        package_version = version('pydoll-python')
+    except PackageNotFoundError:
+        package_version = 'unknown'
+    return {'name': 'pydoll', 'version': package_version}
+
+
+def body_hash(body: Optional[str]) -> Optional[str]:
+    """SHA-256 of a request body as used in replay keys (None without body)."""
+    if not body:
+        return None
+    return hashlib.sha256(body.encode('utf-8')).hexdigest()
+
+
+class HarRecorder:
+    """
+    Records traffic of a tab as HAR 1.2 entries.
+
+    Requests are captured at the response stage of Fetch interception,
+    where the final request, the response headers and the body are all
+    available, then continued unchanged.
+    """
+
+    def __init__(self):
+        """Initialize HAR recorder."""
+        self.entries: list[dict] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def request_patterns() -> list[RequestPattern]:
+        """Fetch.enable patterns pausing every response."""
+        return [RequestPattern(urlPattern='*', requestStage=RequestStage.RESPONSE)]
+
+    async def handle(
+        self,
+        event: RequestPausedEvent,
+        execute_command: Callable[[Command], Awaitable[Any]],
+    ) -> None:
+        """
+        Record a paused response (requests not yet sent and failed ones are ignored).
+
+        Args:
+            event: The paused request event.
+            execute_command: Sends commands on the intercepting target.
+        """
+        params = event['params']
+        if 'responseStatusCode' not in params:
+            return None
+
+        started = datetime.now(timezone.utc)
+        text, encoding, size = '', None, 0
+        try:
+            response = await execute_command(FetchCommands.get_response_body(params['requestId']))
+            result = response['result']
+            text = result['body']
+            if result['base64Encoded']:
+                encoding = 'base64'
+                size = len(base64.b64decode(text))
+            else:
+                size = len(text.encode('utf-8'))
+        except Exception as exc:
+            # redirects and some aborted responses have no body
+            logger.debug(f'No body recorded for {params["request"]["url"]}: {exc}')
+
+        self.entries.append(self._build_entry(params, started, text, encoding, size))
+        return None
+
+    def to_har(self) -> dict:
+        """HAR document of the recorded entries."""
+        return {'log': {'version': HAR_VERSION, 'creator': _creator(), 'entries': self.entries}}
+
+    async def save(self, path: Union[str, Path]):
+        """Write the recording as a HAR file."""
+        async with aiofiles.open(path, 'w', encoding='utf-8') as file:
+            await file.write(json.dumps(self.to_har()))
+
+    @staticmethod
+    def _build_entry(  # noqa: PLR0913, PLR0917
+        params: dict, started: datetime, text: str, encoding: Optional[str], size: int
+    ) -> dict:
+        request = params['request']
+        headers = params.get('responseHeaders', [])
+        header_values = {header['name'].lower(): header['value'] for header in headers}
+        har_request: dict[str, Any] = {
+            'method': request.get('method', 'GET'),
+            'url': request['url'],
+            'httpVersion': 'HTTP/1.1',
+            'headers': [
+                {'name': name, 'value': value} for name, value in request.get('headers', {}).items()
+            ],
+            'queryString': [
+                {'name': name, 'value': value}
+                for name, value in parse_qsl(urlsplit(request['url']).query)
+            ],
+            'cookies': [],
+            'headersSize': -1,
+            'bodySize': len(request.get('postData', '').encode('utf-8')),
+        }
+        if 'postData' in request:
+            har_request['postData'] = {
+                'mimeType': request.get('headers', {}).get('Content-Type', ''),
+                'text': request['postData'],
+            }
+
+        content: dict[str, Any] = {
+            'size': size,
+            'mimeType': header_values.get('content-type', ''),
+            'text': text,
+        }
+        if encoding:
+            content['encoding'] = encoding
+        return {
+            'startedDateTime': started.isoformat(),
+            'time': 0,
+            'request': har_request,
+            'response': {
+                'status': params['responseStatusCode'],
+                'statusText': params.get('responseStatusText', ''),
+                'httpVersion': 'HTTP/1.1',
+                'headers': [{'name': h['name'], 'value': h['value']} for h in headers],
+                'cookies': [],
+                'content': content,
+                'redirectURL': header_values.get('location', ''),
+                'headersSize': -1,
+                'bodySize': size,
+            },
+            'cache': {},
+            'timings': {'send': 0, 'wait': 0, 'receive': 0},
+            '_resourceType': params.get('resourceType', ''),
+        }
+
+
+@dataclass
+class HarReplayStats:
+    """Counters of a HAR replay."""
+
+    hits: int = 0
+    misses: int = 0
+    missed_urls: list[str] = field(default_factory=list)
+
+
+class HarReplayer:
+    """
+    Fulfills every request from a HAR archive.
+
+    Requests are matched by method, URL and, unless disabled, the SHA-256
+    of the request body. When a request was recorded several times the
+    recorded responses are served in order and the last one is repeated.
+    Requests missing from the archive fail, get a 404 or go to the network
+    depending on on_miss.
+    """
+
+    def __init__(
+        self,
+        har: Union[str, Path, dict],
+        on_miss: HarMissBehavior = HarMissBehavior.FAIL,
+        match_body: bool = True,
+    ):
+        """
+        Initialize HAR replayer.
+
+        Args:
+            har: Path of a HAR file or a parsed HAR document.
+            on_miss: Behaviour for requests missing from the archive.
+            match_body: Include the request body hash in the match.
+
+        Raises:
+            InvalidHarFile: If the archive cannot be read.
+        """
+        self.on_miss = HarMissBehavior(on_miss)
+        self.match_body = match_body
+        self.stats = HarReplayStats()
+        self._responses: dict[tuple, list[dict]] = {}
+        self._served: dict[tuple, int] = {}
+        for entry in self._load_entries(har):
+            request = entry['request']
+            key = self._key(
+                request['method'], request['url'], request.get('postData', {}).get('text')
+            )
+            self._responses.setdefault(key, []).append(entry['response'])
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._responses.values())
+
+    @staticmethod
+    def request_patterns() -> list[RequestPattern]:
+        """Fetch.enable patterns pausing every request before it is sent."""
+        return [RequestPattern(urlPattern='*', requestStage=RequestStage.REQUEST)]
+
+    def match(self, method: str, url: str, post_data: Optional[str] = None) -> Optional[dict]:
+        """
+        Find the recorded response to serve next for a request.
+
+        Returns:
+            HAR response object, or None if the request was not recorded.
+        """
+        key = self._key(method, url, post_data)
+        responses = self._responses.get(key)
+        if not responses:
+            return None
+        index = self._served.get(key, 0)
+        self._served[key] = index + 1
+        return responses[min(index, len(responses) - 1)]
+
+    def reset(self):
+        """Serve repeated requests from their first recording again."""
+        self._served.clear()
+
+    async def handle(
+        self,
+        event: RequestPausedEvent,
+        execute_command: Optional[Callable[[Command], Awaitable[Any]]] = None,
+    ) -> Optional[Command[Response]]:
+        """
+        Answer a paused request from the archive.
+
+        Args:
+            event: The paused request event.
+            execute_command: Unused, accepted for the interception stage signature.
+
+        Returns:
+            Command fulfilling or failing the request, None if a missing
+            request should go to the network (or the event is a response).
+        """
+        params = event['params']
+        if 'responseStatusCode' in params or 'responseErrorReason' in params:
+            return None
+        request = params['request']
+        request_id = params['requestId']
+        response = self.match(request.get('method', 'GET'), request['url'], request.get('postData'))
+        if response is not None:
+            self.stats.hits += 1
+            return self._fulfill(request_id, response)
+
+        self.stats.misses += 1
+        self.stats.missed_urls.append(request['url'])
+        if self.on_miss == HarMissBehavior.CONTINUE:
+            return None
+        if self.on_miss == HarMissBehavior.NOT_FOUND:
+            return FetchCommands.fulfill_request(
+                request_id=request_id, response_code=404, response_phrase='Not Found'
+            )
+        return FetchCommands.fail_request(request_id, NetworkErrorReason.INTERNET_DISCONNECTED)
+
+    def _key(self, method: str, url: str, post_data: Optional[str]) -> tuple:
+        if self.match_body:
+            return method.upper(), url, body_hash(post_data)
+        return method.upper(), url
+
+    @staticmethod
+    def _fulfill(request_id: str, response: dict) -> Command[Response]:
+        content = response.get('content', {})
+        text = content.get('text', '')
+        if content.get('encoding') != 'base64':
+            text = base64.b64encode(text.encode('utf-8')).decode('ascii')
+        return FetchCommands.fulfill_request(
+            request_id=request_id,
+            response_code=response['status'],
+            response_headers=[
+                HeaderEntry(name=header['name'], value=header['value'])
+                for header in response.get('headers', [])
+                if header['name'].lower() not in _REPLAY_SKIPPED_HEADERS
+            ],
+            body=text,
+            response_phrase=response.get('statusText') or None,
+        )
+
+    @staticmethod
+    def _load_entries(har: Union[str, Path, dict]) -> list[dict]:
+        if not isinstance(har, dict):
+            try:
+                har = json.loads(Path(har).read_text(encoding='utf-8'))
+            except (OSError, ValueError) as exc:
+                raise InvalidHarFile(f'Could not read HAR file {har}: {exc}')
+        try:
+            return list(har['log']['entries'])  # type: ignore[index]
+        except (KeyError, TypeError):
+            raise InvalidHarFile('HAR document has no log.entries')
@@ -0,0 +1,136 @@
+import asyncio
+import re
+import time
+from typing import Optional, Union
+
+from pydoll.exceptions import NetworkIdleTimeout
+
+
+class NetworkIdleTracker:
+    """
+    Keeps a live count of in-flight requests from Network domain events.
+
+    A request is in flight from Network.requestWillBeSent until
+    Network.loadingFinished or Network.loadingFailed. Requests whose URL
+    matches an ignore pattern (e.g. long polling or analytics beacons) are
+    never counted.
+    """
+
+    def __init__(self, ignore_patterns: Optional[list[Union[str, re.Pattern]]] = None):
+        """
+        Initialize network idle tracker.
+
+        Args:
+            ignore_patterns: Regular expressions searched in request URLs,
+                matching requests are not counted.
+        """
+        self._ignore_patterns = [re.compile(pattern) for pattern in ignore_patterns or []]
+        self._inflight: dict[str, str] = {}
+        self._changed = asyncio.Event()
+        # moment the count last dropped to each level, i.e. stopped exceeding it
+        self._settled_at: dict[int, float] = {}
+        self._started_at = self._now()
+
+    @property
+    def inflight_count(self) -> int:
+        """Number of requests currently in flight."""
+        return len(self._inflight)
+
+    @property
+    def inflight_urls(self) -> list[str]:
+        """URLs of requests currently in flight."""
+        return list(self._inflight.values())
+
+    def is_ignored(self, url: str) -> bool:
+        """Whether requests to the URL are excluded from the count."""
+        return any(pattern.search(url) for pattern in self._ignore_patterns)
+
+    def on_request_will_be_sent(self, event: dict):
+        """Count a new request (redirects reuse the request id and are counted once)."""
+        params = event['params']
+        url = params['request']['url']
+        if params['requestId'] in self._inflight or self.is_ignored(url):
+            return
+        self._inflight[params['requestId']] = url
+        self._notify()
+
+    def on_loading_finished(self, event: dict):
+        """Stop counting a finished request."""
+        self._finish(event['params']['requestId'])
+
+    def on_loading_failed(self, event: dict):
+        """Stop counting a failed or canceled request."""
+        self._finish(event['params']['requestId'])
+
+    def reset(self):
+        """Forget every in-flight request (e.g. after the page was torn down)."""
+        now = self._now()
+        for level in range(self.inflight_count):
+            self._settled_at[level] = now
+        self._inflight.clear()
+        self._notify()
+
+    def idle_for(self, max_inflight: int = 0) -> float:
+        """
+        Seconds since the in-flight count last exceeded max_inflight.
+
+        Returns:
+            Idle duration, or 0.0 if more than max_inflight requests are in flight.
+        """
+        if self.inflight_count > max_inflight:
+            return 0.0
+        return self._now() - self._settled_at.get(max_inflight, self._started_at)
+
+    async def wait_for_idle(
+        self, idle_time: float = 0.5, max_inflight: int = 0, timeout: float = 30
+    ):
+        """
+        Wait until at most max_inflight requests were in flight for idle_time seconds.
+
+        Time the network was already idle before the call counts towards
+        idle_time, so a page that finished loading earlier returns at once.
+
+        Args:
+            idle_time: Seconds the network must stay idle.
+            max_inflight: Requests allowed in flight while considered idle.
+            timeout: Maximum seconds to wait.
+
+        Raises:
+            NetworkIdleTimeout: If the network does not become idle in time.
+        """
+        deadline = self._now() + timeout
+        while True:
+            idle_for = self.idle_for(max_inflight)
+            if self.inflight_count <= max_inflight and idle_for >= idle_time:
+                return
+
+            remaining = deadline - self._now()
+            if remaining <= 0:
+                raise NetworkIdleTimeout(
+                    f'Network not idle after {timeout}s, '
+                    f'{self.inflight_count} requests in flight: {self.inflight_urls[:5]}'
+                )
+
+            wait = remaining
+            if self.inflight_count <= max_inflight:
+                wait = min(remaining, idle_time - idle_for)
+            changed = self._changed
+            try:
+                await asyncio.wait_for(changed.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def _finish(self, request_id: str):
+        if self._inflight.pop(request_id, None) is None:
+            return
+        self._settled_at[self.inflight_count] = self._now()
+        self._notify()
+
+    def _notify(self):
+        """Wake waiters; each waiter holds the event that was current when it started waiting."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
@@ -0,0 +1,375 @@
+import asyncio
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
+from urllib.parse import urlsplit
+
+from pydoll.commands import FetchCommands
+from pydoll.constants import NetworkErrorReason, RequestStage, ResourceType, RuleAction
+from pydoll.exceptions import InvalidRequestRule
+from pydoll.protocol.base import Command, Response
+from pydoll.protocol.fetch.types import HeaderEntry, RequestPattern
+
+# regex features that break once a pattern is embedded in a combined alternation
+_UNCOMBINABLE_REGEX = re.compile(r'\\[1-9]|\(\?P[=<]|\(\?[aiLmsux]+\)')
+
+
+@dataclass
+class RequestRule:
+    """
+    Declarative rule applied to paused requests.
+
+    Every condition that is set must match. URL globs follow Fetch pattern
+    syntax ('*' matches any characters, '?' a single one) and must match the
+    whole URL, regexes are searched anywhere in it, host suffixes match the
+    host and its subdomains on label boundaries.
+    """
+
+    action: RuleAction = RuleAction.BLOCK
+    url_glob: Optional[str] = None
+    url_regex: Optional[Union[str, re.Pattern]] = None
+    host_suffix: Optional[str] = None
+    resource_types: Optional[list[ResourceType]] = None
+    rewrite_url: Optional[str] = None
+    rewrite_headers: Optional[dict[str, str]] = None
+    error_reason: NetworkErrorReason = NetworkErrorReason.BLOCKED_BY_CLIENT
+    name: Optional[str] = None
+    hits: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        """Validate conditions and precompile the URL pattern."""
+        self.action = RuleAction(self.action)
+        if self.url_glob is not None and self.url_regex is not None:
+            raise InvalidRequestRule('A rule takes either url_glob or url_regex, not both')
+        if not (self.url_glob or self.url_regex or self.host_suffix or self.resource_types):
+            raise InvalidRequestRule('A rule needs at least one condition')
+        if self.action == RuleAction.REWRITE and not (self.rewrite_url or self.rewrite_headers):
+            raise InvalidRequestRule('Rewrite rules need rewrite_url or rewrite_headers')
+
+        if self.host_suffix is not None:
+            self.host_suffix = self.host_suffix.lower().strip('.')
+        self._url_pattern: Optional[re.Pattern] = None
+        if self.url_glob is not None:
+            self._url_pattern = re.compile(glob_to_regex(self.url_glob))
+        elif self.url_regex is not None:
+            self._url_pattern = re.compile(self.url_regex)
+        if self.resource_types is not None:
+            self.resource_types = [
+                _to_resource_type(resource_type) for resource_type in self.resource_types
+            ]
+        self._resource_types = {
+            resource_type.value.lower() for resource_type in self.resource_types or []
+        }
+
+    @property
+    def label(self) -> str:
+        """Name used in hit counters."""
+        if self.name:
+            return self.name
+        condition = self.url_glob or self.host_suffix or self.url_regex or self.resource_types
+        return f'{self.action.value}:{getattr(condition, "pattern", condition)}'
+
+    def matches(self, url: str, host: str, resource_type: str) -> bool:
+        """Whether every condition of the rule holds for the request."""
+        if self._resource_types and resource_type.lower() not in self._resource_types:
+            return False
+        if self.host_suffix is not None and not _is_host_suffix(host, self.host_suffix):
+            return False
+        if self._url_pattern is None:
+            return True
+        if self.url_glob is not None:
+            return self._url_pattern.fullmatch(url) is not None
+        return self._url_pattern.search(url) is not None
+
+    def request_patterns(self) -> list[RequestPattern]:
+        """Narrowest Fetch.enable patterns covering every request the rule can match."""
+        if self.url_glob is not None:
+            url_patterns = [self.url_glob]
+        elif self.host_suffix is not None and self.url_regex is None:
+            url_patterns = [f'*://*{self.host_suffix}/*', f'*://*{self.host_suffix}:*']
+        else:
+            url_patterns = ['*']
+
+        patterns = []
+        for url_pattern in url_patterns:
+            for resource_type in self.resource_types or [None]:
+                pattern = RequestPattern(urlPattern=url_pattern, requestStage=RequestStage.REQUEST)
+                if resource_type is not None:
+                    pattern['resourceType'] = resource_type
+                patterns.append(pattern)
+        return patterns
+
+
+class RequestRuleSet:
+    """
+    Rules compiled into a fast matcher.
+
+    Host suffix rules live in a trie walked label by label from the top
+    level domain, URL pattern rules are merged into one alternation per
+    resource type so a single regex match finds the first applicable rule.
+    The first rule (in list order) whose conditions all hold wins.
+    """
+
+    def __init__(self, rules: list[RequestRule]):
+        """
+        Initialize rule set.
+
+        Args:
+            rules: Rules in priority order.
+        """
+        self.rules = list(rules)
+        self.unmatched = 0
+        self._host_trie: dict[Optional[str], Any] = {}
+        self._url_rules: list[int] = []
+        self._uncombinable_rules: list[int] = []
+        self._type_only_rules: list[int] = []
+        self._combined_by_type: dict[str, Optional[re.Pattern]] = {}
+
+        for index, rule in enumerate(self.rules):
+            if rule.host_suffix is not None:
+                self._add_host_suffix(rule.host_suffix, index)
+            elif rule.url_glob is not None or rule.url_regex is not None:
+                if rule.url_regex is not None and _is_uncombinable(rule):
+                    self._uncombinable_rules.append(index)
+                else:
+                    self._url_rules.append(index)
+            else:
+                self._type_only_rules.append(index)
+
+    @property
+    def hits(self) -> dict[str, int]:
+        """Number of requests each rule was applied to."""
+        hits: dict[str, int] = {}
+        for rule in self.rules:
+            hits[rule.label] = hits.get(rule.label, 0) + rule.hits
+        return hits
+
+    def match(self, url: str, resource_type: str = '') -> Optional[RequestRule]:
+        """
+        Find the rule applying to a request.
+
+        Args:
+            url: Request URL.
+            resource_type: Resource type as reported by the Fetch domain.
+
+        Returns:
+            First matching rule, or None.
+        """
+        host = (urlsplit(url).hostname or '').lower()
+        candidates = [
+            index
+            for index in self._match_host_suffix(host)
+            if self.rules[index].matches(url, host, resource_type)
+        ]
+
+        combined = self._get_combined_pattern(resource_type)
+        match = combined.match(url) if combined is not None else None
+        if match is not None:
+            matched_group = next(
+                name for name, value in match.groupdict().items() if value is not None
+            )
+            candidates.append(int(matched_group[1:]))
+
+        candidates.extend(
+            index
+            for index in self._uncombinable_rules + self._type_only_rules
+            if self.rules[index].matches(url, host, resource_type)
+        )
+        if not candidates:
+            return None
+        return self.rules[min(candidates)]
+
+    def request_patterns(self) -> list[RequestPattern]:
+        """Fetch.enable patterns that pause only requests block or rewrite rules may match."""
+        patterns: list[RequestPattern] = []
+        for rule in self.rules:
+            if rule.action == RuleAction.ALLOW:
+                continue
+            for pattern in rule.request_patterns():
+                if pattern not in patterns:
+                    patterns.append(pattern)
+
+        catch_all = RequestPattern(urlPattern='*', requestStage=RequestStage.REQUEST)
+        if catch_all in patterns:
+            return [catch_all]
+        return patterns
+
+    def claims(self, event: dict) -> bool:
+        """Whether resolve() answers the paused request with a rule (no hit is counted)."""
+        params = event['params']
+        if 'responseStatusCode' in params or 'responseErrorReason' in params:
+            return False
+        return self.match(params['request']['url'], params.get('resourceType', '')) is not None
+
+    def resolve(self, event: dict, continue_unmatched: bool = True) -> Optional[Command[Response]]:
+        """
+        Build the command answering a Fetch.requestPaused event.
+
+        Args:
+            event: The paused request event.
+            continue_unmatched: Continue requests no rule applies to (leave
+                them to other handlers otherwise).
+
+        Returns:
+            Command to send, or None if the request is left to other handlers
+            (response stage events always are).
+        """
+        params = event['params']
+        request = params['request']
+        request_id = params['requestId']
+        if 'responseStatusCode' in params or 'responseErrorReason' in params:
+            # rules apply before the request is sent, responses belong to other handlers
+            return FetchCommands.continue_request(request_id) if continue_unmatched else None
+        rule = self.match(request['url'], params.get('resourceType', ''))
+        if rule is None:
+            self.unmatched += 1
+            return FetchCommands.continue_request(request_id) if continue_unmatched else None
+
+        rule.hits += 1
+        if rule.action == RuleAction.BLOCK:
+            return FetchCommands.fail_request(request_id, rule.error_reason)
+        if rule.action == RuleAction.ALLOW:
+            return FetchCommands.continue_request(request_id)
+        return FetchCommands.continue_request(
+            request_id,
+            url=self._rewrite_url(rule, request['url']),
+            headers=self._rewrite_headers(rule, request.get('headers', {})),
+        )
+
+    def _add_host_suffix(self, suffix: str, index: int):
+        node = self._host_trie
+        for label in reversed(suffix.split('.')):
+            node = node.setdefault(label, {})
+        node.setdefault(None, []).append(index)
+
+    def _match_host_suffix(self, host: str) -> list[int]:
+        found: list[int] = []
+        node = self._host_trie
+        for label in reversed(host.split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            found.extend(node.get(None, []))
+        return found
+
+    def _get_combined_pattern(self, resource_type: str) -> Optional[re.Pattern]:
+        """Alternation of URL rules applicable to a resource type (compiled once per type)."""
+        key = resource_type.lower()
+        if key in self._combined_by_type:
+            return self._combined_by_type[key]
+
+        alternatives = []
+        for index in self._url_rules:
+            rule = self.rules[index]
+            if rule._resource_types and key not in rule._resource_types:
+                continue
+            pattern = rule._url_pattern.pattern  # type: ignore[union-attr]
+            if rule.url_glob is not None:
+                alternatives.append(f'(?P<r{index}>{pattern}\\Z)')
+            else:
+                # lazy prefix turns match() into a search while alternatives keep rule order
+                alternatives.append(f'(?P<r{index}>.*?(?:{pattern}))')
+
+        combined = None
+        if alternatives:
+            try:
+                combined = re.compile('|'.join(alternatives), re.DOTALL)
+            except re.error:
+                # e.g. too many groups, fall back to matching these rules one by one
+                self._uncombinable_rules.extend(self._url_rules)
+                self._url_rules = []
+                self._combined_by_type.clear()
+        self._combined_by_type[key] = combined
+        return combined
+
+    @staticmethod
+    def _rewrite_url(rule: RequestRule, url: str) -> Optional[str]:
+        if rule.rewrite_url is None:
+            return None
+        if rule.url_regex is not None:
+            return rule._url_pattern.sub(rule.rewrite_url, url, count=1)  # type: ignore[union-attr]
+        return rule.rewrite_url
+
+    @staticmethod
+    def _rewrite_headers(rule: RequestRule, headers: dict[str, str]) -> Optional[list[HeaderEntry]]:
+        if not rule.rewrite_headers:
+            return None
+        merged = {name: value for name, value in headers.items()}
+        lowered = {name.lower(): name for name in merged}
+        for name, value in rule.rewrite_headers.items():
+            merged.pop(lowered.get(name.lower(), name), None)
+            merged[name] = value
+        return [HeaderEntry(name=name, value=value) for name, value in merged.items()]
+
+
+def skip_rule_matches(
+    callback: Callable[[dict], Any], get_rules: Callable[[], Optional[RequestRuleSet]]
+) -> Callable[[dict], Any]:
+    """
+    Wrap a Fetch.requestPaused callback so it never sees requests the rules answer.
+
+    Args:
+        callback: User or internal handler (sync or async).
+        get_rules: Returns the active rule set, None when rules are off.
+    """
+
+    def is_claimed(event: dict) -> bool:
+        rules = get_rules()
+        return rules is not None and rules.claims(event)
+
+    if asyncio.iscoroutinefunction(callback):
+
+        async def async_wrapper(event: dict):
+            if not is_claimed(event):
+                await callback(event)
+
+        return async_wrapper
+
+    def wrapper(event: dict):
+        if not is_claimed(event):
+            return callback(event)
+        return None
+
+    return wrapper
+
+
+def glob_to_regex(glob: str) -> str:
+    """Translate a Fetch URL glob ('*', '?', backslash escapes) into a regex."""
+    parts = []
+    escaped = False
+    for char in glob:
+        if escaped:
+            parts.append(re.escape(char))
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == '*':
+            parts.append('.*')
+        elif char == '?':
+            parts.append('.')
+        else:
+            parts.append(re.escape(char))
+    return ''.join(parts)
+
+
+def _is_uncombinable(rule: RequestRule) -> bool:
+    """Whether a regex rule must be matched on its own rather than in the alternation."""
+    pattern = rule._url_pattern
+    # flags of compiled regexes would be lost in the combined pattern
+    return bool(pattern.flags & ~re.UNICODE) or bool(  # type: ignore[union-attr]
+        _UNCOMBINABLE_REGEX.search(pattern.pattern)  # type: ignore[union-attr]
+    )
+
+
+def _to_resource_type(resource_type: Union[str, ResourceType]) -> ResourceType:
+    """Resource type enum member for a value given in any case."""
+    if isinstance(resource_type, ResourceType):
+        return resource_type
+    for member in ResourceType:
+        if member.value.lower() == str(resource_type).lower():
+            return member
+    raise InvalidRequestRule(f'Unknown resource type: {resource_type!r}')
+
+
+def _is_host_suffix(host: str, suffix: str) -> bool:
+    return host == suffix or host.endswith(f'.{suffix}')
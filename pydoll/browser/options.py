@@ -1,6 +1,45 @@
+from typing import Optional, Union
+
 from pydoll.browser.interfaces import Options
+from pydoll.constants import PerformanceProfile
 from pydoll.exceptions import ArgumentAlreadyExistsInOptions
 
+_COMMON_PERFORMANCE_ARGUMENTS = [
+    '--blink-settings=imagesEnabled=false',
+    '--disable-gpu',
+    '--disable-background-networking',
+    '--disable-site-isolation-trials',
+    '--disable-extensions',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--metrics-recording-only',
+    '--mute-audio',
+]
+
+PERFORMANCE_PROFILE_ARGUMENTS = {
+    PerformanceProfile.MAX_THROUGHPUT: [
+        *_COMMON_PERFORMANCE_ARGUMENTS,
+        '--disable-background-timer-throttling',
+        '--disable-backgrounding-occluded-windows',
+        '--disable-renderer-backgrounding',
+        '--disable-ipc-flooding-protection',
+    ],
+    PerformanceProfile.LOW_MEMORY: [
+        *_COMMON_PERFORMANCE_ARGUMENTS,
+        '--process-per-site',
+        '--disable-dev-shm-usage',
+        '--disk-cache-size=1048576',
+        '--js-flags=--max-old-space-size=256',
+        '--disable-features=Translate,MediaRouter,OptimizationHints',
+    ],
+}
+
+PERFORMANCE_PROFILE_RENDERER_LIMITS = {
+    PerformanceProfile.MAX_THROUGHPUT: 8,
+    PerformanceProfile.LOW_MEMORY: 2,
+}
+
 
 class ChromiumOptions(Options):
     """
@@ -22,6 +61,9 @@ class ChromiumOptions(Options):
         self._start_timeout = 10
         self._enable_fingerprint_spoofing = False
         self._fingerprint_config = None
+        self._output_buffer_size = 1000
+        self._output_log_file = None
+        self._performance_profile = None
 
     @property
     def arguments(self) -> list[str]:
@@ -123,6 +165,99 @@ class ChromiumOptions(Options):
         """
         self._fingerprint_config = config
 
+    @property
+    def output_buffer_size(self) -> int:
+        """
+        Gets the number of browser stdout/stderr lines kept in memory.
+
+        Returns:
+            int: The maximum number of buffered output lines.
+        """
+        return self._output_buffer_size
+
+    @output_buffer_size.setter
+    def output_buffer_size(self, size: int):
+        """
+        Sets the number of browser stdout/stderr lines kept in memory.
+
+        Args:
+            size (int): The maximum number of buffered output lines.
+        """
+        self._output_buffer_size = size
+
+    @property
+    def output_log_file(self) -> Optional[str]:
+        """
+        Gets the file that mirrors the browser stdout/stderr output.
+
+        Returns:
+            Optional[str]: The log file path, or None if output is only buffered.
+        """
+        return self._output_log_file
+
+    @output_log_file.setter
+    def output_log_file(self, path: Optional[str]):
+        """
+        Sets the file that mirrors the browser stdout/stderr output.
+
+        Args:
+            path (Optional[str]): The log file path, or None to disable mirroring.
+        """
+        self._output_log_file = path
+
+    @property
+    def performance_profile(self) -> Optional[PerformanceProfile]:
+        """
+        Gets the performance profile applied to these options.
+
+        Returns:
+            Optional[PerformanceProfile]: The applied profile, or None if none was applied.
+        """
+        return self._performance_profile
+
+    def apply_performance_profile(
+        self,
+        profile: Union[PerformanceProfile, str],
+        renderer_process_limit: Optional[int] = None,
+        disk_cache_dir: Optional[str] = None,
+    ):
+        """
+        Adds a curated set of arguments tuned for headless crawling.
+
+        'max_throughput' disables images, GPU, background networking,
+        site isolation trials, extensions and background throttling.
+        'low_memory' disables the same features and additionally keeps
+        renderers, caches and the JS heap small. Flags already present in
+        the arguments (e.g. a user supplied '--blink-settings=...') are
+        kept and the profile's variant is skipped.
+
+        Args:
+            profile (Union[PerformanceProfile, str]): The preset to apply.
+            renderer_process_limit (Optional[int]): Maximum number of renderer
+                processes (preset default if None).
+            disk_cache_dir (Optional[str]): Disk cache directory shared by every
+                browser using these options. Browsers running at the same time
+                should not share a directory, so pooled crawlers usually pass
+                one directory per pool slot.
+
+        Raises:
+            ValueError: If the profile name is unknown.
+        """
+        profile = PerformanceProfile(profile)
+        limit = renderer_process_limit or PERFORMANCE_PROFILE_RENDERER_LIMITS[profile]
+        arguments = [
+            *PERFORMANCE_PROFILE_ARGUMENTS[profile],
+            f'--renderer-process-limit={limit}',
+        ]
+        if disk_cache_dir is not None:
+            arguments.append(f'--disk-cache-dir={disk_cache_dir}')
+
+        present_flags = {argument.split('=', 1)[0] for argument in self._arguments}
+        for argument in arguments:
+            if argument.split('=', 1)[0] not in present_flags:
+                self._arguments.append(argument)
+        self._performance_profile = profile
+
     def add_argument(self, argument: str):
         """
         Adds a command-line argument to the options.
@@ -1,5 +1,8 @@
 import asyncio
+import itertools
+import json
 import logging
+import re
 from contextlib import asynccontextmanager
 from functools import partial
 from pathlib import Path
@@ -17,6 +20,27 @@ from typing import (
 
 import aiofiles
 
+from pydoll.browser.network import (
+    AssetCache,
+    HarRecorder,
+    HarReplayer,
+    InterceptionDispatcher,
+    NavigationUsage,
+    NetworkBudget,
+    NetworkIdleTracker,
+    RequestExpectation,
+    RequestRule,
+    RequestRuleSet,
+    ResponseBodyStreamer,
+    ResponseExpectation,
+)
+from pydoll.browser.network.dispatcher import (
+    InterceptionStage,
+    RequestHandler,
+    run_interception_stages,
+)
+from pydoll.browser.network.expectations import EventPredicate, UrlPattern
+from pydoll.browser.network.rules import skip_rule_matches
 from pydoll.commands import (
     DomCommands,
     FetchCommands,
@@ -27,14 +51,19 @@ from pydoll.commands import (
 )
 from pydoll.connection import ConnectionHandler
 from pydoll.constants import (
+    BudgetAction,
     By,
+    HarMissBehavior,
     NetworkErrorReason,
+    PageLoadState,
     RequestMethod,
     RequestStage,
     ResourceType,
     ScreenshotFormat,
+    Scripts,
+    TextMode,
 )
-from pydoll.elements.mixins import FindElementsMixin
+from pydoll.elements.mixins import ExtractionMixin, FindElementsMixin
 from pydoll.elements.web_element import WebElement
 from pydoll.exceptions import (
     IFrameNotFound,
@@ -45,19 +74,29 @@ from pydoll.exceptions import (
     NoDialogPresent,
     NotAnIFrame,
     PageLoadTimeout,
-    WaitElementTimeout,
+    PydollException,
 )
 from pydoll.protocol.base import Response
 from pydoll.protocol.dom.types import EventFileChooserOpened
+from pydoll.protocol.fetch.events import FetchEvent
 from pydoll.protocol.fetch.types import HeaderEntry
+from pydoll.protocol.network.events import NetworkEvent
 from pydoll.protocol.network.responses import GetResponseBodyResponse
-from pydoll.protocol.network.types import Cookie, CookieParam, NetworkLog
+from pydoll.protocol.network.types import Cookie, CookieParam, NetworkLog, RequestPausedEvent
 from pydoll.protocol.page.events import PageEvent
-from pydoll.protocol.page.responses import CaptureScreenshotResponse, PrintToPDFResponse
+from pydoll.protocol.page.responses import (
+    CaptureScreenshotResponse,
+    GetFrameTreeResponse,
+    NavigateResponse,
+    PrintToPDFResponse,
+)
+from pydoll.protocol.page.types import Frame, FrameTree
 from pydoll.protocol.runtime.responses import CallFunctionOnResponse, EvaluateResponse
+from pydoll.protocol.runtime.types import CallArgument
 from pydoll.protocol.storage.responses import GetCookiesResponse
 from pydoll.utils import (
     decode_base64_to_bytes,
+    extract_text_from_html,
     has_return_outside_function,
     is_script_already_function,
 )
@@ -68,9 +107,21 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 IFrame: TypeAlias = 'Tab'
+FormValue: TypeAlias = Union[str, bool, int, float, list[str]]
+
+# Page.lifecycleEvent names signalling each load state ('commit' needs a new loader only)
+_LIFECYCLE_EVENT_NAMES: dict[PageLoadState, Optional[str]] = {
+    PageLoadState.COMMIT: None,
+    PageLoadState.DOM_CONTENT_LOADED: 'DOMContentLoaded',
+    PageLoadState.LOAD: 'load',
+    PageLoadState.NETWORK_IDLE: 'networkIdle',
+}
 
+# numbers the object groups of Tab.scope
+_object_group_ids = itertools.count(1)
 
-class Tab(FindElementsMixin):  # noqa: PLR0904
+
+class Tab(FindElementsMixin, ExtractionMixin):  # noqa: PLR0904
     """
     Controls a browser tab via Chrome DevTools Protocol.
 
@@ -142,11 +193,32 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
         self._page_events_enabled: bool = False
         self._network_events_enabled: bool = False
         self._fetch_events_enabled: bool = False
+        self._fetch_events_options: dict[str, Any] = {}
         self._dom_events_enabled: bool = False
         self._runtime_events_enabled: bool = False
         self._intercept_file_chooser_dialog_enabled: bool = False
         self._cloudflare_captcha_callback_id: Optional[int] = None
         self._browser_context_id: Optional[str] = browser_context_id
+        self._navigation_tracking_enabled: bool = False
+        self._navigation_callback_ids: list[int] = []
+        self._load_waiters: list[tuple[Optional[str], Optional[str], asyncio.Future]] = []
+        self._main_frame_id: str = target_id
+        self._main_frame_loader: Optional[str] = None
+        self._main_frame_load_events: set[str] = set()
+        self._frames: dict[str, Frame] = {}
+        self._network_idle_tracker: Optional[NetworkIdleTracker] = None
+        self._network_idle_callback_ids: list[int] = []
+        self._network_budget: Optional[NetworkBudget] = None
+        self._network_budget_callback_ids: list[int] = []
+        self._request_rules: Optional[RequestRuleSet] = None
+        self._asset_cache: Optional[AssetCache] = None
+        self._har_recorder: Optional[HarRecorder] = None
+        self._har_replayer: Optional[HarReplayer] = None
+        self._request_paused_callback_id: Optional[int] = None
+        self._interception_dispatcher: Optional[InterceptionDispatcher] = None
+        self._response_body_streamer = ResponseBodyStreamer(self._execute_command)
+        self._interception_callback_id: Optional[int] = None
+        self._object_group: Optional[str] = None
         self._initialized: bool = True
 
     @classmethod
@@ -212,9 +284,68 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
         """Whether file chooser dialog interception is active."""
         return self._intercept_file_chooser_dialog_enabled
 
+    @property
+    def network_idle_tracker(self) -> Optional[NetworkIdleTracker]:
+        """In-flight request tracker, None unless network idle tracking is enabled."""
+        return self._network_idle_tracker
+
+    @property
+    def network_budget(self) -> Optional[NetworkBudget]:
+        """Per navigation network budget, None unless enabled."""
+        return self._network_budget
+
+    @property
+    def interception_dispatcher(self) -> Optional[InterceptionDispatcher]:
+        """Active interception dispatcher, None unless request interception is enabled."""
+        return self._interception_dispatcher
+
+    @property
+    def asset_cache(self) -> Optional[AssetCache]:
+        """Active asset cache, None unless enabled with enable_asset_cache."""
+        return self._asset_cache
+
+    @property
+    def har_recorder(self) -> Optional[HarRecorder]:
+        """Active HAR recorder, None unless enabled with enable_har_recording."""
+        return self._har_recorder
+
+    @property
+    def har_replayer(self) -> Optional[HarReplayer]:
+        """Active HAR replayer, None unless enabled with enable_har_replay."""
+        return self._har_replayer
+
+    @property
+    def response_body_streamer(self) -> ResponseBodyStreamer:
+        """Streamer behind iter_response_body, set max_concurrent or chunk_size on it."""
+        return self._response_body_streamer
+
+    @property
+    def request_rules(self) -> Optional[RequestRuleSet]:
+        """Active request rules, None unless enabled with enable_request_rules."""
+        return self._request_rules
+
+    @property
+    def loader_id(self) -> Optional[str]:
+        """Loader id of the current main frame document (None until navigation is tracked)."""
+        return self._main_frame_loader
+
+    @property
+    def frames(self) -> list[Frame]:
+        """Frames of the page as last reported by Page events (empty until tracked)."""
+        return [Frame(**frame) for frame in self._frames.values()]
+
     @property
     async def current_url(self) -> str:
-        """Get current page URL (reflects redirects and client-side navigation)."""
+        """
+        Get current page URL (reflects redirects and client-side navigation).
+
+        Read from the navigation state cache while page events are enabled,
+        otherwise queried from the page.
+        """
+        cached_url = self._get_cached_url()
+        if cached_url is not None:
+            return cached_url
+
         response: EvaluateResponse = await self._execute_command(
             RuntimeCommands.evaluate('window.location.href')
         )
@@ -232,6 +363,7 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
         """Enable CDP Page domain events (load, navigation, dialogs, etc.)."""
         response = await self._execute_command(PageCommands.enable())
         self._page_events_enabled = True
+        await self._enable_navigation_tracking(page_domain_enabled=True)
         return response
 
     async def enable_network_events(self):
@@ -265,8 +397,188 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
             )
         )
         self._fetch_events_enabled = True
+        self._fetch_events_options = {
+            'handle_auth': handle_auth,
+            'resource_type': resource_type,
+            'request_stage': request_stage,
+        }
         return response
 
+    async def enable_request_rules(self, rules: list[RequestRule]) -> RequestRuleSet:
+        """
+        Block, allow or rewrite requests with declarative rules.
+
+        Rules are compiled into a single matcher and Fetch.enable is narrowed
+        to the patterns block and rewrite rules can match, so unrelated
+        requests are never paused. While your own fetch events are enabled,
+        their patterns stay in place and requests no rule matches are left
+        to your handlers.
+
+        Args:
+            rules: Rules in priority order, the first matching rule wins.
+
+        Returns:
+            The compiled rule set with per-rule hit counters.
+        """
+        rule_set = RequestRuleSet(rules)
+        self._request_rules = rule_set
+        await self._update_request_interception()
+        return rule_set
+
+    async def disable_request_rules(self):
+        """Stop applying request rules."""
+        if self._request_rules is None:
+            return
+        self._request_rules = None
+        await self._update_request_interception(disable_when_idle=True)
+
+    async def enable_asset_cache(self, cache: AssetCache) -> AssetCache:
+        """
+        Serve static assets from a local content-addressed cache.
+
+        Cacheable responses of the cache's resource types are stored at the
+        response stage and later requests are fulfilled from disk. The same
+        cache can be shared by many tabs and browsers. While your own fetch
+        events are enabled, only the stages your patterns pause are seen.
+
+        Args:
+            cache: Cache to read from and store into.
+
+        Returns:
+            The cache, whose stats report hits and misses.
+        """
+        self._asset_cache = cache
+        await self._update_request_interception()
+        return cache
+
+    async def disable_asset_cache(self):
+        """Stop serving and storing assets (the cache keeps its entries)."""
+        if self._asset_cache is None:
+            return
+        self._asset_cache = None
+        await self._update_request_interception(disable_when_idle=True)
+
+    async def enable_har_recording(self, recorder: Optional[HarRecorder] = None) -> HarRecorder:
+        """
+        Record the traffic of this tab as HAR.
+
+        Every response is paused once to read its body, then continued.
+
+        Args:
+            recorder: Recorder to append to (a new one if None).
+
+        Returns:
+            The recorder, call its save() to write the HAR file.
+        """
+        self._har_recorder = recorder or HarRecorder()
+        await self._update_request_interception()
+        return self._har_recorder
+
+    async def disable_har_recording(self) -> Optional[HarRecorder]:
+        """
+        Stop recording.
+
+        Returns:
+            The recorder that was active, if any.
+        """
+        recorder = self._har_recorder
+        if recorder is not None:
+            self._har_recorder = None
+            await self._update_request_interception(disable_when_idle=True)
+        return recorder
+
+    async def enable_har_replay(
+        self,
+        har: Union[str, Path, dict, HarReplayer],
+        on_miss: HarMissBehavior = HarMissBehavior.FAIL,
+        match_body: bool = True,
+    ) -> HarReplayer:
+        """
+        Serve every request of this tab from a HAR archive.
+
+        Requests are fulfilled from the recording without touching the
+        network, matched by method, URL and request body hash.
+
+        Args:
+            har: HAR file path, parsed HAR document or replayer.
+            on_miss: What to do with requests missing from the archive.
+            match_body: Include the request body hash in the match.
+
+        Returns:
+            The replayer, whose stats report hits and missed URLs.
+
+        Raises:
+            InvalidHarFile: If the archive cannot be read.
+        """
+        if not isinstance(har, HarReplayer):
+            har = HarReplayer(har, on_miss=on_miss, match_body=match_body)
+        self._har_replayer = har
+        await self._update_request_interception()
+        return har
+
+    async def disable_har_replay(self):
+        """Stop serving requests from the HAR archive."""
+        if self._har_replayer is None:
+            return
+        self._har_replayer = None
+        await self._update_request_interception(disable_when_idle=True)
+
+    async def enable_request_interception(  # noqa: PLR0913, PLR0917
+        self,
+        handler: RequestHandler,
+        max_concurrency: int = 16,
+        handler_timeout: Optional[float] = 10.0,
+        resource_type: Optional[ResourceType] = None,
+        request_stage: Optional[RequestStage] = None,
+    ) -> InterceptionDispatcher:
+        """
+        Intercept requests with a handler running on a bounded worker pool.
+
+        Paused requests are queued and handled concurrently, at most
+        max_concurrency at a time. The handler answers the request itself
+        (e.g. with continue_request) or returns the FetchCommands command to
+        send. A handler that raises or runs longer than handler_timeout has
+        its request continued unchanged. Active request rules and the asset
+        cache get the request before the handler.
+
+        Args:
+            handler: Called with every paused request (sync or async).
+            max_concurrency: Maximum number of handlers running at once.
+            handler_timeout: Seconds before the request is continued
+                unchanged (None for no limit).
+            resource_type: Filter by resource type (all if None).
+            request_stage: When to intercept (Request/Response).
+
+        Returns:
+            The dispatcher, whose stats report counters and queue delays.
+        """
+        await self.disable_request_interception()
+        dispatcher = InterceptionDispatcher(
+            handler,
+            self._execute_command,
+            max_concurrency=max_concurrency,
+            handler_timeout=handler_timeout,
+        )
+        self._interception_dispatcher = dispatcher
+        self._interception_callback_id = await self._register_callback(
+            FetchEvent.REQUEST_PAUSED, dispatcher.dispatch
+        )
+        await self.enable_fetch_events(resource_type=resource_type, request_stage=request_stage)
+        await self._update_request_interception()
+        return dispatcher
+
+    async def disable_request_interception(self):
+        """Stop the interception dispatcher and disable the Fetch domain."""
+        dispatcher = self._interception_dispatcher
+        if dispatcher is None:
+            return
+        if self._interception_callback_id is not None:
+            await self._connection_handler.remove_callback(self._interception_callback_id)
+        self._interception_dispatcher = None
+        self._interception_callback_id = None
+        await dispatcher.close()
+        await self.disable_fetch_events()
+
     async def enable_dom_events(self):
         """Enable CDP DOM domain events (document structure changes)."""
         response = await self._execute_command(DomCommands.enable())
@@ -317,15 +629,17 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
         self._cloudflare_captcha_callback_id = await self.on(PageEvent.LOAD_EVENT_FIRED, callback)
 
     async def disable_fetch_events(self):
-        """Disable CDP Fetch domain and release paused requests."""
+        """Disable CDP Fetch domain and release paused requests (rules and cache stay active)."""
         response = await self._execute_command(FetchCommands.disable())
         self._fetch_events_enabled = False
+        await self._update_request_interception()
         return response
 
     async def disable_page_events(self):
         """Disable CDP Page domain events."""
         response = await self._execute_command(PageCommands.disable())
         self._page_events_enabled = False
+        self._navigation_tracking_enabled = False
         return response
 
     async def disable_network_events(self):
@@ -427,6 +741,228 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
         )
         return response['result']['body']
 
+    async def iter_response_body(self, request_id: str) -> AsyncGenerator[bytes, None]:
+        """
+        Stream the body of a request paused at the response stage in chunks.
+
+        Unlike get_network_response_body the body is never held in memory
+        as a whole. Enable fetch events with RequestStage.RESPONSE to pause
+        responses. Taking the body consumes it, so afterwards the request
+        must be fulfilled or failed instead of continued.
+
+        Args:
+            request_id: Request ID from Fetch.requestPaused.
+
+        Yields:
+            Body chunks as bytes.
+        """
+        async for chunk in self._response_body_streamer.iter_body(request_id):
+            yield chunk
+
+    async def save_response_body(self, request_id: str, path: Union[str, Path]) -> int:
+        """
+        Stream the body of a request paused at the response stage to a file.
+
+        Args:
+            request_id: Request ID from Fetch.requestPaused.
+            path: File to write.
+
+        Returns:
+            Number of bytes written.
+        """
+        return await self._response_body_streamer.save_body(request_id, path)
+
+    async def expect_request(
+        self,
+        url_pattern: Optional[UrlPattern] = None,
+        predicate: Optional[EventPredicate] = None,
+        timeout: float = 30,
+    ) -> RequestExpectation:
+        """
+        Start waiting for the first request matching a pattern.
+
+        Call before triggering the request, then await the returned
+        expectation. Enables network events if needed.
+
+        Args:
+            url_pattern: Glob matched against the whole URL (e.g.
+                '*/api/items*') or compiled regex searched in it.
+            predicate: Called with the Network.requestWillBeSent params,
+                must return True to match.
+            timeout: Seconds awaiting the expectation waits.
+
+        Returns:
+            Awaitable resolving to the CapturedRequest, raises
+            NetworkEventTimeout when awaited after the timeout.
+        """
+        expectation = RequestExpectation(url_pattern, predicate, timeout)
+        await self._start_network_expectation(expectation)
+        return expectation
+
+    async def expect_response(
+        self,
+        url_pattern: Optional[UrlPattern] = None,
+        predicate: Optional[EventPredicate] = None,
+        timeout: float = 30,
+        with_body: bool = False,
+    ) -> ResponseExpectation:
+        """
+        Start waiting for the first response matching a pattern.
+
+        The expectation resolves once the matching response finished
+        loading, with its body when with_body is set, so no polling of the
+        network logs is needed. Listeners are removed automatically.
+
+        Example:
+            ```python
+            items = await tab.expect_response('*/api/items*', with_body=True)
+            await button.click()
+            data = (await items).json()
+            ```
+
+        Args:
+            url_pattern: Glob matched against the whole URL or compiled regex
+                searched in it.
+            predicate: Called with the Network.responseReceived params, must
+                return True to match.
+            timeout: Seconds awaiting the expectation waits.
+            with_body: Fetch the response body before resolving.
+
+        Returns:
+            Awaitable resolving to the CapturedResponse, raises
+            NetworkEventTimeout when awaited after the timeout.
+        """
+        expectation = ResponseExpectation(
+            url_pattern, predicate, timeout, with_body, execute_command=self._execute_command
+        )
+        await self._start_network_expectation(expectation)
+        return expectation
+
+    async def enable_network_idle_tracking(
+        self, ignore_patterns: Optional[list[Union[str, re.Pattern]]] = None
+    ) -> NetworkIdleTracker:
+        """
+        Start counting in-flight requests of this tab.
+
+        Enables network events if needed. Requests already in flight when
+        tracking starts are not counted, so enable it before navigating.
+        Enabling again replaces the tracker (and its ignore patterns).
+
+        Args:
+            ignore_patterns: Regular expressions searched in request URLs,
+                matching requests never keep the network busy.
+
+        Returns:
+            The tracker fed by this tab's network events.
+        """
+        await self.disable_network_idle_tracking()
+        if not self.network_events_enabled:
+            await self.enable_network_events()
+
+        tracker = NetworkIdleTracker(ignore_patterns)
+        listeners = [
+            (NetworkEvent.REQUEST_WILL_BE_SENT, tracker.on_request_will_be_sent),
+            (NetworkEvent.LOADING_FINISHED, tracker.on_loading_finished),
+            (NetworkEvent.LOADING_FAILED, tracker.on_loading_failed),
+        ]
+        for event_name, listener in listeners:
+            self._network_idle_callback_ids.append(
+                await self._connection_handler.register_callback(event_name, listener)
+            )
+        self._network_idle_tracker = tracker
+        return tracker
+
+    async def disable_network_idle_tracking(self):
+        """Stop counting in-flight requests (network events stay enabled)."""
+        for callback_id in self._network_idle_callback_ids:
+            await self._connection_handler.remove_callback(callback_id)
+        self._network_idle_callback_ids = []
+        self._network_idle_tracker = None
+
+    async def wait_for_network_idle(
+        self, idle_time: float = 0.5, max_inflight: int = 0, timeout: float = 30
+    ):
+        """
+        Wait until the page stops fetching.
+
+        Starts network idle tracking if it is not enabled yet, in which case
+        requests already in flight are not seen.
+
+        Args:
+            idle_time: Seconds with at most max_inflight requests in flight.
+            max_inflight: Requests allowed in flight while considered idle.
+            timeout: Maximum seconds to wait.
+
+        Raises:
+            NetworkIdleTimeout: If the network does not become idle in time.
+        """
+        tracker = self._network_idle_tracker or await self.enable_network_idle_tracking()
+        await tracker.wait_for_idle(idle_time, max_inflight, timeout)
+
+    async def enable_network_budget(  # noqa: PLR0913, PLR0917
+        self,
+        max_bytes: Optional[int] = None,
+        max_requests: Optional[int] = None,
+        max_duration: Optional[float] = None,
+        action: BudgetAction = BudgetAction.STOP_LOADING,
+        on_exceeded: Optional[Callable[[NavigationUsage], Any]] = None,
+    ) -> NetworkBudget:
+        """
+        Limit the bytes, requests and time each navigation of this tab may use.
+
+        Enables network events if needed. Usage is counted from the main
+        frame document request of each navigation, so enable the budget
+        before navigating. Once a limit is exceeded the page stops loading
+        (STOP_LOADING) or every further request is paused through Fetch and
+        failed until the next go_to/refresh (BLOCK_REQUESTS). Enabling again
+        replaces the budget.
+
+        Args:
+            max_bytes: Maximum encoded bytes received per navigation.
+            max_requests: Maximum requests sent per navigation.
+            max_duration: Maximum seconds per navigation.
+            action: What to do once a limit is exceeded.
+            on_exceeded: Called with the NavigationUsage that exceeded a limit.
+
+        Returns:
+            The budget, whose current and history attributes report usage.
+        """
+        await self.disable_network_budget()
+        budget = NetworkBudget(
+            self._execute_command,
+            self._main_frame_id,
+            max_bytes=max_bytes,
+            max_requests=max_requests,
+            max_duration=max_duration,
+            action=action,
+            on_exceeded=on_exceeded,
+            update_interception=partial(self._update_request_interception, disable_when_idle=True),
+        )
+        if not self.network_events_enabled:
+            await self.enable_network_events()
+
+        listeners = [
+            (NetworkEvent.REQUEST_WILL_BE_SENT, budget.on_request_will_be_sent),
+            (NetworkEvent.DATA_RECEIVED, budget.on_data_received),
+            (NetworkEvent.LOADING_FINISHED, budget.on_loading_finished),
+        ]
+        for event_name, listener in listeners:
+            self._network_budget_callback_ids.append(
+                await self._connection_handler.register_callback(event_name, listener)
+            )
+        self._network_budget = budget
+        return budget
+
+    async def disable_network_budget(self):
+        """Stop enforcing the network budget and lift its request block."""
+        budget, self._network_budget = self._network_budget, None
+        for callback_id in self._network_budget_callback_ids:
+            await self._connection_handler.remove_callback(callback_id)
+        self._network_budget_callback_ids = []
+        if budget is not None:
+            budget.close()
+            await budget.release()
+
     async def get_network_logs(self, filter: Optional[str] = None) -> list[NetworkLog]:
         """
         Get network logs.
@@ -468,33 +1004,49 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
         """Delete all cookies from current browser context."""
         return await self._execute_command(StorageCommands.clear_cookies(self._browser_context_id))
 
-    async def go_to(self, url: str, timeout: int = 300):
+    async def go_to(
+        self,
+        url: str,
+        timeout: int = 300,
+        wait_until: Union[PageLoadState, str] = PageLoadState.LOAD,
+    ):
         """
         Navigate to URL and wait for loading to complete.
 
-        Refreshes if URL matches current page.
+        Refreshes if URL matches current page. Waiting is driven by Page
+        lifecycle events, so it returns as soon as the requested state is
+        reached. Same-document navigations (e.g. fragment changes) return
+        right after the navigation command.
 
         Args:
             url: Target URL to navigate to.
             timeout: Maximum seconds to wait for page load (default 300).
+            wait_until: Load state to wait for: 'commit', 'domcontentloaded',
+                'load' (default) or 'networkidle'.
 
         Raises:
             PageLoadTimeout: If page doesn't finish loading within timeout.
         """
-        if await self._refresh_if_url_not_changed(url):
+        wait_until = PageLoadState(wait_until)
+        await self._enable_navigation_tracking()
+        if self._network_budget is not None:
+            await self._network_budget.release()
+        if await self._refresh_if_url_not_changed(url, timeout, wait_until):
             return
 
-        await self._execute_command(PageCommands.navigate(url))
+        previous_loader = self._main_frame_loader
+        response: NavigateResponse = await self._execute_command(PageCommands.navigate(url))
+        if wait_until == PageLoadState.COMMIT or 'loaderId' not in response['result']:
+            return
 
-        try:
-            await self._wait_page_load(timeout=timeout)
-        except WaitElementTimeout:
-            raise PageLoadTimeout()
+        await self._wait_page_load(previous_loader, wait_until, timeout)
 
     async def refresh(
         self,
         ignore_cache: bool = False,
         script_to_evaluate_on_load: Optional[str] = None,
+        wait_until: Union[PageLoadState, str] = PageLoadState.LOAD,
+        timeout: int = 300,
     ):
         """
         Reload current page and wait for completion.
@@ -502,19 +1054,24 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
         Args:
             ignore_cache: Bypass browser cache if True.
             script_to_evaluate_on_load: JavaScript to execute after load.
+            wait_until: Load state to wait for: 'commit', 'domcontentloaded',
+                'load' (default) or 'networkidle'.
+            timeout: Maximum seconds to wait for page load (default 300).
 
         Raises:
             PageLoadTimeout: If page doesn't finish loading within timeout.
         """
+        wait_until = PageLoadState(wait_until)
+        await self._enable_navigation_tracking()
+        if self._network_budget is not None:
+            await self._network_budget.release()
+        previous_loader = self._main_frame_loader
         await self._execute_command(
             PageCommands.reload(
                 ignore_cache=ignore_cache, script_to_evaluate_on_load=script_to_evaluate_on_load
             )
         )
-        try:
-            await self._wait_page_load()
-        except WaitElementTimeout:
-            raise PageLoadTimeout()
+        await self._wait_page_load(previous_loader, wait_until, timeout)
 
     async def take_screenshot(
         self,
@@ -680,6 +1237,102 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
 
         return await self._execute_script_without_element(script)
 
+    async def texts(
+        self, elements: list[WebElement], mode: TextMode = TextMode.INNER_TEXT
+    ) -> list[str]:
+        """
+        Text of many elements with a single command.
+
+        Args:
+            elements: Elements of this tab.
+            mode: Text mode as in WebElement.get_text(); with HTML_PARSER the
+                outerHTML of every element is fetched at once and parsed here.
+
+        Returns:
+            Stripped text of each element, in the order given.
+        """
+        if not elements:
+            return []
+        mode = TextMode(mode)
+        response: CallFunctionOnResponse = await self._execute_command(
+            RuntimeCommands.call_function_on(
+                function_declaration=Scripts.ELEMENT_TEXTS,
+                object_id=elements[0]._object_id,
+                arguments=[
+                    CallArgument(value=mode.value),
+                    *(CallArgument(objectId=element._object_id) for element in elements),
+                ],
+                return_by_value=True,
+            )
+        )
+        values = response['result']['result']['value']
+        if mode == TextMode.HTML_PARSER:
+            return [extract_text_from_html(html, strip=True) for html in values]
+        return [value.strip() for value in values]
+
+    async def fill_form(
+        self, fields: dict[str, FormValue], trusted_fallback: bool = False
+    ) -> dict[str, Optional[str]]:
+        """
+        Fill many form fields with a single command.
+
+        Each field is located in the page and set there: text inputs,
+        textareas and contenteditable elements get the value followed by
+        input and change events, selects select the options matching by
+        value or text (a list for multiple selects), checkboxes are
+        clicked into the given state and radio buttons are checked, or
+        the radio of the same group with the given value is.
+
+        Example:
+            errors = await tab.fill_form({'#email': 'a@b.c', '#country': 'France', '#terms': True})
+
+        Args:
+            fields: CSS selectors or XPaths (starting with '/' or './') mapped
+                to values.
+            trusted_fallback: Retry fields whose value the page did not accept
+                from script (e.g. a handler rewrote it or ignored an untrusted
+                click) with real input events: a click for checkboxes and radio
+                buttons, otherwise a click then the value inserted over the
+                selected contents. Retried fields are not checked again.
+
+        Returns:
+            Error of each field, None for fields that were filled.
+        """
+        if not fields:
+            return {}
+        items = list(fields.items())
+        response: EvaluateResponse = await self._execute_command(
+            RuntimeCommands.evaluate(
+                expression=f'({Scripts.FILL_FORM}).call(document, {json.dumps(items)})',
+                return_by_value=True,
+            )
+        )
+        errors: dict[str, Optional[str]] = {}
+        for (selector, value), result in zip(items, response['result']['result']['value']):
+            error = result['error']
+            if error and result['trusted'] and trusted_fallback:
+                error = await self._fill_field_with_input_events(selector, value)
+            errors[selector] = error
+        return errors
+
+    async def _fill_field_with_input_events(self, selector: str, value: FormValue) -> Optional[str]:
+        """Fill one field through Input domain events, returning the error if any."""
+        try:
+            element = cast(WebElement, await self.query(selector))
+            await element.click()
+            if element.get_attribute('type') in {'checkbox', 'radio'}:
+                return None
+            await self._execute_command(
+                RuntimeCommands.call_function_on(
+                    function_declaration=Scripts.SELECT_FIELD_CONTENTS,
+                    object_id=element._object_id,
+                )
+            )
+            await element.insert_text(str(value))
+        except PydollException as exc:
+            return str(exc)
+        return None
+
     # TODO: think about how to remove these duplications with the base class
     async def continue_request(  # noqa: PLR0913, PLR0917
         self,
@@ -727,6 +1380,37 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
             )
         )
 
+    @asynccontextmanager
+    async def scope(self) -> AsyncGenerator[str, None]:
+        """
+        Release every element found inside the block when it exits.
+
+        Remote objects of elements found in the block, and of elements
+        found from them, join one Runtime object group released with a
+        single command on exit; those elements are unusable afterwards.
+        Scopes can be nested, each releases only its own elements. The
+        scope applies to every find on this tab while it is open.
+
+        Example:
+            for page in pages:
+                async with tab.scope():
+                    rows = await tab.query('tr', find_all=True)
+                    ...
+
+        Yields:
+            Name of the object group.
+        """
+        object_group = f'pydoll-scope-{next(_object_group_ids)}'
+        previous_group, self._object_group = self._object_group, object_group
+        try:
+            yield object_group
+        finally:
+            self._object_group = previous_group
+            try:
+                await self._execute_command(RuntimeCommands.release_object_group(object_group))
+            except Exception as exc:
+                logger.debug(f'Could not release object group {object_group}: {exc}')
+
     @asynccontextmanager
     async def expect_file_chooser(
         self, files: Union[str, Path, list[Union[str, Path]]]
@@ -834,7 +1518,17 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
 
         Note:
             Corresponding domain must be enabled before events fire.
+            Fetch.requestPaused callbacks never see requests that active
+            request rules answer.
         """
+        if event_name == FetchEvent.REQUEST_PAUSED:
+            callback = skip_rule_matches(callback, lambda: self._request_rules)
+        return await self._register_callback(event_name, callback, temporary)
+
+    async def _register_callback(
+        self, event_name: str, callback: Callable[[dict], Any], temporary: bool = False
+    ) -> int:
+        """Register an event callback as is, async callbacks run in background tasks."""
 
         async def callback_wrapper(event):
             asyncio.create_task(callback(event))
@@ -848,6 +1542,119 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
             event_name, function_to_register, temporary
         )
 
+    async def _attach_to_target(self, target_id: str, browser_context_id: Optional[str] = None):
+        """
+        Rebind this tab to another target (used after a browser restart).
+
+        Registered event callbacks are kept and previously enabled domains
+        are enabled again on the new target.
+        """
+        self._remove_instance(self._target_id)
+        self._target_id = target_id
+        self._browser_context_id = browser_context_id
+        self._instances[target_id] = self
+        self._navigation_tracking_enabled = False
+        self._main_frame_id = target_id
+        self._set_main_frame_loader(None)
+        self._frames = {}
+        if self._network_idle_tracker is not None:
+            self._network_idle_tracker.reset()
+        if self._network_budget is not None:
+            self._network_budget.main_frame_id = target_id
+        await self._connection_handler.switch_page(target_id)
+
+        enabled_domains = [
+            (self._page_events_enabled, self.enable_page_events, {}),
+            (self._network_events_enabled, self.enable_network_events, {}),
+            (self._dom_events_enabled, self.enable_dom_events, {}),
+            (self._runtime_events_enabled, self.enable_runtime_events, {}),
+            (self._fetch_events_enabled, self.enable_fetch_events, self._fetch_events_options),
+            (
+                self._intercept_file_chooser_dialog_enabled,
+                self.enable_intercept_file_chooser_dialog,
+                {},
+            ),
+        ]
+        for enabled, enable, kwargs in enabled_domains:
+            if enabled:
+                await enable(**kwargs)
+        await self._update_request_interception()
+
+    async def _start_network_expectation(
+        self, expectation: Union[RequestExpectation, ResponseExpectation]
+    ):
+        """Enable network events if needed and register the expectation's listeners."""
+        if not self.network_events_enabled:
+            await self.enable_network_events()
+        await expectation.start(self.on, self._connection_handler.remove_callback)
+
+    def _interception_stages(self) -> list[InterceptionStage]:
+        """Built-in handlers offered every paused request, in order."""
+        stages: list[InterceptionStage] = []
+        if self._network_budget is not None and self._network_budget.blocking:
+            stages.append(
+                partial(self._network_budget.handle, execute_command=self._execute_command)
+            )
+        if self._request_rules is not None:
+            stages.append(partial(self._request_rules.resolve, continue_unmatched=False))
+        for handler in (self._har_replayer, self._asset_cache, self._har_recorder):
+            if handler is not None:
+                stages.append(partial(handler.handle, execute_command=self._execute_command))
+        return stages
+
+    async def _update_request_interception(self, disable_when_idle: bool = False):
+        """
+        Route paused requests through request rules and the asset cache.
+
+        The stages run inside the interception dispatcher when there is one
+        and in a callback of their own otherwise. Unless the user enabled
+        fetch events, Fetch is enabled with just the patterns they need.
+
+        Args:
+            disable_when_idle: Disable Fetch if no stage is left.
+        """
+        stages = self._interception_stages()
+        if self._interception_dispatcher is not None:
+            self._interception_dispatcher.stages = stages
+
+        needs_callback = bool(stages) and self._interception_dispatcher is None
+        if needs_callback and self._request_paused_callback_id is None:
+            self._request_paused_callback_id = await self._register_callback(
+                FetchEvent.REQUEST_PAUSED, self._handle_request_paused
+            )
+        elif not needs_callback and self._request_paused_callback_id is not None:
+            await self._connection_handler.remove_callback(self._request_paused_callback_id)
+            self._request_paused_callback_id = None
+
+        if self._fetch_events_enabled:
+            return
+        patterns = []
+        sources = (
+            self._network_budget,
+            self._request_rules,
+            self._har_replayer,
+            self._asset_cache,
+            self._har_recorder,
+        )
+        for source in sources:
+            for pattern in source.request_patterns() if source is not None else []:
+                if pattern not in patterns:
+                    patterns.append(pattern)
+        if patterns:
+            await self._execute_command(
+                FetchCommands.enable(handle_auth_requests=False, patterns=patterns)
+            )
+        elif disable_when_idle:
+            await self._execute_command(FetchCommands.disable())
+
+    async def _handle_request_paused(self, event: RequestPausedEvent):
+        """Answer a paused request with the built-in stages (rules, HAR, asset cache)."""
+        command = await run_interception_stages(self._interception_stages(), event)
+        if command is None and not self._fetch_events_enabled:
+            command = FetchCommands.continue_request(event['params']['requestId'])
+        if command is not None:
+            await self._execute_command(command)
+
     async def _execute_script_with_element(self, script: str, element: WebElement):
         """
         Execute script with element context.
@@ -888,31 +1695,166 @@ class Tab(FindElementsMixin):  # noqa: PLR0904
         command = RuntimeCommands.evaluate(expression=script)
         return await self._execute_command(command)
 
-    async def _refresh_if_url_not_changed(self, url: str) -> bool:
+    async def _refresh_if_url_not_changed(
+        self,
+        url: str,
+        timeout: int = 300,
+        wait_until: Union[PageLoadState, str] = PageLoadState.LOAD,
+    ) -> bool:
         """Refresh page if URL hasn't changed."""
         current_url = await self.current_url
         if current_url == url:
-            await self.refresh()
+            await self.refresh(wait_until=wait_until, timeout=timeout)
             return True
         return False
 
-    async def _wait_page_load(self, timeout: int = 300):
+    async def _enable_navigation_tracking(self, page_domain_enabled: bool = False):
+        """
+        Track navigation state and load progress from Page events (once per target).
+
+        The frame cache is seeded from Page.getFrameTree; afterwards frame and
+        lifecycle events keep URL, frames and loader id current, so reading
+        them needs no further commands.
+
+        Args:
+            page_domain_enabled: Skip Page.enable because the caller just sent it.
+        """
+        if self._navigation_tracking_enabled:
+            return
+
+        if not self._navigation_callback_ids:
+            listeners = [
+                (PageEvent.LIFECYCLE_EVENT, self._on_lifecycle_event),
+                (PageEvent.FRAME_NAVIGATED, self._on_frame_navigated),
+                (PageEvent.NAVIGATED_WITHIN_DOCUMENT, self._on_navigated_within_document),
+                (PageEvent.FRAME_DETACHED, self._on_frame_detached),
+            ]
+            for event_name, listener in listeners:
+                self._navigation_callback_ids.append(
+                    await self._connection_handler.register_callback(event_name, listener)
+                )
+
+        if not page_domain_enabled:
+            await self._execute_command(PageCommands.enable())
+        await self._execute_command(PageCommands.set_lifecycle_events_enabled(True))
+
+        self._frames = {}
+        response: GetFrameTreeResponse = await self._execute_command(PageCommands.get_frame_tree())
+        frame_tree = response['result']['frameTree']
+        seeded_frames: dict[str, Frame] = {}
+        self._collect_frames(frame_tree, seeded_frames)
+        # frames reported by events while the tree was requested are newer than the tree
+        self._frames = {**seeded_frames, **self._frames}
+        self._main_frame_id = frame_tree['frame']['id']
+        if self._main_frame_loader is None:
+            self._set_main_frame_loader(frame_tree['frame'].get('loaderId'))
+        self._navigation_tracking_enabled = True
+
+    def _collect_frames(self, frame_tree: FrameTree, frames: dict[str, Frame]):
+        """Flatten a frame tree into frames keyed by id."""
+        frames[frame_tree['frame']['id']] = frame_tree['frame']
+        for child in frame_tree.get('childFrames', []):
+            self._collect_frames(child, frames)
+
+    def _get_cached_url(self) -> Optional[str]:
+        """URL of the main frame from the navigation cache (None if not tracked)."""
+        if not self._navigation_tracking_enabled:
+            return None
+        frame = self._frames.get(self._main_frame_id)
+        if frame is None:
+            return None
+        return frame['url'] + frame.get('urlFragment', '')
+
+    async def _wait_page_load(
+        self,
+        previous_loader: Optional[str],
+        wait_until: PageLoadState = PageLoadState.LOAD,
+        timeout: int = 300,
+    ):
         """
-        Wait for page to finish loading.
+        Wait until a main frame document newer than previous_loader reaches wait_until.
+
+        Following the newest loader (instead of a specific one) keeps
+        client-side redirects working: the wait ends on the document the
+        page finally settled on.
 
         Raises:
-            asyncio.TimeoutError: If page doesn't load within timeout.
+            PageLoadTimeout: If the state is not reached within timeout.
         """
-        start_time = asyncio.get_event_loop().time()
-        while True:
-            response: EvaluateResponse = await self._execute_command(
-                RuntimeCommands.evaluate(expression='document.readyState')
-            )
-            if response['result']['result']['value'] == 'complete':
-                break
-            if asyncio.get_event_loop().time() - start_time > timeout:
-                raise WaitElementTimeout('Page load timed out')
-            await asyncio.sleep(0.5)
+        event_name = _LIFECYCLE_EVENT_NAMES[wait_until]
+        if self._is_load_state_reached(previous_loader, event_name):
+            return
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        waiter = (previous_loader, event_name, future)
+        self._load_waiters.append(waiter)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise PageLoadTimeout()
+        finally:
+            if waiter in self._load_waiters:
+                self._load_waiters.remove(waiter)
+
+    def _is_load_state_reached(self, previous_loader: Optional[str], event_name: Optional[str]):
+        """Whether a new main frame document exists and fired event_name (if any)."""
+        if self._main_frame_loader is None or self._main_frame_loader == previous_loader:
+            return False
+        return event_name is None or event_name in self._main_frame_load_events
+
+    def _set_main_frame_loader(self, loader_id: Optional[str]):
+        """Track a new main frame document, forgetting events of the previous one."""
+        if loader_id != self._main_frame_loader:
+            self._main_frame_loader = loader_id
+            self._main_frame_load_events = set()
+
+    def _resolve_load_waiters(self):
+        """Wake navigation waiters whose load state was reached."""
+        for previous_loader, event_name, future in self._load_waiters:
+            if not future.done() and self._is_load_state_reached(previous_loader, event_name):
+                future.set_result(None)
+
+    def _on_lifecycle_event(self, event: dict):
+        """Record Page.lifecycleEvent of the main frame."""
+        params = event['params']
+        if params['frameId'] != self._main_frame_id:
+            return
+        self._set_main_frame_loader(params['loaderId'])
+        self._main_frame_load_events.add(params['name'])
+        self._resolve_load_waiters()
+
+    def _on_frame_navigated(self, event: dict):
+        """Cache the committed frame and track main frame documents."""
+        frame = event['params']['frame']
+        self._frames[frame['id']] = frame
+        if frame.get('parentId'):
+            return
+        self._main_frame_id = frame['id']
+        self._set_main_frame_loader(frame['loaderId'])
+        self._resolve_load_waiters()
+
+    def _on_navigated_within_document(self, event: dict):
+        """Update the cached URL on fragment and History API navigations."""
+        params = event['params']
+        frame = self._frames.get(params['frameId'])
+        if frame is None:
+            return
+        # the event URL already contains the fragment
+        updated = Frame(**{key: value for key, value in frame.items() if key != 'urlFragment'})
+        updated['url'] = params['url']
+        self._frames[params['frameId']] = updated
+
+    def _on_frame_detached(self, event: dict):
+        """Drop a detached frame and its descendants from the cache."""
+        detached = {event['params']['frameId']}
+        for frame_id, frame in list(self._frames.items()):
+            parent_id = frame.get('parentId')
+            while parent_id is not None and parent_id not in detached:
+                parent_id = self._frames.get(parent_id, {}).get('parentId')
+            if parent_id is not None:
+                detached.add(frame_id)
+        for frame_id in detached:
+            self._frames.pop(frame_id, None)
 
     async def _bypass_cloudflare(
         self,
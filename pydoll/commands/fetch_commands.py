@@ -146,6 +146,7 @@ class FetchCommands:
         url_pattern: str = '*',
         resource_type: Optional[ResourceType] = None,
         request_stage: Optional[RequestStage] = None,
+        patterns: Optional[list[RequestPattern]] = None,
     ) -> Command[Response]:
         """
         Creates a command to enable fetch interception.
@@ -162,19 +163,22 @@ class FetchCommands:
                 Defaults to None.
             request_stage (Optional[RequestStage]): The stage of the request to intercept.
                 Defaults to None.
+            patterns (Optional[list[RequestPattern]]): Several request patterns
+                to intercept. When given, url_pattern, resource_type and
+                request_stage are ignored. Defaults to None.
 
         Returns:
             Command[Response]: A command for enabling fetch interception.
         """
-        request_pattern = RequestPattern(urlPattern=url_pattern)
-        if resource_type is not None:
-            request_pattern['resourceType'] = resource_type
-        if request_stage is not None:
-            request_pattern['requestStage'] = request_stage
-
-        params = FetchEnableParams(
-            patterns=[request_pattern], handleAuthRequests=handle_auth_requests
-        )
+        if patterns is None:
+            request_pattern = RequestPattern(urlPattern=url_pattern)
+            if resource_type is not None:
+                request_pattern['resourceType'] = resource_type
+            if request_stage is not None:
+                request_pattern['requestStage'] = request_stage
+            patterns = [request_pattern]
+
+        params = FetchEnableParams(patterns=patterns, handleAuthRequests=handle_auth_requests)
         return Command(method=FetchMethod.ENABLE, params=params)
 
     @staticmethod
@@ -0,0 +1,70 @@
+from typing import Optional
+
+from pydoll.protocol.base import Command, Response
+from pydoll.protocol.io.methods import IOMethod
+from pydoll.protocol.io.params import CloseParams, ReadParams, ResolveBlobParams
+from pydoll.protocol.io.responses import ReadResponse, ResolveBlobResponse
+
+
+class IOCommands:
+    """
+    A class for reading browser-side streams using Chrome DevTools Protocol (CDP).
+
+    Streams are returned by commands such as Fetch.takeResponseBodyAsStream
+    or Page.printToPDF with transferMode 'ReturnAsStream', and are read in
+    chunks until the end of the stream, then closed.
+    """
+
+    @staticmethod
+    def read(
+        handle: str, offset: Optional[int] = None, size: Optional[int] = None
+    ) -> Command[ReadResponse]:
+        """
+        Generates a command to read a chunk of a stream.
+
+        Args:
+            handle: Handle of the stream to read.
+            offset: Seek to this offset before reading (not supported by
+                response body streams, which are read sequentially).
+            size: Maximum number of bytes to read, the browser picks a
+                default if omitted.
+
+        Returns:
+            Command: The CDP command returning the data, whether it is
+                base64 encoded and whether the end of the stream was reached.
+        """
+        params = ReadParams(handle=handle)
+        if offset is not None:
+            params['offset'] = offset
+        if size is not None:
+            params['size'] = size
+        return Command(method=IOMethod.READ, params=params)
+
+    @staticmethod
+    def close(handle: str) -> Command[Response]:
+        """
+        Generates a command to close a stream and discard any temporary backing storage.
+
+        Args:
+            handle: Handle of the stream to close.
+
+        Returns:
+            Command: The CDP command to close the stream.
+        """
+        params = CloseParams(handle=handle)
+        return Command(method=IOMethod.CLOSE, params=params)
+
+    @staticmethod
+    def resolve_blob(object_id: str) -> Command[ResolveBlobResponse]:
+        """
+        Generates a command to get the UUID of a Blob object.
+
+        Args:
+            object_id: Remote object id of a Blob.
+
+        Returns:
+            Command: The CDP command returning the blob UUID, readable as
+                a stream with the handle 'blob:<uuid>'.
+        """
+        params = ResolveBlobParams(objectId=object_id)
+        return Command(method=IOMethod.RESOLVE_BLOB, params=params)
@@ -65,6 +65,8 @@ class ConnectionHandler:
         self._command_manager = CommandsManager()
         self._events_handler = EventsManager()
         self._receive_task: Optional[asyncio.Task] = None
+        self._disconnect_callbacks: list[Callable[[], Any]] = []
+        self._closing = False
         logger.info('ConnectionHandler initialized.')
 
     @property
@@ -77,6 +79,11 @@ class ConnectionHandler:
         """Access currently active JavaScript dialog information."""
         return self._events_handler.dialog
 
+    @property
+    def connected(self) -> bool:
+        """Whether the WebSocket connection is open."""
+        return self._ws_connection is not None and self._ws_connection.state is State.OPEN
+
     async def ping(self) -> bool:
         """Test if WebSocket connection is active and responsive."""
         with suppress(Exception):
@@ -146,8 +153,32 @@ class ConnectionHandler:
         """Remove all registered event callbacks."""
         self._events_handler.clear_callbacks()
 
+    def register_disconnect_callback(self, callback: Callable[[], Any]):
+        """
+        Register function called when the connection is lost unexpectedly.
+
+        Callback (sync or async) is not invoked for connections closed via close().
+        """
+        self._disconnect_callbacks.append(callback)
+
+    def fail_pending_commands(self, exception: Exception):
+        """Fail all commands awaiting a response with the given exception."""
+        self._command_manager.fail_all_pending(exception)
+
+    async def switch_page(self, page_id: str):
+        """
+        Point handler at another page target, keeping registered event callbacks.
+
+        The current connection is dropped and a new one is established to the
+        new target on the next command.
+        """
+        self._closing = True
+        await self._handle_connection_loss()
+        self._page_id = page_id
+
     async def close(self):
         """Close WebSocket connection and release resources."""
+        self._closing = True
         await self.clear_callbacks()
         if self._ws_connection is None:
             return
@@ -165,6 +196,7 @@ class ConnectionHandler:
         """Create fresh WebSocket connection and start event listening."""
         ws_address = await self._resolve_ws_address()
         logger.info(f'Connecting to {ws_address}')
+        self._closing = False
         self._ws_connection = await self._ws_connector(
             ws_address,
             max_size=1024 * 1024 * 10,  # 10MB
@@ -184,8 +216,13 @@ class ConnectionHandler:
             await self._ws_connection.close()
         self._ws_connection = None
 
-        if self._receive_task and not self._receive_task.done():
-            self._receive_task.cancel()
+        receive_task = self._receive_task
+        if receive_task and not receive_task.done():
+            receive_task.cancel()
+            # let the old loop run its cleanup before a new connection resets _closing
+            if receive_task is not asyncio.current_task():
+                with suppress(asyncio.CancelledError):
+                    await receive_task
 
         logger.info('Connection resources cleaned up')
 
@@ -199,6 +236,21 @@ class ConnectionHandler:
         except Exception as e:
             logger.error(f'Unexpected error in event loop: {e}')
             raise
+        finally:
+            # nothing will resolve pending commands anymore, fail them instead of timing out
+            self._command_manager.fail_all_pending(WebSocketConnectionClosed())
+            if not self._closing:
+                self._notify_disconnect()
+
+    def _notify_disconnect(self):
+        """Invoke disconnect callbacks."""
+        for callback in self._disconnect_callbacks:
+            try:
+                result = callback()
+                if asyncio.iscoroutine(result):
+                    asyncio.create_task(result)
+            except Exception as e:
+                logger.error(f'Error in disconnect callback: {e}')
 
     async def _incoming_messages(self) -> AsyncGenerator[Union[str, bytes], None]:
         """Generator yielding raw messages from WebSocket connection."""
@@ -45,3 +45,10 @@ class CommandsManager:
         """Remove pending command without resolving (for timeouts/cancellations)."""
         if command_id in self._pending_commands:
             del self._pending_commands[command_id]
+
+    def fail_all_pending(self, exception: Exception):
+        """Fail every pending command with exception (e.g. after connection loss)."""
+        for future in self._pending_commands.values():
+            if not future.done():
+                future.set_exception(exception)
+        self._pending_commands.clear()
@@ -11,6 +11,30 @@ class By(str, Enum):
     NAME = 'name'
 
 
+class PageLoadState(str, Enum):
+    COMMIT = 'commit'
+    DOM_CONTENT_LOADED = 'domcontentloaded'
+    LOAD = 'load'
+    NETWORK_IDLE = 'networkidle'
+
+
+class PerformanceProfile(str, Enum):
+    MAX_THROUGHPUT = 'max_throughput'
+    LOW_MEMORY = 'low_memory'
+
+
+class TextMode(str, Enum):
+    INNER_TEXT = 'inner_text'
+    TEXT_CONTENT = 'text_content'
+    HTML_PARSER = 'html_parser'
+
+
+class TypingJitter(str, Enum):
+    NONE = 'none'
+    UNIFORM = 'uniform'
+    NORMAL = 'normal'
+
+
 class Scripts:
     ELEMENT_VISIBLE = """
     function() {
@@ -34,6 +58,42 @@ class Scripts:
     }
     """
 
+    CLICK_PREFLIGHT = """
+    function() {
+        const isRendered = (element) => {
+            const rect = element.getBoundingClientRect();
+            const style = getComputedStyle(element);
+            return rect.width > 0 && rect.height > 0
+                && style.visibility !== 'hidden' && style.display !== 'none';
+        };
+        const labels = Array.from(this.labels || []);
+        // a hidden input is clicked through its label, as a user would do
+        const target = isRendered(this) ? this : labels.find(isRendered);
+        if (!target) {
+            return {visible: false};
+        }
+        if (target.scrollIntoViewIfNeeded) {
+            target.scrollIntoViewIfNeeded(true);
+        } else {
+            target.scrollIntoView({block: 'center', inline: 'center'});
+        }
+        const rect = target.getBoundingClientRect();
+        const x = rect.left + rect.width / 2;
+        const y = rect.top + rect.height / 2;
+        const root = target.getRootNode();
+        const hit = (root.elementFromPoint ? root : document).elementFromPoint(x, y);
+        // clicks on a label, or on anything styled inside it, reach the element too
+        const reaches = !hit || target.contains(hit) || this.contains(hit)
+            || labels.some((label) => label.contains(hit));
+        return {
+            visible: true,
+            x: x,
+            y: y,
+            covered_by: reaches ? null : hit.tagName.toLowerCase(),
+        };
+    }
+    """
+
     CLICK = """
     function(){
         clicked = false;
@@ -126,6 +186,255 @@ class Scripts:
         }
     """
 
+    DESCRIBE_ELEMENTS = """
+        function() {
+            return Array.from(this, function(node) {
+                var attributes = [];
+                var nodeAttributes = node.attributes || [];
+                for (var i = 0; i < nodeAttributes.length; i++) {
+                    attributes.push(nodeAttributes[i].name, nodeAttributes[i].value);
+                }
+                return {attributes: attributes, nodeName: node.nodeName.toLowerCase()};
+            });
+        }
+    """
+
+    WAIT_FOR_ELEMENT = """
+        function() {
+            var root = this;
+            var find = function() { {finder} };
+            return new Promise(function(resolve) {
+                var done = false;
+                var observer = null;
+                var frame = null;
+                var timer = null;
+                var finish = function(result) {
+                    done = true;
+                    if (observer) observer.disconnect();
+                    if (frame !== null) cancelAnimationFrame(frame);
+                    clearTimeout(timer);
+                    resolve(result);
+                };
+                var check = function() {
+                    if (done) return;
+                    var result = find();
+                    if (result) finish(result);
+                };
+                var recheck = function() {
+                    check();
+                    if (!done) frame = requestAnimationFrame(recheck);
+                };
+                check();
+                if (done) return;
+                observer = new MutationObserver(check);
+                observer.observe(document, {
+                    childList: true, subtree: true, attributes: true, characterData: true
+                });
+                frame = requestAnimationFrame(recheck);
+                timer = setTimeout(function() { finish(null); }, {timeout});
+            });
+        }
+    """
+
+    WAIT_QUERY_SELECTOR = 'return root.querySelector("{selector}");'
+
+    WAIT_QUERY_SELECTOR_ALL = """
+        var nodes = root.querySelectorAll("{selector}");
+        return nodes.length ? Array.from(nodes) : null;
+    """
+
+    WAIT_XPATH_ELEMENT = """
+        return document.evaluate(
+            "{escaped_value}", root, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    """
+
+    WAIT_XPATH_ELEMENTS = """
+        var snapshot = document.evaluate(
+            "{escaped_value}", root, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        var nodes = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            nodes.push(snapshot.snapshotItem(i));
+        }
+        return nodes.length ? nodes : null;
+    """
+
+    EXTRACT_ROWS = """
+        function() {
+            var selector = {selector};
+            if ({is_xpath}) {
+                var snapshot = document.evaluate(
+                    selector, this, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                );
+                var rows = [];
+                for (var i = 0; i < snapshot.snapshotLength; i++) {
+                    rows.push(snapshot.snapshotItem(i));
+                }
+                return rows;
+            }
+            return Array.from(this.querySelectorAll(selector));
+        }
+    """
+
+    EXTRACT_RECORDS = """
+        function() {
+            var rows = ({rows}).call(this);
+            var fields = {fields};
+            var records = rows.slice(0, {limit}).map(function(row) {
+                var record = {};
+                fields.forEach(function(field) {
+                    var node = field.selector ? row.querySelector(field.selector) : row;
+                    var value = null;
+                    if (node) {
+                        switch (field.property) {
+                            case 'text': value = node.textContent.trim(); break;
+                            case 'inner_text': value = node.innerText; break;
+                            case 'html': value = node.innerHTML; break;
+                            case 'outer_html': value = node.outerHTML; break;
+                            case 'value': value = node.value; break;
+                            default: value = node.getAttribute(field.property);
+                        }
+                    }
+                    record[field.name] = value === undefined ? null : value;
+                });
+                return record;
+            });
+            return {total: rows.length, records: records};
+        }
+    """
+
+    ELEMENT_TEXTS = """
+        function(mode) {
+            var elements = Array.prototype.slice.call(arguments, 1);
+            return elements.map(function(element) {
+                if (mode === 'html_parser') return element.outerHTML || '';
+                if (mode === 'text_content') return element.textContent || '';
+                return element.innerText || element.textContent || '';
+            });
+        }
+    """
+
+    FILL_FORM = """
+        function(fields) {
+            const root = this;
+            const find = (selector) => (selector.startsWith('/') || selector.startsWith('./'))
+                ? document.evaluate(
+                    selector, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+                ).singleNodeValue
+                : root.querySelector(selector);
+            const fire = (element, ...types) => types.forEach(
+                (type) => element.dispatchEvent(new Event(type, {bubbles: true}))
+            );
+            const truthy = (value) => typeof value === 'string'
+                ? !['', 'false', '0', 'off', 'no'].includes(value.toLowerCase())
+                : Boolean(value);
+            const result = (error, trusted) => ({error: error, trusted: Boolean(trusted)});
+
+            const fillSelect = (element, value) => {
+                const wanted = (Array.isArray(value) ? value : [value]).map(String);
+                const options = Array.from(element.options);
+                const matches = (option) => (
+                    wanted.includes(option.value) || wanted.includes(option.text.trim())
+                );
+                if (!options.some(matches)) {
+                    return result('no option matching ' + JSON.stringify(value));
+                }
+                if (element.multiple) {
+                    options.forEach((option) => { option.selected = matches(option); });
+                } else {
+                    element.selectedIndex = options.findIndex(matches);
+                }
+                fire(element, 'input', 'change');
+                return result(null);
+            };
+
+            const fillToggle = (element, value) => {
+                let target = element;
+                let checked = truthy(value);
+                const byValue = typeof value === 'string' && value !== element.value;
+                if (element.type === 'radio' && byValue) {
+                    const scope = element.form || element.getRootNode();
+                    target = Array.from(scope.querySelectorAll('input[type="radio"]')).find(
+                        (radio) => radio.name === element.name && radio.value === value
+                    );
+                    if (!target) {
+                        return result('no radio button with value ' + JSON.stringify(value));
+                    }
+                    checked = true;
+                }
+                if (target.checked !== checked) {
+                    if (target.type === 'radio' && !checked) {
+                        target.checked = false;
+                        fire(target, 'input', 'change');
+                    } else {
+                        target.click();
+                    }
+                }
+                if (target.checked !== checked) {
+                    return result('checked state was not changed', target === element);
+                }
+                return result(null);
+            };
+
+            const fillText = (element, value) => {
+                const text = String(value);
+                if (element.isContentEditable) {
+                    element.textContent = text;
+                    fire(element, 'input');
+                    return result(null);
+                }
+                // the prototype setter keeps frameworks tracking the value in sync
+                const descriptor = Object.getOwnPropertyDescriptor(
+                    Object.getPrototypeOf(element), 'value'
+                );
+                if (descriptor && descriptor.set) {
+                    descriptor.set.call(element, text);
+                } else {
+                    element.value = text;
+                }
+                fire(element, 'input', 'change');
+                if (element.value !== text) {
+                    return result('value was changed to ' + JSON.stringify(element.value), true);
+                }
+                return result(null);
+            };
+
+            return fields.map(([selector, value]) => {
+                try {
+                    const element = find(selector);
+                    if (!element) return result('element not found');
+                    if (element.disabled) return result('element is disabled');
+                    const tag = element.tagName.toLowerCase();
+                    const type = (element.type || '').toLowerCase();
+                    if (tag === 'select') return fillSelect(element, value);
+                    if (type === 'checkbox' || type === 'radio') return fillToggle(element, value);
+                    if (type === 'file') return result('file inputs need set_input_files()');
+                    if (element.readOnly) return result('element is read-only');
+                    if (!element.isContentEditable && !('value' in element)) {
+                        return result('element is not a form field');
+                    }
+                    return fillText(element, value);
+                } catch (error) {
+                    return result(String(error && error.message || error));
+                }
+            });
+        }
+    """
+
+    SELECT_FIELD_CONTENTS = """
+        function() {
+            this.focus();
+            if (this.select) {
+                this.select();
+            } else {
+                window.getSelection().selectAllChildren(this);
+            }
+        }
+    """
+
     # Fingerprint spoofing related scripts
     FINGERPRINT_WRAPPER = """
 (function() {{
@@ -638,6 +947,27 @@ class ResourceType(str, Enum):
     OTHER = 'OTHER'
 
 
+class RuleAction(str, Enum):
+    BLOCK = 'block'
+    ALLOW = 'allow'
+    REWRITE = 'rewrite'
+
+
+class BudgetAction(str, Enum):
+    """What a tab does once a network budget is exceeded."""
+
+    STOP_LOADING = 'stop_loading'
+    BLOCK_REQUESTS = 'block_requests'
+
+
+class HarMissBehavior(str, Enum):
+    """What HAR replay does with requests missing from the archive."""
+
+    FAIL = 'fail'
+    NOT_FOUND = 'not_found'
+    CONTINUE = 'continue'
+
+
 class RequestStage(str, Enum):
     REQUEST = 'Request'
     RESPONSE = 'Response'
@@ -1,5 +1,7 @@
+from pydoll.elements.mixins.extraction_mixin import ExtractionMixin
 from pydoll.elements.mixins.find_elements_mixin import FindElementsMixin
 
 __all__ = [
+    'ExtractionMixin',
     'FindElementsMixin',
 ]
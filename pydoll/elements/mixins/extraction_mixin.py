@@ -0,0 +1,180 @@
+import json
+from contextlib import suppress
+from typing import Any, AsyncIterator, Optional
+
+from pydoll.commands import RuntimeCommands
+from pydoll.constants import Scripts
+from pydoll.exceptions import ExtractionFailed
+from pydoll.protocol.base import Command
+
+DEFAULT_EXTRACT_CHUNK_SIZE = 1000
+
+# rows of a snapshot array read by a chunked extraction
+_SNAPSHOT_SLICE = 'function() { return this.slice({start}, {end}); }'
+
+
+def parse_field(name: str, spec: str) -> dict[str, str]:
+    """
+    Parse an extraction field spec of the form 'selector@property'.
+
+    The selector is a CSS selector relative to the row, the row itself if
+    omitted. The property is 'text' (trimmed textContent, the default),
+    'inner_text', 'html', 'outer_html', 'value' or an attribute name.
+
+    Raises:
+        ValueError: If the spec names neither a selector nor a property.
+    """
+    selector, separator, prop = spec.rpartition('@')
+    if not separator:
+        selector, prop = spec, ''
+    selector, prop = selector.strip(), prop.strip()
+    if not selector and not prop:
+        raise ValueError(f'Invalid extraction field {name!r}: {spec!r}')
+    return {'name': name, 'selector': selector, 'property': prop or 'text'}
+
+
+class ExtractionMixin:
+    """
+    Mixin projecting many elements into plain records inside the page.
+
+    The rows and every field of every row are read by a single in-page
+    function returning by value, instead of a command per element and
+    field. Searches run in the document or relative to the current element
+    (when used from WebElement). The host class provides _execute_command,
+    as FindElementsMixin does.
+    """
+
+    __slots__ = ()
+
+    async def extract(
+        self,
+        selector: str,
+        fields: dict[str, str],
+        chunk_size: int = DEFAULT_EXTRACT_CHUNK_SIZE,
+    ) -> list[dict[str, Optional[str]]]:
+        """
+        Extract one record per element matching selector.
+
+        Example:
+            tab.extract('tr.product', {'title': 'a@text', 'href': 'a@href', 'sku': '@data-sku'})
+
+        Args:
+            selector: CSS selector or XPath (starting with '/' or './') of the rows.
+            fields: Record keys mapped to 'selector@property' specs, see parse_field.
+                Missing elements or attributes give None.
+            chunk_size: Rows returned per command; larger results take
+                one more command plus one per extra chunk.
+
+        Returns:
+            Records in document order.
+
+        Raises:
+            ExtractionFailed: If the page throws (e.g. an invalid selector).
+        """
+        return [record async for record in self.iter_extract(selector, fields, chunk_size)]
+
+    async def iter_extract(
+        self,
+        selector: str,
+        fields: dict[str, str],
+        chunk_size: int = DEFAULT_EXTRACT_CHUNK_SIZE,
+    ) -> AsyncIterator[dict[str, Optional[str]]]:
+        """
+        Stream the records of extract() chunk by chunk.
+
+        The first chunk comes with the match count in one command. When
+        more rows matched, the rows are snapshotted in the page and read
+        chunk_size at a time, so only one chunk is held in memory and
+        later chunks see the elements that matched when the snapshot was
+        taken.
+
+        Args:
+            selector: CSS selector or XPath (starting with '/' or './') of the rows.
+            fields: Record keys mapped to 'selector@property' specs.
+            chunk_size: Rows returned per command.
+
+        Yields:
+            Records in document order.
+
+        Raises:
+            ExtractionFailed: If the page throws (e.g. an invalid selector).
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        fields_json = json.dumps([parse_field(name, spec) for name, spec in fields.items()])
+        is_xpath = self._is_xpath(selector)
+        if is_xpath and getattr(self, '_object_id', ''):
+            selector = selector if selector.startswith('.') else f'.{selector}'
+        rows_function = Scripts.EXTRACT_ROWS.replace(
+            '{is_xpath}', 'true' if is_xpath else 'false'
+        ).replace('{selector}', json.dumps(selector))
+
+        first = await self._call_extraction_function(
+            self._records_function(rows_function, fields_json, chunk_size)
+        )
+        for record in first['records']:
+            yield record
+        if first['total'] <= chunk_size:
+            return
+
+        snapshot = await self._call_extraction_function(rows_function, return_by_value=False)
+        snapshot_id = snapshot['objectId']
+        try:
+            start = chunk_size
+            while True:
+                rows = _SNAPSHOT_SLICE.replace('{start}', str(start)).replace(
+                    '{end}', str(start + chunk_size)
+                )
+                chunk = await self._call_extraction_function(
+                    self._records_function(rows, fields_json, chunk_size), snapshot_id
+                )
+                for record in chunk['records']:
+                    yield record
+                if chunk['total'] < chunk_size:
+                    break
+                start += chunk_size
+        finally:
+            with suppress(Exception):
+                await self._execute_command(  # type: ignore[attr-defined]
+                    RuntimeCommands.release_object(snapshot_id)
+                )
+
+    async def _call_extraction_function(
+        self, function: str, object_id: str = '', return_by_value: bool = True
+    ) -> Any:
+        """Call function on object_id (or this element, or the document) and unwrap its result."""
+        object_id = object_id or getattr(self, '_object_id', '')
+        if object_id:
+            command: Command = RuntimeCommands.call_function_on(
+                function_declaration=function,
+                object_id=object_id,
+                return_by_value=return_by_value,
+            )
+        else:
+            command = RuntimeCommands.evaluate(
+                expression=f'({function}).call(document)', return_by_value=return_by_value
+            )
+        response = await self._execute_command(command)  # type: ignore[attr-defined]
+        if 'error' in response:
+            raise ExtractionFailed(response['error'].get('message', ''))
+        result = response['result']
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            raise ExtractionFailed(
+                details.get('exception', {}).get('description') or details.get('text')
+            )
+        return result['result']['value'] if return_by_value else result['result']
+
+    @staticmethod
+    def _records_function(rows_function: str, fields_json: str, limit: int) -> str:
+        # the selector is substituted last so its text is never rewritten
+        return (
+            Scripts.EXTRACT_RECORDS.replace('{limit}', str(limit))
+            .replace('{fields}', fields_json)
+            .replace('{rows}', rows_function)
+        )
+
+    @staticmethod
+    def _is_xpath(selector: str) -> bool:
+        """Same detection as query(): XPath starts with / or ./"""
+        return selector.startswith(('/', './'))
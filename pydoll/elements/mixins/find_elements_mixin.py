@@ -1,12 +1,15 @@
 import asyncio
-from typing import TYPE_CHECKING, Optional, TypeVar, Union
+import itertools
+import math
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from pydoll.commands import (
     DomCommands,
     RuntimeCommands,
 )
-from pydoll.constants import By, Scripts
-from pydoll.exceptions import ElementNotFound, WaitElementTimeout
+from pydoll.constants import By, Scripts, SerializationValue
+from pydoll.exceptions import ElementNotFound, WaitElementFailed, WaitElementTimeout
 from pydoll.protocol.base import Command
 from pydoll.protocol.dom.responses import DescribeNodeResponse
 from pydoll.protocol.dom.types import Node
@@ -15,12 +18,80 @@ from pydoll.protocol.runtime.responses import (
     EvaluateResponse,
     GetPropertiesResponse,
 )
+from pydoll.protocol.runtime.types import RemoteObject, SerializationOptions
 
 if TYPE_CHECKING:
     from pydoll.elements.web_element import WebElement
 
 T = TypeVar('T')
 
+# deep serialization returns the tag name and attributes of a node along with
+# its handle, without its children or shadow tree
+NODE_SERIALIZATION = SerializationOptions(
+    serialization=SerializationValue.DEEP,
+    maxDepth=0,
+    additionalParameters={'maxNodeDepth': 0, 'includeShadowTree': 'none'},
+)
+
+# extra seconds the CDP command of an in-page wait may take beyond the wait itself
+WAIT_COMMAND_MARGIN = 5
+# pause before waiting again in a document that replaced the one being watched
+WAIT_RETRY_INTERVAL = 0.05
+# command errors caused by a navigation replacing the document, the wait is retried
+TRANSIENT_WAIT_ERRORS = (
+    'Execution context was destroyed',
+    'Cannot find context with specified id',
+    'Cannot find default execution context',
+    'Inspected target navigated or closed',
+)
+
+# releases sent in the background, kept referenced until they complete
+_pending_releases: set[asyncio.Task] = set()
+_find_group_ids = itertools.count(1)
+
+
+def release_object_group(connection_handler: Any, object_group: str):
+    """
+    Release a remote object group without waiting for the reply.
+
+    Used where awaiting is impossible (garbage collected handles). Does
+    nothing outside a running event loop or once the connection is closed.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if not getattr(connection_handler, 'connected', False):
+        return
+    task = loop.create_task(_release(connection_handler, object_group))
+    _pending_releases.add(task)
+    task.add_done_callback(_pending_releases.discard)
+
+
+async def _release(connection_handler: Any, object_group: str):
+    with suppress(Exception):
+        await connection_handler.execute_command(RuntimeCommands.release_object_group(object_group))
+
+
+class ObjectGroupLease:
+    """
+    Object group created by one find, owned by the element handles it returned.
+
+    Every handle of the group (and every handle found from one of them)
+    references the lease; the group is released once the last of them is
+    garbage collected. Remote objects are only ever released as a group,
+    so handles sharing an object id never release it under each other.
+    """
+
+    __slots__ = ('_connection_handler', 'object_group')
+
+    def __init__(self, connection_handler: Any, object_group: str):
+        self._connection_handler = connection_handler
+        self.object_group = object_group
+
+    def __del__(self):
+        release_object_group(self._connection_handler, self.object_group)
+
 
 def create_web_element(*args, **kwargs):
     """
@@ -42,8 +113,15 @@ class FindElementsMixin:
     with support for single/multiple element finding and configurable waiting.
     Classes using this mixin gain powerful element discovery without implementing
     complex location logic themselves.
+
+    Handles of found elements join the object group named by the host's
+    _object_group attribute, if set, so they can be released together.
+    Otherwise every find puts its handles in a new group, released once
+    they are all garbage collected.
     """
 
+    __slots__ = ()
+
     async def find(  # noqa: PLR0913, PLR0917
         self,
         id: Optional[str] = None,
@@ -140,7 +218,8 @@ class FindElementsMixin:
         Core element finding method with optional waiting capability.
 
         Searches for elements with flexible waiting. If timeout specified,
-        repeatedly attempts to find elements with 0.5s delays until success or timeout.
+        waits in the page with a MutationObserver (rechecked on every
+        animation frame) and returns as soon as the selector matches.
         Used by higher-level find() and query() methods.
 
         Args:
@@ -156,24 +235,75 @@ class FindElementsMixin:
         Raises:
             ElementNotFound: If no elements found with timeout=0 and raise_exc=True.
             WaitElementTimeout: If elements not found within timeout and raise_exc=True.
+            WaitElementFailed: If the browser rejects the wait for another
+                reason than a navigation.
         """
-        find_method = self._find_element if not find_all else self._find_elements
-        start_time = asyncio.get_event_loop().time()
-
         if not timeout:
+            find_method = self._find_element if not find_all else self._find_elements
             return await find_method(by, value, raise_exc=raise_exc)
 
-        while True:
-            element = await find_method(by, value, raise_exc=False)
-            if element:
-                return element
+        element = await self._wait_for_element(by, value, timeout, find_all)
+        if element:
+            return element
+        if raise_exc:
+            raise WaitElementTimeout()
+        return None
 
-            if asyncio.get_event_loop().time() - start_time > timeout:
-                if raise_exc:
-                    raise WaitElementTimeout()
-                return None
+    async def _wait_for_element(
+        self, by: By, value: str, timeout: float, find_all: bool = False
+    ) -> Union['WebElement', list['WebElement'], None]:
+        """
+        Wait in the page until the selector matches, at most timeout seconds.
+
+        The in-page promise is awaited with a single command. When the
+        document is replaced while waiting (navigation), the wait is
+        installed again in the new document for the remaining time; other
+        command errors and exceptions thrown in the page (e.g. an invalid
+        selector) raise WaitElementFailed.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        object_group = self._find_object_group()
+        while (remaining := deadline - loop.time()) > 0:
+            command = self._in_object_group(
+                self._get_wait_element_command(
+                    by, value, remaining, find_all, getattr(self, '_object_id', '')
+                ),
+                object_group,
+            )
+            response = await self._execute_command(
+                command, timeout=math.ceil(remaining) + WAIT_COMMAND_MARGIN
+            )
+            if 'error' in response:
+                message = response['error'].get('message', '')
+                if not any(error in message for error in TRANSIENT_WAIT_ERRORS):
+                    raise WaitElementFailed(message)
+                await asyncio.sleep(WAIT_RETRY_INTERVAL)
+                continue
 
-            await asyncio.sleep(0.5)
+            if 'exceptionDetails' in response['result']:
+                details = response['result']['exceptionDetails']
+                raise WaitElementFailed(
+                    details.get('exception', {}).get('description') or details.get('text', '')
+                )
+            remote_object = response['result']['result']
+            if not remote_object.get('objectId'):
+                return None
+            if find_all:
+                return await self._get_elements_from_array(
+                    remote_object['objectId'], by, value, object_group
+                )
+            attributes = await self._get_remote_object_attributes(remote_object)
+            return create_web_element(
+                remote_object['objectId'],
+                self._connection_handler,  # type: ignore
+                by,
+                value,
+                attributes,
+                object_group=object_group,
+                object_group_lease=self._lease_for(object_group),
+            )
+        return None
 
     async def _find_element(
         self, by: By, value: str, raise_exc: bool = True
@@ -201,18 +331,28 @@ class FindElementsMixin:
         else:
             command = self._get_find_element_command(by, value)
 
+        object_group = self._find_object_group()
         response_for_command: Union[
             EvaluateResponse, CallFunctionOnResponse
-        ] = await self._execute_command(command)
+        ] = await self._execute_command(self._in_object_group(command, object_group))
 
         if not self._has_object_id_key(response_for_command):
             if raise_exc:
                 raise ElementNotFound()
             return None
 
-        object_id = response_for_command['result']['result']['objectId']
-        attributes = await self._get_object_attributes(object_id=object_id)
-        return create_web_element(object_id, self._connection_handler, by, value, attributes)  # type: ignore
+        remote_object = response_for_command['result']['result']
+        object_id = remote_object['objectId']
+        attributes = await self._get_remote_object_attributes(remote_object)
+        return create_web_element(
+            object_id,
+            self._connection_handler,  # type: ignore
+            by,
+            value,
+            attributes,
+            object_group=object_group,
+            object_group_lease=self._lease_for(object_group),
+        )
 
     async def _find_elements(
         self, by: By, value: str, raise_exc: bool = True
@@ -240,9 +380,10 @@ class FindElementsMixin:
         else:
             command = self._get_find_elements_command(by, value)
 
+        object_group = self._find_object_group()
         response_for_command: Union[
             EvaluateResponse, CallFunctionOnResponse
-        ] = await self._execute_command(command)
+        ] = await self._execute_command(self._in_object_group(command, object_group))
 
         if not response_for_command.get('result', {}).get('result', {}).get('objectId'):
             if raise_exc:
@@ -250,31 +391,61 @@ class FindElementsMixin:
             return []
 
         object_id = response_for_command['result']['result']['objectId']
-        query_response: GetPropertiesResponse = await self._execute_command(
-            RuntimeCommands.get_properties(object_id=object_id)
+        return await self._get_elements_from_array(object_id, by, value, object_group)
+
+    async def _get_elements_from_array(
+        self, object_id: str, by: By, value: str, object_group: str
+    ) -> list['WebElement']:
+        """
+        Wrap the nodes of an in-page array or NodeList into WebElements.
+
+        The element handles share the array's object group, the array is
+        released along with them.
+        """
+        # handles and attributes of every match are fetched concurrently in two
+        # commands, instead of one DOM.describeNode round trip per match
+        properties_response, description_response = await asyncio.gather(
+            self._execute_command(RuntimeCommands.get_properties(object_id, own_properties=True)),
+            self._execute_command(
+                RuntimeCommands.call_function_on(
+                    function_declaration=Scripts.DESCRIBE_ELEMENTS,
+                    object_id=object_id,
+                    return_by_value=True,
+                )
+            ),
         )
-        response = []
-        for query in query_response['result']['result']:
-            query_value = query.get('value', {})
-            if query_value and query_value['type'] == 'object':
-                response.append(query_value['objectId'])
+        descriptions = description_response['result']['result'].get('value') or []
 
+        lease = self._lease_for(object_group)
         elements = []
-        for object_id in response:
-            try:
-                node_description = await self._describe_node(object_id=object_id)
-            except KeyError:
+        for index, element_object_id in self._indexed_object_ids(properties_response):
+            if index >= len(descriptions):
                 continue
-
-            attributes = node_description.get('attributes', [])
-            tag_name = node_description.get('nodeName', '').lower()
-            attributes.extend(['tag_name', tag_name])
-
+            description = descriptions[index]
+            attributes = [*description['attributes'], 'tag_name', description['nodeName']]
             elements.append(
-                create_web_element(object_id, self._connection_handler, by, value, attributes)  # type: ignore
+                create_web_element(
+                    element_object_id,
+                    self._connection_handler,  # type: ignore
+                    by,
+                    value,
+                    attributes,
+                    object_group=object_group,
+                    object_group_lease=lease,
+                )
             )
         return elements
 
+    @staticmethod
+    def _indexed_object_ids(response: GetPropertiesResponse) -> list[tuple[int, str]]:
+        """Array index and object id of each object element of a Runtime.getProperties result."""
+        object_ids = []
+        for prop in response['result']['result']:
+            prop_value = prop.get('value', {})
+            if prop['name'].isdigit() and prop_value and prop_value['type'] == 'object':
+                object_ids.append((int(prop['name']), prop_value['objectId']))
+        return object_ids
+
     async def _get_object_attributes(self, object_id: str) -> list[str]:
         """
         Get attributes of a DOM node.
@@ -285,6 +456,24 @@ class FindElementsMixin:
         attributes.extend(['tag_name', tag_name])
         return attributes
 
+    async def _get_remote_object_attributes(self, remote_object: RemoteObject) -> list[str]:
+        """
+        Get attributes of a DOM node from its deep serialized value.
+
+        Falls back to DOM.describeNode when the node was not serialized
+        (e.g. text nodes or browsers without deep serialization).
+        """
+        serialized = remote_object.get('deepSerializedValue', {})
+        node = serialized.get('value') if serialized.get('type') == 'node' else None
+        if not isinstance(node, dict) or 'localName' not in node:
+            return await self._get_object_attributes(object_id=remote_object['objectId'])
+
+        attributes = [
+            item for name, value in node.get('attributes', {}).items() for item in (name, value)
+        ]
+        attributes.extend(['tag_name', node['localName'].lower()])
+        return attributes
+
     def _get_by_and_value(  # noqa: PLR0913, PLR0917
         self,
         by_map: dict[str, By],
@@ -375,9 +564,30 @@ class FindElementsMixin:
         )
         return response['result']['node']
 
-    async def _execute_command(self, command: Command[T]) -> T:
-        """Execute CDP command via connection handler (60s timeout)."""
-        return await self._connection_handler.execute_command(command, timeout=60)  # type: ignore
+    @property
+    def _object_group_name(self) -> Optional[str]:
+        """Object group the handles of found elements join, None for no group."""
+        return getattr(self, '_object_group', None)
+
+    def _find_object_group(self) -> str:
+        """Object group for the handles of one find: the host's, or a new one."""
+        return self._object_group_name or f'pydoll-find-{next(_find_group_ids)}'
+
+    def _lease_for(self, object_group: str) -> Optional[ObjectGroupLease]:
+        """Lease keeping object_group alive, a new one for groups created by a find."""
+        if object_group == self._object_group_name:
+            return getattr(self, '_object_group_lease', None)
+        return ObjectGroupLease(self._connection_handler, object_group)
+
+    @staticmethod
+    def _in_object_group(command: Command[T], object_group: str) -> Command[T]:
+        """Put the remote object returned by a Runtime command in object_group."""
+        command.setdefault('params', {})['objectGroup'] = object_group  # type: ignore
+        return command
+
+    async def _execute_command(self, command: Command[T], timeout: int = 60) -> T:
+        """Execute CDP command via connection handler (60s timeout by default)."""
+        return await self._connection_handler.execute_command(command, timeout=timeout)  # type: ignore
 
     def _get_find_element_command(self, by: By, value: str, object_id: str = ''):
         """
@@ -403,6 +613,7 @@ class FindElementsMixin:
                 function_declaration=script,
                 object_id=object_id,
                 return_by_value=False,
+                serialization_options=NODE_SERIALIZATION,
             )
         elif by == By.XPATH:
             command = self._get_find_element_by_xpath_command(value, object_id)
@@ -412,7 +623,8 @@ class FindElementsMixin:
             )
         else:
             command = RuntimeCommands.evaluate(
-                expression=Scripts.QUERY_SELECTOR.replace('{selector}', selector)
+                expression=Scripts.QUERY_SELECTOR.replace('{selector}', selector),
+                serialization_options=NODE_SERIALIZATION,
             )
         return command
 
@@ -446,6 +658,53 @@ class FindElementsMixin:
             )
         return command
 
+    def _get_wait_element_command(  # noqa: PLR0913, PLR0917
+        self, by: By, value: str, timeout: float, find_all: bool, object_id: str = ''
+    ):
+        """
+        Create CDP command waiting in the page for element(s) to match.
+
+        The finder runs relative to the element when object_id is given,
+        to the document otherwise. The promise resolves to the match (or
+        an array of matches) as soon as it exists, to null after timeout.
+        """
+        if by == By.NAME:
+            by, value = By.XPATH, f'//*[@name="{value}"]'
+        escaped_value = value.replace('"', '\\"')
+        if by == By.XPATH:
+            if object_id:
+                escaped_value = self._ensure_relative_xpath(escaped_value)
+            script = Scripts.WAIT_XPATH_ELEMENTS if find_all else Scripts.WAIT_XPATH_ELEMENT
+            finder = script.replace('{escaped_value}', escaped_value)
+        else:
+            match by:
+                case By.CLASS_NAME:
+                    selector = f'.{escaped_value}'
+                case By.ID:
+                    selector = f'#{escaped_value}'
+                case _:
+                    selector = escaped_value
+            script = Scripts.WAIT_QUERY_SELECTOR_ALL if find_all else Scripts.WAIT_QUERY_SELECTOR
+            finder = script.replace('{selector}', selector)
+
+        function = Scripts.WAIT_FOR_ELEMENT.replace('{finder}', finder).replace(
+            '{timeout}', str(int(timeout * 1000))
+        )
+        serialization_options = None if find_all else NODE_SERIALIZATION
+        if object_id:
+            return RuntimeCommands.call_function_on(
+                function_declaration=function,
+                object_id=object_id,
+                await_promise=True,
+                return_by_value=False,
+                serialization_options=serialization_options,
+            )
+        return RuntimeCommands.evaluate(
+            expression=f'({function}).call(document)',
+            await_promise=True,
+            serialization_options=serialization_options,
+        )
+
     def _get_find_element_by_xpath_command(self, xpath: str, object_id: str):
         """
         Create CDP command specifically for XPath single element finding.
@@ -461,10 +720,13 @@ class FindElementsMixin:
                 function_declaration=script,
                 object_id=object_id,
                 return_by_value=False,
+                serialization_options=NODE_SERIALIZATION,
             )
         else:
             script = Scripts.FIND_XPATH_ELEMENT.replace('{escaped_value}', escaped_value)
-            command = RuntimeCommands.evaluate(expression=script)
+            command = RuntimeCommands.evaluate(
+                expression=script, serialization_options=NODE_SERIALIZATION
+            )
         return command
 
     def _get_find_elements_by_xpath_command(self, xpath: str, object_id: str):
@@ -1,6 +1,6 @@
 import asyncio
 import json
-from typing import Optional
+from typing import Optional, Sequence
 
 import aiofiles
 
@@ -19,8 +19,14 @@ from pydoll.constants import (
     MouseEventType,
     ScreenshotFormat,
     Scripts,
+    TextMode,
+    TypingJitter,
+)
+from pydoll.elements.mixins import ExtractionMixin, FindElementsMixin
+from pydoll.elements.mixins.find_elements_mixin import (
+    NODE_SERIALIZATION,
+    ObjectGroupLease,
 )
-from pydoll.elements.mixins import FindElementsMixin
 from pydoll.exceptions import (
     ElementNotAFileInput,
     ElementNotFound,
@@ -34,27 +40,54 @@ from pydoll.protocol.dom.responses import (
 from pydoll.protocol.dom.types import Quad
 from pydoll.protocol.page.responses import CaptureScreenshotResponse
 from pydoll.protocol.page.types import Viewport
+from pydoll.protocol.runtime.types import CallArgument
 from pydoll.utils import (
+    build_typing_plan,
     decode_base64_to_bytes,
     extract_text_from_html,
 )
 
 
-class WebElement(FindElementsMixin):  # noqa: PLR0904
+class WebElement(FindElementsMixin, ExtractionMixin):  # noqa: PLR0904
     """
     DOM element wrapper for browser automation.
 
     Provides comprehensive functionality for element interaction, inspection,
     and manipulation using Chrome DevTools Protocol commands.
+
+    Instances are slotted and keep the attribute list as received, the
+    attribute dictionary is only built on first access, so large result
+    sets stay cheap to hold. Instances have no __dict__: setting attributes
+    other than the slots raises AttributeError, so patch methods on the
+    class (patch.object(WebElement, ...)) rather than on an instance.
+    Weak references are supported.
+
+    Remote objects are released with their object group: once every
+    element holding the group's lease is garbage collected, or when the
+    owner of the group (e.g. Tab.scope) releases it.
     """
 
-    def __init__(
+    __slots__ = (
+        '_object_id',
+        '_search_method',
+        '_selector',
+        '_connection_handler',
+        '_attributes_list',
+        '_attributes_dict',
+        '_object_group',
+        '_object_group_lease',
+        '__weakref__',
+    )
+
+    def __init__(  # noqa: PLR0913, PLR0917
         self,
         object_id: str,
         connection_handler: ConnectionHandler,
         method: Optional[str] = None,
         selector: Optional[str] = None,
         attributes_list: list[str] = [],
+        object_group: Optional[str] = None,
+        object_group_lease: Optional[ObjectGroupLease] = None,
     ):
         """
         Initialize WebElement wrapper.
@@ -65,13 +98,31 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
             method: Search method used to find this element (for debugging).
             selector: Selector string used to find this element (for debugging).
             attributes_list: Flat list of alternating attribute names and values.
+            object_group: Object group holding the remote object, also used for
+                elements found from this one.
+            object_group_lease: Lease releasing object_group once every handle
+                referencing it is garbage collected (None if another owner,
+                e.g. Tab.scope(), releases the group).
         """
+        self._object_group = object_group
+        self._object_group_lease = object_group_lease
         self._object_id = object_id
         self._search_method = method
         self._selector = selector
         self._connection_handler = connection_handler
-        self._attributes: dict[str, str] = {}
-        self._def_attributes(attributes_list)
+        if len(attributes_list) % 2:
+            raise IndexError(f'Attribute list without a value for {attributes_list[-1]!r}')
+        self._attributes_list: Sequence[str] = attributes_list
+        self._attributes_dict: Optional[dict[str, str]] = None
+
+    @property
+    def _attributes(self) -> dict[str, str]:
+        """Attributes by name, built from the attribute list on first access."""
+        if self._attributes_dict is None:
+            self._attributes_dict = {}
+            self._def_attributes(self._attributes_list)
+            self._attributes_list = ()
+        return self._attributes_dict
 
     @property
     def value(self) -> Optional[str]:
@@ -100,9 +151,8 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
 
     @property
     async def text(self) -> str:
-        """Visible text content of the element."""
-        outer_html = await self.inner_html
-        return extract_text_from_html(outer_html, strip=True)
+        """Visible text of the element (innerText), see get_text() for other modes."""
+        return await self.get_text()
 
     @property
     async def bounds(self) -> Quad:
@@ -122,6 +172,30 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
         response: GetOuterHTMLResponse = await self._execute_command(command)
         return response['result']['outerHTML']
 
+    async def get_text(self, mode: TextMode = TextMode.INNER_TEXT) -> str:
+        """
+        Text of the element, stripped of surrounding whitespace.
+
+        Args:
+            mode: INNER_TEXT (rendered text read in the page, default),
+                TEXT_CONTENT (text of every descendant, no layout needed) or
+                HTML_PARSER (outerHTML fetched and parsed in Python).
+        """
+        mode = TextMode(mode)
+        if mode == TextMode.HTML_PARSER:
+            outer_html = await self.inner_html
+            return extract_text_from_html(outer_html, strip=True)
+
+        response = await self._execute_command(
+            RuntimeCommands.call_function_on(
+                function_declaration=Scripts.ELEMENT_TEXTS,
+                object_id=self._object_id,
+                arguments=[CallArgument(value=mode.value), CallArgument(objectId=self._object_id)],
+                return_by_value=True,
+            )
+        )
+        return response['result']['result']['value'][0].strip()
+
     async def get_bounds_using_js(self) -> dict[str, int]:
         """
         Get element bounds using JavaScript getBoundingClientRect().
@@ -133,13 +207,30 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
 
     async def get_parent_element(self) -> 'WebElement':
         """Element's parent element."""
-        result = await self._execute_script(Scripts.GET_PARENT_NODE)
+        object_group = self._find_object_group()
+        result = await self._execute_command(
+            self._in_object_group(
+                RuntimeCommands.call_function_on(
+                    object_id=self._object_id,
+                    function_declaration=Scripts.GET_PARENT_NODE,
+                    serialization_options=NODE_SERIALIZATION,
+                ),
+                object_group,
+            )
+        )
         if not self._has_object_id_key(result):
             raise ElementNotFound(f'Parent element not found for element: {self}')
 
-        object_id = result['result']['result']['objectId']
-        attributes = await self._get_object_attributes(object_id=object_id)
-        return WebElement(object_id, self._connection_handler, attributes_list=attributes)
+        remote_object = result['result']['result']
+        object_id = remote_object['objectId']
+        attributes = await self._get_remote_object_attributes(remote_object)
+        return WebElement(
+            object_id,
+            self._connection_handler,
+            attributes_list=attributes,
+            object_group=object_group,
+            object_group_lease=self._lease_for(object_group),
+        )
 
     async def take_screenshot(self, path: str, quality: int = 100):
         """
@@ -220,50 +311,39 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
 
         Raises:
             ElementNotVisible: If element is not visible.
+            ElementNotInteractable: If another element covers the element center.
 
         Note:
             For <option> elements, delegates to specialized JavaScript approach.
-            Element is automatically scrolled into view.
+            Visibility, scrolling into view and the hit test of the element
+            center are handled by one in-page call; offsets are applied after
+            it, so the click point may lie outside the element.
         """
         if self._is_option_tag():
             return await self._click_option_tag()
 
-        if not await self._is_element_visible():
-            raise ElementNotVisible()
-
-        await self.scroll_into_view()
-
-        try:
-            element_bounds = await self.bounds
-            position_to_click = self._calculate_center(element_bounds)
-            position_to_click = (
-                position_to_click[0] + x_offset,
-                position_to_click[1] + y_offset,
-            )
-        except KeyError:
-            element_bounds_js = await self.get_bounds_using_js()
-            position_to_click = (
-                element_bounds_js['x'] + element_bounds_js['width'] / 2,
-                element_bounds_js['y'] + element_bounds_js['height'] / 2,
-            )
-
+        x, y = await self._click_preflight()
+        x, y = x + x_offset, y + y_offset
         press_command = InputCommands.dispatch_mouse_event(
             type=MouseEventType.MOUSE_PRESSED,
-            x=int(position_to_click[0]),
-            y=int(position_to_click[1]),
+            x=int(x),
+            y=int(y),
             button=MouseButton.LEFT,
             click_count=1,
         )
         release_command = InputCommands.dispatch_mouse_event(
             type=MouseEventType.MOUSE_RELEASED,
-            x=int(position_to_click[0]),
-            y=int(position_to_click[1]),
+            x=int(x),
+            y=int(y),
             button=MouseButton.LEFT,
             click_count=1,
         )
-        await self._connection_handler.execute_command(press_command)
+        # the press goes out while the button is held and the release follows it
+        # on the same connection; both acknowledgements are collected at the end
+        press = asyncio.ensure_future(self._connection_handler.execute_command(press_command))
         await asyncio.sleep(hold_time)
-        await self._connection_handler.execute_command(release_command)
+        release = asyncio.ensure_future(self._connection_handler.execute_command(release_command))
+        await asyncio.gather(press, release)
 
     async def insert_text(self, text: str):
         """
@@ -293,21 +373,42 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
             DomCommands.set_file_input_files(files=files, object_id=self._object_id)
         )
 
-    async def type_text(self, text: str, interval: float = 0.1):
+    async def type_text(  # noqa: PLR0913, PLR0917
+        self,
+        text: str,
+        interval: float = 0.1,
+        jitter: TypingJitter = TypingJitter.NONE,
+        jitter_ratio: float = 0.3,
+        pipelined: bool = False,
+    ):
         """
         Type text character by character with realistic timing.
 
         More realistic than insert_text() but slower.
+
+        Args:
+            text: Text to type.
+            interval: Mean pause after each character in seconds.
+            jitter: Distribution of the pauses around interval, see build_typing_plan.
+            jitter_ratio: Spread of the pauses relative to interval.
+            pipelined: Send each key event at its planned time without waiting
+                for the previous one to be acknowledged; replies are collected at
+                the end, so typing takes the planned time instead of the plan
+                plus a round trip per character.
         """
         await self.click()
-        for char in text:
+        delays = build_typing_plan(len(text), interval, jitter, jitter_ratio)
+        if pipelined:
+            return await self._type_text_pipelined(text, delays)
+
+        for char, delay in zip(text, delays):
             await self._execute_command(
                 InputCommands.dispatch_key_event(
                     type=KeyEventType.CHAR,
                     text=char,
                 )
             )
-            await asyncio.sleep(interval)
+            await asyncio.sleep(delay)
 
     async def key_down(self, key: Key, modifiers: Optional[KeyModifier] = None):
         """
@@ -354,6 +455,28 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
         await asyncio.sleep(interval)
         await self.key_up(key)
 
+    async def _type_text_pipelined(self, text: str, delays: list[float]):
+        """Send one key event per character on the schedule of delays, then await the replies."""
+        loop = asyncio.get_running_loop()
+        send_at = loop.time()
+        sends = []
+        for char, delay in zip(text, delays):
+            # commands go out in the order their tasks start, sleeping always yields
+            # so each send starts before the next one is scheduled
+            await asyncio.sleep(max(0.0, send_at - loop.time()))
+            sends.append(
+                asyncio.ensure_future(
+                    self._execute_command(
+                        InputCommands.dispatch_key_event(type=KeyEventType.CHAR, text=char)
+                    )
+                )
+            )
+            send_at += delay
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
     async def _click_option_tag(self):
         """Specialized method for clicking <option> elements in dropdowns."""
 
@@ -365,6 +488,37 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
             )
         )
 
+    async def _click_preflight(self) -> tuple[float, float]:
+        """
+        Check the element can be clicked, scroll it into view and get its center.
+
+        Hidden inputs are checked through their first visible label, and hits on
+        the element's labels don't count as covering it.
+
+        Returns:
+            Viewport coordinates of the element center (or of its label).
+
+        Raises:
+            ElementNotVisible: If neither the element nor one of its labels is visible.
+            ElementNotInteractable: If another element covers the center.
+        """
+        response = await self._execute_command(
+            RuntimeCommands.call_function_on(
+                function_declaration=Scripts.CLICK_PREFLIGHT,
+                object_id=self._object_id,
+                return_by_value=True,
+            )
+        )
+        preflight = response['result']['result']['value']
+        if not preflight['visible']:
+            raise ElementNotVisible()
+        if preflight['covered_by']:
+            raise ElementNotInteractable(
+                f'Element center ({preflight["x"]}, {preflight["y"]}) is covered by '
+                f'a <{preflight["covered_by"]}> element'
+            )
+        return preflight['x'], preflight['y']
+
     async def _is_element_visible(self):
         """Check if element is visible using comprehensive JavaScript visibility test."""
         result = await self._execute_script(Scripts.ELEMENT_VISIBLE, return_by_value=True)
@@ -389,7 +543,7 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
             )
         )
 
-    def _def_attributes(self, attributes_list: list[str]):
+    def _def_attributes(self, attributes_list: Sequence[str]):
         """Process flat attribute list into dictionary (renames 'class' to 'class_name')."""
         for i in range(0, len(attributes_list), 2):
             key = attributes_list[i]
@@ -67,6 +67,12 @@ class FailedToStartBrowser(BrowserException):
     message = 'Failed to start the browser'
 
 
+class BrowserCrashed(BrowserException):
+    """Raised when the browser process exits or its connection is lost unexpectedly."""
+
+    message = 'The browser process crashed'
+
+
 class UnsupportedOS(BrowserException):
     """Raised when attempting to run on an unsupported operating system."""
 
@@ -157,6 +163,12 @@ class ElementNotAFileInput(ElementException):
     message = 'The element is not a file input'
 
 
+class WaitElementFailed(ElementException):
+    """Raised when the browser rejects the command waiting for an element."""
+
+    message = 'Waiting for the element failed'
+
+
 class TimeoutException(PydollException):
     """Base class for exceptions related to timeouts."""
 
@@ -175,6 +187,18 @@ class WaitElementTimeout(TimeoutException):
     message = 'Timed out waiting for element to appear'
 
 
+class NetworkIdleTimeout(TimeoutException):
+    """Raised when the network does not become idle in time."""
+
+    message = 'Timed out waiting for network idle'
+
+
+class NetworkEventTimeout(TimeoutException):
+    """Raised when no matching request or response is seen in time."""
+
+    message = 'Timed out waiting for a matching request or response'
+
+
 class ConfigurationException(PydollException):
     """Base class for exceptions related to configuration and options."""
 
@@ -199,6 +223,18 @@ class ArgumentAlreadyExistsInOptions(ConfigurationException):
     message = 'The argument already exists in the options'
 
 
+class InvalidRequestRule(ConfigurationException):
+    """Raised when a request rule has missing or conflicting conditions."""
+
+    message = 'Invalid request rule'
+
+
+class InvalidHarFile(ConfigurationException):
+    """Raised when a HAR archive cannot be read or has no log entries."""
+
+    message = 'Invalid HAR file'
+
+
 class InvalidFileExtension(ConfigurationException):
     """Raised when an unsupported file extension is provided."""
 
@@ -251,3 +287,33 @@ class InvalidScriptWithElement(ScriptException):
     """Raised when a script contains 'argument' but no element is provided."""
 
     message = 'Script contains "argument" but no element was provided'
+
+
+class ExtractionFailed(ScriptException):
+    """Raised when an in-page data extraction throws (e.g. an invalid selector)."""
+
+    message = 'Data extraction failed in the page'
+
+
+class FleetException(PydollException):
+    """Base class for exceptions related to multi-process browser fleets."""
+
+    message = 'A browser fleet error occurred'
+
+
+class FleetNotRunning(FleetException):
+    """Raised when submitting jobs to a fleet that is not started or is draining."""
+
+    message = 'The browser fleet is not running'
+
+
+class FleetJobFailed(FleetException):
+    """Raised when a job raised an exception inside a fleet worker."""
+
+    message = 'The fleet job failed'
+
+
+class FleetWorkerDied(FleetException):
+    """Raised for jobs that were running on a worker process that exited unexpectedly."""
+
+    message = 'The fleet worker process died'
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class IOMethod(str, Enum):
+    CLOSE = 'IO.close'
+    READ = 'IO.read'
+    RESOLVE_BLOB = 'IO.resolveBlob'
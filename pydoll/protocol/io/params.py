@@ -0,0 +1,20 @@
+try:
+    from typing import NotRequired
+except ImportError:
+    from typing_extensions import NotRequired
+
+from pydoll.protocol.base import CommandParams
+
+
+class CloseParams(CommandParams):
+    handle: str
+
+
+class ReadParams(CommandParams):
+    handle: str
+    offset: NotRequired[int]
+    size: NotRequired[int]
+
+
+class ResolveBlobParams(CommandParams):
+    objectId: str
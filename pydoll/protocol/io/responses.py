@@ -0,0 +1,22 @@
+try:
+    from typing import NotRequired, TypedDict
+except ImportError:
+    from typing_extensions import NotRequired, TypedDict
+
+
+class ReadResultDict(TypedDict):
+    base64Encoded: NotRequired[bool]
+    data: str
+    eof: bool
+
+
+class ResolveBlobResultDict(TypedDict):
+    uuid: str
+
+
+class ReadResponse(TypedDict):
+    result: ReadResultDict
+
+
+class ResolveBlobResponse(TypedDict):
+    result: ResolveBlobResultDict
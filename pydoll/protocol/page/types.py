@@ -153,8 +153,10 @@ class Frame(TypedDict):
     """Information about a frame."""
 
     id: str
+    parentId: NotRequired[str]
     loaderId: NotRequired[str]
     url: str
+    urlFragment: NotRequired[str]
     securityOrigin: NotRequired[str]
     mimeType: NotRequired[str]
     unreachableUrl: NotRequired[str]
@@ -1,12 +1,15 @@
 import base64
 import logging
 import os
+import random
 import re
 from html import unescape
 from html.parser import HTMLParser
+from typing import Optional
 
 import aiohttp
 
+from pydoll.constants import TypingJitter
 from pydoll.exceptions import InvalidBrowserPath, InvalidResponse, NetworkError
 
 logger = logging.getLogger(__name__)
@@ -101,6 +104,42 @@ def extract_text_from_html(html: str, separator: str = '', strip: bool = False)
     return parser.get_text(separator=separator, strip=strip)
 
 
+def build_typing_plan(
+    count: int,
+    interval: float,
+    jitter: TypingJitter = TypingJitter.NONE,
+    jitter_ratio: float = 0.3,
+    rng: Optional[random.Random] = None,
+) -> list[float]:
+    """
+    Computes the pauses following each of count keystrokes.
+
+    Args:
+        count (int): Number of keystrokes.
+        interval (float): Mean pause in seconds.
+        jitter (TypingJitter, optional): Distribution of the pauses around interval.
+            NONE keeps them constant, UNIFORM draws them within interval * (1 ± jitter_ratio),
+            NORMAL with a standard deviation of interval * jitter_ratio. Defaults to NONE.
+        jitter_ratio (float, optional): Spread of the pauses relative to interval.
+            Defaults to 0.3.
+        rng (random.Random, optional): Random generator, e.g. seeded for reproducible plans.
+            Defaults to a new unseeded one.
+
+    Returns:
+        list[float]: Non-negative pauses in seconds, one per keystroke.
+    """
+    rng = rng or random.Random()
+    spread = interval * jitter_ratio
+    match TypingJitter(jitter):
+        case TypingJitter.UNIFORM:
+            delays = [rng.uniform(interval - spread, interval + spread) for _ in range(count)]
+        case TypingJitter.NORMAL:
+            delays = [rng.gauss(interval, spread) for _ in range(count)]
+        case _:
+            delays = [interval] * count
+    return [max(0.0, delay) for delay in delays]
+
+
 def decode_base64_to_bytes(image: str) -> bytes:
     """
     Decodes a base64 image string to bytes.
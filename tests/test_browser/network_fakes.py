@@ -0,0 +1,80 @@
+"""Event factories and a fake target shared by the network interception tests."""
+
+import base64
+
+
+def paused(  # noqa: PLR0913, PLR0917
+    url='https://a.test/',
+    request_id='req-1',
+    resource_type='Script',
+    method='GET',
+    headers=None,
+    post_data=None,
+):
+    """Fetch.requestPaused event of a request paused before being sent."""
+    request = {'url': url, 'method': method, 'headers': headers or {}}
+    if post_data is not None:
+        request['postData'] = post_data
+    return {
+        'method': 'Fetch.requestPaused',
+        'params': {'requestId': request_id, 'resourceType': resource_type, 'request': request},
+    }
+
+
+def paused_response(url='https://a.test/', status=200, response_headers=None, **kwargs):
+    """Fetch.requestPaused event of a request paused at the response stage."""
+    event = paused(url, **kwargs)
+    event['params']['responseStatusCode'] = status
+    event['params']['responseStatusText'] = 'OK'
+    event['params']['responseHeaders'] = response_headers or []
+    return event
+
+
+def request_will_be_sent(  # noqa: PLR0913, PLR0917
+    request_id,
+    url='https://a.test/app.js',
+    resource_type='Script',
+    loader_id='L1',
+    frame_id='main',
+):
+    """Network.requestWillBeSent event."""
+    return {
+        'method': 'Network.requestWillBeSent',
+        'params': {
+            'requestId': request_id,
+            'loaderId': loader_id,
+            'frameId': frame_id,
+            'type': resource_type,
+            'request': {'url': url},
+        },
+    }
+
+
+class FakeTarget:
+    """
+    Records the commands sent on a target.
+
+    Fetch.getResponseBody is answered from bodies, keyed by the url of an
+    event passed to expect() or by request id; a None body fails like a
+    response Chrome no longer holds. Other commands get an empty result.
+    """
+
+    def __init__(self, bodies=None):
+        self.bodies = {} if bodies is None else bodies
+        self.commands = []
+        self.urls = {}
+
+    async def __call__(self, command):
+        self.commands.append(command)
+        if command['method'] != 'Fetch.getResponseBody':
+            return {'result': {}}
+        request_id = command['params']['requestId']
+        body = self.bodies[self.urls.get(request_id, request_id)]
+        if body is None:
+            raise RuntimeError('No data found for resource with given identifier')
+        return {'result': {'body': base64.b64encode(body).decode(), 'base64Encoded': True}}
+
+    def expect(self, event):
+        """Answer the body request of event from the body of its url."""
+        self.urls[event['params']['requestId']] = event['params']['request']['url']
+        return event
@@ -0,0 +1,230 @@
+import base64
+import hashlib
+
+import pytest
+
+from pydoll.browser.network import AssetCache
+from pydoll.commands import FetchCommands
+from pydoll.constants import RequestStage, ResourceType
+from tests.test_browser.network_fakes import FakeTarget, paused, paused_response
+
+CACHEABLE = [
+    {'name': 'Content-Type', 'value': 'text/javascript'},
+    {'name': 'Cache-Control', 'value': 'public, max-age=3600'},
+    {'name': 'Content-Encoding', 'value': 'gzip'},
+]
+
+
+async def store(cache, target, url, body, response_headers=CACHEABLE, **kwargs):
+    target.bodies[url] = body
+    event = target.expect(paused_response(url, response_headers=response_headers, **kwargs))
+    assert await cache.handle(event, target) is None
+
+
+@pytest.mark.asyncio
+async def test_miss_store_and_hit(tmp_path):
+    cache = AssetCache(tmp_path)
+    target = FakeTarget()
+    url = 'https://cdn.test/app.js'
+
+    assert await cache.handle(paused(url), target) is None
+    await store(cache, target, url, b'console.log(1)')
+    command = await cache.handle(paused(url, request_id='req-2'), target)
+
+    assert command == FetchCommands.fulfill_request(
+        request_id='req-2',
+        response_code=200,
+        response_headers=[
+            {'name': 'Content-Type', 'value': 'text/javascript'},
+            {'name': 'Cache-Control', 'value': 'public, max-age=3600'},
+        ],
+        body=base64.b64encode(b'console.log(1)').decode(),
+    )
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.bytes_served == 14
+    digest = hashlib.sha256(b'console.log(1)').hexdigest()
+    assert (tmp_path / 'blobs' / digest[:2] / digest).read_bytes() == b'console.log(1)'
+
+
+@pytest.mark.asyncio
+async def test_identical_bodies_are_stored_once(tmp_path):
+    cache = AssetCache(tmp_path)
+    target = FakeTarget()
+
+    await store(cache, target, 'https://a.test/lib.js', b'x' * 10)
+    await store(cache, target, 'https://b.test/lib.js', b'x' * 10)
+
+    assert len(cache) == 2
+    assert cache.size == 10
+    assert len(list((tmp_path / 'blobs').rglob('*'))) == 2  # one prefix dir, one blob
+
+
+@pytest.mark.asyncio
+async def test_replaced_body_deletes_unreferenced_blob(tmp_path):
+    cache = AssetCache(tmp_path)
+    target = FakeTarget()
+    url = 'https://a.test/app.js'
+
+    await store(cache, target, url, b'v1')
+    await store(cache, target, url, b'v1')
+    assert len(list((tmp_path / 'blobs').rglob('*'))) == 2
+
+    await store(cache, target, url, b'v2')
+
+    blobs = [path.name for path in (tmp_path / 'blobs').rglob('*') if path.is_file()]
+    assert blobs == [hashlib.sha256(b'v2').hexdigest()]
+    assert cache.size == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_blob_survives_replacing_one_url(tmp_path):
+    cache = AssetCache(tmp_path)
+    target = FakeTarget()
+
+    await store(cache, target, 'https://a.test/lib.js', b'shared')
+    await store(cache, target, 'https://b.test/lib.js', b'shared')
+    await store(cache, target, 'https://a.test/lib.js', b'own')
+
+    assert await cache.handle(paused('https://b.test/lib.js'), target) is not None
+    assert cache.size == len(b'shared') + len(b'own')
+
+
+@pytest.mark.asyncio
+async def test_no_temporary_files_are_left(tmp_path):
+    cache = AssetCache(tmp_path)
+    target = FakeTarget()
+    await store(cache, target, 'https://a.test/a.js', b'body')
+    cache.save()
+
+    assert not list(tmp_path.rglob('*.tmp'))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'headers',
+    [
+        [{'name': 'Cache-Control', 'value': 'no-store'}],
+        [{'name': 'Cache-Control', 'value': 'max-age=60, private'}],
+        [{'name': 'Cache-Control', 'value': 'no-cache, max-age=60'}],
+        [{'name': 'Cache-Control', 'value': 'max-age=60'}, {'name': 'Age', 'value': '60'}],
+        [{'name': 'Cache-Control', 'value': 'max-age=60'}, {'name': 'Vary', 'value': 'Cookie'}],
+        [{'name': 'Expires', 'value': '0'}],
+        [],
+    ],
+)
+async def test_uncacheable_responses_are_skipped(tmp_path, headers):
+    cache = AssetCache(tmp_path)
+    target = FakeTarget()
+
+    await store(cache, target, 'https://a.test/a.js', b'body', response_headers=headers)
+
+    assert len(cache) == 0
+    assert target.commands == []
+
+
+@pytest.mark.asyncio
+async def test_expires_header_and_default_ttl(tmp_path):
+    cache = AssetCache(tmp_path, default_ttl=30)
+    target = FakeTarget()
+
+    await store(
+        cache,
+        target,
+        'https://a.test/a.css',
+        b'body',
+        resource_type='Stylesheet',
+        response_headers=[
+            {'name': 'Date', 'value': 'Mon, 01 Jan 2024 00:00:00 GMT'},
+            {'name': 'Expires', 'value': 'Mon, 01 Jan 2024 01:00:00 GMT'},
+        ],
+    )
+    await store(cache, target, 'https://a.test/b.js', b'body', response_headers=[])
+
+    assert 'https://a.test/a.css' in cache
+    assert 'https://a.test/b.js' in cache
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_dropped(tmp_path, monkeypatch):
+    cache = AssetCache(tmp_path)
+    target = FakeTarget()
+    await store(cache, target, 'https://a.test/a.js', b'body')
+
+    monkeypatch.setattr('pydoll.browser.network.asset_cache.time.time', lambda: 2**40)
+
+    assert await cache.handle(paused('https://a.test/a.js'), target) is None
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(tmp_path):
+    cache = AssetCache(tmp_path, max_size=25)
+    target = FakeTarget()
+
+    await store(cache, target, 'https://a.test/1.js', b'1' * 10)
+    await store(cache, target, 'https://a.test/2.js', b'2' * 10)
+    assert await cache.handle(paused('https://a.test/1.js'), target) is not None
+    await store(cache, target, 'https://a.test/3.js', b'3' * 10)
+
+    assert 'https://a.test/1.js' in cache
+    assert 'https://a.test/2.js' not in cache
+    assert cache.size == 20
+    assert cache.stats.evicted == 1
+
+
+@pytest.mark.asyncio
+async def test_ignored_requests(tmp_path):
+    cache = AssetCache(tmp_path)
+    target = FakeTarget()
+    await store(cache, target, 'https://a.test/a.js', b'body')
+
+    assert await cache.handle(paused('https://a.test/a.js', method='POST'), target) is None
+    assert await cache.handle(
+        paused('https://a.test/a.js', resource_type='Image'), target
+    ) is None
+    assert await cache.handle(
+        paused('https://a.test/a.js', headers={'Cache-Control': 'no-cache'}), target
+    ) is None
+    assert cache.stats.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_index_is_persisted(tmp_path):
+    cache = AssetCache(tmp_path)
+    target = FakeTarget()
+    await store(cache, target, 'https://a.test/a.js', b'body')
+    cache.save()
+
+    reloaded = AssetCache(tmp_path)
+
+    assert 'https://a.test/a.js' in reloaded
+    assert reloaded.size == 4
+    assert await reloaded.handle(paused('https://a.test/a.js'), target) is not None
+
+
+def test_unreadable_index_is_ignored(tmp_path):
+    (tmp_path / AssetCache.INDEX_FILE).write_text('{not json')
+    assert len(AssetCache(tmp_path)) == 0
+
+
+@pytest.mark.asyncio
+async def test_missing_blob_is_a_miss(tmp_path):
+    cache = AssetCache(tmp_path)
+    target = FakeTarget()
+    await store(cache, target, 'https://a.test/a.js', b'body')
+    for blob in (tmp_path / 'blobs').rglob('*'):
+        if blob.is_file():
+            blob.unlink()
+
+    assert await cache.handle(paused('https://a.test/a.js'), target) is None
+    assert len(cache) == 0
+
+
+def test_request_patterns(tmp_path):
+    cache = AssetCache(tmp_path, resource_types=[ResourceType.FONT])
+    assert cache.request_patterns() == [
+        {'urlPattern': '*', 'resourceType': ResourceType.FONT, 'requestStage': RequestStage.REQUEST},
+        {'urlPattern': '*', 'resourceType': ResourceType.FONT, 'requestStage': RequestStage.RESPONSE},
+    ]
@@ -9,11 +9,18 @@ from pydoll import exceptions
 from pydoll.browser.chromium.chrome import Chrome
 from pydoll.browser.chromium.base import Browser
 from pydoll.browser.managers import ProxyManager, ChromiumOptionsManager, BrowserProcessManager, TempDirectoryManager
+from pydoll.browser.managers.resource_monitor import (
+    BrowserResourceMonitor,
+    BrowserResourceUsage,
+    ResourceThresholds,
+)
+from pydoll.browser.network import RequestRule
 from pydoll.browser.options import ChromiumOptions as Options
 from pydoll.browser.tab import Tab
 from pydoll.commands import (
     BrowserCommands,
     FetchCommands,
+    PageCommands,
     RuntimeCommands,
     StorageCommands,
     TargetCommands,
@@ -158,6 +165,69 @@ async def test_start_browser_success_with_start_timeout(mock_browser):
 
     await mock_browser.start()
 
+@pytest.mark.asyncio
+async def test_start_browser_attaches_output_manager(mock_browser):
+    mock_browser._connection_handler.ping.return_value = True
+    mock_browser._get_valid_tab_id = AsyncMock(return_value='page1')
+    mock_browser._browser_output_manager = MagicMock()
+    mock_browser._browser_output_manager.attach = AsyncMock()
+    mock_browser._browser_output_manager.is_attached = False
+
+    await mock_browser.start()
+
+    mock_browser._browser_output_manager.attach.assert_awaited_once_with(
+        mock_browser._browser_process_manager.start_browser_process.return_value
+    )
+
+
+@pytest.mark.asyncio
+async def test_start_browser_fails_fast_when_process_exits(mock_browser):
+    mock_browser._connection_handler.ping.return_value = True
+    mock_browser._browser_output_manager = MagicMock()
+    mock_browser._browser_output_manager.attach = AsyncMock()
+    mock_browser._browser_output_manager.is_attached = True
+    mock_browser._browser_output_manager.closed = True
+    mock_browser._browser_output_manager.wait_for_line = AsyncMock(return_value=None)
+    mock_browser._browser_output_manager.get_recent_lines.return_value = [
+        'ERROR: Missing X server or $DISPLAY'
+    ]
+
+    with pytest.raises(exceptions.FailedToStartBrowser) as exc_info:
+        await mock_browser.start()
+
+    assert 'Missing X server' in str(exc_info.value)
+    mock_browser._connection_handler.ping.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_verify_browser_running_deducts_banner_wait(mock_browser):
+    mock_browser.options.start_timeout = 10
+    mock_browser._browser_output_manager = MagicMock()
+    mock_browser._browser_output_manager.is_attached = True
+    mock_browser._browser_output_manager.closed = False
+    mock_browser._browser_output_manager.wait_for_line = AsyncMock(return_value=None)
+    mock_browser._is_browser_running = AsyncMock(return_value=True)
+
+    with patch('pydoll.browser.chromium.base.time') as mock_time:
+        mock_time.monotonic.side_effect = [100.0, 107.5]
+        await mock_browser._verify_browser_running()
+
+    mock_browser._browser_output_manager.wait_for_line.assert_awaited_once_with(
+        'DevTools listening on', timeout=10
+    )
+    mock_browser._is_browser_running.assert_awaited_once_with(3)
+
+
+def test_get_recent_output(mock_browser):
+    mock_browser._browser_output_manager._lines.extend(
+        [('stdout', 'first'), ('stderr', 'second'), ('stderr', 'third')]
+    )
+
+    assert mock_browser.get_recent_output() == ['first', 'second', 'third']
+    assert mock_browser.get_recent_output(limit=1) == ['third']
+    assert mock_browser.get_recent_output(stream='stdout') == ['first']
+
+
 @pytest.mark.asyncio
 async def test_proxy_configuration(mock_browser):
     mock_browser._proxy_manager.get_proxy_credentials = MagicMock(
@@ -282,6 +352,219 @@ async def test_stop_browser(mock_browser):
     mock_browser._temp_directory_manager.cleanup.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_restart_browser(mock_browser):
+    mock_browser._connection_handler.ping.return_value = True
+    mock_browser._get_valid_tab_id = AsyncMock(return_value='page1')
+    mock_browser._proxy_manager.get_proxy_credentials = MagicMock(
+        return_value=(True, ('user', 'pass'))
+    )
+    mock_browser._configure_proxy = AsyncMock()
+    await mock_browser.start()
+
+    tab = await mock_browser.restart()
+
+    assert isinstance(tab, Tab)
+    mock_browser._connection_handler.execute_command.assert_any_await(
+        BrowserCommands.close(), timeout=5
+    )
+    mock_browser._browser_process_manager.stop_process.assert_called_once()
+    mock_browser._temp_directory_manager.cleanup.assert_not_called()
+    assert mock_browser._browser_process_manager.start_browser_process.call_count == 2
+    # proxy credentials are extracted once and reused by the relaunch
+    mock_browser._proxy_manager.get_proxy_credentials.assert_called_once()
+    mock_browser._configure_proxy.assert_awaited_with(True, ('user', 'pass'))
+
+
+@pytest.mark.asyncio
+async def test_restart_browser_when_process_is_dead(mock_browser):
+    mock_browser._connection_handler.ping = AsyncMock(side_effect=[False, True])
+    mock_browser._get_valid_tab_id = AsyncMock(return_value='page1')
+
+    await mock_browser.restart()
+
+    mock_browser._browser_process_manager.stop_process.assert_called_once()
+    assert not any(
+        call.args and call.args[0] == BrowserCommands.close()
+        for call in mock_browser._connection_handler.execute_command.await_args_list
+    )
+
+
+@pytest.mark.asyncio
+async def test_enable_resource_monitor(mock_browser):
+    thresholds = ResourceThresholds(max_rss_bytes=1024)
+    callback = MagicMock()
+    with patch.object(BrowserResourceMonitor, 'start', AsyncMock()) as mock_start:
+        monitor = await mock_browser.enable_resource_monitor(
+            thresholds=thresholds, interval=1, callback=callback, auto_restart=True
+        )
+
+    mock_start.assert_awaited_once()
+    assert monitor.thresholds is thresholds
+    assert monitor.interval == 1
+    assert monitor._callbacks == [callback, mock_browser._restart_on_threshold_exceeded]
+    assert mock_browser._resource_monitor is monitor
+
+    with patch.object(BrowserResourceMonitor, 'stop', AsyncMock()) as mock_stop:
+        await mock_browser.disable_resource_monitor()
+    mock_stop.assert_awaited_once()
+    assert mock_browser._resource_monitor is None
+
+
+@pytest.mark.asyncio
+async def test_restart_on_threshold_exceeded(mock_browser):
+    mock_browser.restart = AsyncMock()
+    usage = BrowserResourceUsage(pid=1, rss_bytes=1, cpu_time=0, num_threads=1, process_count=1)
+
+    await mock_browser._restart_on_threshold_exceeded(usage, ['rss 1 > 0'])
+
+    mock_browser.restart.assert_awaited_once()
+
+
+def test_get_resource_usage(mock_browser):
+    with patch.object(BrowserResourceMonitor, 'sample', return_value='usage') as mock_sample:
+        assert mock_browser.get_resource_usage() == 'usage'
+    mock_sample.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_enable_crash_watchdog_requires_running_process(mock_browser):
+    mock_browser._browser_process_manager.is_process_alive.return_value = False
+    with pytest.raises(exceptions.BrowserNotRunning):
+        await mock_browser.enable_crash_watchdog()
+
+
+@pytest.mark.asyncio
+async def test_start_target_tracking(mock_browser):
+    mock_browser.get_targets = AsyncMock(
+        return_value=[{'targetId': 't1', 'type': 'page', 'url': 'https://a.com'}]
+    )
+
+    await mock_browser._start_target_tracking()
+
+    assert mock_browser._known_targets == {
+        't1': {'targetId': 't1', 'type': 'page', 'url': 'https://a.com'}
+    }
+    mock_browser._connection_handler.execute_command.assert_any_await(
+        TargetCommands.set_discover_targets(True), timeout=10
+    )
+    mock_browser._update_known_target(
+        {'params': {'targetInfo': {'targetId': 't1', 'type': 'page', 'url': 'https://b.com'}}}
+    )
+    assert mock_browser._known_targets['t1']['url'] == 'https://b.com'
+    mock_browser._remove_known_target({'params': {'targetId': 't1'}})
+    assert mock_browser._known_targets == {}
+
+
+@pytest.mark.asyncio
+async def test_crash_watchdog_fails_pending_work_and_notifies(mock_browser):
+    mock_browser.get_targets = AsyncMock(
+        return_value=[{'targetId': 'crash-page', 'type': 'page', 'url': 'https://a.com'}]
+    )
+    tab = Tab(mock_browser, mock_browser._connection_port, 'crash-page')
+    future = tab._connection_handler._command_manager.create_command_future({'method': 'X'})
+    crashed = asyncio.Event()
+    errors = []
+
+    async def on_crash(error):
+        errors.append(error)
+        crashed.set()
+
+    mock_browser._browser_output_manager._lines.append(('stderr', 'Segmentation fault'))
+    await mock_browser.enable_crash_watchdog(callback=on_crash, poll_interval=0.01)
+    mock_browser._browser_process_manager.is_process_alive.return_value = False
+
+    await asyncio.wait_for(crashed.wait(), timeout=5)
+
+    assert isinstance(errors[0], exceptions.BrowserCrashed)
+    assert 'Segmentation fault' in str(errors[0])
+    with pytest.raises(exceptions.BrowserCrashed):
+        await future
+    await asyncio.sleep(0)
+    assert mock_browser._crash_watchdog_task is None
+    Tab._remove_instance('crash-page')
+
+
+@pytest.mark.asyncio
+async def test_crash_watchdog_detects_connection_loss(mock_browser):
+    mock_browser.get_targets = AsyncMock(return_value=[])
+    crashed = asyncio.Event()
+
+    await mock_browser.enable_crash_watchdog(
+        callback=lambda error: crashed.set(), poll_interval=10
+    )
+    mock_browser._crash_detected.set()
+
+    await asyncio.wait_for(crashed.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_crash_watchdog_ignores_intentional_restart(mock_browser):
+    mock_browser.get_targets = AsyncMock(return_value=[])
+    callback = MagicMock()
+    await mock_browser.enable_crash_watchdog(callback=callback, poll_interval=0.01)
+
+    async with mock_browser._lifecycle_lock:
+        mock_browser._crash_detected.set()
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(0.05)
+
+    callback.assert_not_called()
+    assert mock_browser._crash_watchdog_task is not None
+    await mock_browser.disable_crash_watchdog()
+    assert mock_browser._crash_watchdog_task is None
+
+
+@pytest.mark.asyncio
+async def test_crash_watchdog_auto_restart(mock_browser):
+    mock_browser.get_targets = AsyncMock(return_value=[])
+    mock_browser._recover_from_crash = AsyncMock()
+    recovered = asyncio.Event()
+    await mock_browser.enable_crash_watchdog(
+        auto_restart=True, callback=lambda error: recovered.set(), poll_interval=10
+    )
+
+    mock_browser._crash_detected.set()
+    await asyncio.wait_for(recovered.wait(), timeout=1)
+    await asyncio.sleep(0)
+
+    mock_browser._recover_from_crash.assert_awaited_once_with([])
+    assert mock_browser._crash_watchdog_task is not None
+    await mock_browser.disable_crash_watchdog()
+
+
+@pytest.mark.asyncio
+async def test_recover_from_crash_moves_tabs_to_new_targets(mock_browser):
+    first = Tab(mock_browser, mock_browser._connection_port, 'old-1')
+    second = Tab(mock_browser, mock_browser._connection_port, 'old-2')
+    for tab in (first, second):
+        tab._attach_to_target = AsyncMock()
+        tab._execute_command = AsyncMock()
+    mock_browser._known_targets = {
+        'old-1': {'targetId': 'old-1', 'type': 'page', 'url': 'https://a.com'},
+        'old-2': {'targetId': 'old-2', 'type': 'page', 'url': 'about:blank'},
+    }
+    initial_tab = MagicMock(_target_id='initial')
+    initial_tab._connection_handler.close = AsyncMock()
+    mock_browser.restart = AsyncMock(return_value=initial_tab)
+    mock_browser._start_target_tracking = AsyncMock()
+    mock_browser._setup_fingerprint_for_tab = AsyncMock()
+    mock_browser._connection_handler.execute_command.return_value = {
+        'result': {'targetId': 'created'}
+    }
+
+    await mock_browser._recover_from_crash([first, second])
+
+    first._attach_to_target.assert_awaited_once_with('initial', None)
+    second._attach_to_target.assert_awaited_once_with('created', None)
+    initial_tab._connection_handler.close.assert_awaited_once()
+    first._execute_command.assert_awaited_once_with(PageCommands.navigate('https://a.com'))
+    second._execute_command.assert_not_called()
+    assert mock_browser._setup_fingerprint_for_tab.await_count == 2
+    Tab._remove_instance('old-1')
+    Tab._remove_instance('old-2')
+
+
 @pytest.mark.asyncio
 async def test_stop_browser_not_running(mock_browser):
     mock_browser._connection_handler.ping.return_value = False
@@ -318,6 +601,103 @@ async def test_disable_events(mock_browser):
     )
 
 
+@pytest.mark.asyncio
+async def test_enable_request_rules(mock_browser):
+    mock_browser._connection_handler.register_callback.return_value = 3
+    rule_set = await mock_browser.enable_request_rules(
+        [RequestRule(host_suffix='ads.com')]
+    )
+
+    assert mock_browser.request_rules is rule_set
+    mock_browser._connection_handler.execute_command.assert_called_with(
+        FetchCommands.enable(
+            handle_auth_requests=False, patterns=rule_set.request_patterns()
+        )
+    )
+
+    await mock_browser._apply_request_rules(
+        {'params': {'requestId': 'r1', 'request': {'url': 'https://x.ads.com/'}}}
+    )
+    mock_browser._connection_handler.execute_command.assert_called_with(
+        FetchCommands.fail_request('r1', NetworkErrorReason.BLOCKED_BY_CLIENT),
+        timeout=10,
+    )
+    assert rule_set.hits == {'block:ads.com': 1}
+
+
+@pytest.mark.asyncio
+async def test_request_rules_survive_restart(mock_browser):
+    mock_browser._connection_handler.ping.return_value = True
+    mock_browser._get_valid_tab_id = AsyncMock(return_value='page1')
+    mock_browser._proxy_manager.get_proxy_credentials = MagicMock(
+        return_value=(False, (None, None))
+    )
+    mock_browser._connection_handler.register_callback.return_value = 3
+    rule_set = await mock_browser.enable_request_rules(
+        [RequestRule(host_suffix='ads.com')]
+    )
+    await mock_browser.enable_fetch_events()
+    mock_browser._connection_handler.execute_command.reset_mock()
+    mock_browser._connection_handler.register_callback.return_value = 8
+
+    await mock_browser.restart()
+
+    assert mock_browser.request_rules is rule_set
+    assert mock_browser._request_rules_callback_id == 8
+    assert not mock_browser._fetch_events_enabled
+    assert (
+        mock_browser._connection_handler.register_callback.await_args.args[0]
+        == FetchEvent.REQUEST_PAUSED
+    )
+    mock_browser._connection_handler.execute_command.assert_any_await(
+        FetchCommands.enable(
+            handle_auth_requests=False, patterns=rule_set.request_patterns()
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_paused_handlers_skip_rule_matches(mock_browser):
+    await mock_browser.enable_request_rules([RequestRule(host_suffix='ads.com')])
+    handled = []
+
+    await mock_browser.on('Fetch.requestPaused', lambda event: handled.append(event))
+    registered = mock_browser._connection_handler.register_callback.call_args.args[1]
+    registered({'params': {'requestId': 'r1', 'request': {'url': 'https://x.ads.com/'}}})
+    registered({'params': {'requestId': 'r2', 'request': {'url': 'https://a.test/'}}})
+
+    assert [event['params']['requestId'] for event in handled] == ['r2']
+
+
+@pytest.mark.asyncio
+async def test_request_rules_survive_fetch_events(mock_browser):
+    mock_browser._connection_handler.remove_callback = AsyncMock()
+    rule_set = await mock_browser.enable_request_rules(
+        [RequestRule(host_suffix='ads.com')]
+    )
+    await mock_browser.enable_fetch_events()
+
+    await mock_browser._apply_request_rules(
+        {'params': {'requestId': 'r2', 'request': {'url': 'https://a.test/'}}}
+    )
+    mock_browser._connection_handler.execute_command.assert_called_with(
+        FetchCommands.enable(handle_auth_requests=False, resource_type=None)
+    )
+
+    await mock_browser.disable_fetch_events()
+    mock_browser._connection_handler.execute_command.assert_called_with(
+        FetchCommands.enable(
+            handle_auth_requests=False, patterns=rule_set.request_patterns()
+        )
+    )
+
+    await mock_browser.disable_request_rules()
+    assert mock_browser.request_rules is None
+    mock_browser._connection_handler.execute_command.assert_called_with(
+        FetchCommands.disable()
+    )
+
+
 @pytest.mark.asyncio
 async def test__continue_request_callback(mock_browser):
     await mock_browser._continue_request_callback({'params': {'requestId': 'request1'}})
@@ -0,0 +1,215 @@
+import asyncio
+import functools
+import os
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from pydoll import exceptions
+from pydoll.browser.fleet import BrowserFleet, WorkerStats
+
+
+class FakeTab:
+    def __init__(self, browser):
+        self.browser = browser
+        self.generation = browser.restarts
+
+
+class FakeBrowser:
+    def __init__(self, connection_port=None):
+        self.connection_port = connection_port
+        self.restarts = 0
+
+    async def start(self, headless=False):
+        return FakeTab(self)
+
+    async def restart(self):
+        self.restarts += 1
+        return FakeTab(self)
+
+    async def stop(self):
+        pass
+
+
+class BrokenBrowser(FakeBrowser):
+    async def start(self, headless=False):
+        raise RuntimeError('no binary')
+
+
+async def describe(tab, value):
+    return os.getpid(), tab.browser.connection_port, tab.generation, value * 2
+
+
+async def fail(tab, message):
+    raise ValueError(message)
+
+
+async def crash(tab):
+    os._exit(3)
+
+
+def make_fleet(**kwargs):
+    kwargs.setdefault('workers', 2)
+    kwargs.setdefault('browser_factory', FakeBrowser)
+    kwargs.setdefault('poll_interval', 0.05)
+    return BrowserFleet(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_submit_runs_jobs_in_worker_processes():
+    async with make_fleet(browsers_per_worker=2, base_port=9500) as fleet:
+        results = [await fleet.submit(describe, value) for value in range(4)]
+
+    assert [result[3] for result in results] == [0, 2, 4, 6]
+    assert all(result[0] != os.getpid() for result in results)
+    assert {result[1] for result in results} <= {9500, 9501, 9502, 9503}
+    assert not fleet.is_running
+
+
+@pytest.mark.asyncio
+async def test_map_streams_results_and_stats():
+    async with make_fleet() as fleet:
+        results = [result async for result in fleet.map(describe, range(10))]
+        stats = fleet.stats
+
+    assert sorted(result[3] for result in results) == [value * 2 for value in range(10)]
+    assert all(isinstance(worker, WorkerStats) for worker in stats)
+    assert sum(worker.jobs_completed for worker in stats) == 10
+    assert all(worker.state == 'ready' and worker.running == 0 for worker in stats)
+    assert all(worker.state == 'stopped' for worker in fleet.stats)
+
+
+@pytest.mark.asyncio
+async def test_job_exception_fails_future():
+    async with make_fleet(workers=1) as fleet:
+        with pytest.raises(exceptions.FleetJobFailed, match='ValueError: boom'):
+            await fleet.submit(fail, 'boom')
+        results = [result async for result in fleet.map(fail, ['a'], return_exceptions=True)]
+
+    assert isinstance(results[0], exceptions.FleetJobFailed)
+    assert fleet.stats[0].jobs_failed == 2
+
+
+@pytest.mark.asyncio
+async def test_drain_finishes_queued_jobs():
+    fleet = make_fleet(workers=1)
+    await fleet.start()
+    futures = [fleet.submit(describe, value) for value in range(5)]
+    await fleet.drain()
+
+    assert [future.result()[3] for future in futures] == [0, 2, 4, 6, 8]
+    with pytest.raises(exceptions.FleetNotRunning):
+        fleet.submit(describe, 1)
+
+
+@pytest.mark.asyncio
+async def test_worker_death_fails_running_job():
+    async with make_fleet(workers=1) as fleet:
+        with pytest.raises(exceptions.FleetWorkerDied):
+            await fleet.submit(crash)
+
+    assert fleet.stats[0].state == 'dead'
+    assert fleet.stats[0].error == 'exit code 3'
+
+
+@pytest.mark.asyncio
+async def test_recycle_after_restarts_browser():
+    async with make_fleet(workers=1, recycle_after=2) as fleet:
+        results = [await fleet.submit(describe, value) for value in range(5)]
+
+    assert [result[2] for result in results] == [0, 0, 1, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_start_fails_when_no_worker_starts():
+    fleet = make_fleet(browser_factory=BrokenBrowser)
+    with pytest.raises(exceptions.FailedToStartBrowser, match='RuntimeError: no binary'):
+        await fleet.start()
+    assert not fleet.is_running
+
+
+@pytest.mark.asyncio
+async def test_submit_requires_started_fleet():
+    with pytest.raises(exceptions.FleetNotRunning):
+        make_fleet().submit(describe, 1)
+
+
+class RecordingBrowser(FakeBrowser):
+    def __init__(self, marker_dir, connection_port=None):
+        super().__init__(connection_port)
+        self.marker_dir = marker_dir
+
+    async def stop(self):
+        with open(os.path.join(self.marker_dir, f'stopped-{os.getpid()}'), 'w'):
+            pass
+
+
+class StuckBrowser(FakeBrowser):
+    async def stop(self):
+        await asyncio.sleep(3600)
+
+
+async def hang(tab):
+    await asyncio.sleep(3600)
+
+
+async def spawn_child(tab):
+    return subprocess.Popen(['sleep', '60']).pid
+
+
+def is_gone(pid):
+    try:
+        with open(f'/proc/{pid}/stat') as stat:
+            # reparented children may linger as zombies when nothing reaps them
+            return stat.read().split(')')[-1].split()[0] == 'Z'
+    except FileNotFoundError:
+        return True
+
+
+@pytest.mark.asyncio
+async def test_terminate_stops_browsers_of_busy_workers(tmp_path):
+    fleet = make_fleet(browser_factory=functools.partial(RecordingBrowser, str(tmp_path)))
+    await fleet.start()
+    futures = [fleet.submit(hang) for _ in range(2)]
+    await asyncio.sleep(0.3)
+
+    await fleet.terminate()
+
+    for future in futures:
+        with pytest.raises(exceptions.FleetWorkerDied):
+            await future
+    assert all(worker.state == 'stopped' for worker in fleet.stats)
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.path.isdir('/proc'), reason='needs process groups and /proc')
+async def test_terminate_kills_stuck_workers_with_their_children():
+    fleet = make_fleet(workers=1, browser_factory=StuckBrowser, grace_period=0.5)
+    await fleet.start()
+    child_pid = await fleet.submit(spawn_child)
+
+    await fleet.terminate()
+
+    assert fleet.stats[0].state == 'dead'
+    assert is_gone(child_pid)
+
+
+@pytest.mark.asyncio
+async def test_worker_death_fails_jobs_dequeued_before_started():
+    fleet = make_fleet(workers=1, browsers_per_worker=2)
+    loop = asyncio.get_running_loop()
+    fleet._held_jobs = [0, 7]
+    fleet._processes = {0: SimpleNamespace(exitcode=9, pid=None, is_alive=lambda: False)}
+    fleet._workers = {0: WorkerStats(worker_id=0)}
+    fleet._running_jobs = {0: set()}
+    lost, queued = loop.create_future(), loop.create_future()
+    fleet._futures = {7: lost, 8: queued}
+
+    fleet._handle_worker_death(0)
+
+    with pytest.raises(exceptions.FleetWorkerDied, match='exit code 9'):
+        await lost
+    assert not queued.done()
+    assert fleet.stats[0].jobs_failed == 1
@@ -1,6 +1,8 @@
 import pytest
 
+from pydoll.browser import interfaces
 from pydoll.browser.options import ChromiumOptions as Options
+from pydoll.constants import PerformanceProfile
 
 from pydoll.exceptions import ArgumentAlreadyExistsInOptions
 
@@ -9,6 +11,21 @@ def test_initial_arguments():
     assert options.arguments == []
 
 
+def test_output_options_have_defaults():
+    class MinimalOptions(interfaces.Options):
+        arguments = []
+        binary_location = ''
+        start_timeout = 10
+
+        def add_argument(self, argument):
+            self.arguments.append(argument)
+
+    options = Options()
+    options.output_buffer_size = 50
+    assert (MinimalOptions().output_buffer_size, MinimalOptions().output_log_file) == (1000, None)
+    assert (Options().output_buffer_size, options.output_buffer_size) == (1000, 50)
+
+
 def test_initial_binary_location():
     options = Options()
     assert not options.binary_location
@@ -44,3 +61,44 @@ def test_add_multiple_arguments():
     options.add_argument('--headless')
     options.add_argument('--no-sandbox')
     assert options.arguments == ['--headless', '--no-sandbox']
+
+
+def test_apply_performance_profile_max_throughput():
+    options = Options()
+    options.apply_performance_profile('max_throughput')
+    assert options.performance_profile is PerformanceProfile.MAX_THROUGHPUT
+    assert '--blink-settings=imagesEnabled=false' in options.arguments
+    assert '--disable-gpu' in options.arguments
+    assert '--disable-site-isolation-trials' in options.arguments
+    assert '--disable-renderer-backgrounding' in options.arguments
+    assert '--renderer-process-limit=8' in options.arguments
+    assert not any(arg.startswith('--disk-cache-dir') for arg in options.arguments)
+
+
+def test_apply_performance_profile_low_memory_overrides():
+    options = Options()
+    options.apply_performance_profile(
+        PerformanceProfile.LOW_MEMORY, renderer_process_limit=1, disk_cache_dir='/tmp/cache'
+    )
+    assert '--process-per-site' in options.arguments
+    assert '--renderer-process-limit=1' in options.arguments
+    assert '--disk-cache-dir=/tmp/cache' in options.arguments
+    assert len(options.arguments) == len(set(options.arguments))
+
+
+def test_apply_performance_profile_keeps_user_flags():
+    options = Options()
+    options.add_argument('--blink-settings=imagesEnabled=true')
+    options.add_argument('--disable-gpu')
+    options.apply_performance_profile('max_throughput')
+    options.apply_performance_profile('max_throughput')
+    assert '--blink-settings=imagesEnabled=true' in options.arguments
+    assert '--blink-settings=imagesEnabled=false' not in options.arguments
+    assert options.arguments.count('--disable-gpu') == 1
+
+
+def test_apply_unknown_performance_profile():
+    options = Options()
+    with pytest.raises(ValueError):
+        options.apply_performance_profile('turbo')
+    assert options.arguments == []
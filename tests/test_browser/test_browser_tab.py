@@ -1,12 +1,29 @@
+import asyncio
 import base64
+from functools import partial
+
 import pytest
 import pytest_asyncio
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch, ANY
 from pathlib import Path
 
-from pydoll.constants import By, RequestStage, ResourceType, RequestMethod
+from pydoll.constants import (
+    BudgetAction,
+    By,
+    NetworkErrorReason,
+    PageLoadState,
+    RequestStage,
+    ResourceType,
+    RequestMethod,
+    Scripts,
+    TextMode,
+)
+from pydoll.browser.network import AssetCache, HarRecorder, RequestRule
 from pydoll.browser.tab import Tab
+from pydoll.protocol.fetch.events import FetchEvent
+from pydoll.elements.web_element import WebElement
+from pydoll.commands import FetchCommands, NetworkCommands, PageCommands, RuntimeCommands
 from pydoll.exceptions import (
     NoDialogPresent,
     PageLoadTimeout,
@@ -16,7 +33,10 @@ from pydoll.exceptions import (
     InvalidFileExtension,
     WaitElementTimeout,
     NetworkEventsNotEnabled,
+    NetworkIdleTimeout,
+    NetworkEventTimeout,
     InvalidScriptWithElement,
+    ElementNotFound,
 )
 
 @pytest_asyncio.fixture
@@ -287,80 +307,416 @@ class TestTabCookieManagement:
         assert tab._connection_handler.execute_command.call_count == 1
 
 
+class PageLifecycleSimulator:
+    """Feeds Page lifecycle events to a tab's registered callbacks."""
+
+    def __init__(self, tab, current_url='https://old-url.com'):
+        self.tab = tab
+        self.current_url = current_url
+        self.callbacks = {}
+        self.methods = []
+        self.next_loader = 2
+        self.pending_events = ['init', 'DOMContentLoaded', 'load']
+        self.events_before_response = False
+        tab._connection_handler.register_callback.side_effect = self.register_callback
+        tab._connection_handler.execute_command.side_effect = self.execute_command
+
+    async def register_callback(self, event_name, callback, temporary=False):
+        self.callbacks[event_name] = callback
+        return len(self.callbacks)
+
+    def emit(self, event_name, params):
+        self.callbacks[event_name]({'method': event_name, 'params': params})
+
+    def lifecycle(self, loader_id, *names, frame_id=None):
+        for name in names:
+            self.emit(
+                'Page.lifecycleEvent',
+                {
+                    'frameId': frame_id or self.tab._target_id,
+                    'loaderId': loader_id,
+                    'name': name,
+                    'timestamp': 1.0,
+                },
+            )
+
+    def commit(self, loader_id, url):
+        if not self.pending_events:
+            return
+        self.emit(
+            'Page.frameNavigated',
+            {'frame': {'id': self.tab._target_id, 'loaderId': loader_id, 'url': url}},
+        )
+        self.lifecycle(loader_id, *self.pending_events)
+
+    async def execute_command(self, command, timeout=10):
+        method = command['method']
+        self.methods.append(method)
+        if method == 'Runtime.evaluate':
+            return {'result': {'result': {'value': self.current_url}}}
+        if method == 'Page.getFrameTree':
+            frame = {'id': self.tab._target_id, 'loaderId': 'loader-1', 'url': self.current_url}
+            return {'result': {'frameTree': {'frame': frame}}}
+        if method in {'Page.navigate', 'Page.reload'}:
+            loader_id = f'loader-{self.next_loader}'
+            self.next_loader += 1
+            url = command['params'].get('url', self.current_url)
+            fire = partial(self.commit, loader_id, url)
+            if self.events_before_response:
+                fire()
+            else:
+                asyncio.get_running_loop().call_soon(fire)
+            return {'result': {'frameId': self.tab._target_id, 'loaderId': loader_id}}
+        return {'result': {}}
+
+
 class TestTabNavigation:
     """Test Tab navigation methods."""
 
     @pytest.mark.asyncio
     async def test_go_to_new_url(self, tab):
-        """Test navigating to a new URL."""
-        tab._connection_handler.execute_command.side_effect = [
-            {'result': {'result': {'value': 'https://old-url.com'}}},  # current_url
-            {'result': {'frameId': 'frame-id'}},  # navigate command
-            {'result': {'result': {'value': 'complete'}}},  # _wait_page_load
+        """Test navigating to a new URL resolves on the load lifecycle event."""
+        page = PageLifecycleSimulator(tab)
+
+        await tab.go_to('https://example.com')
+
+        assert page.methods == [
+            'Page.enable',
+            'Page.setLifecycleEventsEnabled',
+            'Page.getFrameTree',
+            'Page.navigate',
         ]
-        
+        assert tab.loader_id == 'loader-2'
+        assert await tab.current_url == 'https://example.com'
+
+    @pytest.mark.asyncio
+    async def test_go_to_enables_lifecycle_events_once(self, tab):
+        """Test lifecycle events are only enabled on the first navigation."""
+        page = PageLifecycleSimulator(tab)
+
         await tab.go_to('https://example.com')
-        
-        # Should call current_url, navigate, and _wait_page_load
-        assert tab._connection_handler.execute_command.call_count == 3
+        await tab.go_to('https://example.org')
+
+        assert page.methods.count('Page.setLifecycleEventsEnabled') == 1
+        assert page.methods.count('Page.navigate') == 2
+        assert 'Runtime.evaluate' not in page.methods
+        assert len(page.callbacks) == 4
+
+    @pytest.mark.asyncio
+    async def test_go_to_events_before_response(self, tab):
+        """Test events arriving before the navigate response are not missed."""
+        page = PageLifecycleSimulator(tab)
+        page.events_before_response = True
+
+        await tab.go_to('https://example.com', timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_go_to_wait_until_domcontentloaded(self, tab):
+        """Test waiting for DOMContentLoaded only."""
+        page = PageLifecycleSimulator(tab)
+        page.pending_events = ['init', 'DOMContentLoaded']
+
+        await tab.go_to('https://example.com', timeout=1, wait_until='domcontentloaded')
+
+    @pytest.mark.asyncio
+    async def test_go_to_wait_until_networkidle(self, tab):
+        """Test waiting for the networkIdle lifecycle event."""
+        page = PageLifecycleSimulator(tab)
+        page.pending_events = ['init', 'DOMContentLoaded', 'load']
+
+        with pytest.raises(PageLoadTimeout):
+            await tab.go_to('https://example.com', timeout=0.05, wait_until='networkidle')
+
+        page.pending_events = ['init', 'load', 'networkIdle']
+        await tab.go_to('https://example.org', timeout=1, wait_until=PageLoadState.NETWORK_IDLE)
+
+    @pytest.mark.asyncio
+    async def test_go_to_wait_until_commit(self, tab):
+        """Test commit returns right after the navigate command."""
+        page = PageLifecycleSimulator(tab)
+        page.pending_events = []
+
+        await tab.go_to('https://example.com', timeout=0.05, wait_until='commit')
+
+        assert page.methods[-1] == 'Page.navigate'
+
+    @pytest.mark.asyncio
+    async def test_go_to_same_document_navigation(self, tab):
+        """Test navigations without a new loader don't wait for load events."""
+        page = PageLifecycleSimulator(tab)
+
+        async def execute_command(command, timeout=10):
+            if command['method'] == 'Page.navigate':
+                return {'result': {'frameId': tab._target_id}}
+            return await page.execute_command(command, timeout)
+
+        tab._connection_handler.execute_command.side_effect = execute_command
+
+        await tab.go_to('https://old-url.com/#section', timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_go_to_invalid_wait_until(self, tab):
+        """Test unknown wait_until values are rejected."""
+        with pytest.raises(ValueError):
+            await tab.go_to('https://example.com', wait_until='idle')
 
     @pytest.mark.asyncio
     async def test_go_to_same_url(self, tab):
         """Test navigating to the same URL (should refresh)."""
-        tab._connection_handler.execute_command.side_effect = [
-            {'result': {'result': {'value': 'https://example.com'}}},  # current_url
-            {'result': {}},  # refresh command
-            {'result': {'result': {'value': 'complete'}}},  # _wait_page_load
-        ]
-        
+        page = PageLifecycleSimulator(tab, current_url='https://example.com')
+
         await tab.go_to('https://example.com')
-        
-        # Should call current_url, refresh, and _wait_page_load
-        assert tab._connection_handler.execute_command.call_count == 3
+
+        assert 'Page.reload' in page.methods
+        assert 'Page.navigate' not in page.methods
 
     @pytest.mark.asyncio
     async def test_go_to_timeout(self, tab):
-        """Test navigation timeout."""
-        # Mock current_url to return different URL
-        tab._connection_handler.execute_command.side_effect = [
-            {'result': {'result': {'value': 'https://old-url.com'}}},  # current_url
-            {'result': {'frameId': 'frame-id'}},  # navigate command
-            {'result': {'result': {'value': 'loading'}}},  # _wait_page_load (loading state)
-            {'result': {'result': {'value': 'loading'}}},  # _wait_page_load (still loading)
-        ]
-        
-        # Mock time to simulate timeout
-        with patch('pydoll.browser.tab.asyncio.get_event_loop') as mock_loop:
-            mock_loop.return_value.time.side_effect = [0, 1]  # timeout after 1 second
-            with patch('pydoll.browser.tab.asyncio.sleep', AsyncMock()):
-                with pytest.raises(PageLoadTimeout):
-                    await tab.go_to('https://example.com', timeout=0.5)
+        """Test navigation timeout when the load event never arrives."""
+        page = PageLifecycleSimulator(tab)
+        page.pending_events = ['init', 'DOMContentLoaded']
+
+        with pytest.raises(PageLoadTimeout):
+            await tab.go_to('https://example.com', timeout=0.05)
+
+        assert tab._load_waiters == []
+
+    @pytest.mark.asyncio
+    async def test_go_to_follows_client_redirect(self, tab):
+        """Test a newer main frame document replaces the one being waited for."""
+        page = PageLifecycleSimulator(tab)
+        page.pending_events = ['init']
+
+        async def redirect():
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            page.lifecycle('loader-redirect', 'init', 'DOMContentLoaded', 'load')
+
+        redirect_task = asyncio.create_task(redirect())
+        await tab.go_to('https://example.com', timeout=1)
+        await redirect_task
+
+        assert tab._main_frame_loader == 'loader-redirect'
+
+    @pytest.mark.asyncio
+    async def test_go_to_ignores_child_frames(self, tab):
+        """Test lifecycle events of iframes don't resolve the navigation."""
+        page = PageLifecycleSimulator(tab)
+        page.pending_events = ['init']
+
+        async def iframe_load():
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            page.lifecycle('iframe-loader', 'init', 'load', frame_id='child-frame')
+
+        iframe_task = asyncio.create_task(iframe_load())
+        with pytest.raises(PageLoadTimeout):
+            await tab.go_to('https://example.com', timeout=0.05)
+        await iframe_task
+
+    @pytest.mark.asyncio
+    async def test_go_to_load_state_needs_main_frame_lifecycle(self, tab):
+        """Test only main frame lifecycle events complete the wait, not Page load events."""
+        page = PageLifecycleSimulator(tab)
+        page.pending_events = ['init', 'DOMContentLoaded']
+
+        with pytest.raises(PageLoadTimeout):
+            await tab.go_to('https://example.com', timeout=0.05)
+        assert 'Page.loadEventFired' not in page.callbacks
+        assert 'Page.domContentEventFired' not in page.callbacks
+
+    @pytest.mark.asyncio
+    async def test_frame_navigated_tracks_main_frame(self, tab):
+        """Test Page.frameNavigated updates the main frame document."""
+        page = PageLifecycleSimulator(tab)
+        await tab._enable_navigation_tracking()
+
+        page.emit(
+            'Page.frameNavigated',
+            {'frame': {'id': 'child', 'parentId': 'x', 'loaderId': 'c', 'url': 'about:blank'}},
+        )
+        assert tab._main_frame_loader == 'loader-1'
+
+        page.emit(
+            'Page.frameNavigated',
+            {'frame': {'id': 'main', 'loaderId': 'loader-9', 'url': 'https://example.com/'}},
+        )
+        assert tab._main_frame_id == 'main'
+        assert tab._main_frame_loader == 'loader-9'
 
     @pytest.mark.asyncio
     async def test_refresh(self, tab):
-        """Test page refresh."""
-        tab._connection_handler.execute_command.side_effect = [
-            {'result': {}},  # refresh command
-            {'result': {'result': {'value': 'complete'}}},  # _wait_page_load
-        ]
-        
-        await tab.refresh()
-        
-        # Should call refresh and _wait_page_load
-        assert tab._connection_handler.execute_command.call_count == 2
+        """Test page refresh waits for a new document, not the current one."""
+        page = PageLifecycleSimulator(tab)
+        await tab._enable_navigation_tracking()
+        page.lifecycle('loader-1', 'init', 'DOMContentLoaded', 'load')
+
+        await tab.refresh(timeout=1)
+
+        assert page.methods[-1] == 'Page.reload'
+        assert tab._main_frame_loader == 'loader-2'
+
+    @pytest.mark.asyncio
+    async def test_refresh_timeout(self, tab):
+        """Test refresh times out when the new document never loads."""
+        page = PageLifecycleSimulator(tab)
+        await tab._enable_navigation_tracking()
+        page.lifecycle('loader-1', 'init', 'load')
+        page.pending_events = []
+
+        with pytest.raises(PageLoadTimeout):
+            await tab.refresh(timeout=0.05)
 
     @pytest.mark.asyncio
     async def test_refresh_with_params(self, tab):
         """Test page refresh with parameters."""
-        tab._connection_handler.execute_command.side_effect = [
-            {'result': {}},  # refresh command
-            {'result': {'result': {'value': 'complete'}}},  # _wait_page_load
-        ]
-        
+        page = PageLifecycleSimulator(tab)
+
         await tab.refresh(ignore_cache=True, script_to_evaluate_on_load='console.log("test")')
-        
-        # Should call refresh and _wait_page_load
-        assert tab._connection_handler.execute_command.call_count == 2
+
+        assert page.methods == [
+            'Page.enable',
+            'Page.setLifecycleEventsEnabled',
+            'Page.getFrameTree',
+            'Page.reload',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_disable_page_events_reenables_on_navigation(self, tab):
+        """Test disabling the Page domain re-enables lifecycle events on next navigation."""
+        page = PageLifecycleSimulator(tab)
+        await tab.go_to('https://example.com')
+        await tab.disable_page_events()
+        await tab.go_to('https://example.org')
+
+        assert page.methods.count('Page.setLifecycleEventsEnabled') == 2
+        assert len(page.callbacks) == 4
+
+
+class TestTabNavigationState:
+    """Test the navigation state cache fed by Page events."""
+
+    @pytest.mark.asyncio
+    async def test_current_url_queries_page_without_tracking(self, tab):
+        """Test current_url falls back to Runtime.evaluate when not tracking."""
+        page = PageLifecycleSimulator(tab, current_url='https://example.com/')
+
+        assert await tab.current_url == 'https://example.com/'
+        assert page.methods == ['Runtime.evaluate']
+
+    @pytest.mark.asyncio
+    async def test_enable_page_events_seeds_cache(self, tab):
+        """Test enabling page events seeds URL, frames and loader from the frame tree."""
+        page = PageLifecycleSimulator(tab, current_url='https://example.com/')
+
+        await tab.enable_page_events()
+        url = await tab.current_url
+
+        assert url == 'https://example.com/'
+        assert page.methods == [
+            'Page.enable',
+            'Page.setLifecycleEventsEnabled',
+            'Page.getFrameTree',
+        ]
+        assert tab.loader_id == 'loader-1'
+        assert [frame['id'] for frame in tab.frames] == [tab._target_id]
+
+    @pytest.mark.asyncio
+    async def test_navigated_within_document_updates_url(self, tab):
+        """Test fragment and History API navigations update the cached URL."""
+        page = PageLifecycleSimulator(tab, current_url='https://example.com/')
+        await tab.enable_page_events()
+        page.emit(
+            'Page.frameNavigated',
+            {
+                'frame': {
+                    'id': tab._target_id,
+                    'loaderId': 'loader-1',
+                    'url': 'https://example.com/',
+                    'urlFragment': '#top',
+                }
+            },
+        )
+        assert await tab.current_url == 'https://example.com/#top'
+
+        page.emit(
+            'Page.navigatedWithinDocument',
+            {'frameId': tab._target_id, 'url': 'https://example.com/app/items'},
+        )
+        page.emit('Page.navigatedWithinDocument', {'frameId': 'unknown', 'url': 'about:blank'})
+
+        assert await tab.current_url == 'https://example.com/app/items'
+        assert 'Runtime.evaluate' not in page.methods
+
+    @pytest.mark.asyncio
+    async def test_go_to_same_url_uses_cache(self, tab):
+        """Test go_to compares against the cached URL without querying the page."""
+        page = PageLifecycleSimulator(tab, current_url='https://example.com/')
+        await tab.go_to('https://example.org/')
+        await tab.go_to('https://example.org/')
+
+        assert page.methods[-1] == 'Page.reload'
+        assert 'Runtime.evaluate' not in page.methods
+
+    @pytest.mark.asyncio
+    async def test_frame_detached_removes_subtree(self, tab):
+        """Test detached frames and their descendants leave the cache."""
+        page = PageLifecycleSimulator(tab)
+        await tab.enable_page_events()
+        for frame_id, parent_id in (('child', tab._target_id), ('grandchild', 'child')):
+            page.emit(
+                'Page.frameNavigated',
+                {
+                    'frame': {
+                        'id': frame_id,
+                        'parentId': parent_id,
+                        'loaderId': f'{frame_id}-loader',
+                        'url': f'https://example.com/{frame_id}',
+                    }
+                },
+            )
+        assert len(tab.frames) == 3
+
+        page.emit('Page.frameDetached', {'frameId': 'child', 'reason': 'remove'})
+
+        assert [frame['id'] for frame in tab.frames] == [tab._target_id]
+
+    @pytest.mark.asyncio
+    async def test_events_during_frame_tree_request_win(self, tab):
+        """Test frames reported while the tree was requested are not overwritten."""
+        page = PageLifecycleSimulator(tab, current_url='https://old.example.com/')
+
+        async def execute_command(command, timeout=10):
+            if command['method'] == 'Page.getFrameTree':
+                page.emit(
+                    'Page.frameNavigated',
+                    {
+                        'frame': {
+                            'id': tab._target_id,
+                            'loaderId': 'loader-5',
+                            'url': 'https://new.example.com/',
+                        }
+                    },
+                )
+            return await page.execute_command(command, timeout)
+
+        tab._connection_handler.execute_command.side_effect = execute_command
+
+        await tab.enable_page_events()
+
+        assert await tab.current_url == 'https://new.example.com/'
+        assert tab.loader_id == 'loader-5'
+
+    @pytest.mark.asyncio
+    async def test_disable_page_events_invalidates_cache(self, tab):
+        """Test the page is queried again once page events are disabled."""
+        page = PageLifecycleSimulator(tab, current_url='https://example.com/')
+        await tab.enable_page_events()
+        await tab.disable_page_events()
+
+        await tab.current_url
+
+        assert page.methods[-1] == 'Runtime.evaluate'
 
 
 class TestTabScreenshotAndPDF:
@@ -1156,46 +1512,40 @@ class TestTabUtilityMethods:
             mock_execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_wait_page_load_complete(self, tab):
-        """Test _wait_page_load when page is complete."""
-        tab._connection_handler.execute_command.return_value = {
-            'result': {'result': {'value': 'complete'}}
-        }
-        
-        await tab._wait_page_load()
-        
-        assert_mock_called_at_least_once(tab._connection_handler)
+    async def test_wait_page_load_already_reached(self, tab):
+        """Test _wait_page_load returns immediately if the state was already reached."""
+        tab._main_frame_loader = 'loader-2'
+        tab._main_frame_load_events = {'init', 'load'}
+
+        await tab._wait_page_load('loader-1', timeout=0.01)
+
+        tab._connection_handler.execute_command.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_wait_page_load_timeout(self, tab):
         """Test _wait_page_load timeout."""
-        # Mock execute_command to always return 'loading' state
-        tab._connection_handler.execute_command.return_value = {
-            'result': {'result': {'value': 'loading'}}
-        }
-        
-        # Mock time to simulate timeout without actually waiting
-        with patch('pydoll.browser.tab.asyncio.get_event_loop') as mock_loop:
-            # First call returns 0, second call returns time > timeout
-            mock_loop.return_value.time.side_effect = [0, 1]  # 1 > 0.5 timeout
-            with patch('pydoll.browser.tab.asyncio.sleep', AsyncMock()):
-                with pytest.raises(WaitElementTimeout, match="Page load timed out"):
-                    await tab._wait_page_load(timeout=0.5)
+        tab._main_frame_loader = 'loader-1'
+        tab._main_frame_load_events = {'init', 'load'}
+
+        with pytest.raises(PageLoadTimeout):
+            await tab._wait_page_load('loader-1', timeout=0.01)
+        assert tab._load_waiters == []
 
     @pytest.mark.asyncio
     async def test_refresh_if_url_not_changed_same_url(self, tab):
         """Test _refresh_if_url_not_changed with same URL."""
-        # Mock multiple calls: current_url, refresh, and _wait_page_load
-        tab._connection_handler.execute_command.side_effect = [
-            {'result': {'result': {'value': 'https://example.com'}}},  # current_url call
-            {'result': {}},  # refresh call
-            {'result': {'result': {'value': 'complete'}}},  # _wait_page_load call
-        ]
-        
+        page = PageLifecycleSimulator(tab, current_url='https://example.com')
+
         result = await tab._refresh_if_url_not_changed('https://example.com')
-        
+
         assert result is True
-        assert tab._connection_handler.execute_command.call_count == 3
+        assert page.methods == [
+            'Runtime.evaluate',
+            'Page.enable',
+            'Page.setLifecycleEventsEnabled',
+            'Page.getFrameTree',
+            'Page.reload',
+        ]
 
     @pytest.mark.asyncio
     async def test_refresh_if_url_not_changed_different_url(self, tab):
@@ -1483,6 +1833,119 @@ class TestTabEdgeCases:
         assert dialog == test_dialog
 
 
+class TestTabNetworkIdle:
+    """Test Tab network idle tracking."""
+
+    @pytest.mark.asyncio
+    async def test_enable_network_idle_tracking(self, tab):
+        """Test tracking enables network events and registers listeners."""
+        tab._connection_handler.register_callback.side_effect = [1, 2, 3]
+
+        tracker = await tab.enable_network_idle_tracking(ignore_patterns=['beacon'])
+
+        assert tab.network_idle_tracker is tracker
+        assert tab.network_events_enabled
+        registered = [call.args[0] for call in tab._connection_handler.register_callback.call_args_list]
+        assert registered == [
+            'Network.requestWillBeSent',
+            'Network.loadingFinished',
+            'Network.loadingFailed',
+        ]
+        assert tracker.is_ignored('https://example.com/beacon')
+
+    @pytest.mark.asyncio
+    async def test_disable_network_idle_tracking(self, tab):
+        """Test disabling tracking removes listeners."""
+        tab._connection_handler.register_callback.side_effect = [1, 2, 3]
+        await tab.enable_network_idle_tracking()
+
+        await tab.disable_network_idle_tracking()
+
+        assert tab.network_idle_tracker is None
+        assert tab._connection_handler.remove_callback.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_wait_for_network_idle_starts_tracking(self, tab):
+        """Test waiting starts tracking on demand and resolves once idle."""
+        callbacks = {}
+
+        async def register_callback(event_name, callback, temporary=False):
+            callbacks[event_name] = callback
+            return len(callbacks)
+
+        tab._connection_handler.register_callback.side_effect = register_callback
+
+        async def network_activity():
+            await asyncio.sleep(0.01)
+            callbacks['Network.requestWillBeSent']({
+                'params': {'requestId': '1', 'request': {'url': 'https://example.com/api'}}
+            })
+            await asyncio.sleep(0.02)
+            callbacks['Network.loadingFinished']({'params': {'requestId': '1'}})
+
+        task = asyncio.create_task(network_activity())
+        await tab.wait_for_network_idle(idle_time=0.05, timeout=1)
+        await task
+
+        assert tab.network_idle_tracker.inflight_count == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_network_idle_timeout(self, tab):
+        """Test waiting raises NetworkIdleTimeout while requests stay in flight."""
+        tracker = await tab.enable_network_idle_tracking()
+        tracker.on_request_will_be_sent({
+            'params': {'requestId': '1', 'request': {'url': 'https://example.com/stream'}}
+        })
+
+        with pytest.raises(NetworkIdleTimeout):
+            await tab.wait_for_network_idle(timeout=0.05)
+
+
+class TestTabTargetRebinding:
+    """Test moving a Tab to a new target after a browser restart."""
+
+    @pytest.mark.asyncio
+    async def test_attach_to_target_updates_registry(self, tab):
+        old_target_id = tab._target_id
+        tab._connection_handler.switch_page = AsyncMock()
+
+        await tab._attach_to_target('new-target', 'new-context')
+
+        assert tab._target_id == 'new-target'
+        assert tab._browser_context_id == 'new-context'
+        assert Tab.get_instance('new-target') is tab
+        assert Tab.get_instance(old_target_id) is None
+        tab._connection_handler.switch_page.assert_awaited_once_with('new-target')
+        tab._connection_handler.execute_command.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_attach_to_target_restores_enabled_domains(self, tab):
+        tab._connection_handler.switch_page = AsyncMock()
+        await tab.enable_page_events()
+        await tab.enable_network_events()
+        await tab.enable_fetch_events(
+            resource_type=ResourceType.DOCUMENT, request_stage=RequestStage.RESPONSE
+        )
+        tab._connection_handler.execute_command.reset_mock()
+
+        await tab._attach_to_target('new-target')
+
+        commands = [
+            call.args[0] for call in tab._connection_handler.execute_command.await_args_list
+        ]
+        assert PageCommands.enable() in commands
+        assert PageCommands.set_lifecycle_events_enabled(True) in commands
+        assert PageCommands.get_frame_tree() in commands
+        assert NetworkCommands.enable() in commands
+        assert FetchCommands.enable(
+            handle_auth_requests=False,
+            resource_type=ResourceType.DOCUMENT,
+            request_stage=RequestStage.RESPONSE,
+        ) in commands
+        assert len(commands) == 5
+        assert tab.page_events_enabled and tab.network_events_enabled
+
+
 class TestTabNetworkMethods:
     """Test Tab network-related methods."""
 
@@ -1645,4 +2108,647 @@ class TestTabNetworkMethods:
         result = await tab.get_network_logs(filter='example')
         
         # Should handle missing request data gracefully
-        assert result == []
\ No newline at end of file
+        assert result == []
+
+class TestTabRequestRules:
+    """Test Tab request rules integration."""
+
+    @pytest.mark.asyncio
+    async def test_enable_request_rules_narrows_fetch(self, tab):
+        """Test rules register a listener and enable Fetch with their patterns."""
+        tab._connection_handler.register_callback.return_value = 7
+
+        rule_set = await tab.enable_request_rules([RequestRule(host_suffix='ads.com')])
+
+        assert tab.request_rules is rule_set
+        assert tab._request_paused_callback_id == 7
+        tab._connection_handler.execute_command.assert_called_with(
+            FetchCommands.enable(
+                handle_auth_requests=False, patterns=rule_set.request_patterns()
+            ),
+            timeout=60,
+        )
+
+    @pytest.mark.asyncio
+    async def test_enable_request_rules_keeps_user_fetch_patterns(self, tab):
+        """Test rules do not replace Fetch patterns set by the user."""
+        tab._fetch_events_enabled = True
+
+        await tab.enable_request_rules([RequestRule(host_suffix='ads.com')])
+
+        tab._connection_handler.execute_command.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_apply_request_rules(self, tab):
+        """Test paused requests are failed, continued or left to user handlers."""
+        await tab.enable_request_rules([RequestRule(host_suffix='ads.com')])
+        tab._connection_handler.execute_command.reset_mock()
+
+        blocked = {'params': {'requestId': 'r1', 'request': {'url': 'https://ads.com/a.js'}}}
+        unmatched = {'params': {'requestId': 'r2', 'request': {'url': 'https://a.test/'}}}
+        await tab._handle_request_paused(blocked)
+        await tab._handle_request_paused(unmatched)
+        tab._fetch_events_enabled = True
+        await tab._handle_request_paused(unmatched)
+
+        sent = [call.args[0] for call in tab._connection_handler.execute_command.call_args_list]
+        assert sent == [
+            FetchCommands.fail_request('r1', NetworkErrorReason.BLOCKED_BY_CLIENT),
+            FetchCommands.continue_request('r2'),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_user_handlers_skip_rule_matches(self, tab):
+        """Test requests answered by the rules never reach Tab.on request handlers."""
+        await tab.enable_request_rules([RequestRule(host_suffix='ads.com')])
+        handled = []
+
+        async def handler(event):
+            handled.append(event['params']['requestId'])
+
+        await tab.on(FetchEvent.REQUEST_PAUSED, handler)
+        registered = tab._connection_handler.register_callback.call_args.args[1]
+        await registered({'params': {'requestId': 'r1', 'request': {'url': 'https://ads.com/a'}}})
+        await registered({'params': {'requestId': 'r2', 'request': {'url': 'https://a.test/'}}})
+        await asyncio.sleep(0)
+
+        assert handled == ['r2']
+
+    @pytest.mark.asyncio
+    async def test_disable_fetch_events_restores_rule_patterns(self, tab):
+        """Test turning off user interception keeps the rules running."""
+        rule_set = await tab.enable_request_rules([RequestRule(host_suffix='ads.com')])
+        await tab.enable_fetch_events()
+
+        await tab.disable_fetch_events()
+
+        tab._connection_handler.execute_command.assert_called_with(
+            FetchCommands.enable(
+                handle_auth_requests=False, patterns=rule_set.request_patterns()
+            ),
+            timeout=60,
+        )
+
+    @pytest.mark.asyncio
+    async def test_disable_request_rules(self, tab):
+        """Test disabling rules removes the listener and Fetch interception."""
+        tab._connection_handler.register_callback.return_value = 7
+        await tab.enable_request_rules([RequestRule(host_suffix='ads.com')])
+
+        await tab.disable_request_rules()
+
+        assert tab.request_rules is None
+        tab._connection_handler.remove_callback.assert_called_once_with(7)
+        tab._connection_handler.execute_command.assert_called_with(
+            FetchCommands.disable(), timeout=60
+        )
+
+
+class TestTabRequestInterception:
+    """Test Tab interception dispatcher integration."""
+
+    @pytest.mark.asyncio
+    async def test_enable_request_interception(self, tab):
+        """Test the dispatcher is registered and Fetch is enabled."""
+        tab._connection_handler.register_callback.return_value = 4
+
+        dispatcher = await tab.enable_request_interception(
+            lambda event: None, max_concurrency=2, resource_type=ResourceType.IMAGE
+        )
+
+        assert tab.interception_dispatcher is dispatcher
+        assert dispatcher.max_concurrency == 2
+        assert tab._fetch_events_enabled
+        tab._connection_handler.register_callback.assert_called_with(
+            'Fetch.requestPaused', dispatcher.dispatch, False
+        )
+        tab._connection_handler.execute_command.assert_called_with(
+            FetchCommands.enable(
+                handle_auth_requests=False, resource_type=ResourceType.IMAGE
+            ),
+            timeout=60,
+        )
+
+    @pytest.mark.asyncio
+    async def test_request_interception_takes_over_rules(self, tab):
+        """Test rules run inside the dispatcher while interception is active."""
+        tab._connection_handler.register_callback.side_effect = [1, 2, 3]
+        rule_set = await tab.enable_request_rules([RequestRule(host_suffix='ads.com')])
+
+        dispatcher = await tab.enable_request_interception(lambda event: None)
+
+        assert len(dispatcher.stages) == 1
+        tab._connection_handler.remove_callback.assert_called_once_with(1)
+        assert tab._request_paused_callback_id is None
+
+        await tab.disable_request_interception()
+
+        assert tab.interception_dispatcher is None
+        assert not tab._fetch_events_enabled
+        assert tab._request_paused_callback_id == 3
+        tab._connection_handler.execute_command.assert_called_with(
+            FetchCommands.enable(
+                handle_auth_requests=False, patterns=rule_set.request_patterns()
+            ),
+            timeout=60,
+        )
+
+    @pytest.mark.asyncio
+    async def test_enable_request_rules_during_interception(self, tab):
+        """Test rules enabled later are handed to the dispatcher."""
+        dispatcher = await tab.enable_request_interception(lambda event: None)
+        tab._connection_handler.register_callback.reset_mock()
+
+        await tab.enable_request_rules([RequestRule(host_suffix='ads.com')])
+        assert len(dispatcher.stages) == 1
+        tab._connection_handler.register_callback.assert_not_called()
+
+        await tab.disable_request_rules()
+        assert dispatcher.stages == []
+
+
+class TestTabAssetCache:
+    """Test Tab asset cache integration."""
+
+    @pytest.mark.asyncio
+    async def test_enable_asset_cache_merges_patterns_with_rules(self, tab, tmp_path):
+        """Test rules and cache share one narrowed Fetch.enable and one callback."""
+        tab._connection_handler.register_callback.return_value = 5
+        rule_set = await tab.enable_request_rules([RequestRule(host_suffix='ads.com')])
+        cache = AssetCache(tmp_path)
+
+        assert await tab.enable_asset_cache(cache) is cache
+
+        assert tab.asset_cache is cache
+        tab._connection_handler.register_callback.assert_called_once()
+        tab._connection_handler.execute_command.assert_called_with(
+            FetchCommands.enable(
+                handle_auth_requests=False,
+                patterns=rule_set.request_patterns() + cache.request_patterns(),
+            ),
+            timeout=60,
+        )
+
+    @pytest.mark.asyncio
+    async def test_request_paused_serves_from_cache(self, tab, tmp_path):
+        """Test cache hits are fulfilled and misses continued."""
+        cache = AssetCache(tmp_path)
+        await tab.enable_asset_cache(cache)
+        tab._connection_handler.execute_command.reset_mock()
+        cache._serve = AsyncMock(
+            side_effect=[FetchCommands.fulfill_request('r1', 200, body='eA=='), None]
+        )
+        event = {
+            'params': {
+                'requestId': 'r1',
+                'resourceType': 'Script',
+                'request': {'url': 'https://a.test/a.js', 'method': 'GET', 'headers': {}},
+            }
+        }
+
+        await tab._handle_request_paused(event)
+        event['params']['requestId'] = 'r2'
+        await tab._handle_request_paused(event)
+
+        sent = [call.args[0] for call in tab._connection_handler.execute_command.call_args_list]
+        assert sent == [
+            FetchCommands.fulfill_request('r1', 200, body='eA=='),
+            FetchCommands.continue_request('r2'),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_disable_asset_cache(self, tab, tmp_path):
+        """Test disabling the last stage removes the callback and Fetch."""
+        tab._connection_handler.register_callback.return_value = 5
+        await tab.enable_asset_cache(AssetCache(tmp_path))
+
+        await tab.disable_asset_cache()
+
+        assert tab.asset_cache is None
+        tab._connection_handler.remove_callback.assert_called_once_with(5)
+        tab._connection_handler.execute_command.assert_called_with(
+            FetchCommands.disable(), timeout=60
+        )
+
+
+class TestTabHar:
+    """Test Tab HAR recording and replay integration."""
+
+    @pytest.mark.asyncio
+    async def test_enable_har_recording(self, tab):
+        """Test recording pauses every response."""
+        recorder = await tab.enable_har_recording()
+
+        assert tab.har_recorder is recorder
+        tab._connection_handler.execute_command.assert_called_with(
+            FetchCommands.enable(
+                handle_auth_requests=False, patterns=HarRecorder.request_patterns()
+            ),
+            timeout=60,
+        )
+        assert await tab.disable_har_recording() is recorder
+        assert tab.har_recorder is None
+
+    @pytest.mark.asyncio
+    async def test_har_replay_answers_before_other_stages(self, tab, tmp_path):
+        """Test replayed requests are fulfilled and misses fail without network."""
+        har = {
+            'log': {
+                'entries': [
+                    {
+                        'request': {'method': 'GET', 'url': 'https://a.test/'},
+                        'response': {'status': 200, 'headers': [], 'content': {'text': 'hi'}},
+                    }
+                ]
+            }
+        }
+        replayer = await tab.enable_har_replay(har)
+        await tab.enable_asset_cache(AssetCache(tmp_path))
+        tab._connection_handler.execute_command.reset_mock()
+
+        for request_id, url in (('r1', 'https://a.test/'), ('r2', 'https://b.test/')):
+            await tab._handle_request_paused({
+                'params': {
+                    'requestId': request_id,
+                    'resourceType': 'Document',
+                    'request': {'url': url, 'method': 'GET', 'headers': {}},
+                }
+            })
+
+        sent = [call.args[0] for call in tab._connection_handler.execute_command.call_args_list]
+        assert tab.har_replayer is replayer
+        assert sent[0]['method'] == 'Fetch.fulfillRequest'
+        assert sent[1] == FetchCommands.fail_request('r2', NetworkErrorReason.INTERNET_DISCONNECTED)
+
+        await tab.disable_har_replay()
+        assert tab.har_replayer is None
+
+
+class TestTabResponseBodyStreaming:
+    """Test Tab streamed response body capture."""
+
+    @pytest.mark.asyncio
+    async def test_save_response_body(self, tab, tmp_path):
+        """Test the body is read through Fetch and IO streams."""
+        tab._connection_handler.execute_command.side_effect = [
+            {'result': {'stream': 'stream-1'}},
+            {'result': {'data': base64.b64encode(b'abc').decode(), 'base64Encoded': True, 'eof': False}},
+            {'result': {'data': '', 'base64Encoded': True, 'eof': True}},
+            {'result': {}},
+        ]
+        path = tmp_path / 'body.bin'
+
+        assert await tab.save_response_body('r1', path) == 3
+
+        assert path.read_bytes() == b'abc'
+        methods = [
+            call.args[0]['method'] for call in tab._connection_handler.execute_command.call_args_list
+        ]
+        assert methods == ['Fetch.takeResponseBodyAsStream', 'IO.read', 'IO.read', 'IO.close']
+
+    @pytest.mark.asyncio
+    async def test_iter_response_body(self, tab):
+        """Test chunks are yielded as they are read."""
+        tab.response_body_streamer.chunk_size = 2
+        tab._connection_handler.execute_command.side_effect = [
+            {'result': {'stream': 'stream-1'}},
+            {'result': {'data': 'ab', 'eof': False}},
+            {'result': {'data': 'c', 'eof': True}},
+            {'result': {}},
+        ]
+
+        assert [chunk async for chunk in tab.iter_response_body('r1')] == [b'ab', b'c']
+
+
+class TestTabNetworkExpectations:
+    """Test Tab expect_request / expect_response."""
+
+    @pytest.mark.asyncio
+    async def test_expect_response_enables_network_and_resolves(self, tab):
+        """Test the expectation registers listeners and resolves from events."""
+        callbacks = {}
+
+        async def register_callback(event_name, callback, temporary=False):
+            callbacks[event_name] = callback
+            return len(callbacks)
+
+        tab._connection_handler.register_callback.side_effect = register_callback
+        tab._connection_handler.execute_command.return_value = {
+            'result': {'body': '{"ok": true}', 'base64Encoded': False}
+        }
+
+        expectation = await tab.expect_response('*/api/*', with_body=True)
+        callbacks['Network.responseReceived']({
+            'params': {
+                'requestId': 'r1',
+                'type': 'Fetch',
+                'response': {'url': 'https://a.test/api/x', 'status': 200, 'headers': {}},
+            }
+        })
+        await callbacks['Network.loadingFinished']({'params': {'requestId': 'r1'}})
+        response = await expectation
+
+        assert tab.network_events_enabled
+        assert response.json() == {'ok': True}
+        assert tab._connection_handler.remove_callback.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_expect_request_timeout(self, tab):
+        """Test expect_request raises NetworkEventTimeout."""
+        expectation = await tab.expect_request('*/api/*', timeout=0.01)
+
+        with pytest.raises(NetworkEventTimeout):
+            await expectation
+
+
+class TestTabNetworkBudget:
+    """Test Tab network budget integration."""
+
+    @pytest.mark.asyncio
+    async def test_enable_network_budget(self, tab):
+        """Test enabling registers listeners and enables network events."""
+        tab._connection_handler.register_callback.side_effect = [1, 2, 3]
+
+        budget = await tab.enable_network_budget(max_requests=10)
+
+        assert tab.network_budget is budget
+        assert tab.network_events_enabled
+        assert budget.main_frame_id == tab._target_id
+        events = [
+            call.args[0] for call in tab._connection_handler.register_callback.call_args_list
+        ]
+        assert events == [
+            'Network.requestWillBeSent',
+            'Network.dataReceived',
+            'Network.loadingFinished',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_disable_network_budget_releases_block(self, tab):
+        """Test disabling removes listeners and lifts the request block."""
+        tab._connection_handler.register_callback.side_effect = [1, 2, 3]
+        budget = await tab.enable_network_budget(
+            max_requests=1, action=BudgetAction.BLOCK_REQUESTS
+        )
+        budget._blocking = True
+        tab._connection_handler.execute_command.reset_mock()
+
+        await tab.disable_network_budget()
+
+        assert tab.network_budget is None
+        assert tab._connection_handler.remove_callback.call_count == 3
+        tab._connection_handler.execute_command.assert_called_once_with(
+            FetchCommands.disable(), timeout=60
+        )
+
+    @pytest.mark.asyncio
+    async def test_network_budget_blocks_through_interception(self, tab):
+        """Test blocking pauses every request and fails it instead of setBlockedURLs."""
+        tab._connection_handler.register_callback.side_effect = [1, 2, 3, 4]
+        budget = await tab.enable_network_budget(
+            max_requests=0, action=BudgetAction.BLOCK_REQUESTS
+        )
+        tab._connection_handler.execute_command.reset_mock()
+
+        budget.on_request_will_be_sent({
+            'params': {
+                'requestId': 'N1',
+                'loaderId': 'N1',
+                'frameId': tab._target_id,
+                'type': 'Document',
+                'request': {'url': 'https://a.test/'},
+            }
+        })
+        await asyncio.sleep(0)
+
+        tab._connection_handler.execute_command.assert_called_once_with(
+            FetchCommands.enable(handle_auth_requests=False, patterns=budget.request_patterns()),
+            timeout=60,
+        )
+        tab._connection_handler.execute_command.reset_mock()
+        await tab._handle_request_paused({
+            'params': {'requestId': 'i1', 'request': {'url': 'https://a.test/app.js'}}
+        })
+        tab._connection_handler.execute_command.assert_called_once_with(
+            FetchCommands.fail_request('i1', NetworkErrorReason.BLOCKED_BY_CLIENT), timeout=60
+        )
+
+
+class TestTabExtract:
+    """Test Tab bulk data extraction."""
+
+    @pytest.mark.asyncio
+    async def test_extract_runs_in_one_command(self, tab):
+        """Test extract projects every row in a single evaluate call."""
+        tab._connection_handler.execute_command.return_value = {
+            'result': {
+                'result': {
+                    'type': 'object',
+                    'value': {'total': 1, 'records': [{'title': 'Alpha', 'href': '/a'}]},
+                }
+            }
+        }
+
+        records = await tab.extract('tr', {'title': 'a@text', 'href': 'a@href'})
+
+        assert records == [{'title': 'Alpha', 'href': '/a'}]
+        tab._connection_handler.execute_command.assert_called_once()
+        assert tab._connection_handler.execute_command.call_args.kwargs == {'timeout': 60}
+
+
+class TestTabTexts:
+    """Test Tab batched text retrieval."""
+
+    @pytest.mark.asyncio
+    async def test_texts_single_command(self, tab):
+        """Test texts of many elements come from one callFunctionOn."""
+        elements = [WebElement(f'node-{i}', tab._connection_handler) for i in range(3)]
+        tab._connection_handler.execute_command.return_value = {
+            'result': {'result': {'type': 'object', 'value': [' a ', 'b\n', '']}}
+        }
+
+        assert await tab.texts(elements) == ['a', 'b', '']
+        tab._connection_handler.execute_command.assert_called_once()
+        command = tab._connection_handler.execute_command.call_args.args[0]
+        assert command['params']['objectId'] == 'node-0'
+        assert command['params']['arguments'] == [
+            {'value': 'inner_text'},
+            {'objectId': 'node-0'},
+            {'objectId': 'node-1'},
+            {'objectId': 'node-2'},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_texts_html_parser_mode(self, tab):
+        """Test HTML_PARSER mode parses the fetched outerHTML in Python."""
+        elements = [WebElement('node-0', tab._connection_handler)]
+        tab._connection_handler.execute_command.return_value = {
+            'result': {'result': {'type': 'object', 'value': ['<p>Hi <b>there</b></p>']}}
+        }
+
+        assert await tab.texts(elements, TextMode.HTML_PARSER) == ['Hithere']
+
+    @pytest.mark.asyncio
+    async def test_texts_empty(self, tab):
+        """Test no command is sent without elements."""
+        assert await tab.texts([]) == []
+        tab._connection_handler.execute_command.assert_not_called()
+
+
+class TestTabScope:
+    """Test Tab object group scopes."""
+
+    @pytest.mark.asyncio
+    async def test_scope_groups_finds_and_releases(self, tab):
+        """Test finds in a scope join its object group, released on exit."""
+        tab._connection_handler.execute_command.return_value = {
+            'result': {
+                'result': {
+                    'type': 'object',
+                    'objectId': 'node-1',
+                    'deepSerializedValue': {
+                        'type': 'node',
+                        'value': {'localName': 'a', 'attributes': {}},
+                    },
+                }
+            }
+        }
+
+        async with tab.scope() as object_group:
+            element = await tab.query('a')
+            find_command = tab._connection_handler.execute_command.call_args.args[0]
+
+        assert find_command['params']['objectGroup'] == object_group
+        assert element._object_group == object_group
+        assert tab._object_group is None
+        tab._connection_handler.execute_command.assert_called_with(
+            RuntimeCommands.release_object_group(object_group), timeout=60
+        )
+
+    @pytest.mark.asyncio
+    async def test_nested_scopes(self, tab):
+        """Test a nested scope restores the outer group and releases only its own."""
+        async with tab.scope() as outer:
+            async with tab.scope() as inner:
+                assert tab._object_group == inner
+            assert tab._object_group == outer
+            tab._connection_handler.execute_command.assert_called_once_with(
+                RuntimeCommands.release_object_group(inner), timeout=60
+            )
+        assert outer != inner
+
+    @pytest.mark.asyncio
+    async def test_scope_release_failure_ignored(self, tab):
+        """Test a failed group release does not hide the block's outcome."""
+        tab._connection_handler.execute_command.side_effect = Exception('closed')
+
+        with pytest.raises(ValueError):
+            async with tab.scope():
+                raise ValueError('boom')
+        assert tab._object_group is None
+
+
+class TestTabFillForm:
+    """Test Tab batched form filling."""
+
+    @pytest.mark.asyncio
+    async def test_fill_form_single_command(self, tab):
+        """Test every field is filled by one evaluate and errors are reported per field."""
+        tab._connection_handler.execute_command.return_value = {
+            'result': {'result': {'type': 'object', 'value': [
+                {'error': None, 'trusted': False},
+                {'error': 'element not found', 'trusted': False},
+                {'error': None, 'trusted': False},
+            ]}}
+        }
+
+        errors = await tab.fill_form({'#email': 'a@b.c', '#missing': 'x', '#terms': True})
+
+        assert errors == {'#email': None, '#missing': 'element not found', '#terms': None}
+        tab._connection_handler.execute_command.assert_called_once()
+        command = tab._connection_handler.execute_command.call_args.args[0]
+        assert command['params']['returnByValue'] is True
+        assert command['params']['expression'].endswith(
+            '.call(document, [["#email", "a@b.c"], ["#missing", "x"], ["#terms", true]])'
+        )
+
+    @pytest.mark.asyncio
+    async def test_fill_form_empty(self, tab):
+        """Test no command is sent without fields."""
+        assert await tab.fill_form({}) == {}
+        tab._connection_handler.execute_command.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejected_field_reported_without_fallback(self, tab):
+        """Test fields needing trusted input keep their error unless the fallback is enabled."""
+        tab._connection_handler.execute_command.return_value = {
+            'result': {'result': {'type': 'object', 'value': [
+                {'error': 'value was changed to ""', 'trusted': True},
+            ]}}
+        }
+        tab.query = AsyncMock()
+
+        errors = await tab.fill_form({'#card': '4242'})
+
+        assert errors == {'#card': 'value was changed to ""'}
+        tab.query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_trusted_fallback_types_value(self, tab):
+        """Test the fallback clicks the field, selects its contents and inserts the value."""
+        tab._connection_handler.execute_command.side_effect = [
+            {'result': {'result': {'type': 'object', 'value': [
+                {'error': 'value was changed to ""', 'trusted': True},
+                {'error': 'no option matching "de"', 'trusted': False},
+            ]}}},
+            {'result': {'result': {'type': 'undefined'}}},
+        ]
+        element = WebElement('card-id', tab._connection_handler, attributes_list=['type', 'text'])
+        tab.query = AsyncMock(return_value=element)
+
+        with (
+            patch.object(WebElement, 'click') as mock_click,
+            patch.object(WebElement, 'insert_text') as mock_insert_text,
+        ):
+            errors = await tab.fill_form({'#card': 4242, '#country': 'de'}, trusted_fallback=True)
+
+        assert errors == {'#card': None, '#country': 'no option matching "de"'}
+        tab.query.assert_called_once_with('#card')
+        mock_click.assert_called_once()
+        mock_insert_text.assert_called_once_with('4242')
+        select_command = tab._connection_handler.execute_command.call_args.args[0]
+        assert select_command['params']['functionDeclaration'] == Scripts.SELECT_FIELD_CONTENTS
+        assert select_command['params']['objectId'] == 'card-id'
+
+    @pytest.mark.asyncio
+    async def test_trusted_fallback_clicks_checkbox(self, tab):
+        """Test checkboxes the page did not toggle from script are clicked."""
+        tab._connection_handler.execute_command.return_value = {
+            'result': {'result': {'type': 'object', 'value': [
+                {'error': 'checked state was not changed', 'trusted': True},
+            ]}}
+        }
+        element = WebElement('terms-id', tab._connection_handler, attributes_list=['type', 'checkbox'])
+        tab.query = AsyncMock(return_value=element)
+
+        with (
+            patch.object(WebElement, 'click') as mock_click,
+            patch.object(WebElement, 'insert_text') as mock_insert_text,
+        ):
+            assert await tab.fill_form({'#terms': True}, trusted_fallback=True) == {'#terms': None}
+        mock_click.assert_called_once()
+        mock_insert_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_trusted_fallback_failure_reported(self, tab):
+        """Test a failing fallback reports its error for the field."""
+        tab._connection_handler.execute_command.return_value = {
+            'result': {'result': {'type': 'object', 'value': [
+                {'error': 'value was changed to ""', 'trusted': True},
+            ]}}
+        }
+        tab.query = AsyncMock(side_effect=ElementNotFound())
+
+        errors = await tab.fill_form({'#card': '4242'}, trusted_fallback=True)
+
+        assert errors == {'#card': 'The specified element was not found'}
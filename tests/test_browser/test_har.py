@@ -0,0 +1,171 @@
+import base64
+import json
+
+import pytest
+
+from pydoll.browser.network import HarRecorder, HarReplayer
+from pydoll.commands import FetchCommands
+from pydoll.constants import HarMissBehavior, NetworkErrorReason, RequestStage
+from pydoll.exceptions import InvalidHarFile
+from tests.test_browser.network_fakes import FakeTarget, paused, paused_response
+
+
+async def record(entries):
+    recorder = HarRecorder()
+    bodies = {}
+    for index, (url, method, post_data, body) in enumerate(entries):
+        request_id = f'req-{index}'
+        bodies[request_id] = body
+        event = paused_response(
+            url,
+            request_id=request_id,
+            method=method,
+            post_data=post_data,
+            response_headers=[
+                {'name': 'Content-Type', 'value': 'text/html'},
+                {'name': 'Content-Length', 'value': str(len(body or b''))},
+            ],
+        )
+        assert await recorder.handle(event, FakeTarget(bodies)) is None
+    return recorder
+
+
+@pytest.mark.asyncio
+async def test_recorder_builds_har_entries():
+    recorder = await record([('https://a.test/?q=1', 'POST', 'a=1', b'<html></html>')])
+
+    har = recorder.to_har()
+    entry = har['log']['entries'][0]
+    assert har['log']['version'] == '1.2'
+    assert har['log']['creator']['name'] == 'pydoll'
+    assert entry['request']['method'] == 'POST'
+    assert entry['request']['queryString'] == [{'name': 'q', 'value': '1'}]
+    assert entry['request']['postData']['text'] == 'a=1'
+    assert entry['response']['status'] == 200
+    assert entry['response']['content'] == {
+        'size': 13,
+        'mimeType': 'text/html',
+        'text': base64.b64encode(b'<html></html>').decode(),
+        'encoding': 'base64',
+    }
+
+
+@pytest.mark.asyncio
+async def test_recorder_ignores_request_stage_and_survives_missing_body():
+    recorder = HarRecorder()
+
+    assert await recorder.handle(paused('https://a.test/'), FakeTarget()) is None
+    assert len(recorder) == 0
+
+    redirect = paused_response(
+        'https://a.test/old',
+        status=302,
+        response_headers=[{'name': 'Location', 'value': 'https://a.test/new'}],
+    )
+    await recorder.handle(redirect, FakeTarget({'req-1': None}))
+
+    assert recorder.entries[0]['response']['redirectURL'] == 'https://a.test/new'
+    assert recorder.entries[0]['response']['content']['text'] == ''
+
+
+@pytest.mark.asyncio
+async def test_save_and_replay_from_file(tmp_path):
+    recorder = await record([('https://a.test/', 'GET', None, b'hello')])
+    path = tmp_path / 'session.har'
+    await recorder.save(path)
+
+    replayer = HarReplayer(path)
+    command = await replayer.handle(paused('https://a.test/', request_id='live-1'))
+
+    assert json.loads(path.read_text())['log']['entries']
+    assert command == FetchCommands.fulfill_request(
+        request_id='live-1',
+        response_code=200,
+        response_headers=[{'name': 'Content-Type', 'value': 'text/html'}],
+        body=base64.b64encode(b'hello').decode(),
+        response_phrase='OK',
+    )
+    assert replayer.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_replay_matches_body_hash():
+    recorder = await record([
+        ('https://a.test/api', 'POST', '{"page": 1}', b'one'),
+        ('https://a.test/api', 'POST', '{"page": 2}', b'two'),
+    ])
+    replayer = HarReplayer(recorder.to_har())
+
+    second = await replayer.handle(paused('https://a.test/api', method='POST', post_data='{"page": 2}'))
+    missing = await replayer.handle(paused('https://a.test/api', method='POST', post_data='{}'))
+
+    assert base64.b64decode(second['params']['body']) == b'two'
+    assert missing == FetchCommands.fail_request('req-1', NetworkErrorReason.INTERNET_DISCONNECTED)
+    assert replayer.stats.missed_urls == ['https://a.test/api']
+
+
+@pytest.mark.asyncio
+async def test_replay_without_body_matching_serves_in_order():
+    recorder = await record([
+        ('https://a.test/api', 'POST', 'a', b'one'),
+        ('https://a.test/api', 'POST', 'b', b'two'),
+    ])
+    replayer = HarReplayer(recorder.to_har(), match_body=False)
+
+    bodies = [
+        base64.b64decode(
+            (await replayer.handle(paused('https://a.test/api', method='POST')))['params']['body']
+        )
+        for _ in range(3)
+    ]
+    replayer.reset()
+
+    assert bodies == [b'one', b'two', b'two']
+    assert replayer.match('post', 'https://a.test/api')['content']['text'] == (
+        base64.b64encode(b'one').decode()
+    )
+
+
+@pytest.mark.asyncio
+async def test_replay_miss_behaviours():
+    har = {'log': {'entries': []}}
+
+    not_found = await HarReplayer(har, on_miss=HarMissBehavior.NOT_FOUND).handle(
+        paused('https://a.test/')
+    )
+    passed_on = await HarReplayer(har, on_miss='continue').handle(paused('https://a.test/'))
+
+    assert not_found == FetchCommands.fulfill_request(
+        request_id='req-1', response_code=404, response_phrase='Not Found'
+    )
+    assert passed_on is None
+
+
+@pytest.mark.asyncio
+async def test_replay_text_content_and_response_stage():
+    har = {
+        'log': {
+            'entries': [
+                {
+                    'request': {'method': 'GET', 'url': 'https://a.test/'},
+                    'response': {'status': 200, 'headers': [], 'content': {'text': 'hi'}},
+                }
+            ]
+        }
+    }
+    replayer = HarReplayer(har)
+
+    command = await replayer.handle(paused('https://a.test/'))
+
+    assert command['params']['body'] == base64.b64encode(b'hi').decode()
+    assert await replayer.handle(paused_response('https://a.test/')) is None
+    assert replayer.request_patterns() == [
+        {'urlPattern': '*', 'requestStage': RequestStage.REQUEST}
+    ]
+
+
+def test_invalid_har(tmp_path):
+    with pytest.raises(InvalidHarFile):
+        HarReplayer(tmp_path / 'missing.har')
+    with pytest.raises(InvalidHarFile):
+        HarReplayer({'entries': []})
@@ -0,0 +1,164 @@
+import asyncio
+from functools import partial
+
+import pytest
+
+from pydoll.browser.network import (
+    InterceptionDispatcher,
+    InterceptionStats,
+    RequestRule,
+    RequestRuleSet,
+)
+from pydoll.commands import FetchCommands
+from pydoll.constants import NetworkErrorReason
+from tests.test_browser.network_fakes import FakeTarget, paused
+
+
+@pytest.mark.asyncio
+async def test_handlers_run_concurrently_up_to_limit():
+    sent = FakeTarget()
+    running = 0
+    peak = 0
+
+    async def handler(event):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return FetchCommands.continue_request(event['params']['requestId'])
+
+    dispatcher = InterceptionDispatcher(handler, sent, max_concurrency=3)
+    for index in range(9):
+        dispatcher.dispatch(paused(request_id=f'r{index}'))
+    await dispatcher.join()
+    await dispatcher.close()
+
+    assert peak == 3
+    assert {command['params']['requestId'] for command in sent.commands} == {
+        f'r{index}' for index in range(9)
+    }
+    assert dispatcher.stats.completed == 9
+    assert dispatcher.stats.queued == 0
+    assert dispatcher.stats.queue_delay_max > 0
+    assert not dispatcher.is_running
+
+
+@pytest.mark.asyncio
+async def test_slow_handler_is_auto_continued():
+    sent = FakeTarget()
+
+    async def handler(event):
+        await asyncio.sleep(10)
+
+    dispatcher = InterceptionDispatcher(handler, sent, handler_timeout=0.01)
+    dispatcher.dispatch(paused(request_id='r1'))
+    await dispatcher.join()
+    await dispatcher.close()
+
+    assert sent.commands == [FetchCommands.continue_request('r1')]
+    assert dispatcher.stats.timed_out == 1
+    assert dispatcher.stats.auto_continued == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_is_auto_continued():
+    sent = FakeTarget()
+
+    def handler(event):
+        raise ValueError('boom')
+
+    dispatcher = InterceptionDispatcher(handler, sent)
+    dispatcher.dispatch(paused(request_id='r1'))
+    await dispatcher.join()
+    await dispatcher.close()
+
+    assert sent.commands == [FetchCommands.continue_request('r1')]
+    assert dispatcher.stats.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_handler_answering_itself_sends_nothing():
+    sent = FakeTarget()
+    dispatcher = InterceptionDispatcher(lambda event: None, sent)
+    dispatcher.dispatch(paused(request_id='r1'))
+    await dispatcher.join()
+    await dispatcher.close()
+
+    assert sent.commands == []
+    assert dispatcher.stats.completed == 1
+
+
+@pytest.mark.asyncio
+async def test_rules_resolve_before_handler():
+    sent = FakeTarget()
+    handled = []
+    rules = RequestRuleSet([RequestRule(host_suffix='ads.com')])
+    dispatcher = InterceptionDispatcher(
+        handled.append, sent, stages=[partial(rules.resolve, continue_unmatched=False)]
+    )
+
+    dispatcher.dispatch(paused('https://ads.com/a.js', request_id='r1'))
+    dispatcher.dispatch(paused(request_id='r2'))
+    await dispatcher.join()
+    await dispatcher.close()
+
+    assert sent.commands == [
+        FetchCommands.fail_request('r1', NetworkErrorReason.BLOCKED_BY_CLIENT)
+    ]
+    assert [event['params']['requestId'] for event in handled] == ['r2']
+    assert dispatcher.stats.resolved_by_stages == 1
+
+
+@pytest.mark.asyncio
+async def test_send_errors_are_swallowed():
+    async def execute_command(command):
+        raise RuntimeError('Invalid InterceptionId')
+
+    dispatcher = InterceptionDispatcher(
+        lambda event: FetchCommands.continue_request('r1'), execute_command
+    )
+    dispatcher.dispatch(paused(request_id='r1'))
+    await dispatcher.join()
+    await dispatcher.close()
+
+    assert dispatcher.stats.completed == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_stage_is_skipped():
+    sent = FakeTarget()
+
+    def broken_stage(event):
+        raise RuntimeError('broken')
+
+    async def answering_stage(event):
+        return FetchCommands.continue_request(event['params']['requestId'])
+
+    dispatcher = InterceptionDispatcher(
+        lambda event: None, sent, stages=[broken_stage, answering_stage]
+    )
+    dispatcher.dispatch(paused(request_id='r1'))
+    await dispatcher.join()
+    await dispatcher.close()
+
+    assert sent.commands == [FetchCommands.continue_request('r1')]
+    assert dispatcher.stats.resolved_by_stages == 1
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        InterceptionDispatcher(lambda event: None, FakeTarget(), max_concurrency=0)
+
+
+def test_queue_delay_statistics():
+    stats = InterceptionStats(dispatched=4, queued=4)
+    for delay in (0.4, 0.1, 0.3, 0.2):
+        stats.record_queue_delay(delay)
+
+    assert stats.queued == 0
+    assert stats.queue_delay_mean == pytest.approx(0.25)
+    assert stats.queue_delay_max == 0.4
+    assert stats.queue_delay_percentile(0) == 0.1
+    assert stats.queue_delay_percentile(100) == 0.4
+    assert InterceptionStats().queue_delay_percentile(50) == 0.0
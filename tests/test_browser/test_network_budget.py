@@ -0,0 +1,191 @@
+import asyncio
+
+import pytest
+
+from pydoll.browser.network import NetworkBudget
+from pydoll.commands import FetchCommands, PageCommands
+from pydoll.constants import BudgetAction, NetworkErrorReason, RequestStage
+from pydoll.protocol.fetch.types import RequestPattern
+from tests.test_browser.network_fakes import (
+    FakeTarget,
+    paused,
+    paused_response,
+    request_will_be_sent,
+)
+
+
+def navigation_event(request_id, url='https://a.test/'):
+    return request_will_be_sent(request_id, url, 'Document', loader_id=request_id)
+
+
+def data_event(request_id, length):
+    return {'params': {'requestId': request_id, 'encodedDataLength': length}}
+
+
+def make_budget(**kwargs):
+    target = FakeTarget()
+    return NetworkBudget(target, 'main', **kwargs), target
+
+
+def test_requires_a_limit():
+    with pytest.raises(ValueError):
+        NetworkBudget(FakeTarget(), 'main')
+
+
+@pytest.mark.asyncio
+async def test_usage_is_reported_per_navigation():
+    budget, _ = make_budget(max_bytes=10_000)
+
+    budget.on_request_will_be_sent(navigation_event('N1'))
+    budget.on_data_received(data_event('N1', 100))
+    budget.on_loading_finished(data_event('N1', 150))
+    budget.on_request_will_be_sent(request_will_be_sent('r1'))
+    budget.on_request_will_be_sent(request_will_be_sent('r1'))  # redirect
+    budget.on_data_received(data_event('r1', 50))
+    budget.on_request_will_be_sent(navigation_event('N2', 'https://b.test/'))
+    budget.on_data_received(data_event('r1', 1000))  # previous page, ignored
+
+    first = budget.history[0]
+    assert (first.url, first.requests, first.bytes_received) == ('https://a.test/', 2, 200)
+    assert first.finished_at is not None
+    assert budget.current.url == 'https://b.test/'
+    assert budget.current.requests == 1
+    assert budget.current.bytes_received == 0
+
+
+@pytest.mark.asyncio
+async def test_events_before_first_navigation_are_ignored():
+    budget, _ = make_budget(max_requests=0)
+
+    budget.on_request_will_be_sent(request_will_be_sent('r1'))
+    budget.on_request_will_be_sent({
+        'params': {**navigation_event('f1')['params'], 'frameId': 'child'}
+    })
+
+    assert budget.current is None
+
+
+@pytest.mark.asyncio
+async def test_bytes_exceeded_stops_loading_once():
+    exceeded = []
+    budget, target = make_budget(max_bytes=100, on_exceeded=exceeded.append)
+
+    budget.on_request_will_be_sent(navigation_event('N1'))
+    budget.on_data_received(data_event('N1', 80))
+    budget.on_data_received(data_event('N1', 80))
+    budget.on_data_received(data_event('N1', 80))
+    await asyncio.sleep(0)
+
+    assert target.commands == [PageCommands.stop_loading()]
+    assert budget.current.exceeded == 'bytes'
+    assert exceeded == [budget.current]
+
+
+@pytest.mark.asyncio
+async def test_async_on_exceeded_is_awaited():
+    exceeded = []
+
+    async def on_exceeded(usage):
+        await asyncio.sleep(0)
+        exceeded.append(usage)
+
+    budget, target = make_budget(max_requests=0, on_exceeded=on_exceeded)
+
+    budget.on_request_will_be_sent(navigation_event('N1'))
+    await asyncio.sleep(0.01)
+
+    assert exceeded == [budget.current]
+    assert target.commands == [PageCommands.stop_loading()]
+    assert not budget._tasks
+
+
+@pytest.mark.asyncio
+async def test_on_exceeded_errors_are_logged(caplog):
+    def on_exceeded(usage):
+        raise RuntimeError('boom')
+
+    async def on_exceeded_async(usage):
+        raise RuntimeError('async boom')
+
+    for callback in (on_exceeded, on_exceeded_async):
+        budget, target = make_budget(max_requests=0, on_exceeded=callback)
+        budget.on_request_will_be_sent(navigation_event('N1'))
+        await asyncio.sleep(0.01)
+        assert target.commands == [PageCommands.stop_loading()]
+
+    assert 'boom' in caplog.text
+    assert 'async boom' in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_requests_exceeded_blocks_until_released():
+    updates = []
+
+    async def update_interception():
+        updates.append(budget.request_patterns())
+
+    budget, target = make_budget(
+        max_requests=2,
+        action=BudgetAction.BLOCK_REQUESTS,
+        update_interception=update_interception,
+    )
+
+    budget.on_request_will_be_sent(navigation_event('N1'))
+    budget.on_request_will_be_sent(request_will_be_sent('r1'))
+    budget.on_request_will_be_sent(request_will_be_sent('r2'))
+    await asyncio.sleep(0)
+
+    assert budget.current.exceeded == 'requests'
+    assert budget.blocking
+    assert updates == [[RequestPattern(urlPattern='*', requestStage=RequestStage.REQUEST)]]
+
+    await budget.release()
+    await budget.release()
+    assert not budget.blocking
+    assert updates[1:] == [[]]
+    assert target.commands == []
+
+
+@pytest.mark.asyncio
+async def test_handle_fails_requests_only_while_blocking():
+    budget, target = make_budget(max_requests=0, action=BudgetAction.BLOCK_REQUESTS)
+    request = paused(request_id='i1')
+    response = paused_response(request_id='i1')
+
+    assert await budget.handle(request, target) is None
+
+    budget.on_request_will_be_sent(navigation_event('N1'))
+    assert budget.blocking
+    assert await budget.handle(request, target) == FetchCommands.fail_request(
+        'i1', NetworkErrorReason.BLOCKED_BY_CLIENT
+    )
+    assert await budget.handle(response, target) is None
+
+    await budget.release()
+    assert await budget.handle(request, target) is None
+
+
+@pytest.mark.asyncio
+async def test_duration_exceeded():
+    budget, target = make_budget(max_duration=0.01)
+
+    budget.on_request_will_be_sent(navigation_event('N1'))
+    await asyncio.sleep(0.05)
+
+    assert budget.current.exceeded == 'duration'
+    assert target.commands == [PageCommands.stop_loading()]
+
+
+@pytest.mark.asyncio
+async def test_new_navigation_cancels_duration_timer():
+    budget, target = make_budget(max_duration=0.03)
+
+    budget.on_request_will_be_sent(navigation_event('N1'))
+    await asyncio.sleep(0.02)
+    budget.on_request_will_be_sent(navigation_event('N2'))
+    await asyncio.sleep(0.02)
+    budget.close()
+
+    assert budget.history[0].exceeded is None
+    assert budget.current.exceeded is None
+    assert target.commands == []
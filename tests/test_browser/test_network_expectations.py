@@ -0,0 +1,174 @@
+import asyncio
+import base64
+import re
+
+import pytest
+
+from pydoll.browser.network import (
+    CapturedResponse,
+    RequestExpectation,
+    ResponseExpectation,
+)
+from pydoll.browser.network.expectations import NetworkExpectation, compile_url_matcher
+from pydoll.exceptions import NetworkEventTimeout
+
+
+class FakeEvents:
+    """Minimal callback registry standing in for Tab.on / remove_callback."""
+
+    def __init__(self):
+        self.callbacks = {}
+        self.next_id = 0
+
+    async def register(self, event_name, callback):
+        self.next_id += 1
+        self.callbacks[self.next_id] = (event_name, callback)
+        return self.next_id
+
+    async def remove(self, callback_id):
+        self.callbacks.pop(callback_id, None)
+
+    async def emit(self, event_name, params):
+        for name, callback in list(self.callbacks.values()):
+            if name == event_name:
+                result = callback({'method': event_name, 'params': params})
+                if asyncio.iscoroutine(result):
+                    await result
+
+
+def response_received(request_id, url, status=200):
+    return {
+        'requestId': request_id,
+        'type': 'XHR',
+        'response': {'url': url, 'status': status, 'headers': {}},
+    }
+
+
+def test_compile_url_matcher():
+    assert compile_url_matcher(None)('https://a.test/')
+    assert compile_url_matcher('*/api/*')('https://a.test/api/items')
+    assert not compile_url_matcher('*/api/*')('https://a.test/static/app.js')
+    assert compile_url_matcher(re.compile(r'items\?page=\d'))('https://a.test/items?page=2')
+
+
+@pytest.mark.asyncio
+async def test_request_expectation_resolves_first_match():
+    events = FakeEvents()
+    expectation = RequestExpectation('*/api/*', predicate=lambda params: params['request']['method'] == 'POST')
+    await expectation.start(events.register, events.remove)
+
+    await events.emit('Network.requestWillBeSent', {
+        'requestId': '1', 'type': 'XHR', 'request': {'url': 'https://a.test/api/x', 'method': 'GET'},
+    })
+    await events.emit('Network.requestWillBeSent', {
+        'requestId': '2', 'type': 'XHR', 'request': {'url': 'https://a.test/api/x', 'method': 'POST'},
+    })
+    request = await expectation
+
+    assert request.request_id == '2'
+    assert request.method == 'POST'
+    assert request.url == 'https://a.test/api/x'
+    assert events.callbacks == {}
+
+
+@pytest.mark.asyncio
+async def test_response_expectation_waits_for_loading_finished_and_body():
+    events = FakeEvents()
+    commands = []
+
+    async def execute_command(command):
+        commands.append(command)
+        body = base64.b64encode(b'{"items": [1, 2]}').decode()
+        return {'result': {'body': body, 'base64Encoded': True}}
+
+    expectation = ResponseExpectation(
+        '*/api/items*', with_body=True, execute_command=execute_command
+    )
+    await expectation.start(events.register, events.remove)
+
+    await events.emit('Network.responseReceived', response_received('1', 'https://a.test/api/items'))
+    await events.emit('Network.responseReceived', response_received('2', 'https://a.test/app.js'))
+    assert not expectation.done()
+    await events.emit('Network.loadingFinished', {'requestId': '2'})
+    assert not expectation.done()
+    await events.emit('Network.loadingFinished', {'requestId': '1'})
+
+    response = await expectation
+    assert isinstance(response, CapturedResponse)
+    assert response.status == 200
+    assert response.resource_type == 'XHR'
+    assert response.json() == {'items': [1, 2]}
+    assert commands == [{'method': 'Network.getResponseBody', 'params': {'requestId': '1'}}]
+    await asyncio.sleep(0)
+    assert events.callbacks == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_candidate_is_skipped():
+    events = FakeEvents()
+    expectation = ResponseExpectation('*/api/*', predicate=lambda params: params['response']['status'] == 200)
+    await expectation.start(events.register, events.remove)
+
+    await events.emit('Network.responseReceived', response_received('1', 'https://a.test/api/a'))
+    await events.emit('Network.loadingFailed', {'requestId': '1'})
+    await events.emit('Network.loadingFinished', {'requestId': '1'})
+    await events.emit('Network.responseReceived', response_received('2', 'https://a.test/api/b', 500))
+    await events.emit('Network.loadingFinished', {'requestId': '2'})
+    await events.emit('Network.responseReceived', response_received('3', 'https://a.test/api/c'))
+    await events.emit('Network.loadingFinished', {'requestId': '3'})
+
+    response = await expectation
+    assert response.request_id == '3'
+    assert response.body is None
+    assert response.text is None
+
+
+@pytest.mark.asyncio
+async def test_body_error_fails_expectation():
+    events = FakeEvents()
+
+    async def execute_command(command):
+        raise RuntimeError('No resource with given identifier found')
+
+    expectation = ResponseExpectation(with_body=True, execute_command=execute_command)
+    await expectation.start(events.register, events.remove)
+    await events.emit('Network.responseReceived', response_received('1', 'https://a.test/'))
+    await events.emit('Network.loadingFinished', {'requestId': '1'})
+
+    with pytest.raises(RuntimeError):
+        await expectation
+
+
+@pytest.mark.asyncio
+async def test_timeout_unregisters():
+    events = FakeEvents()
+    expectation = RequestExpectation('*/never', timeout=0.01)
+    await expectation.start(events.register, events.remove)
+
+    with pytest.raises(NetworkEventTimeout, match='No request matching'):
+        await expectation
+    assert events.callbacks == {}
+
+
+@pytest.mark.asyncio
+async def test_cancel():
+    events = FakeEvents()
+    expectation = ResponseExpectation()
+    await expectation.start(events.register, events.remove)
+
+    await expectation.cancel()
+
+    assert expectation.done()
+    assert events.callbacks == {}
+
+
+@pytest.mark.asyncio
+async def test_with_body_requires_execute_command():
+    with pytest.raises(ValueError):
+        ResponseExpectation(with_body=True)
+
+
+@pytest.mark.asyncio
+async def test_base_expectation_is_abstract():
+    with pytest.raises(TypeError):
+        NetworkExpectation()
@@ -0,0 +1,127 @@
+import asyncio
+import time
+
+import pytest
+
+from pydoll.browser.network import NetworkIdleTracker
+from pydoll.exceptions import NetworkIdleTimeout
+from tests.test_browser.network_fakes import request_will_be_sent
+
+
+def loading_finished(request_id):
+    return {'method': 'Network.loadingFinished', 'params': {'requestId': request_id}}
+
+
+def loading_failed(request_id):
+    return {'method': 'Network.loadingFailed', 'params': {'requestId': request_id}}
+
+
+def test_counts_inflight_requests():
+    tracker = NetworkIdleTracker()
+    tracker.on_request_will_be_sent(request_will_be_sent('1'))
+    tracker.on_request_will_be_sent(request_will_be_sent('2', 'https://example.com/img.png'))
+    # redirects reuse the request id
+    tracker.on_request_will_be_sent(request_will_be_sent('2', 'https://cdn.example.com/img.png'))
+    assert tracker.inflight_count == 2
+    assert tracker.inflight_urls == ['https://a.test/app.js', 'https://example.com/img.png']
+
+    tracker.on_loading_finished(loading_finished('1'))
+    tracker.on_loading_failed(loading_failed('2'))
+    tracker.on_loading_finished(loading_finished('unknown'))
+    assert tracker.inflight_count == 0
+
+
+def test_ignore_patterns():
+    tracker = NetworkIdleTracker(ignore_patterns=[r'/poll\b', 'analytics'])
+    tracker.on_request_will_be_sent(request_will_be_sent('1', 'https://example.com/poll?x=1'))
+    tracker.on_request_will_be_sent(request_will_be_sent('2', 'https://analytics.example.com/'))
+    tracker.on_request_will_be_sent(request_will_be_sent('3', 'https://example.com/polling'))
+    assert tracker.inflight_urls == ['https://example.com/polling']
+    assert tracker.is_ignored('https://example.com/poll')
+
+
+def test_idle_for_tracks_level():
+    tracker = NetworkIdleTracker()
+    tracker.on_request_will_be_sent(request_will_be_sent('1'))
+    tracker.on_request_will_be_sent(request_will_be_sent('2'))
+    assert tracker.idle_for(0) == 0.0
+    assert tracker.idle_for(1) == 0.0
+    assert tracker.idle_for(2) > 0
+
+    tracker.on_loading_finished(loading_finished('1'))
+    assert tracker.idle_for(1) < 0.1
+    assert tracker.idle_for(0) == 0.0
+
+
+def test_reset_clears_inflight():
+    tracker = NetworkIdleTracker()
+    tracker.on_request_will_be_sent(request_will_be_sent('1'))
+    tracker.on_request_will_be_sent(request_will_be_sent('2'))
+    tracker.reset()
+    assert tracker.inflight_count == 0
+    assert tracker.idle_for(0) < 0.1
+    assert tracker.idle_for(1) < 0.1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_idle_returns_when_already_idle():
+    tracker = NetworkIdleTracker()
+    tracker._started_at -= 1
+    started = time.monotonic()
+    await tracker.wait_for_idle(idle_time=0.5, timeout=1)
+    assert time.monotonic() - started < 0.1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_idle_waits_for_requests():
+    tracker = NetworkIdleTracker()
+    tracker.on_request_will_be_sent(request_will_be_sent('1'))
+
+    async def finish_later():
+        await asyncio.sleep(0.05)
+        tracker.on_request_will_be_sent(request_will_be_sent('2'))
+        tracker.on_loading_finished(loading_finished('1'))
+        await asyncio.sleep(0.05)
+        tracker.on_loading_finished(loading_finished('2'))
+
+    task = asyncio.create_task(finish_later())
+    started = time.monotonic()
+    await tracker.wait_for_idle(idle_time=0.05, timeout=2)
+    elapsed = time.monotonic() - started
+    await task
+
+    assert tracker.inflight_count == 0
+    assert 0.14 <= elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_wait_for_idle_allows_max_inflight():
+    tracker = NetworkIdleTracker()
+    tracker.on_request_will_be_sent(request_will_be_sent('long-poll'))
+    await tracker.wait_for_idle(idle_time=0.01, max_inflight=1, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_idle_restarts_window_when_busy_again():
+    tracker = NetworkIdleTracker()
+
+    async def burst():
+        await asyncio.sleep(0.03)
+        tracker.on_request_will_be_sent(request_will_be_sent('1'))
+        await asyncio.sleep(0.03)
+        tracker.on_loading_finished(loading_finished('1'))
+
+    task = asyncio.create_task(burst())
+    started = time.monotonic()
+    await tracker.wait_for_idle(idle_time=0.05, timeout=1)
+    await task
+
+    assert time.monotonic() - started >= 0.11
+
+
+@pytest.mark.asyncio
+async def test_wait_for_idle_timeout():
+    tracker = NetworkIdleTracker()
+    tracker.on_request_will_be_sent(request_will_be_sent('1', 'https://example.com/stream'))
+    with pytest.raises(NetworkIdleTimeout, match='example.com/stream'):
+        await tracker.wait_for_idle(timeout=0.05)
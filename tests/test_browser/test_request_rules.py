@@ -0,0 +1,214 @@
+import re
+
+import pytest
+
+from pydoll.browser.network import RequestRule, RequestRuleSet
+from pydoll.browser.network.rules import glob_to_regex
+from pydoll.commands import FetchCommands
+from pydoll.constants import NetworkErrorReason, RequestStage, ResourceType, RuleAction
+from pydoll.exceptions import InvalidRequestRule
+from tests.test_browser.network_fakes import paused
+
+
+class TestRequestRule:
+    """Test rule validation and matching."""
+
+    def test_requires_condition(self):
+        with pytest.raises(InvalidRequestRule):
+            RequestRule(RuleAction.BLOCK)
+
+    def test_rejects_glob_and_regex(self):
+        with pytest.raises(InvalidRequestRule):
+            RequestRule(RuleAction.BLOCK, url_glob='*', url_regex='.*')
+
+    def test_rewrite_requires_target(self):
+        with pytest.raises(InvalidRequestRule):
+            RequestRule(RuleAction.REWRITE, url_glob='*')
+
+    def test_glob_matches_whole_url(self):
+        rule = RequestRule(url_glob='*.woff2')
+        assert rule.matches('https://cdn.test/font.woff2', 'cdn.test', 'Font')
+        assert not rule.matches('https://cdn.test/font.woff2?v=1', 'cdn.test', 'Font')
+
+    def test_host_suffix_respects_label_boundaries(self):
+        rule = RequestRule(host_suffix='.Ads.com')
+        assert rule.host_suffix == 'ads.com'
+        assert rule.matches('https://x.ads.com/', 'x.ads.com', 'Script')
+        assert rule.matches('https://ads.com/', 'ads.com', 'Script')
+        assert not rule.matches('https://badads.com/', 'badads.com', 'Script')
+
+    def test_resource_types_are_case_insensitive(self):
+        rule = RequestRule(resource_types=[ResourceType.MEDIA, 'Font'])
+        assert rule.matches('https://a.test/v.mp4', 'a.test', 'Media')
+        assert rule.matches('https://a.test/f.ttf', 'a.test', 'font')
+        assert not rule.matches('https://a.test/', 'a.test', 'Document')
+
+    def test_resource_types_normalized_to_enum(self):
+        rule = RequestRule(url_glob='*.png', resource_types=['image', 'SCRIPT'])
+        assert rule.resource_types == [ResourceType.IMAGE, ResourceType.SCRIPT]
+        assert [pattern['resourceType'] for pattern in rule.request_patterns()] == [
+            ResourceType.IMAGE,
+            ResourceType.SCRIPT,
+        ]
+
+    def test_unknown_resource_type_rejected(self):
+        with pytest.raises(InvalidRequestRule):
+            RequestRule(resource_types=['picture'])
+
+    def test_label_defaults_to_condition(self):
+        assert RequestRule(url_regex=re.compile('ads')).label == 'block:ads'
+        assert RequestRule(host_suffix='ads.com', name='ads').label == 'ads'
+
+    def test_glob_to_regex_escapes(self):
+        assert re.fullmatch(glob_to_regex(r'https://a.test/\*?'), 'https://a.test/*x')
+        assert not re.fullmatch(glob_to_regex('https://a.test/'), 'https://aXtest/')
+
+
+class TestRequestRuleSet:
+    """Test compiled matching, patterns and resolution."""
+
+    def test_first_rule_in_list_order_wins(self):
+        rule_set = RequestRuleSet([
+            RequestRule(RuleAction.ALLOW, url_glob='https://ads.com/keep/*'),
+            RequestRule(RuleAction.BLOCK, host_suffix='ads.com'),
+            RequestRule(RuleAction.BLOCK, url_regex=r'track'),
+        ])
+
+        assert rule_set.match('https://ads.com/keep/a.js').action == RuleAction.ALLOW
+        assert rule_set.match('https://cdn.ads.com/a.js') is rule_set.rules[1]
+        assert rule_set.match('https://site.test/track.gif') is rule_set.rules[2]
+        assert rule_set.match('https://site.test/app.js') is None
+
+    def test_combined_pattern_is_per_resource_type(self):
+        rule_set = RequestRuleSet([
+            RequestRule(url_glob='*.png', resource_types=[ResourceType.IMAGE]),
+            RequestRule(url_regex=r'\.png$'),
+        ])
+
+        assert rule_set.match('https://a.test/x.png', 'Image') is rule_set.rules[0]
+        assert rule_set.match('https://a.test/x.png', 'Fetch') is rule_set.rules[1]
+        assert set(rule_set._combined_by_type) == {'image', 'fetch'}
+
+    def test_uncombinable_regex_is_matched_alone(self):
+        rule_set = RequestRuleSet([
+            RequestRule(url_regex=r'(a)\1'),
+            RequestRule(url_regex=r'(?P<name>b)(?P=name)'),
+        ])
+
+        assert rule_set._uncombinable_rules == [0, 1]
+        assert rule_set.match('https://x.test/aa') is rule_set.rules[0]
+        assert rule_set.match('https://x.test/bb') is rule_set.rules[1]
+
+    def test_flagged_regex_keeps_its_flags(self):
+        rule = RequestRule(url_regex=re.compile(r'/ADS/', re.I))
+        rule_set = RequestRuleSet([RequestRule(url_regex='track'), rule])
+
+        assert rule.matches('https://x.com/ads/1', 'x.com', 'Script')
+        assert rule_set._uncombinable_rules == [1]
+        assert rule_set.match('https://x.com/ads/1', 'Script') is rule
+        assert rule_set.match('https://x.com/track', 'Script') is rule_set.rules[0]
+
+    def test_claims_only_matched_request_stage_events(self):
+        rule = RequestRule(host_suffix='ads.com')
+        rule_set = RequestRuleSet([rule])
+        response_stage = paused('https://ads.com/a.js')
+        response_stage['params']['responseStatusCode'] = 200
+
+        assert rule_set.claims(paused('https://ads.com/a.js'))
+        assert not rule_set.claims(paused('https://a.test/'))
+        assert not rule_set.claims(response_stage)
+        assert rule.hits == 0
+
+    def test_type_only_rules(self):
+        rule_set = RequestRuleSet([RequestRule(resource_types=[ResourceType.FONT])])
+        assert rule_set.match('https://a.test/f.woff', 'Font') is rule_set.rules[0]
+        assert rule_set.match('https://a.test/f.woff', 'Script') is None
+
+    def test_request_patterns_are_narrowed(self):
+        rule_set = RequestRuleSet([
+            RequestRule(RuleAction.ALLOW, url_glob='*'),
+            RequestRule(host_suffix='ads.com'),
+            RequestRule(url_glob='*.woff2', resource_types=[ResourceType.FONT]),
+        ])
+
+        assert rule_set.request_patterns() == [
+            {'urlPattern': '*://*ads.com/*', 'requestStage': RequestStage.REQUEST},
+            {'urlPattern': '*://*ads.com:*', 'requestStage': RequestStage.REQUEST},
+            {
+                'urlPattern': '*.woff2',
+                'requestStage': RequestStage.REQUEST,
+                'resourceType': ResourceType.FONT,
+            },
+        ]
+
+    def test_request_patterns_collapse_to_catch_all(self):
+        rule_set = RequestRuleSet([
+            RequestRule(host_suffix='ads.com'),
+            RequestRule(url_regex='track'),
+        ])
+
+        assert rule_set.request_patterns() == [
+            {'urlPattern': '*', 'requestStage': RequestStage.REQUEST}
+        ]
+
+    def test_resolve_block_and_hits(self):
+        rule_set = RequestRuleSet([
+            RequestRule(
+                host_suffix='ads.com', name='ads', error_reason=NetworkErrorReason.ABORTED
+            ),
+        ])
+
+        command = rule_set.resolve(paused('https://x.ads.com/a.js'))
+        rule_set.resolve(paused('https://ads.com/b.js'))
+
+        assert command == FetchCommands.fail_request('req-1', NetworkErrorReason.ABORTED)
+        assert rule_set.hits == {'ads': 2}
+        assert rule_set.unmatched == 0
+
+    def test_resolve_unmatched(self):
+        rule_set = RequestRuleSet([RequestRule(host_suffix='ads.com')])
+
+        assert rule_set.resolve(paused('https://a.test/')) == FetchCommands.continue_request(
+            'req-1'
+        )
+        assert rule_set.resolve(paused('https://a.test/'), continue_unmatched=False) is None
+        assert rule_set.unmatched == 2
+
+    def test_resolve_allow(self):
+        rule_set = RequestRuleSet([RequestRule(RuleAction.ALLOW, url_glob='*')])
+        assert rule_set.resolve(paused('https://a.test/')) == FetchCommands.continue_request(
+            'req-1'
+        )
+
+    def test_resolve_rewrite_regex_url_and_headers(self):
+        rule_set = RequestRuleSet([
+            RequestRule(
+                RuleAction.REWRITE,
+                url_regex=r'^http://(.*)$',
+                rewrite_url=r'https://\1',
+                rewrite_headers={'user-agent': 'bot', 'X-Extra': '1'},
+            ),
+        ])
+
+        command = rule_set.resolve(
+            paused('http://a.test/p', headers={'User-Agent': 'chrome', 'Accept': '*/*'})
+        )
+
+        assert command['params']['url'] == 'https://a.test/p'
+        assert command['params']['headers'] == [
+            {'name': 'Accept', 'value': '*/*'},
+            {'name': 'user-agent', 'value': 'bot'},
+            {'name': 'X-Extra', 'value': '1'},
+        ]
+
+    def test_resolve_rewrite_glob_replaces_url(self):
+        rule_set = RequestRuleSet([
+            RequestRule(
+                RuleAction.REWRITE, url_glob='*/old.js', rewrite_url='https://a.test/new.js'
+            ),
+        ])
+
+        command = rule_set.resolve(paused('https://a.test/old.js'))
+
+        assert command['params']['url'] == 'https://a.test/new.js'
+        assert 'headers' not in command['params']
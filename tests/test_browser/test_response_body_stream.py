@@ -0,0 +1,109 @@
+import asyncio
+import base64
+
+import pytest
+
+from pydoll.browser.network import ResponseBodyStreamer
+
+
+class FakeStreams:
+    """Serves Fetch.takeResponseBodyAsStream and IO.read from in-memory bodies."""
+
+    def __init__(self, bodies, base64_encoded=True, delay=0):
+        self.bodies = bodies
+        self.base64_encoded = base64_encoded
+        self.delay = delay
+        self.positions = {}
+        self.commands = []
+        self.closed = []
+        self.reading = 0
+        self.peak_reading = 0
+
+    async def __call__(self, command):
+        self.commands.append(command)
+        method, params = command['method'], command.get('params', {})
+        if method == 'Fetch.takeResponseBodyAsStream':
+            handle = f'stream-{params["requestId"]}'
+            self.positions[handle] = (params['requestId'], 0)
+            self.reading += 1
+            self.peak_reading = max(self.peak_reading, self.reading)
+            return {'result': {'stream': handle}}
+        if method == 'IO.read':
+            await asyncio.sleep(self.delay)
+            request_id, position = self.positions[params['handle']]
+            chunk = self.bodies[request_id][position : position + params['size']]
+            self.positions[params['handle']] = (request_id, position + len(chunk))
+            eof = position + len(chunk) >= len(self.bodies[request_id])
+            data = base64.b64encode(chunk).decode() if self.base64_encoded else chunk.decode()
+            return {'result': {'data': data, 'eof': eof, 'base64Encoded': self.base64_encoded}}
+        if method == 'IO.close':
+            self.reading -= 1
+            self.closed.append(params['handle'])
+            return {'result': {}}
+        raise AssertionError(method)
+
+
+@pytest.mark.asyncio
+async def test_iter_body_reads_chunks_and_closes_stream():
+    target = FakeStreams({'r1': b'0123456789'})
+    streamer = ResponseBodyStreamer(target, chunk_size=4)
+
+    chunks = [chunk async for chunk in streamer.iter_body('r1')]
+
+    assert chunks == [b'0123', b'4567', b'89']
+    assert [command['params'] for command in target.commands if command['method'] == 'IO.read'] == [
+        {'handle': 'stream-r1', 'size': 4}
+    ] * 3
+    assert target.closed == ['stream-r1']
+    assert streamer.active == 0
+
+
+@pytest.mark.asyncio
+async def test_text_chunks_are_encoded():
+    target = FakeStreams({'r1': 'héllo'.encode()}, base64_encoded=False)
+    streamer = ResponseBodyStreamer(target, chunk_size=100)
+
+    assert [chunk async for chunk in streamer.iter_body('r1')] == ['héllo'.encode()]
+
+
+@pytest.mark.asyncio
+async def test_save_body_writes_file(tmp_path):
+    body = bytes(range(256)) * 10
+    target = FakeStreams({'r1': body})
+    streamer = ResponseBodyStreamer(target, chunk_size=1000)
+    path = tmp_path / 'download.bin'
+
+    assert await streamer.save_body('r1', path) == len(body)
+    assert path.read_bytes() == body
+
+
+@pytest.mark.asyncio
+async def test_concurrent_captures_respect_limit(tmp_path):
+    bodies = {f'r{index}': b'x' * 30 for index in range(6)}
+    target = FakeStreams(bodies, delay=0.005)
+    streamer = ResponseBodyStreamer(target, max_concurrent=2, chunk_size=10)
+
+    sizes = await asyncio.gather(
+        *(streamer.save_body(request_id, tmp_path / request_id) for request_id in bodies)
+    )
+
+    assert sizes == [30] * 6
+    assert target.peak_reading == 2
+    assert len(target.closed) == 6
+
+
+@pytest.mark.asyncio
+async def test_stream_is_closed_on_error():
+    target = FakeStreams({'r1': b'data'})
+
+    async def failing_read(command):
+        if command['method'] == 'IO.read':
+            raise RuntimeError('target closed')
+        return await target(command)
+
+    streamer = ResponseBodyStreamer(failing_read)
+
+    with pytest.raises(RuntimeError):
+        [chunk async for chunk in streamer.iter_body('r1')]
+    assert target.closed == ['stream-r1']
+    assert streamer.active == 0
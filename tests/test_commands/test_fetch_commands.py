@@ -202,6 +202,21 @@ class TestFetchCommands:
         assert result['params']['handleAuthRequests'] == handle_auth
         assert result['params']['patterns'][0]['requestStage'] == request_stage
 
+    def test_enable_with_patterns(self):
+        """Test enable command with explicit patterns."""
+        patterns = [
+            {'urlPattern': '*://*.ads.com/*', 'requestStage': RequestStage.REQUEST},
+            {'urlPattern': '*', 'resourceType': ResourceType.FONT},
+        ]
+        result = FetchCommands.enable(
+            handle_auth_requests=False,
+            url_pattern='ignored',
+            patterns=patterns
+        )
+
+        assert result['method'] == FetchMethod.ENABLE
+        assert result['params']['patterns'] == patterns
+
     def test_enable_with_all_params(self):
         """Test enable command with all parameters."""
         handle_auth = True
@@ -0,0 +1,29 @@
+from pydoll.commands import IOCommands
+from pydoll.protocol.io.methods import IOMethod
+
+
+def test_read_minimal():
+    """Test read with only a handle."""
+    result = IOCommands.read('stream-1')
+    assert result['method'] == IOMethod.READ
+    assert result['params'] == {'handle': 'stream-1'}
+
+
+def test_read_with_offset_and_size():
+    """Test read with offset and size."""
+    result = IOCommands.read('stream-1', offset=10, size=1024)
+    assert result['params'] == {'handle': 'stream-1', 'offset': 10, 'size': 1024}
+
+
+def test_close():
+    """Test close command."""
+    result = IOCommands.close('stream-1')
+    assert result['method'] == IOMethod.CLOSE
+    assert result['params'] == {'handle': 'stream-1'}
+
+
+def test_resolve_blob():
+    """Test resolve_blob command."""
+    result = IOCommands.resolve_blob('object-1')
+    assert result['method'] == IOMethod.RESOLVE_BLOB
+    assert result['params'] == {'objectId': 'object-1'}
@@ -96,8 +96,7 @@ async def test_execute_command_connection_closed_exception(connection_handler):
         )
     )
     connection_handler._ws_connection.close = AsyncMock()
-    connection_handler._receive_task = AsyncMock(spec=asyncio.Task)
-    connection_handler._receive_task.done = MagicMock(return_value=False)
+    connection_handler._receive_task = asyncio.create_task(asyncio.Event().wait())
     with pytest.raises(exceptions.WebSocketConnectionClosed):
         await connection_handler.execute_command({
             'id': 1,
@@ -318,3 +317,111 @@ def test__repr__(connection_handler):
 def test__str__(connection_handler):
     result = connection_handler.__str__()
     assert result == 'ConnectionHandler(port=9222)'
+
+
+@pytest.mark.asyncio
+async def test__receive_events_fails_pending_commands_on_disconnect(connection_handler):
+    async def fake_incoming_messages_connection_closed():
+        raise websockets.ConnectionClosed(None, None)
+        yield
+
+    disconnected = MagicMock()
+    connection_handler.register_disconnect_callback(disconnected)
+    connection_handler._incoming_messages = fake_incoming_messages_connection_closed
+    future = connection_handler._command_manager.create_command_future({'method': 'Test'})
+
+    await connection_handler._receive_events()
+
+    with pytest.raises(exceptions.WebSocketConnectionClosed):
+        await future
+    disconnected.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test__receive_events_async_disconnect_callback(connection_handler):
+    async def fake_incoming_messages():
+        return
+        yield
+
+    called = asyncio.Event()
+
+    async def disconnected():
+        called.set()
+
+    connection_handler.register_disconnect_callback(disconnected)
+    connection_handler._incoming_messages = fake_incoming_messages
+
+    await connection_handler._receive_events()
+    await asyncio.wait_for(called.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test__receive_events_no_disconnect_callback_after_close(connection_handler):
+    async def fake_incoming_messages():
+        return
+        yield
+
+    disconnected = MagicMock()
+    connection_handler.register_disconnect_callback(disconnected)
+    connection_handler._incoming_messages = fake_incoming_messages
+
+    await connection_handler.close()
+    await connection_handler._receive_events()
+
+    disconnected.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fail_pending_commands(connection_handler):
+    future = connection_handler._command_manager.create_command_future({'method': 'Test'})
+
+    connection_handler.fail_pending_commands(exceptions.BrowserCrashed())
+
+    with pytest.raises(exceptions.BrowserCrashed):
+        await future
+
+
+@pytest.mark.asyncio
+async def test_switch_page_keeps_callbacks(connection_handler_with_page_id):
+    handler = connection_handler_with_page_id
+    callback_id = await handler.register_callback('Page.loadEventFired', MagicMock())
+
+    await handler.switch_page('NEW-PAGE')
+
+    assert handler._page_id == 'NEW-PAGE'
+    assert handler._ws_connection is None
+    assert callback_id in handler._events_handler._event_callbacks
+    assert await handler._resolve_ws_address() == (
+        'ws://localhost:9222/devtools/page/NEW-PAGE'
+    )
+
+
+@pytest.mark.asyncio
+async def test_switch_page_waits_for_old_receive_loop(connection_handler_with_page_id):
+    handler = connection_handler_with_page_id
+    disconnected = MagicMock()
+    handler.register_disconnect_callback(disconnected)
+    pending = handler._command_manager.create_command_future({'method': 'Test'})
+
+    received = asyncio.Event()
+
+    async def blocking_recv():
+        received.set()
+        await asyncio.Event().wait()
+
+    handler._ws_connection = AsyncMock()
+    handler._ws_connection.state = State.OPEN
+    handler._ws_connection.recv = blocking_recv
+    handler._receive_task = asyncio.create_task(handler._receive_events())
+    await received.wait()
+
+    await handler.switch_page('NEW-PAGE')
+    # a new connection resets the flag; the old loop must be finished by now
+    handler._closing = False
+    await asyncio.sleep(0)
+
+    assert handler._receive_task.done()
+    assert pending.done()
+    with pytest.raises(exceptions.WebSocketConnectionClosed):
+        await pending
+    disconnected.assert_not_called()
@@ -0,0 +1,127 @@
+import pytest
+
+from pydoll.elements.mixins import ExtractionMixin
+from pydoll.elements.mixins.extraction_mixin import parse_field
+from pydoll.exceptions import ExtractionFailed
+
+
+class FakeDocument(ExtractionMixin):
+    """Answers extraction commands from a list of prepared responses."""
+
+    def __init__(self, responses, object_id=None):
+        self.responses = list(responses)
+        self.commands = []
+        if object_id:
+            self._object_id = object_id
+
+    async def _execute_command(self, command):
+        self.commands.append(command)
+        return self.responses.pop(0)
+
+
+def records_response(records, total=None):
+    return {
+        'result': {
+            'result': {
+                'type': 'object',
+                'value': {'total': len(records) if total is None else total, 'records': records},
+            }
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    'spec, expected',
+    [
+        ('a@href', ('a', 'href')),
+        ('@data-sku', ('', 'data-sku')),
+        ('td.name', ('td.name', 'text')),
+        ('span.price@inner_text', ('span.price', 'inner_text')),
+        ('a@', ('a', 'text')),
+    ],
+)
+def test_parse_field(spec, expected):
+    field = parse_field('key', spec)
+    assert (field['selector'], field['property']) == expected
+    assert field['name'] == 'key'
+
+
+@pytest.mark.parametrize('spec', ['', '@', ' @ '])
+def test_parse_field_rejects_empty_specs(spec):
+    with pytest.raises(ValueError):
+        parse_field('key', spec)
+
+
+@pytest.mark.asyncio
+async def test_extract_in_one_command():
+    records = [{'title': 'Alpha', 'href': '/a'}, {'title': 'Beta', 'href': None}]
+    document = FakeDocument([records_response(records)])
+
+    result = await document.extract('tr.row', {'title': 'a@text', 'href': 'a@href'})
+
+    assert result == records
+    assert len(document.commands) == 1
+    command = document.commands[0]
+    assert command['method'] == 'Runtime.evaluate'
+    assert command['params']['returnByValue'] is True
+    expression = command['params']['expression']
+    assert '"tr.row"' in expression
+    assert '{"name": "href", "selector": "a", "property": "href"}' in expression
+
+
+@pytest.mark.asyncio
+async def test_large_results_are_read_in_chunks():
+    document = FakeDocument([
+        records_response([{'n': 0}, {'n': 1}], total=5),
+        {'result': {'result': {'type': 'object', 'subtype': 'array', 'objectId': 'rows'}}},
+        records_response([{'n': 2}, {'n': 3}]),
+        records_response([{'n': 4}]),
+        {'result': {}},
+    ])
+
+    chunks = []
+    async for record in document.iter_extract('li', {'n': '@data-n'}, chunk_size=2):
+        chunks.append(record['n'])
+
+    assert chunks == [0, 1, 2, 3, 4]
+    methods = [command['method'] for command in document.commands]
+    assert methods == [
+        'Runtime.evaluate',
+        'Runtime.evaluate',
+        'Runtime.callFunctionOn',
+        'Runtime.callFunctionOn',
+        'Runtime.releaseObject',
+    ]
+    assert document.commands[1]['params']['returnByValue'] is False
+    assert 'this.slice(4, 6)' in document.commands[3]['params']['functionDeclaration']
+    assert document.commands[4]['params'] == {'objectId': 'rows'}
+
+
+@pytest.mark.asyncio
+async def test_extract_relative_to_element():
+    document = FakeDocument([records_response([])], object_id='table-id')
+
+    assert await document.extract('//tr', {'cell': 'td'}) == []
+
+    command = document.commands[0]
+    assert command['method'] == 'Runtime.callFunctionOn'
+    assert command['params']['objectId'] == 'table-id'
+    assert '".//tr"' in command['params']['functionDeclaration']
+
+
+@pytest.mark.asyncio
+async def test_page_exception_raises_extraction_failed():
+    document = FakeDocument([
+        {
+            'result': {
+                'result': {'type': 'object', 'subtype': 'error'},
+                'exceptionDetails': {
+                    'text': 'Uncaught',
+                    'exception': {'description': "SyntaxError: '##' is not a valid selector"},
+                },
+            }
+        }
+    ])
+
+    with pytest.raises(ExtractionFailed, match='not a valid selector'):
+        await document.extract('##', {'text': '@text'})
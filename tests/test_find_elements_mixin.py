@@ -1,10 +1,13 @@
+import asyncio
 import pytest
 import re
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from pydoll.elements.mixins.find_elements_mixin import FindElementsMixin
+from pydoll.commands import RuntimeCommands
+from pydoll.elements.mixins.find_elements_mixin import FindElementsMixin, release_object_group
 from pydoll.constants import By
-from pydoll.exceptions import ElementNotFound, WaitElementTimeout
+from pydoll.exceptions import ElementNotFound, WaitElementFailed, WaitElementTimeout
+from pydoll.elements.web_element import WebElement
 
 
 class MockFindElementsMixin(FindElementsMixin):
@@ -406,68 +409,146 @@ class TestFindElementsMixinEdgeCases:
         self.mixin._find_element.assert_called_once_with(By.ID, 'test-id', raise_exc=True)
 
     @pytest.mark.asyncio
-    async def test_find_or_wait_element_timeout_success_on_retry(self):
-        """Test find_or_wait_element succeeds on retry within timeout."""
-        # First call returns None, second call returns element
+    async def test_find_or_wait_element_awaits_in_page_wait(self):
+        """Test waiting awaits a single in-page promise with the remaining timeout."""
         mock_element = MagicMock()
-        self.mixin._find_element = AsyncMock(side_effect=[None, mock_element])
-        
-        with patch('asyncio.sleep') as mock_sleep, \
-             patch('asyncio.get_event_loop') as mock_loop:
-            # Mock time progression
-            mock_loop.return_value.time.side_effect = [0, 0.5, 1.0]
-            
-            result = await self.mixin.find_or_wait_element(
-                By.ID, 'test-id', timeout=2, raise_exc=False
-            )
-        
+        self.mixin._wait_for_element = AsyncMock(return_value=mock_element)
+
+        result = await self.mixin.find_or_wait_element(By.ID, 'test-id', timeout=2)
+
         assert result == mock_element
-        assert self.mixin._find_element.call_count == 2
-        mock_sleep.assert_called_once_with(0.5)
+        self.mixin._wait_for_element.assert_called_once_with(By.ID, 'test-id', 2, False)
 
     @pytest.mark.asyncio
     async def test_find_or_wait_element_timeout_failure(self):
         """Test find_or_wait_element raises WaitElementTimeout."""
-        self.mixin._find_element = AsyncMock(return_value=None)
-        
-        with patch('asyncio.sleep') as mock_sleep, \
-             patch('asyncio.get_event_loop') as mock_loop:
-            # Mock time progression that exceeds timeout
-            mock_loop.return_value.time.side_effect = [0, 0.5, 1.0, 1.5, 2.1]
-            
-            with pytest.raises(WaitElementTimeout):
-                await self.mixin.find_or_wait_element(
-                    By.ID, 'test-id', timeout=2, raise_exc=True
-                )
+        self.mixin._wait_for_element = AsyncMock(return_value=None)
+
+        with pytest.raises(WaitElementTimeout):
+            await self.mixin.find_or_wait_element(By.ID, 'test-id', timeout=2, raise_exc=True)
 
     @pytest.mark.asyncio
     async def test_find_or_wait_element_timeout_failure_no_exception(self):
         """Test find_or_wait_element returns None when raise_exc=False."""
-        self.mixin._find_element = AsyncMock(return_value=None)
-        
-        with patch('asyncio.sleep') as mock_sleep, \
-             patch('asyncio.get_event_loop') as mock_loop:
-            # Mock time progression that exceeds timeout
-            mock_loop.return_value.time.side_effect = [0, 0.5, 1.0, 1.5, 2.1]
-            
-            result = await self.mixin.find_or_wait_element(
-                By.ID, 'test-id', timeout=2, raise_exc=False
-            )
-        
+        self.mixin._wait_for_element = AsyncMock(return_value=[])
+
+        result = await self.mixin.find_or_wait_element(
+            By.ID, 'test-id', timeout=2, find_all=True, raise_exc=False
+        )
+
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_find_elements_with_timeout(self):
-        """Test find with find_all=True and timeout."""
-        mock_elements = [MagicMock(), MagicMock()]
-        self.mixin._find_elements = AsyncMock(return_value=mock_elements)
-        
+    async def test_wait_for_element_single_command(self):
+        """Test the wait resolves from one awaitPromise command."""
+        del self.mixin._object_id
+        self.mixin._connection_handler.execute_command.return_value = {
+            'result': {
+                'result': {
+                    'objectId': 'late-element',
+                    'deepSerializedValue': {
+                        'type': 'node',
+                        'value': {'localName': 'div', 'attributes': {'id': 'late'}},
+                    },
+                }
+            }
+        }
+
+        element = await self.mixin.find_or_wait_element(By.ID, 'late', timeout=30)
+
+        assert element.id == 'late'
+        self.mixin._connection_handler.execute_command.assert_called_once()
+        command, = self.mixin._connection_handler.execute_command.call_args.args
+        assert command['method'] == 'Runtime.evaluate'
+        assert command['params']['awaitPromise'] is True
+        assert 'MutationObserver' in command['params']['expression']
+        assert 'root.querySelector("#late")' in command['params']['expression']
+        assert self.mixin._connection_handler.execute_command.call_args.kwargs['timeout'] == 35
+
+    @pytest.mark.asyncio
+    async def test_wait_for_element_retries_after_navigation(self):
+        """Test a wait interrupted by a navigation is installed again."""
+        del self.mixin._object_id
+        self.mixin._connection_handler.execute_command.side_effect = [
+            {'error': {'code': -32000, 'message': 'Execution context was destroyed.'}},
+            {'result': {'result': {'type': 'object', 'subtype': 'null', 'value': None}}},
+        ]
+
+        with patch('asyncio.sleep', new=AsyncMock()):
+            result = await self.mixin._wait_for_element(By.CSS_SELECTOR, '.late', 5)
+
+        assert result is None
+        assert self.mixin._connection_handler.execute_command.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_for_element_retries_in_new_context(self):
+        """Test a wait sent while the old context is gone is retried."""
+        del self.mixin._object_id
+        self.mixin._connection_handler.execute_command.side_effect = [
+            {'error': {'code': -32000, 'message': 'Cannot find context with specified id'}},
+            {'result': {'result': {'type': 'object', 'subtype': 'null', 'value': None}}},
+        ]
+
+        with patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            result = await self.mixin._wait_for_element(By.CSS_SELECTOR, '.late', 5)
+
+        assert result is None
+        mock_sleep.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_element_raises_other_errors(self):
+        """Test errors unrelated to navigation are raised instead of retried."""
+        self.mixin._object_id = 'stale-id'
+        self.mixin._connection_handler.execute_command.return_value = {
+            'error': {'code': -32000, 'message': 'Could not find object with given id'}
+        }
+
+        with pytest.raises(WaitElementFailed, match='Could not find object with given id'):
+            await self.mixin.find_or_wait_element(By.CSS_SELECTOR, '.late', timeout=5)
+        self.mixin._connection_handler.execute_command.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_element_invalid_selector(self):
+        """Test a selector rejected in the page raises instead of returning the error."""
+        del self.mixin._object_id
+        description = "SyntaxError: Failed to execute 'querySelector' on 'Document'"
+        self.mixin._connection_handler.execute_command.return_value = {
+            'result': {
+                'result': {'type': 'object', 'subtype': 'error', 'objectId': 'err-1'},
+                'exceptionDetails': {
+                    'text': 'Uncaught (in promise)',
+                    'exception': {'type': 'object', 'description': description},
+                },
+            }
+        }
+        self.mixin._get_remote_object_attributes = AsyncMock()
+
+        with pytest.raises(WaitElementFailed, match='SyntaxError'):
+            await self.mixin._wait_for_element(By.CSS_SELECTOR, 'div[', 5)
+        self.mixin._get_remote_object_attributes.assert_not_called()
+        self.mixin._connection_handler.execute_command.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_elements_returns_all_matches(self):
+        """Test find_all waits for an array and resolves its elements."""
+        self.mixin._object_id = 'parent-id'
+        self.mixin._connection_handler.execute_command.return_value = {
+            'result': {'result': {'type': 'object', 'subtype': 'array', 'objectId': 'list'}}
+        }
+        self.mixin._get_elements_from_array = AsyncMock(return_value=[MagicMock()])
+
         result = await self.mixin.find_or_wait_element(
-            By.CLASS_NAME, 'item', timeout=1, find_all=True
+            By.XPATH, '//li', timeout=1, find_all=True
         )
-        
-        assert result == mock_elements
-        self.mixin._find_elements.assert_called_once()
+
+        assert len(result) == 1
+        command, = self.mixin._connection_handler.execute_command.call_args.args
+        self.mixin._get_elements_from_array.assert_called_once_with(
+            'list', By.XPATH, '//li', command['params']['objectGroup']
+        )
+        assert command['method'] == 'Runtime.callFunctionOn'
+        assert command['params']['objectId'] == 'parent-id'
+        assert '".//li", root' in command['params']['functionDeclaration']
 
     def test_regex_pattern_in_get_expression_type(self):
         """Test the regex pattern used in _get_expression_type."""
@@ -541,4 +622,196 @@ class TestFindElementsMixinEdgeCases:
         # Should wrap with spaces to match exact class names
         assert '" test-class "' in xpath
         # Should use concat to add spaces
-        assert 'concat(" "' in xpath
\ No newline at end of file
+        assert 'concat(" "' in xpath
+
+class TestFindElementsBatching:
+    """Test _find_elements resolves every match with a fixed number of commands."""
+
+    def setup_method(self):
+        self.mixin = MockFindElementsMixin()
+        del self.mixin._object_id
+
+    @pytest.mark.asyncio
+    async def test_find_elements_uses_three_commands(self):
+        """Test handles and attributes of all matches come from two batched calls."""
+        count = 50
+        self.mixin._connection_handler.execute_command.side_effect = [
+            {'result': {'result': {'type': 'object', 'objectId': 'list-1'}}},
+            {
+                'result': {
+                    'result': [
+                        {'name': str(i), 'value': {'type': 'object', 'objectId': f'node-{i}'}}
+                        for i in reversed(range(count))
+                    ]
+                }
+            },
+            {
+                'result': {
+                    'result': {
+                        'type': 'object',
+                        'value': [
+                            {'nodeName': 'div', 'attributes': ['id', f'card-{i}']}
+                            for i in range(count)
+                        ],
+                    }
+                }
+            },
+        ]
+
+        elements = await self.mixin._find_elements(By.CSS_SELECTOR, '.card')
+
+        assert self.mixin._connection_handler.execute_command.call_count == 3
+        by_object_id = {element._object_id: element for element in elements}
+        assert len(by_object_id) == count
+        assert by_object_id['node-7'].id == 'card-7'
+        assert by_object_id['node-7'].tag_name == 'div'
+        commands = [
+            call.args[0] for call in self.mixin._connection_handler.execute_command.call_args_list
+        ]
+        assert commands[1]['params'] == {'objectId': 'list-1', 'ownProperties': True}
+        assert commands[2]['params']['returnByValue'] is True
+
+
+class TestObjectGroups:
+    """Test found element handles join the host's object group and get released."""
+
+    def setup_method(self):
+        self.mixin = MockFindElementsMixin()
+        del self.mixin._object_id
+
+    @pytest.mark.asyncio
+    async def test_find_element_joins_object_group(self):
+        """Test the find command and the element carry the current object group."""
+        self.mixin._object_group = 'pydoll-scope-1'
+        self.mixin._connection_handler.execute_command.return_value = {
+            'result': {
+                'result': {
+                    'type': 'object',
+                    'objectId': 'node-1',
+                    'deepSerializedValue': {
+                        'type': 'node',
+                        'value': {'localName': 'div', 'attributes': {'id': 'card'}},
+                    },
+                }
+            }
+        }
+
+        element = await self.mixin._find_element(By.ID, 'card')
+
+        command = self.mixin._connection_handler.execute_command.call_args.args[0]
+        assert command['params']['objectGroup'] == 'pydoll-scope-1'
+        assert element._object_group == 'pydoll-scope-1'
+
+    @pytest.mark.asyncio
+    async def test_find_element_without_object_group(self):
+        """Test a find outside a scope puts its handle in a group of its own."""
+        self.mixin._connection_handler.execute_command.return_value = {
+            'result': {'result': {'type': 'object', 'objectId': 'node-1'}}
+        }
+        self.mixin._get_object_attributes = AsyncMock(return_value=['tag_name', 'div'])
+
+        element = await self.mixin._find_element(By.ID, 'card')
+        other = await self.mixin._find_element(By.ID, 'card')
+
+        command = self.mixin._connection_handler.execute_command.call_args_list[0].args[0]
+        assert command['params']['objectGroup'].startswith('pydoll-find-')
+        assert element._object_group == command['params']['objectGroup']
+        assert element._object_group_lease.object_group == element._object_group
+        assert other._object_group != element._object_group
+
+    @pytest.mark.asyncio
+    async def test_find_group_released_with_its_last_handle(self):
+        """Test a find's own group is released once all of its handles are collected."""
+        self.mixin._connection_handler.execute_command.side_effect = [
+            {'result': {'result': {'type': 'object', 'objectId': 'list-1'}}},
+            {
+                'result': {
+                    'result': [
+                        {'name': '0', 'value': {'type': 'object', 'objectId': 'node-0'}},
+                        {'name': '1', 'value': {'type': 'object', 'objectId': 'node-1'}},
+                    ]
+                }
+            },
+            {
+                'result': {
+                    'result': {
+                        'type': 'object',
+                        'value': [
+                            {'nodeName': 'li', 'attributes': []},
+                            {'nodeName': 'li', 'attributes': []},
+                        ],
+                    }
+                }
+            },
+            {'result': {}},
+        ]
+        first, second = await self.mixin._find_elements(By.TAG_NAME, 'li')
+        object_group = first._object_group
+        child = WebElement(
+            'node-2',
+            self.mixin._connection_handler,
+            object_group=object_group,
+            object_group_lease=first._object_group_lease,
+        )
+        execute_command = self.mixin._connection_handler.execute_command
+
+        del first, second
+        await asyncio.sleep(0)
+        assert execute_command.call_count == 3
+
+        del child
+        await asyncio.sleep(0)
+        assert execute_command.call_count == 4
+        assert execute_command.call_args.args[0] == RuntimeCommands.release_object_group(
+            object_group
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_elements_in_scope_leave_release_to_scope(self):
+        """Test handles found in a scope join it and release nothing themselves."""
+        self.mixin._object_group = 'pydoll-scope-1'
+        self.mixin._connection_handler.execute_command.side_effect = [
+            {'result': {'result': {'type': 'object', 'objectId': 'list-1'}}},
+            {
+                'result': {
+                    'result': [{'name': '0', 'value': {'type': 'object', 'objectId': 'node-0'}}]
+                }
+            },
+            {
+                'result': {
+                    'result': {'type': 'object', 'value': [{'nodeName': 'li', 'attributes': []}]}
+                }
+            },
+            {'result': {}},
+        ]
+
+        elements = await self.mixin._find_elements(By.TAG_NAME, 'li')
+        assert elements[0]._object_group == 'pydoll-scope-1'
+        assert elements[0]._object_group_lease is None
+        del elements
+        await asyncio.sleep(0)
+
+        commands = [
+            call.args[0] for call in self.mixin._connection_handler.execute_command.call_args_list
+        ]
+        assert commands[0]['params']['objectGroup'] == 'pydoll-scope-1'
+        assert len(commands) == 3
+
+    @pytest.mark.asyncio
+    async def test_release_skipped_when_disconnected(self):
+        """Test nothing is sent once the connection is closed."""
+        handler = AsyncMock()
+        handler.connected = False
+
+        release_object_group(handler, 'pydoll-find-1')
+        await asyncio.sleep(0)
+
+        handler.execute_command.assert_not_called()
+
+    def test_release_skipped_without_event_loop(self):
+        """Test releasing outside a running loop does nothing."""
+        handler = AsyncMock()
+
+        release_object_group(handler, 'pydoll-find-1')
+
+        handler.execute_command.assert_not_called()
@@ -1,15 +1,21 @@
+import asyncio
+import subprocess
+import sys
 from unittest.mock import MagicMock, Mock, patch, ANY
 
 import pytest
 
 from pydoll.browser.managers import (
+    BrowserOutputManager,
+    BrowserResourceMonitor,
     ChromiumOptionsManager,
     BrowserProcessManager,
     ProxyManager,
+    ResourceThresholds,
     TempDirectoryManager,
 )
 from pydoll.browser.options import ChromiumOptions as Options
-from pydoll.exceptions import InvalidOptionsObject
+from pydoll.exceptions import InvalidOptionsObject, UnsupportedOS
 
 
 @pytest.fixture
@@ -225,3 +231,281 @@ def test_initialize_options_preserves_custom_arguments():
     assert '--custom-flag' in result.arguments
     assert '--no-first-run' in result.arguments
     assert '--no-default-browser-check' in result.arguments
+
+
+def _spawn_python(code: str) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, '-c', code], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+
+
+@pytest.mark.asyncio
+async def test_output_manager_drains_both_streams():
+    process = _spawn_python(
+        'import sys\n'
+        'for i in range(5): print(f"out {i}")\n'
+        'print("DevTools listening on ws://x", file=sys.stderr)\n'
+    )
+    manager = BrowserOutputManager(max_lines=100)
+    await manager.attach(process)
+
+    assert manager.is_attached
+    await asyncio.wait_for(manager.wait_closed(), timeout=10)
+    process.wait()
+
+    assert manager.get_recent_lines(stream='stdout') == [f'out {i}' for i in range(5)]
+    assert manager.get_recent_lines(stream='stderr') == ['DevTools listening on ws://x']
+    assert manager.get_recent_lines(limit=2)[-1] in {'out 4', 'DevTools listening on ws://x'}
+    await manager.detach()
+    assert not manager.is_attached
+
+
+@pytest.mark.asyncio
+async def test_output_manager_is_bounded():
+    process = _spawn_python('for i in range(50): print(i)')
+    manager = BrowserOutputManager(max_lines=10)
+    await manager.attach(process)
+    await asyncio.wait_for(manager.wait_closed(), timeout=10)
+    process.wait()
+
+    assert manager.get_recent_lines() == [str(i) for i in range(40, 50)]
+    assert manager.get_recent_lines(limit=0) == []
+    await manager.detach()
+
+
+@pytest.mark.asyncio
+async def test_output_manager_does_not_block_verbose_process():
+    # writes far more than a pipe buffer holds; would hang without draining
+    process = _spawn_python('import sys\nfor i in range(20000): sys.stderr.write("x" * 100 + "\\n")')
+    manager = BrowserOutputManager(max_lines=5)
+    await manager.attach(process)
+    await asyncio.wait_for(manager.wait_closed(), timeout=20)
+
+    assert process.wait(timeout=5) == 0
+    assert len(manager.get_recent_lines()) == 5
+    await manager.detach()
+
+
+@pytest.mark.asyncio
+async def test_output_manager_wait_for_line():
+    process = _spawn_python(
+        'import sys, time\n'
+        'time.sleep(0.2)\n'
+        'print("DevTools listening on ws://127.0.0.1", file=sys.stderr, flush=True)\n'
+        'time.sleep(5)\n'
+    )
+    manager = BrowserOutputManager()
+    await manager.attach(process)
+    try:
+        line = await manager.wait_for_line('DevTools listening on', timeout=5)
+        assert line == 'DevTools listening on ws://127.0.0.1'
+        # already buffered lines match immediately
+        assert await manager.wait_for_line('DevTools', timeout=0) == line
+    finally:
+        process.kill()
+        process.wait()
+        await manager.detach()
+
+
+@pytest.mark.asyncio
+async def test_output_manager_wait_for_line_returns_none_on_exit():
+    process = _spawn_python('print("crashed")')
+    manager = BrowserOutputManager()
+    await manager.attach(process)
+
+    assert await manager.wait_for_line('DevTools listening on', timeout=10) is None
+    assert manager.closed
+    process.wait()
+    await manager.detach()
+
+
+@pytest.mark.asyncio
+async def test_output_manager_mirrors_to_log_file(tmp_path):
+    log_file = tmp_path / 'browser.log'
+    process = _spawn_python('import sys\nprint("hello")\nprint("oops", file=sys.stderr)')
+    manager = BrowserOutputManager(log_file=str(log_file))
+    await manager.attach(process)
+    await asyncio.wait_for(manager.wait_closed(), timeout=10)
+    process.wait()
+    await manager.detach()
+
+    content = log_file.read_text().splitlines()
+    assert '[stdout] hello' in content
+    assert '[stderr] oops' in content
+
+
+@pytest.mark.asyncio
+async def test_output_manager_ignores_non_pipe_streams():
+    manager = BrowserOutputManager()
+    await manager.attach(MagicMock())
+
+    assert not manager.is_attached
+    assert await manager.wait_for_line('anything', timeout=1) is None
+
+
+def _write_fake_proc(root, pid, ppid, cmdline, utime, stime, threads, rss_pages, comm='chrome'):
+    proc_dir = root / str(pid)
+    proc_dir.mkdir(parents=True)
+    fields = ['S', str(ppid)] + ['0'] * 9 + [str(utime), str(stime)] + ['0'] * 4
+    fields += [str(threads), '0', '0', '0', str(rss_pages)] + ['0'] * 10
+    (proc_dir / 'stat').write_text(f'{pid} ({comm}) ' + ' '.join(fields))
+    (proc_dir / 'cmdline').write_bytes(b'\0'.join(arg.encode() for arg in cmdline))
+
+
+@pytest.fixture
+def fake_proc(tmp_path):
+    root = tmp_path / 'proc'
+    _write_fake_proc(root, 1, 0, ['/sbin/init'], 0, 0, 1, 1, comm='init')
+    _write_fake_proc(root, 100, 1, ['chrome', '--no-first-run'], 100, 50, 20, 1000)
+    _write_fake_proc(root, 101, 100, ['chrome', '--type=zygote'], 10, 0, 2, 100)
+    _write_fake_proc(root, 102, 101, ['chrome', '--type=renderer'], 200, 100, 15, 5000,
+                     comm='chrome (renderer)')
+    _write_fake_proc(root, 103, 101, ['chrome', '--type=renderer'], 10, 10, 10, 300)
+    _write_fake_proc(root, 104, 100, ['chrome', '--type=gpu-process'], 0, 0, 5, 200)
+    _write_fake_proc(root, 200, 1, ['python'], 0, 0, 1, 1)
+    (root / 'self').mkdir()
+    (root / 'self' / 'stat').write_text('')
+    return root
+
+
+@pytest.fixture
+def monitored_process_manager():
+    manager = BrowserProcessManager(process_creator=Mock())
+    manager._process = MagicMock(pid=100)
+    return manager
+
+
+def test_resource_monitor_walks_process_tree(fake_proc, monitored_process_manager):
+    monitor = BrowserResourceMonitor(monitored_process_manager, proc_root=str(fake_proc))
+    monitor._page_size = 4096
+    monitor._clock_ticks = 100
+
+    usage = monitor.sample()
+
+    assert usage.pid == 100
+    assert usage.process_count == 5
+    assert sorted(p.pid for p in usage.processes) == [100, 101, 102, 103, 104]
+    assert usage.rss_bytes == (1000 + 100 + 5000 + 300 + 200) * 4096
+    assert usage.num_threads == 52
+    assert usage.cpu_time == pytest.approx(4.8)
+    assert sorted(r.pid for r in usage.renderers) == [102, 103]
+    types = {p.pid: p.process_type for p in usage.processes}
+    assert types[100] == 'browser'
+    assert types[104] == 'gpu-process'
+    assert monitor.last_usage is usage
+
+
+def test_resource_monitor_returns_none_without_process(fake_proc, monitored_process_manager):
+    monitor = BrowserResourceMonitor(monitored_process_manager, proc_root=str(fake_proc))
+    monitored_process_manager._process = None
+    assert monitor.sample() is None
+
+    monitored_process_manager._process = MagicMock(pid=999)
+    assert monitor.sample() is None
+
+
+def test_resource_monitor_unsupported(tmp_path, monitored_process_manager):
+    monitor = BrowserResourceMonitor(monitored_process_manager, proc_root=str(tmp_path))
+    assert not monitor.is_supported
+    with pytest.raises(UnsupportedOS):
+        monitor.sample()
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='requires /proc')
+def test_resource_monitor_samples_real_process():
+    process = _spawn_python('import time; time.sleep(5)')
+    try:
+        manager = BrowserProcessManager(process_creator=Mock())
+        manager._process = process
+        usage = BrowserResourceMonitor(manager).sample()
+
+        assert usage.pid == process.pid
+        assert usage.process_count == 1
+        assert usage.rss_bytes > 0
+        assert usage.num_threads >= 1
+    finally:
+        process.kill()
+        process.wait()
+
+
+def test_resource_thresholds_check(fake_proc, monitored_process_manager):
+    monitor = BrowserResourceMonitor(monitored_process_manager, proc_root=str(fake_proc))
+    monitor._page_size = 4096
+    usage = monitor.sample()
+
+    assert ResourceThresholds().check(usage) == []
+    violations = ResourceThresholds(
+        max_rss_bytes=1024,
+        max_renderer_rss_bytes=1000 * 4096,
+        max_threads=10,
+        max_process_count=4,
+        max_cpu_time=0.5,
+    ).check(usage)
+
+    assert len(violations) == 5
+    assert any('renderer 102' in violation for violation in violations)
+    assert not any('renderer 103' in violation for violation in violations)
+
+
+@pytest.mark.asyncio
+async def test_resource_monitor_invokes_callbacks(fake_proc, monitored_process_manager):
+    monitor = BrowserResourceMonitor(
+        monitored_process_manager,
+        thresholds=ResourceThresholds(max_process_count=2),
+        interval=0.01,
+        proc_root=str(fake_proc),
+    )
+    calls = []
+    triggered = asyncio.Event()
+
+    async def async_callback(usage, violations):
+        calls.append(('async', usage.pid, violations))
+        triggered.set()
+
+    monitor.on_threshold_exceeded(lambda usage, violations: calls.append(('sync', usage.pid)))
+    monitor.on_threshold_exceeded(async_callback)
+
+    await monitor.start()
+    assert monitor.is_running
+    await asyncio.wait_for(triggered.wait(), timeout=5)
+    await monitor.stop()
+
+    assert not monitor.is_running
+    assert ('sync', 100) in calls
+    assert ('async', 100, ['processes 5 > 2']) in calls
+
+
+@pytest.mark.asyncio
+async def test_resource_monitor_stop_from_callback(fake_proc, monitored_process_manager):
+    monitor = BrowserResourceMonitor(
+        monitored_process_manager,
+        thresholds=ResourceThresholds(max_process_count=2),
+        interval=0.01,
+        proc_root=str(fake_proc),
+    )
+    stopped = asyncio.Event()
+
+    async def stop_monitor(usage, violations):
+        await monitor.stop()
+        stopped.set()
+
+    monitor.on_threshold_exceeded(stop_monitor)
+    await monitor.start()
+    await asyncio.wait_for(stopped.wait(), timeout=5)
+    await asyncio.sleep(0.05)
+
+    assert not monitor.is_running
+
+
+def test_process_liveness_and_exit_code(process_manager):
+    assert not process_manager.is_process_alive()
+    assert process_manager.get_exit_code() is None
+
+    process_manager._process = MagicMock()
+    process_manager._process.poll.return_value = None
+    assert process_manager.is_process_alive()
+    assert process_manager.get_exit_code() is None
+
+    process_manager._process.poll.return_value = -11
+    assert not process_manager.is_process_alive()
+    assert process_manager.get_exit_code() == -11
@@ -193,3 +193,17 @@ async def test_trigger_callbacks_error_handling(events_manager, caplog):
         'Error in callback' in record.message for record in caplog.records
     )
     assert error_logged, 'The error in the callback should be logged'
+
+
+@pytest.mark.asyncio
+async def test_fail_all_pending(commands_manager):
+    first = commands_manager.create_command_future({'method': 'First'})
+    second = commands_manager.create_command_future({'method': 'Second'})
+    second.set_result('done')
+
+    commands_manager.fail_all_pending(exceptions.WebSocketConnectionClosed())
+
+    with pytest.raises(exceptions.WebSocketConnectionClosed):
+        await first
+    assert second.result() == 'done'
+    assert commands_manager._pending_commands == {}
@@ -3,11 +3,14 @@ import pytest
 from aioresponses import aioresponses
 import tempfile
 import os
+import random
 import sys
 from unittest.mock import patch
 
 from pydoll import exceptions
+from pydoll.constants import TypingJitter
 from pydoll.utils import (
+    build_typing_plan,
     clean_script_for_analysis,
     decode_base64_to_bytes,
     get_browser_ws_address,
@@ -427,3 +430,29 @@ class TestScriptAnalysisFunctions:
                 '<template>hidden</template></div>')
         result = extract_text_from_html(html, strip=True, separator="/")
         assert result == 'Hello/world'
+
+
+class TestBuildTypingPlan:
+    """Test typing plan generation."""
+
+    def test_constant_pauses_without_jitter(self):
+        assert build_typing_plan(3, 0.1) == [0.1, 0.1, 0.1]
+
+    def test_uniform_pauses_within_spread(self):
+        delays = build_typing_plan(200, 0.1, TypingJitter.UNIFORM, 0.5, random.Random(1))
+        assert len(delays) == 200
+        assert all(0.05 <= delay <= 0.15 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_normal_pauses_never_negative(self):
+        delays = build_typing_plan(500, 0.1, TypingJitter.NORMAL, 2.0, random.Random(1))
+        assert min(delays) == 0.0
+        assert all(delay >= 0 for delay in delays)
+
+    def test_seeded_plans_reproducible(self):
+        first = build_typing_plan(20, 0.1, 'normal', 0.3, random.Random(7))
+        second = build_typing_plan(20, 0.1, 'normal', 0.3, random.Random(7))
+        assert first == second
+
+    def test_empty_plan(self):
+        assert build_typing_plan(0, 0.1, TypingJitter.UNIFORM) == []
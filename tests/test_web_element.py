@@ -3,6 +3,7 @@ import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch, mock_open
 import json
 import asyncio
+import weakref
 
 from pydoll.exceptions import (
     ElementNotVisible,
@@ -26,9 +27,12 @@ from pydoll.constants import (
     MouseEventType,
     ScreenshotFormat,
     Scripts,
+    TextMode,
+    TypingJitter,
 )
 
 from pydoll.elements.web_element import WebElement
+from pydoll.elements.mixins.find_elements_mixin import ObjectGroupLease
 
 
 @pytest_asyncio.fixture
@@ -111,6 +115,13 @@ def option_element(mock_connection_handler):
     )
 
 
+@pytest.fixture
+def mock_click():
+    """Patch WebElement.click (elements are slotted, so it is patched on the class)."""
+    with patch.object(WebElement, 'click') as click:
+        yield click
+
+
 @pytest.fixture
 def disabled_element(mock_connection_handler):
     """Disabled element fixture for testing enabled/disabled state."""
@@ -179,6 +190,71 @@ class TestWebElementInitialization:
         assert element._attributes['class_name'] == 'my-class'
         assert element._attributes['id'] == 'my-id'
 
+    def test_attributes_built_on_first_access(self, mock_connection_handler):
+        """Test that the attribute dictionary is only built when first read."""
+        element = WebElement(
+            object_id='lazy-test',
+            connection_handler=mock_connection_handler,
+            attributes_list=['id', 'lazy-id'],
+        )
+        assert element._attributes_dict is None
+
+        assert element.id == 'lazy-id'
+        assert element._attributes_dict == {'id': 'lazy-id'}
+        assert element._attributes_list == ()
+
+    def test_slotted_handle_has_no_instance_dict(self, mock_connection_handler):
+        """Test that handles are slotted, without a per-instance __dict__."""
+        element = WebElement(object_id='slots-test', connection_handler=mock_connection_handler)
+        assert '_object_id' in WebElement.__slots__
+        assert not hasattr(element, '__dict__')
+        assert weakref.ref(element)() is element
+
+        with pytest.raises(AttributeError):
+            element.click = AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_collected_element_never_releases_its_object(self, mock_connection_handler):
+        """Test a handle without a lease releases nothing, its object id may be shared."""
+        element = WebElement(object_id='gc-id', connection_handler=mock_connection_handler)
+        del element
+        await asyncio.sleep(0)
+
+        mock_connection_handler.execute_command.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_object_group_released_with_last_lease_holder(self, mock_connection_handler):
+        """Test the group of a lease is released once no handle references it."""
+        lease = ObjectGroupLease(mock_connection_handler, 'pydoll-find-1')
+        element = WebElement(
+            object_id='leased-id',
+            connection_handler=mock_connection_handler,
+            object_group='pydoll-find-1',
+            object_group_lease=lease,
+        )
+        del lease
+        await asyncio.sleep(0)
+        mock_connection_handler.execute_command.assert_not_called()
+
+        del element
+        await asyncio.sleep(0)
+        mock_connection_handler.execute_command.assert_called_once_with(
+            RuntimeCommands.release_object_group('pydoll-find-1')
+        )
+
+    @pytest.mark.asyncio
+    async def test_grouped_element_left_to_its_group(self, mock_connection_handler):
+        """Test elements in an object group are not released one by one."""
+        element = WebElement(
+            object_id='grouped-id',
+            connection_handler=mock_connection_handler,
+            object_group='pydoll-scope-1',
+        )
+        del element
+        await asyncio.sleep(0)
+
+        mock_connection_handler.execute_command.assert_not_called()
+
 
 class TestWebElementProperties:
     """Test WebElement properties and getters."""
@@ -216,7 +292,7 @@ class TestWebElementProperties:
             'result': {'outerHTML': test_html}
         }
 
-        text = await web_element.text
+        text = await web_element.get_text(TextMode.HTML_PARSER)
         assert text == 'HelloWorld'  # BeautifulSoup strips spaces between elements
 
     @pytest.mark.asyncio
@@ -227,9 +303,38 @@ class TestWebElementProperties:
             'result': {'outerHTML': test_html}
         }
 
-        text = await web_element.text
+        text = await web_element.get_text('html_parser')
         assert text == 'TextBoldItalicMore text'  # BeautifulSoup strips spaces between elements
 
+    @pytest.mark.asyncio
+    async def test_text_property_reads_inner_text_in_page(self, web_element):
+        """Test text property reads innerText in the page."""
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {'result': {'type': 'object', 'value': ['  Hello\nWorld \n']}}
+        }
+
+        text = await web_element.text
+
+        assert text == 'Hello\nWorld'
+        command = web_element._connection_handler.execute_command.call_args.args[0]
+        assert command['method'] == 'Runtime.callFunctionOn'
+        assert command['params']['arguments'] == [
+            {'value': 'inner_text'},
+            {'objectId': web_element._object_id},
+        ]
+        assert command['params']['returnByValue'] is True
+
+    @pytest.mark.asyncio
+    async def test_get_text_content_mode(self, web_element):
+        """Test TEXT_CONTENT mode is passed to the page."""
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {'result': {'type': 'object', 'value': ['raw']}}
+        }
+
+        assert await web_element.get_text(TextMode.TEXT_CONTENT) == 'raw'
+        command = web_element._connection_handler.execute_command.call_args.args[0]
+        assert command['params']['arguments'][0] == {'value': 'text_content'}
+
     @pytest.mark.asyncio
     async def test_bounds_property(self, web_element):
         """Test bounds property returns correct coordinates."""
@@ -288,31 +393,92 @@ class TestWebElementMethods:
         input_element._connection_handler.execute_command.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_type_text(self, input_element):
+    async def test_type_text(self, input_element, mock_click):
         """Test type_text method with character-by-character typing."""
         test_text = 'Hi'
-        input_element.click = AsyncMock()
         with patch('asyncio.sleep') as mock_sleep:
             await input_element.type_text(test_text, interval=0.05)
 
         # Should call execute_command for each character
         assert input_element._connection_handler.execute_command.call_count == len(test_text)
-        assert input_element.click.call_count == 1
+        assert mock_click.call_count == 1
         
         # Verify sleep was called between characters
         assert mock_sleep.call_count == len(test_text)
         mock_sleep.assert_called_with(0.05)
 
     @pytest.mark.asyncio
-    async def test_type_text_default_interval(self, input_element):
+    async def test_type_text_default_interval(self, input_element, mock_click):
         """Test type_text with default interval."""
         test_text = 'A'
-        input_element.click = AsyncMock()
         with patch('asyncio.sleep') as mock_sleep:
             await input_element.type_text(test_text)
 
         mock_sleep.assert_called_with(0.1)  # Default interval
-        assert input_element.click.call_count == 1
+        assert mock_click.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_type_text_with_jitter(self, input_element, mock_click):
+        """Test pauses follow the jittered typing plan."""
+        with patch(
+            'pydoll.elements.web_element.build_typing_plan', return_value=[0.2, 0.05]
+        ) as mock_plan, patch('asyncio.sleep') as mock_sleep:
+            await input_element.type_text('Hi', jitter=TypingJitter.UNIFORM)
+
+        mock_plan.assert_called_once_with(2, 0.1, TypingJitter.UNIFORM, 0.3)
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.2, 0.05]
+
+    @pytest.mark.asyncio
+    async def test_type_text_pipelined_does_not_wait_for_replies(self, input_element, mock_click):
+        """Test pipelined typing sends every key event before any reply arrives."""
+        replies = asyncio.Event()
+        sent = []
+
+        async def execute_command(command, timeout=60):
+            sent.append(command['params']['text'])
+            await replies.wait()
+
+        input_element._connection_handler.execute_command.side_effect = execute_command
+        typing = asyncio.create_task(input_element.type_text('abc', interval=0, pipelined=True))
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert sent == ['a', 'b', 'c']
+        assert not typing.done()
+        replies.set()
+        await typing
+
+    @pytest.mark.asyncio
+    async def test_type_text_pipelined_follows_plan(self, input_element, mock_click):
+        """Test pipelined key events are sent at the planned offsets."""
+        loop = asyncio.get_running_loop()
+        sent_at = []
+
+        async def execute_command(command, timeout=60):
+            sent_at.append(loop.time())
+            await asyncio.sleep(0.05)  # slower than the typing interval
+
+        input_element._connection_handler.execute_command.side_effect = execute_command
+        started = loop.time()
+        await input_element.type_text('abcd', interval=0.02, pipelined=True)
+        elapsed = loop.time() - started
+
+        offsets = [at - sent_at[0] for at in sent_at]
+        assert offsets[-1] == pytest.approx(0.06, abs=0.015)
+        assert elapsed < 0.06 + 0.05 + 0.03
+
+    @pytest.mark.asyncio
+    async def test_type_text_pipelined_raises_first_error(self, input_element, mock_click):
+        """Test failures of pipelined key events surface once all replies are in."""
+        input_element._connection_handler.execute_command.side_effect = [
+            None,
+            RuntimeError('closed'),
+            None,
+        ]
+
+        with pytest.raises(RuntimeError, match='closed'):
+            await input_element.type_text('abc', interval=0, pipelined=True)
+        assert input_element._connection_handler.execute_command.call_count == 3
 
     @pytest.mark.asyncio
     async def test_get_parent_element_success(self, web_element):
@@ -348,6 +514,38 @@ class TestWebElementMethods:
         }
         web_element._connection_handler.execute_command.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_get_parent_element_uses_serialized_node(self, web_element):
+        """Test parent attributes come from the deep serialized value in one command."""
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {
+                'result': {
+                    'type': 'object',
+                    'subtype': 'node',
+                    'objectId': 'parent-object-id',
+                    'deepSerializedValue': {
+                        'type': 'node',
+                        'value': {
+                            'nodeType': 1,
+                            'localName': 'section',
+                            'attributes': {'id': 'main', 'class': 'wide'},
+                        },
+                    },
+                }
+            }
+        }
+
+        parent_element = await web_element.get_parent_element()
+
+        assert parent_element._attributes == {
+            'id': 'main',
+            'class_name': 'wide',
+            'tag_name': 'section',
+        }
+        web_element._connection_handler.execute_command.assert_called_once()
+        command = web_element._connection_handler.execute_command.call_args.args[0]
+        assert command['params']['serializationOptions']['serialization'] == 'deep'
+
     @pytest.mark.asyncio
     async def test_get_parent_element_not_found(self, web_element):
         """Test parent element not found raises ElementNotFound."""
@@ -501,102 +699,184 @@ class TestWebElementClicking:
     async def test_click_using_js_success(self, web_element):
         """Test successful JavaScript click."""
         # Mock element visibility and click success
-        web_element._is_element_visible = AsyncMock(return_value=True)
-        web_element.scroll_into_view = AsyncMock()
-        web_element._execute_script = AsyncMock(
-            return_value={'result': {'result': {'value': True}}}
-        )
-        
-        await web_element.click_using_js()
-        
-        web_element.scroll_into_view.assert_called_once()
-        web_element._is_element_visible.assert_called_once()
+        with (
+            patch.object(WebElement, '_is_element_visible', return_value=True) as mock_visible,
+            patch.object(WebElement, 'scroll_into_view') as mock_scroll,
+            patch.object(
+                WebElement,
+                '_execute_script',
+                return_value={'result': {'result': {'value': True}}},
+            ),
+        ):
+            await web_element.click_using_js()
+
+        mock_scroll.assert_called_once()
+        mock_visible.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_click_using_js_not_visible(self, web_element):
         """Test JavaScript click when element is not visible."""
-        web_element._is_element_visible = AsyncMock(return_value=False)
-        web_element.scroll_into_view = AsyncMock()
-
-        with pytest.raises(ElementNotVisible):
+        with (
+            patch.object(WebElement, '_is_element_visible', return_value=False),
+            patch.object(WebElement, 'scroll_into_view'),
+            pytest.raises(ElementNotVisible),
+        ):
             await web_element.click_using_js()
 
     @pytest.mark.asyncio
     async def test_click_using_js_not_interactable(self, web_element):
         """Test JavaScript click when element is not interactable."""
-        web_element._is_element_visible = AsyncMock(return_value=True)
-        web_element.scroll_into_view = AsyncMock()
-        web_element._execute_script = AsyncMock(
-            return_value={'result': {'result': {'value': False}}}
-        )
-
-        with pytest.raises(ElementNotInteractable):
+        with (
+            patch.object(WebElement, '_is_element_visible', return_value=True),
+            patch.object(WebElement, 'scroll_into_view'),
+            patch.object(
+                WebElement,
+                '_execute_script',
+                return_value={'result': {'result': {'value': False}}},
+            ),
+            pytest.raises(ElementNotInteractable),
+        ):
             await web_element.click_using_js()
 
     @pytest.mark.asyncio
     async def test_click_using_js_option_element(self, option_element):
         """Test JavaScript click on option element uses specialized method."""
-        option_element._click_option_tag = AsyncMock()
-        
-        await option_element.click_using_js()
-        
-        option_element._click_option_tag.assert_called_once()
+        with patch.object(WebElement, '_click_option_tag') as mock_click_option_tag:
+            await option_element.click_using_js()
+
+        mock_click_option_tag.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_click_success(self, web_element):
-        """Test successful mouse click."""
-        bounds = [0, 0, 100, 0, 100, 100, 0, 100]  # Rectangle coordinates
-        web_element._is_element_visible = AsyncMock(return_value=True)
-        web_element.scroll_into_view = AsyncMock()
+        """Test mouse click after a single in-page preflight."""
         web_element._connection_handler.execute_command.side_effect = [
-            {'result': {'model': {'content': bounds}}},  # bounds
+            {'result': {'result': {'value': {
+                'visible': True, 'x': 55.5, 'y': 60.0, 'covered_by': None
+            }}}},
             None,  # mouse press
             None,  # mouse release
         ]
-        
+
         with patch('asyncio.sleep') as mock_sleep:
             await web_element.click(x_offset=5, y_offset=10, hold_time=0.2)
-        
-        # Should call mouse press and release
+
         assert web_element._connection_handler.execute_command.call_count == 3
         mock_sleep.assert_called_once_with(0.2)
+        calls = web_element._connection_handler.execute_command.call_args_list
+        preflight = calls[0].args[0]
+        assert preflight['params']['functionDeclaration'] == Scripts.CLICK_PREFLIGHT
+        assert 'arguments' not in preflight['params']
+        press, release = calls[1].args[0], calls[2].args[0]
+        assert press['params']['type'] == MouseEventType.MOUSE_PRESSED
+        assert release['params']['type'] == MouseEventType.MOUSE_RELEASED
+        assert (press['params']['x'], press['params']['y']) == (60, 70)
+
+    @pytest.mark.asyncio
+    async def test_click_offset_outside_element(self, web_element):
+        """Test offsets are applied after the center hit test, even beyond the element."""
+        web_element._connection_handler.execute_command.side_effect = [
+            {'result': {'result': {'value': {
+                'visible': True, 'x': 50, 'y': 50, 'covered_by': None
+            }}}},
+            None,  # mouse press
+            None,  # mouse release
+        ]
+
+        with patch('asyncio.sleep'):
+            await web_element.click(x_offset=200, y_offset=-80)
+
+        calls = web_element._connection_handler.execute_command.call_args_list
+        for call in calls[1:]:
+            assert (call.args[0]['params']['x'], call.args[0]['params']['y']) == (250, -30)
+
+    @pytest.mark.asyncio
+    async def test_click_hidden_input_overlaid_by_label(self, input_element):
+        """Test a hidden input covered by its label or a styled span is still clicked."""
+        # the preflight resolves the label (or a span inside it) as reaching the input
+        input_element._connection_handler.execute_command.side_effect = [
+            {'result': {'result': {'value': {
+                'visible': True, 'x': 12, 'y': 34, 'covered_by': None
+            }}}},
+            None,  # mouse press
+            None,  # mouse release
+        ]
+
+        with patch('asyncio.sleep'):
+            await input_element.click()
+
+        calls = input_element._connection_handler.execute_command.call_args_list
+        assert len(calls) == 3
+        assert (calls[1].args[0]['params']['x'], calls[1].args[0]['params']['y']) == (12, 34)
+        script = calls[0].args[0]['params']['functionDeclaration']
+        assert 'this.labels' in script
+        assert 'label.contains(hit)' in script
+
+    @pytest.mark.asyncio
+    async def test_click_press_sent_before_release(self, web_element):
+        """Test press and release are pipelined: both are sent before either ack."""
+        sent = []
+        real_sleep = asyncio.sleep
+
+        async def execute_command(command, timeout=10):
+            if command['method'] == 'Runtime.callFunctionOn':
+                sent.append('preflight')
+                return {'result': {'result': {'value': {
+                    'visible': True, 'x': 1, 'y': 1, 'covered_by': None
+                }}}}
+            event_type = command['params']['type']
+            sent.append(event_type)
+            await real_sleep(0.01)  # slow acknowledgement
+            sent.append(f'ack {event_type}')
+
+        web_element._connection_handler.execute_command.side_effect = execute_command
+
+        async def hold(seconds):
+            await real_sleep(0)
+            sent.append('hold')
+
+        with patch('asyncio.sleep', side_effect=hold):
+            await web_element.click(hold_time=0.1)
+
+        assert sent == [
+            'preflight',
+            MouseEventType.MOUSE_PRESSED,
+            'hold',
+            MouseEventType.MOUSE_RELEASED,
+            f'ack {MouseEventType.MOUSE_PRESSED}',
+            f'ack {MouseEventType.MOUSE_RELEASED}',
+        ]
 
     @pytest.mark.asyncio
     async def test_click_not_visible(self, web_element):
         """Test click when element is not visible."""
-        web_element._is_element_visible = AsyncMock(return_value=False)
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {'result': {'value': {'visible': False}}}
+        }
 
         with pytest.raises(ElementNotVisible):
             await web_element.click()
+        web_element._connection_handler.execute_command.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_click_covered(self, web_element):
+        """Test click when another element is on top of the click point."""
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {'result': {'value': {
+                'visible': True, 'x': 10, 'y': 20, 'covered_by': 'div'
+            }}}
+        }
+
+        with pytest.raises(ElementNotInteractable, match='covered by a <div>'):
+            await web_element.click()
+        web_element._connection_handler.execute_command.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_click_option_element(self, option_element):
         """Test click on option element uses specialized method."""
-        option_element._click_option_tag = AsyncMock()
-        
-        await option_element.click()
-        
-        option_element._click_option_tag.assert_called_once()
+        with patch.object(WebElement, '_click_option_tag') as mock_click_option_tag:
+            await option_element.click()
 
-    @pytest.mark.asyncio
-    async def test_click_bounds_fallback_to_js(self, web_element):
-        """Test click falls back to JS bounds when CDP bounds fail."""
-        web_element._is_element_visible = AsyncMock(return_value=True)
-        web_element.scroll_into_view = AsyncMock()
-        
-        # First call (bounds) raises KeyError, second call (JS bounds) succeeds
-        js_bounds = {'x': 10, 'y': 20, 'width': 100, 'height': 50}
-        web_element._connection_handler.execute_command.side_effect = [
-            {'result': {'model': {'invalid_key': []}}},  # bounds with KeyError
-            {'result': {'result': {'value': json.dumps(js_bounds)}}},  # JS bounds
-            None,  # mouse press
-            None,  # mouse release
-        ]
-        
-        await web_element.click()
-        
-        # Should call bounds, JS bounds, mouse press, and mouse release
-        assert web_element._connection_handler.execute_command.call_count == 4
+        mock_click_option_tag.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_click_option_tag_method(self, option_element):
@@ -693,40 +973,40 @@ class TestWebElementVisibility:
     @pytest.mark.asyncio
     async def test_is_element_visible_true(self, web_element):
         """Test _is_element_visible returns True."""
-        web_element._execute_script = AsyncMock(
-            return_value={'result': {'result': {'value': True}}}
-        )
-        
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {'result': {'value': True}}
+        }
+
         result = await web_element._is_element_visible()
         assert result is True
 
     @pytest.mark.asyncio
     async def test_is_element_visible_false(self, web_element):
         """Test _is_element_visible returns False."""
-        web_element._execute_script = AsyncMock(
-            return_value={'result': {'result': {'value': False}}}
-        )
-        
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {'result': {'value': False}}
+        }
+
         result = await web_element._is_element_visible()
         assert result is False
 
     @pytest.mark.asyncio
     async def test_is_element_on_top_true(self, web_element):
         """Test _is_element_on_top returns True."""
-        web_element._execute_script = AsyncMock(
-            return_value={'result': {'result': {'value': True}}}
-        )
-        
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {'result': {'value': True}}
+        }
+
         result = await web_element._is_element_on_top()
         assert result is True
 
     @pytest.mark.asyncio
     async def test_is_element_on_top_false(self, web_element):
         """Test _is_element_on_top returns False."""
-        web_element._execute_script = AsyncMock(
-            return_value={'result': {'result': {'value': False}}}
-        )
-        
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {'result': {'value': False}}
+        }
+
         result = await web_element._is_element_on_top()
         assert result is False
 
@@ -827,6 +1107,31 @@ class TestWebElementFindMethods:
         assert element._object_id == 'found-element-id'
         assert element._attributes['class_name'] == 'btn'
 
+    @pytest.mark.asyncio
+    async def test_find_element_single_round_trip(self, web_element):
+        """Test a serialized node needs no DOM.describeNode call."""
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {
+                'result': {
+                    'objectId': 'found-element-id',
+                    'deepSerializedValue': {
+                        'type': 'node',
+                        'value': {
+                            'localName': 'button',
+                            'attributes': {'class': 'btn', 'disabled': ''},
+                        },
+                    },
+                }
+            }
+        }
+
+        element = await web_element.query('button.btn')
+
+        web_element._connection_handler.execute_command.assert_called_once()
+        assert element.class_name == 'btn'
+        assert element.tag_name == 'button'
+        assert not element.is_enabled
+
     @pytest.mark.asyncio
     async def test_find_element_not_found_with_exception(self, web_element):
         """Test element not found raises exception."""
@@ -854,67 +1159,71 @@ class TestWebElementFindMethods:
         properties_response = {
             'result': {
                 'result': [
-                    {'value': {'type': 'object', 'objectId': 'child-1'}},
-                    {'value': {'type': 'object', 'objectId': 'child-2'}},
+                    {'name': '0', 'value': {'type': 'object', 'objectId': 'child-1'}},
+                    {'name': '1', 'value': {'type': 'object', 'objectId': 'child-2'}},
+                    {'name': 'length', 'value': {'type': 'number', 'value': 2}},
                 ]
             }
         }
         describe_response = {
             'result': {
-                'node': {'nodeName': 'LI', 'attributes': ['class', 'item']}
+                'result': {
+                    'type': 'object',
+                    'value': [
+                        {'nodeName': 'li', 'attributes': ['class', 'item']},
+                        {'nodeName': 'li', 'attributes': ['class', 'item active']},
+                    ],
+                }
             }
         }
-        
+
         web_element._connection_handler.execute_command.side_effect = [
             find_response,
             properties_response,
             describe_response,
-            describe_response,
         ]
-        
+
         elements = await web_element.find(class_name='item', find_all=True)
         
         assert len(elements) == 2
         assert all(isinstance(elem, WebElement) for elem in elements)
         assert elements[0]._object_id == 'child-1'
         assert elements[1]._object_id == 'child-2'
+        assert elements[1].class_name == 'item active'
+        assert elements[1].tag_name == 'li'
+        assert web_element._connection_handler.execute_command.call_count == 3
 
     @pytest.mark.asyncio
     async def test_find_with_timeout_success(self, web_element):
-        """Test find with timeout succeeds on retry."""
+        """Test find with timeout waits relative to the element in the page."""
         node_response = {'result': {'result': {'objectId': 'delayed-element'}}}
         describe_response = {
             'result': {
                 'node': {'nodeName': 'DIV', 'attributes': []}
             }
         }
-        
-        # First call returns empty, second call succeeds
         web_element._connection_handler.execute_command.side_effect = [
-            {'result': {'result': {}}},  # First attempt fails
-            node_response,  # Second attempt succeeds
+            node_response,
             describe_response,
         ]
-        
-        with patch('asyncio.sleep') as mock_sleep:
-            element = await web_element.find(id='delayed', timeout=2)
-        
+
+        element = await web_element.find(id='delayed', timeout=2)
+
         assert isinstance(element, WebElement)
         assert element._object_id == 'delayed-element'
-        mock_sleep.assert_called()
+        wait_command = web_element._connection_handler.execute_command.call_args_list[0].args[0]
+        assert wait_command['params']['objectId'] == web_element._object_id
+        assert wait_command['params']['awaitPromise'] is True
 
     @pytest.mark.asyncio
     async def test_find_with_timeout_failure(self, web_element):
         """Test find with timeout raises WaitElementTimeout."""
         web_element._connection_handler.execute_command.return_value = {
-            'result': {'result': {}}
+            'result': {'result': {'type': 'object', 'subtype': 'null', 'value': None}}
         }
-        
-        with patch('asyncio.get_event_loop') as mock_loop:
-            mock_loop.return_value.time.side_effect = [0, 0.5, 1.0, 1.5, 2.1]  # Simulate time progression
-            
-            with pytest.raises(WaitElementTimeout):
-                await web_element.find(id='never-appears', timeout=2)
+
+        with pytest.raises(WaitElementTimeout):
+            await web_element.find(id='never-appears', timeout=2)
 
     @pytest.mark.asyncio
     async def test_query_css_selector(self, web_element):
@@ -982,18 +1291,17 @@ class TestWebElementEdgeCases:
         }
         
         # BeautifulSoup should handle malformed HTML gracefully
-        text = await web_element.text
+        text = await web_element.get_text(TextMode.HTML_PARSER)
         assert 'Unclosed tag' in text
         assert 'content' in text
 
     @pytest.mark.asyncio
     async def test_click_with_zero_hold_time(self, web_element):
         """Test click with zero hold time."""
-        bounds = [0, 0, 50, 0, 50, 50, 0, 50]
-        web_element._is_element_visible = AsyncMock(return_value=True)
-        web_element.scroll_into_view = AsyncMock()
         web_element._connection_handler.execute_command.side_effect = [
-            {'result': {'model': {'content': bounds}}},
+            {'result': {'result': {'value': {
+                'visible': True, 'x': 25, 'y': 25, 'covered_by': None
+            }}}},
             None,  # mouse press
             None,  # mouse release
         ]
@@ -1004,14 +1312,13 @@ class TestWebElementEdgeCases:
         mock_sleep.assert_called_once_with(0)
 
     @pytest.mark.asyncio
-    async def test_type_text_empty_string(self, input_element):
+    async def test_type_text_empty_string(self, input_element, mock_click):
         """Test type_text with empty string."""
-        input_element.click = AsyncMock()
         await input_element.type_text('')
 
         # Should not call execute_command for empty string
         input_element._connection_handler.execute_command.assert_not_called()
-        assert input_element.click.call_count == 1
+        assert mock_click.call_count == 1
 
     @pytest.mark.asyncio
     async def test_set_input_files_empty_list(self, file_input_element):